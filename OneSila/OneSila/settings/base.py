@@ -264,6 +264,9 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Send at most one subscription refresh per instance within this many seconds, 0 sends every refresh.
+SUBSCRIPTION_REFRESH_DEBOUNCE_SECONDS = 0
+
 #
 # Default CORS settings
 #
@@ -9,6 +9,9 @@ options.DEFAULT_NAMES = (*options.DEFAULT_NAMES, 'search_terms',)
 # One the Meta Fields, we should set this.
 options.DEFAULT_NAMES = (*options.DEFAULT_NAMES, 'url_detail_page_string',)
 
+# Optional dotted path to a core.managers.search_backends.BaseSearchBackend used by queryset.search().
+options.DEFAULT_NAMES = (*options.DEFAULT_NAMES, 'search_backend',)
+
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
@@ -4,6 +4,7 @@ import json
 from django.conf import settings
 from django.http import HttpResponse
 import os
+import threading
 import datetime
 from get_absolute_url.helpers import reverse_lazy
 from io import BytesIO
@@ -170,6 +171,55 @@ def ensure_serializable(value, *, _seen=None):
     return value
 
 
+class TransactionBuffer(threading.local):
+    """
+    Base for the thread local buffers that collect work during a transaction and flush it once on commit.
+
+    register_flush() registers a single on_commit flush per transaction. When no flush of this buffer is
+    pending anymore, because the last one ran or was dropped with a rolled back transaction or savepoint,
+    whatever is still buffered belongs to rolled back work and is cleared before registering a new one.
+    Work buffered in a rolled back savepoint of a transaction that still commits is flushed with it.
+    """
+
+    def __init__(self):
+        self.pending_flush = None
+
+    def clear(self):
+        raise NotImplementedError
+
+    def flush(self):
+        raise NotImplementedError
+
+    def is_flush_pending(self, *, connection):
+        return self.pending_flush is not None and any(
+            callback is self.pending_flush for _, callback, _ in connection.run_on_commit
+        )
+
+    def register_flush(self):
+        """
+        Returns False when there is no transaction to wait for, the buffer is then cleared and the
+        caller should do the work right away.
+        """
+        from django.db import transaction
+
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            self.pending_flush = None
+            self.clear()
+            return False
+
+        if self.is_flush_pending(connection=connection):
+            return True
+
+        def pending_flush():
+            self.pending_flush = None
+            self.flush()
+
+        self.clear()
+        self.pending_flush = pending_flush
+        transaction.on_commit(pending_flush)
+        return True
+
 
 def safe_run_task(task_func, *args, **kwargs):
     from django.db import transaction, connection
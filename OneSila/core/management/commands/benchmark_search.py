@@ -0,0 +1,62 @@
+import time
+from statistics import median
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from core.managers.search_backends import get_search_backend
+from core.models import MultiTenantCompany
+
+
+class Command(BaseCommand):
+    help = "Time queryset.search() implementations for a model: the legacy ORM search, the EXISTS search and the configured search backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Model label, e.g. products.Product")
+        parser.add_argument("term")
+        parser.add_argument("--mtc-id", type=int, default=None)
+        parser.add_argument("--repetitions", type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+
+        multi_tenant_company = None
+        if options["mtc_id"] is not None:
+            multi_tenant_company = MultiTenantCompany.objects.get(id=options["mtc_id"])
+
+        search_term = options["term"]
+        search_fields = getattr(model._meta, 'search_terms', [])
+        queryset = model.objects.all()
+
+        implementations = {
+            'legacy': lambda: queryset.get_search_results_old(
+                search_term=search_term,
+                search_fields=search_fields,
+                multi_tenant_company=multi_tenant_company)[0],
+            'exists': lambda: queryset.get_search_results(
+                search_term=search_term,
+                search_fields=search_fields,
+                multi_tenant_company=multi_tenant_company)[0],
+        }
+
+        backend = get_search_backend(queryset=queryset, search_term=search_term)
+        if backend is not None:
+            implementations['backend'] = lambda: backend.get_search_results(
+                search_term=search_term,
+                search_fields=search_fields,
+                multi_tenant_company=multi_tenant_company)[0]
+        else:
+            self.stdout.write(self.style.WARNING("No search backend available for this model and database."))
+
+        for name, build_queryset in implementations.items():
+            timings = []
+            count = 0
+            for _ in range(options["repetitions"]):
+                start = time.perf_counter()
+                count = len(list(build_queryset().values_list('pk', flat=True).distinct()))
+                timings.append((time.perf_counter() - start) * 1000)
+
+            self.stdout.write(f"{name:<8} results={count:<6} median={median(timings):.1f}ms min={min(timings):.1f}ms")
@@ -5,6 +5,7 @@ from django.utils.text import smart_split, unescape_string_literal
 from django.contrib.admin.utils import lookup_spawns_duplicates
 
 from core.exceptions import SearchFailedError
+from core.managers.search_backends import get_search_backend
 
 import operator
 from functools import reduce
@@ -155,6 +156,14 @@ class SearchQuerySetMixin:
             logger.warning("No `search_terms` declared on the model Meta class")
             search_fields = []
 
+        backend = get_search_backend(queryset=self, search_term=search_term)
+        if backend is not None:
+            qs, _ = backend.get_search_results(
+                search_term=search_term,
+                search_fields=search_fields,
+                multi_tenant_company=multi_tenant_company)
+            return qs.distinct()
+
         qs, _ = self.get_search_results(
             search_term=search_term,
             search_fields=search_fields,
@@ -0,0 +1,123 @@
+from django.db import connections
+from django.utils.module_loading import import_string
+from django.utils.text import smart_split, unescape_string_literal
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class BaseSearchBackend:
+    """
+    A search backend resolves `queryset.search()` for one model.
+    Models opt in by declaring `search_backend = 'dotted.path.ToBackend'` on their Meta class.
+    Whenever a backend is not available for the current database the queryset falls back to the
+    EXISTS based implementation of SearchQuerySetMixin.
+    """
+    vendors = None
+
+    def __init__(self, *, queryset):
+        self.queryset = queryset
+
+    def is_available(self, *, search_term) -> bool:
+        if self.vendors is None:
+            return True
+        return connections[self.queryset.db].vendor in self.vendors
+
+    def get_search_results(self, *, search_term, search_fields, multi_tenant_company=None):
+        raise NotImplementedError("Search backends must implement get_search_results()")
+
+
+class DocumentSearchBackend(BaseSearchBackend):
+    """
+    Search a denormalised document table instead of the model relations.
+
+    Subclasses declare the document model, which needs a `document` text field, a `multi_tenant_company`
+    foreign key and a foreign key back to the searched model named `document_relation_field`.
+    Every term has to appear in the document (ILIKE, backed by a pg_trgm GIN index) and the results are
+    ranked with ts_rank over the same document.
+    """
+    vendors = ('postgresql',)
+    document_model = None
+    document_relation_field = None
+    search_config = 'simple'
+    rank_annotation = 'search_rank'
+
+    def get_document_model(self):
+        if isinstance(self.document_model, str):
+            from django.apps import apps
+            return apps.get_model(self.document_model)
+        return self.document_model
+
+    def is_available(self, *, search_term) -> bool:
+        # Literal searches keep the exact-match semantics of the ORM backend.
+        if search_term.startswith('"') and search_term.endswith('"') and len(search_term) > 1:
+            return False
+        return super().is_available(search_term=search_term)
+
+    def get_terms(self, *, search_term):
+        terms = []
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            if bit:
+                terms.append(bit.lower())
+        return terms
+
+    def get_documents(self, *, terms, multi_tenant_company=None):
+        documents = self.get_document_model().objects.all()
+        if multi_tenant_company:
+            documents = documents.filter(multi_tenant_company=multi_tenant_company)
+
+        for term in terms:
+            documents = documents.filter(document__contains=term)
+
+        return documents
+
+    def get_search_results(self, *, search_term, search_fields, multi_tenant_company=None):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+        from django.db.models import FloatField, OuterRef, Subquery
+
+        queryset = self.queryset
+        if multi_tenant_company:
+            queryset = queryset.filter(multi_tenant_company=multi_tenant_company)
+
+        terms = self.get_terms(search_term=search_term)
+        if not terms:
+            return queryset, False
+
+        documents = self.get_documents(terms=terms, multi_tenant_company=multi_tenant_company)
+        queryset = queryset.filter(pk__in=documents.values(self.document_relation_field))
+
+        rank = (
+            documents.filter(**{self.document_relation_field: OuterRef('pk')})
+            .annotate(rank=SearchRank(
+                SearchVector('document', config=self.search_config),
+                SearchQuery(' '.join(terms), config=self.search_config),
+            ))
+            .values('rank')[:1]
+        )
+        queryset = queryset.annotate(**{self.rank_annotation: Subquery(rank, output_field=FloatField())})
+        queryset = queryset.order_by(f'-{self.rank_annotation}', 'pk')
+
+        return queryset, False
+
+
+def get_search_backend(*, queryset, search_term):
+    """
+    Return the backend declared on the model Meta when it can serve this search, None otherwise.
+    """
+    backend_path = getattr(queryset.model._meta, 'search_backend', None)
+    if not backend_path or not search_term:
+        return None
+
+    try:
+        backend_class = import_string(backend_path)
+    except ImportError:
+        logger.warning("Search backend %s for %s cannot be imported.", backend_path, queryset.model.__name__)
+        return None
+
+    backend = backend_class(queryset=queryset)
+    if not backend.is_available(search_term=search_term):
+        return None
+
+    return backend
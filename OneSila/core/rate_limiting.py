@@ -0,0 +1,126 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from django.core.cache import cache
+
+_local_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    Token bucket stored in the default cache (Redis in production) so every worker shares the same budget.
+
+    The bucket holds up to `capacity` tokens and refills continuously at `refill_rate` tokens per second.
+    Updates happen under the cache lock when the backend provides one (django-redis) and under a process
+    lock otherwise (locmem in tests).
+    """
+    key_prefix = 'token_bucket'
+    lock_timeout = 5
+
+    def __init__(self, *, key: str, capacity: float, refill_rate: float):
+        self.key = f"{self.key_prefix}:{key}"
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+
+    @classmethod
+    def per_minute(cls, *, key: str, requests_per_minute: int):
+        return cls(key=key, capacity=requests_per_minute, refill_rate=requests_per_minute / 60)
+
+    @contextmanager
+    def _lock(self):
+        lock_factory = getattr(cache, 'lock', None)
+        if lock_factory is None:
+            with _local_lock:
+                yield
+            return
+
+        with lock_factory(f"{self.key}:lock", timeout=self.lock_timeout):
+            yield
+
+    def _now(self):
+        return time.time()
+
+    def _refill(self, *, tokens: float, updated_at: float, now: float) -> float:
+        elapsed = max(now - updated_at, 0)
+        return min(self.capacity, tokens + elapsed * self.refill_rate)
+
+    def _load(self, *, now: float):
+        state = cache.get(self.key)
+        if state is None:
+            return self.capacity
+
+        tokens, updated_at = state
+        return self._refill(tokens=tokens, updated_at=updated_at, now=now)
+
+    def _store(self, *, tokens: float, now: float):
+        # Once the bucket is full again the state carries no information, so let it expire.
+        timeout = max(int((self.capacity - tokens) / self.refill_rate) + 60, 60) if self.refill_rate else None
+        cache.set(self.key, (tokens, now), timeout=timeout)
+
+    def get_tokens(self) -> float:
+        return self._load(now=self._now())
+
+    def consume(self, tokens: float = 1) -> bool:
+        """
+        Take `tokens` out of the bucket when they are available.
+
+        A request bigger than the capacity is allowed once the bucket is full and leaves the bucket
+        in debt, so oversized work still runs but blocks the integration until the debt is paid back.
+        """
+        with self._lock():
+            now = self._now()
+            available = self._load(now=now)
+
+            if tokens > self.capacity:
+                allowed = available >= self.capacity
+            else:
+                allowed = available >= tokens
+
+            if allowed:
+                available -= tokens
+
+            self._store(tokens=available, now=now)
+            return allowed
+
+    def consume_sequence(self, costs) -> int:
+        """
+        Consume the given costs in order under a single lock and stop at the first one that does not fit.
+        Returns how many of them were granted.
+        """
+        granted = 0
+        with self._lock():
+            now = self._now()
+            available = self._load(now=now)
+
+            for tokens in costs:
+                if tokens > self.capacity:
+                    allowed = granted == 0 and available >= self.capacity
+                else:
+                    allowed = available >= tokens
+
+                if not allowed:
+                    break
+
+                available -= tokens
+                granted += 1
+
+            self._store(tokens=available, now=now)
+
+        return granted
+
+    def refund(self, tokens: float = 1):
+        with self._lock():
+            now = self._now()
+            self._store(tokens=min(self.capacity, self._load(now=now) + tokens), now=now)
+
+    def seconds_until_available(self, tokens: float = 1) -> float:
+        needed = min(tokens, self.capacity) - self.get_tokens()
+        if needed <= 0:
+            return 0
+        if not self.refill_rate:
+            return float('inf')
+        return needed / self.refill_rate
+
+    def reset(self):
+        cache.delete(self.key)
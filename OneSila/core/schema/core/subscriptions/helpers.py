@@ -2,12 +2,12 @@ from strawberry.relay import to_base64
 
 
 def get_group(instance):
-    return f"{instance.__class__.__name__}"
+    # One group per instance, so a save only reaches the subscribers of that instance.
+    return f"{instance.__class__.__name__}_{instance.pk}"
 
 
 def get_msg_type(instance):
-    group = get_group(instance)
-    return f"{group}_{instance.id}"
+    return f"{instance.__class__.__name__}_{instance.id}"
 
 
 def get_msg(instance):
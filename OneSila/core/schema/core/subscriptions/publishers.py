@@ -1,6 +1,7 @@
 from strawberry_django.auth.utils import get_current_user
 from strawberry.relay.utils import from_base64
-from asgiref.sync import sync_to_async
+from asgiref.sync import async_to_sync, sync_to_async
+import channels.layers
 import contextlib
 
 from .typing import Info, GlobalID, Model
@@ -28,6 +29,8 @@ class ModelInstanceSubscribePublisher:
         yield msg
     ```
 
+    Every instance has its own group. The refresh messages sent from the receivers are delivered with
+    `ModelInstanceSubscribePublisher.publish(messages={group: msg})`, which sends a whole batch in one go.
     """
 
     def __init__(self, info: Info, pk: GlobalID, model: Model, multi_tenant_company_protection=True):
@@ -116,6 +119,23 @@ class ModelInstanceSubscribePublisher:
         await self.channel_layer.group_send(group=self.group, message=self.msg)
         logger.debug(f"Sent message {self.msg} to group {self.group}")
 
+    @staticmethod
+    async def send_group_messages(*, channel_layer, messages):
+        for group, msg in messages.items():
+            await channel_layer.group_send(group=group, message=msg)
+
+    @classmethod
+    def publish(cls, *, messages):
+        """
+        Synchronously send a batch of {group: msg} refresh messages.
+        """
+        if not messages:
+            return
+
+        channel_layer = channels.layers.get_channel_layer()
+        async_to_sync(cls.send_group_messages)(channel_layer=channel_layer, messages=messages)
+        logger.debug(f"Published {len(messages)} refresh messages")
+
     async def send_initial_message(self):
         await self.send_message()
 
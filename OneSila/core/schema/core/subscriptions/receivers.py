@@ -1,14 +1,81 @@
-from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+from core.helpers import TransactionBuffer
 from .helpers import get_group, get_msg
-import channels.layers
+from .publishers import ModelInstanceSubscribePublisher
 
 import logging
 logger = logging.getLogger(__name__)
 
 
+class SubscriptionRefreshBuffer(TransactionBuffer):
+    """
+    Holds the refresh messages of the current transaction, one per group, so saving the same
+    instance many times ends up as a single message sent on commit.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.messages = {}
+
+    def add(self, *, group, msg):
+        self.messages[group] = msg
+
+    def clear(self):
+        self.messages = {}
+
+    def flush(self):
+        messages = self.messages
+        self.clear()
+        publish_refresh_messages(messages=messages)
+
+
+subscription_refresh_buffer = SubscriptionRefreshBuffer()
+
+
+def get_debounce_seconds():
+    return getattr(settings, 'SUBSCRIPTION_REFRESH_DEBOUNCE_SECONDS', 0)
+
+
+def publish_refresh_messages(*, messages):
+    """
+    Send the messages, or with SUBSCRIPTION_REFRESH_DEBOUNCE_SECONDS set at most one message per group
+    and window: the first one is sent right away and the later ones are replaced by a single delayed
+    message at the end of the window, so subscribers still end up with the last state.
+    """
+    if not messages:
+        return
+
+    debounce = get_debounce_seconds()
+    if not debounce:
+        ModelInstanceSubscribePublisher.publish(messages=messages)
+        return
+
+    send_now, send_later = {}, {}
+    for group, msg in messages.items():
+        if cache.add(f"subscription_refresh:{group}", True, timeout=debounce):
+            send_now[group] = msg
+        elif cache.add(f"subscription_refresh:{group}:trailing", True, timeout=debounce):
+            send_later[group] = msg
+
+    if send_now:
+        ModelInstanceSubscribePublisher.publish(messages=send_now)
+
+    if send_later:
+        from core.tasks import core__subscriptions__publish_refresh_messages_task
+
+        core__subscriptions__publish_refresh_messages_task.schedule(
+            kwargs={'messages': send_later},
+            delay=debounce,
+        )
+
+
 def refresh_subscription_receiver(instance):
     group = get_group(instance)
     msg = get_msg(instance)
 
-    channel_layer = channels.layers.get_channel_layer()
-    async_to_sync(channel_layer.group_send)(group=group, message=msg)
+    if subscription_refresh_buffer.register_flush():
+        subscription_refresh_buffer.add(group=group, msg=msg)
+        return
+
+    publish_refresh_messages(messages={group: msg})
@@ -21,3 +21,10 @@ def core__demo_data__delete_task(multi_tenant_company):
     if multi_tenant_company.demodatarelation_set.all().exists():
         fac = DemoDataLibrary()
         fac.delete_demo_data(multi_tenant_company=multi_tenant_company)
+
+
+@db_task()
+def core__subscriptions__publish_refresh_messages_task(messages):
+    from core.schema.core.subscriptions.publishers import ModelInstanceSubscribePublisher
+
+    ModelInstanceSubscribePublisher.publish(messages=messages)
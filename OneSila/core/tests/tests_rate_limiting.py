@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from core.rate_limiting import TokenBucket
+
+
+class TokenBucketTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.now = 1_000_000.0
+        patcher = patch.object(TokenBucket, '_now', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_consume_until_empty_then_refill(self):
+        bucket = TokenBucket.per_minute(key='test', requests_per_minute=60)
+
+        self.assertTrue(bucket.consume(60))
+        self.assertFalse(bucket.consume(1))
+
+        self.now += 2
+        self.assertTrue(bucket.consume(2))
+        self.assertFalse(bucket.consume(1))
+
+    def test_oversized_request_needs_full_bucket_and_creates_debt(self):
+        bucket = TokenBucket(key='oversized', capacity=10, refill_rate=1)
+
+        self.assertTrue(bucket.consume(1))
+        self.assertFalse(bucket.consume(15))
+
+        self.now += 1
+        self.assertTrue(bucket.consume(15))
+        self.assertEqual(bucket.get_tokens(), -5)
+        self.assertEqual(bucket.seconds_until_available(1), 6)
+
+    def test_consume_sequence_stops_at_first_cost_that_does_not_fit(self):
+        bucket = TokenBucket(key='sequence', capacity=5, refill_rate=1)
+
+        self.assertEqual(bucket.consume_sequence([2, 2, 3, 1]), 2)
+        self.assertEqual(bucket.get_tokens(), 1)
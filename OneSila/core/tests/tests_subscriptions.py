@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.test import TestCase, override_settings
+
+from core.schema.core.subscriptions.helpers import get_group, get_msg
+from core.schema.core.subscriptions.publishers import ModelInstanceSubscribePublisher
+from core.schema.core.subscriptions.receivers import (
+    publish_refresh_messages,
+    refresh_subscription_receiver,
+    subscription_refresh_buffer,
+)
+
+
+class Product(SimpleNamespace):
+    pass
+
+
+class SubscriptionRefreshTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        subscription_refresh_buffer.clear()
+        subscription_refresh_buffer.pending_flush = None
+        patcher = patch.object(ModelInstanceSubscribePublisher, 'publish')
+        self.publish = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_group_is_per_instance(self):
+        self.assertEqual(get_group(Product(pk=1, id=1)), 'Product_1')
+        self.assertEqual(get_msg(Product(pk=1, id=1)), {'type': 'Product_1'})
+
+    def test_refreshes_are_deduplicated_until_commit(self):
+        first, second = Product(pk=1, id=1), Product(pk=2, id=2)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for _ in range(3):
+                refresh_subscription_receiver(first)
+            refresh_subscription_receiver(second)
+
+            self.publish.assert_not_called()
+
+        self.assertEqual(len(callbacks), 1)
+        self.publish.assert_called_once_with(messages={
+            'Product_1': {'type': 'Product_1'},
+            'Product_2': {'type': 'Product_2'},
+        })
+
+    def test_refresh_after_rolled_back_savepoint_is_sent(self):
+        product = Product(pk=1, id=1)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    refresh_subscription_receiver(Product(pk=2, id=2))
+                    refresh_subscription_receiver(product)
+                    raise DatabaseError
+            except DatabaseError:
+                pass
+
+            refresh_subscription_receiver(product)
+
+        self.assertEqual(len(callbacks), 1)
+        self.publish.assert_called_once_with(messages={'Product_1': {'type': 'Product_1'}})
+
+    @override_settings(SUBSCRIPTION_REFRESH_DEBOUNCE_SECONDS=5)
+    @patch('core.tasks.core__subscriptions__publish_refresh_messages_task')
+    def test_debounce_sends_first_and_schedules_one_trailing_message(self, task):
+        messages = {'Product_1': {'type': 'Product_1'}}
+
+        for _ in range(3):
+            publish_refresh_messages(messages=messages)
+
+        self.publish.assert_called_once_with(messages=messages)
+        task.schedule.assert_called_once_with(kwargs={'messages': messages}, delay=5)
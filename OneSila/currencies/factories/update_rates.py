@@ -1,23 +1,43 @@
+from currencies.helpers import get_currency_converter, sort_currencies_by_inheritance
 from currencies.models import Currency
+from currencies.signals import exchange_rates_change
 
-from currency_converter import CurrencyConverter
+from currency_converter import RateNotFoundError
+from django.db import transaction
 from django.db.models import F
+from django.utils import timezone
+
+import logging
+logger = logging.getLogger(__name__)
 
 
 class UpdateCurrencyPairMixin:
     def __init__(self):
-        self.currency_converter = CurrencyConverter()
+        self.currency_converter = get_currency_converter()
 
-    def update_rate_pair(self, pair):
+    def get_official_rate(self, pair):
         from_iso = pair.inherits_from.iso_code
         to_iso = pair.iso_code
-        pair.set_exchange_rate_official(self.currency_converter.convert(1, from_iso, to_iso))
+        return self.currency_converter.convert(1, from_iso, to_iso)
+
+    def update_rate_pair(self, pair):
+        pair.set_exchange_rate_official(self.get_official_rate(pair))
 
 
 class UpdateOfficialRateFactory(UpdateCurrencyPairMixin):
     """
     This factory will update the official-rate on every configured currency pair.
+
+    All rates are computed in one pass, parents before the currencies inheriting from them, and written
+    with a single bulk update. The currencies following the official rate whose rate changed are then
+    announced with one exchange_rates_change so their prices get repriced in bulk.
     """
+    batch_size = 500
+
+    def __init__(self):
+        super().__init__()
+        self.updated_currencies = []
+        self.changed_rate_currencies = []
 
     def set_base_currency_queryset(self):
         # Why not filter on `follow_official_rate`?
@@ -26,15 +46,45 @@ class UpdateOfficialRateFactory(UpdateCurrencyPairMixin):
         self.base_currency_queryset = Currency.objects.\
             filter(
                 inherits_from__isnull=False
-            )
+            ).select_related('inherits_from')
 
     def update_all_rate_pairs(self):
-        for pair in self.base_currency_queryset.iterator():
-            self.update_rate_pair(pair)
+        now = timezone.now()
+
+        for pair in sort_currencies_by_inheritance(self.base_currency_queryset):
+            try:
+                new_rate = self.get_official_rate(pair)
+            except (ValueError, RateNotFoundError) as e:
+                logger.warning(f"Could not fetch the official rate for {pair.inherits_from.iso_code}->{pair.iso_code}: {e}")
+                continue
+
+            if pair.exchange_rate_official == new_rate:
+                continue
+
+            pair.exchange_rate_official = new_rate
+            pair.updated_at = now
+            self.updated_currencies.append(pair)
+
+            if pair.follow_official_rate:
+                self.changed_rate_currencies.append(pair)
+
+        with transaction.atomic():
+            Currency.objects.bulk_update(
+                self.updated_currencies,
+                ['exchange_rate_official', 'updated_at'],
+                batch_size=self.batch_size,
+            )
+
+        logger.info(f"Updated {len(self.updated_currencies)} official rates, {len(self.changed_rate_currencies)} currencies changed rate.")
+
+    def send_signals(self):
+        if self.changed_rate_currencies:
+            exchange_rates_change.send(sender=Currency, instances=self.changed_rate_currencies)
 
     def run(self):
         self.set_base_currency_queryset()
         self.update_all_rate_pairs()
+        self.send_signals()
 
 
 class UpdateSingleRate(UpdateCurrencyPairMixin):
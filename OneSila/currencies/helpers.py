@@ -1,5 +1,7 @@
 import math
+from collections import deque
 from decimal import Decimal
+from functools import lru_cache
 
 
 def roundup(x, ceil):
@@ -38,3 +40,44 @@ def currency_convert(round_prices_up_to, exchange_rate, price):
 
     new_price = Decimal(price) * Decimal(exchange_rate)
     return roundup(new_price, round_prices_up_to)
+
+
+@lru_cache(maxsize=None)
+def get_currency_converter():
+    '''
+    CurrencyConverter parses its bundled ECB dataset every time it is created,
+    so we keep a single instance per process.
+    '''
+    from currency_converter import CurrencyConverter
+    return CurrencyConverter()
+
+
+def sort_currencies_by_inheritance(currencies):
+    '''
+    Return the currencies ordered so every currency comes after the one it inherits from.
+    Parents outside of the given currencies are ignored and currencies stuck in an
+    inheritance loop are appended at the end.
+    '''
+    currencies = list(currencies)
+    by_id = {currency.id: currency for currency in currencies}
+    children = {}
+    roots = deque()
+
+    for currency in currencies:
+        parent_id = currency.inherits_from_id
+        if parent_id in by_id and parent_id != currency.id:
+            children.setdefault(parent_id, []).append(currency)
+        else:
+            roots.append(currency)
+
+    ordered = []
+    while roots:
+        currency = roots.popleft()
+        ordered.append(currency)
+        roots.extend(children.pop(currency.id, []))
+
+    if len(ordered) < len(currencies):
+        ordered_ids = {currency.id for currency in ordered}
+        ordered.extend(currency for currency in currencies if currency.id not in ordered_ids)
+
+    return ordered
@@ -3,3 +3,4 @@ from django.db.models.signals import ModelSignal
 
 
 exchange_rate_change = ModelSignal(use_caching=True)
+exchange_rates_change = ModelSignal(use_caching=True)
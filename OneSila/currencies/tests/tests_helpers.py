@@ -1,5 +1,7 @@
+from types import SimpleNamespace
+
 from core.tests import TestCase
-from currencies.helpers import currency_convert
+from currencies.helpers import currency_convert, get_currency_converter, sort_currencies_by_inheritance
 
 
 class CurrencyConvertTestCase(TestCase):
@@ -46,3 +48,27 @@ class CurrencyConvertTestCase(TestCase):
             2))
         expected_amount = 9.99
         self.assertEqual(new_amount, expected_amount)
+
+
+class SortCurrenciesByInheritanceTestCase(TestCase):
+    def test_parents_come_before_children(self):
+        grandchild = SimpleNamespace(id=3, inherits_from_id=2)
+        child = SimpleNamespace(id=2, inherits_from_id=1)
+        parent = SimpleNamespace(id=1, inherits_from_id=None)
+        orphan = SimpleNamespace(id=4, inherits_from_id=99)
+
+        ordered = sort_currencies_by_inheritance([grandchild, child, orphan, parent])
+        ids = [currency.id for currency in ordered]
+
+        self.assertEqual(sorted(ids), [1, 2, 3, 4])
+        self.assertLess(ids.index(1), ids.index(2))
+        self.assertLess(ids.index(2), ids.index(3))
+
+    def test_inheritance_loops_are_kept(self):
+        first = SimpleNamespace(id=1, inherits_from_id=2)
+        second = SimpleNamespace(id=2, inherits_from_id=1)
+
+        self.assertEqual(len(sort_currencies_by_inheritance([first, second])), 2)
+
+    def test_currency_converter_is_cached(self):
+        self.assertIs(get_currency_converter(), get_currency_converter())
@@ -0,0 +1,653 @@
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.utils.text import slugify
+
+from currencies.models import Currency
+from eancodes.models import EanCode
+from imports_exports.factories.properties import ImportProductPropertyInstance
+from products.models import Product, ProductTranslation
+from properties.models import Property, PropertyTranslation, PropertySelectValueTranslation, ProductProperty
+from sales_prices.models import SalesPrice
+from taxes.models import VatRate
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class BulkProductImport:
+    """
+    Import a chunk of structured product records with set-based reads and bulk writes.
+
+    Existing products, VAT rates, properties, select values, currencies, translations, EAN codes and
+    prices are resolved with one IN query each, then every model is written with bulk_create / bulk_update.
+    Only plain records are handled here: anything this class cannot reproduce exactly (variations, media,
+    rules, translated or multi-select properties, values that do not exist yet, update_only misses, ...)
+    is returned in `fallback_records` so the caller runs it through the regular ImportProductInstance.
+
+    Because bulk writes skip save(), no per object signal is sent. A single `products_batch_imported` signal
+    carries the created and updated objects once the whole chunk is stored, and the inspector, sales channel,
+    price, workflow and search receivers handle the chunk from it.
+    """
+    supported_keys = {
+        'sku', 'name', 'type', 'language', 'active', 'allow_backorder', 'vat_rate', 'use_vat_rate_name',
+        'ean_code', 'translations', 'prices', 'properties',
+    }
+    supported_types = [Product.SIMPLE, Product.CONFIGURABLE, Product.BUNDLE]
+    supported_translation_keys = {'name', 'language', 'subtitle', 'short_description', 'description', 'url_key'}
+    supported_price_keys = {'currency', 'price', 'rrp'}
+    supported_property_keys = {'property_data', 'value'}
+    supported_property_types = [
+        Property.TYPES.INT, Property.TYPES.FLOAT, Property.TYPES.BOOLEAN, Property.TYPES.DATE,
+        Property.TYPES.DATETIME, Property.TYPES.SELECT,
+    ]
+    product_fields = ['active', 'allow_backorder', 'vat_rate']
+    translation_fields = ['name', 'subtitle', 'short_description', 'description', 'url_key']
+    product_property_value_fields = ['value_boolean', 'value_int', 'value_float', 'value_date', 'value_datetime', 'value_select']
+
+    def __init__(self, records, import_process, language=None):
+        self.records = list(records)
+        self.import_process = import_process
+        self.multi_tenant_company = import_process.multi_tenant_company
+        self.language = language
+
+        self.create_only = import_process.create_only
+        self.update_only = import_process.update_only
+        self.override_only = import_process.override_only
+
+        self.batch_records = []
+        self.fallback_records = []
+        self.processed_records = []
+
+        self.products = {}
+        self.created_objects = []
+        self.updated_objects = []
+
+    # --------------------
+    # HELPERS
+    # --------------------
+    def _is_empty_value(self, value):
+        return value is None or (isinstance(value, str) and value == "")
+
+    def _should_skip_override(self, value):
+        return self.override_only and not self._is_empty_value(value)
+
+    def _update_fields(self, instance, values: dict) -> list:
+        changed = []
+        for field, value in values.items():
+            current = getattr(instance, field)
+            if self._should_skip_override(current):
+                continue
+            if current != value:
+                setattr(instance, field, value)
+                changed.append(field)
+        return changed
+
+    def get_record_language(self, record):
+        return self.language or record.get('language') or self.multi_tenant_company.language
+
+    def fallback(self, record):
+        self.fallback_records.append(record)
+
+    # --------------------
+    # SPLIT
+    # --------------------
+    def is_batchable(self, record) -> bool:
+        if not isinstance(record, dict) or not set(record) <= self.supported_keys:
+            return False
+
+        if not record.get('sku') or not isinstance(record['sku'], str) or record['sku'] != record['sku'].strip():
+            return False
+
+        if record.get('type', Product.SIMPLE) not in self.supported_types:
+            return False
+
+        for translation in record.get('translations') or []:
+            if not isinstance(translation, dict) or not set(translation) <= self.supported_translation_keys:
+                return False
+
+        for price in record.get('prices') or []:
+            if not isinstance(price, dict) or not set(price) <= self.supported_price_keys or not price.get('currency'):
+                return False
+
+        for product_property in record.get('properties') or []:
+            if not isinstance(product_property, dict) or not set(product_property) <= self.supported_property_keys:
+                return False
+
+            property_data = product_property.get('property_data')
+            if not isinstance(property_data, dict) or not property_data.get('name') or not set(property_data) <= {'name', 'type'}:
+                return False
+
+        return True
+
+    def split_records(self):
+        seen_skus = set()
+        for record in self.records:
+            if not self.is_batchable(record) or record['sku'] in seen_skus:
+                self.fallback(record)
+                continue
+
+            seen_skus.add(record['sku'])
+            self.batch_records.append(record)
+
+    def drop_records(self, records):
+        records = list(records)
+        if not records:
+            return
+
+        ids = {id(record) for record in records}
+        self.batch_records = [record for record in self.batch_records if id(record) not in ids]
+        self.fallback_records.extend(records)
+
+    # --------------------
+    # RESOLVE
+    # --------------------
+    def resolve_products(self):
+        skus = [record['sku'] for record in self.batch_records]
+        self.products = {
+            product.sku: product
+            for product in Product.objects.filter(multi_tenant_company=self.multi_tenant_company, sku__in=skus)
+        }
+
+        # Type changes and update_only misses are reported by the regular import.
+        self.drop_records(
+            record for record in self.batch_records
+            if (record['sku'] in self.products and self.products[record['sku']].type != record.get('type', Product.SIMPLE))
+            or (self.update_only and record['sku'] not in self.products)
+        )
+
+    def resolve_vat_rates(self):
+        rates, names = set(), set()
+        for record in self.batch_records:
+            if record.get('vat_rate') is None:
+                continue
+            if record.get('use_vat_rate_name'):
+                names.add(record['vat_rate'])
+            else:
+                try:
+                    rates.add(int(record['vat_rate']))
+                except (TypeError, ValueError):
+                    self.drop_records([record])
+
+        qs = VatRate.objects.filter(multi_tenant_company=self.multi_tenant_company)
+        self.vat_rates_by_rate = {vat_rate.rate: vat_rate for vat_rate in qs.filter(rate__in=rates).order_by('-id')}
+        self.vat_rates_by_name = {vat_rate.name: vat_rate for vat_rate in qs.filter(name__in=names).order_by('-id')}
+
+        for rate in rates - set(self.vat_rates_by_rate):
+            self.vat_rates_by_rate[rate], _ = VatRate.objects.get_or_create(multi_tenant_company=self.multi_tenant_company, rate=rate)
+        for name in names - set(self.vat_rates_by_name):
+            self.vat_rates_by_name[name], _ = VatRate.objects.get_or_create(multi_tenant_company=self.multi_tenant_company, name=name)
+
+    def get_vat_rate(self, record):
+        if record.get('use_vat_rate_name'):
+            return self.vat_rates_by_name[record['vat_rate']]
+        return self.vat_rates_by_rate[int(record['vat_rate'])]
+
+    def resolve_currencies(self):
+        iso_codes = {price['currency'] for record in self.batch_records for price in record.get('prices') or []}
+        self.currencies = {}
+        for currency in Currency.objects.filter(multi_tenant_company=self.multi_tenant_company, iso_code__in=iso_codes).order_by('-id'):
+            self.currencies[currency.iso_code] = currency
+
+        # Unknown currencies are validated and created by the regular import.
+        self.drop_records(
+            record for record in self.batch_records
+            if any(price['currency'] not in self.currencies for price in record.get('prices') or [])
+        )
+
+    def resolve_properties(self):
+        names = {
+            product_property['property_data']['name']
+            for record in self.batch_records
+            for product_property in record.get('properties') or []
+        }
+
+        self.properties = {}
+        translations = PropertyTranslation.objects.filter(
+            multi_tenant_company=self.multi_tenant_company,
+            name__in=names,
+        ).select_related('property').order_by('-id')
+        for translation in translations:
+            self.properties[translation.name] = translation.property
+
+        def is_resolved(product_property):
+            property_data = product_property['property_data']
+            property_instance = self.properties.get(property_data['name'])
+            if property_instance is None or property_instance.is_product_type:
+                return False
+            if property_instance.type not in self.supported_property_types:
+                return False
+            return property_data.get('type') in (None, property_instance.type)
+
+        self.drop_records(
+            record for record in self.batch_records
+            if not all(is_resolved(product_property) for product_property in record.get('properties') or [])
+        )
+
+    def resolve_select_values(self):
+        wanted = set()
+        for record in self.batch_records:
+            for product_property in record.get('properties') or []:
+                property_instance = self.properties[product_property['property_data']['name']]
+                if property_instance.type == Property.TYPES.SELECT:
+                    wanted.add((property_instance.id, product_property['value']))
+
+        self.select_values = {}
+        translations = PropertySelectValueTranslation.objects.filter(
+            multi_tenant_company=self.multi_tenant_company,
+            propertyselectvalue__property_id__in={property_id for property_id, _ in wanted},
+            value__in={value for _, value in wanted},
+        ).select_related('propertyselectvalue').order_by('-id')
+        for translation in translations:
+            self.select_values[(translation.propertyselectvalue.property_id, translation.value)] = translation.propertyselectvalue
+
+        # Missing select values are created (and translated) by the regular import.
+        self.drop_records(
+            record for record in self.batch_records
+            if any(
+                self.properties[product_property['property_data']['name']].type == Property.TYPES.SELECT and
+                (self.properties[product_property['property_data']['name']].id, product_property['value']) not in self.select_values
+                for product_property in record.get('properties') or []
+            )
+        )
+
+    def get_property_values(self, property_instance, value) -> dict:
+        coercer = ProductPropertyValueCoercer(property_instance=property_instance, value=value)
+        coercer.set_value()
+
+        values = {field: getattr(coercer, field) for field in self.product_property_value_fields}
+
+        if property_instance.type == Property.TYPES.SELECT:
+            values['value_select'] = self.select_values[(property_instance.id, value)]
+
+        return {field: values[field] for field in self.product_property_value_fields if values[field] is not None}
+
+    def validate_values(self):
+        invalid = []
+        for record in self.batch_records:
+            try:
+                for product_property in record.get('properties') or []:
+                    self.get_property_values(self.properties[product_property['property_data']['name']], product_property['value'])
+                for price in record.get('prices') or []:
+                    self.get_price_values(price)
+                if record['sku'] in self.products and any('name' not in translation for translation in self.get_record_translations(record)):
+                    # ImportProductTranslationInstance requires a name when updating.
+                    raise ValueError("The 'name' field is required.")
+            except (TypeError, ValueError, InvalidOperation):
+                invalid.append(record)
+
+        # The regular import raises (and reports) the exact error for these records.
+        self.drop_records(invalid)
+
+    # --------------------
+    # PRODUCTS
+    # --------------------
+    def get_product_values(self, record) -> dict:
+        values = {}
+        for field in ['active', 'allow_backorder']:
+            if field in record:
+                values[field] = record[field]
+        if 'vat_rate' in record:
+            values['vat_rate'] = self.get_vat_rate(record) if record['vat_rate'] is not None else None
+        return values
+
+    def save_products(self):
+        new_products, changed_products, changed_fields = [], [], set()
+
+        for record in self.batch_records:
+            product = self.products.get(record['sku'])
+            values = self.get_product_values(record)
+
+            if product is None:
+                product = Product(
+                    multi_tenant_company=self.multi_tenant_company,
+                    sku=record['sku'],
+                    type=record.get('type', Product.SIMPLE),
+                    **values,
+                )
+                product._batch_created = True
+                new_products.append(product)
+                self.products[record['sku']] = product
+                continue
+
+            product._batch_created = False
+            if self.create_only:
+                continue
+
+            fields = self._update_fields(product, values)
+            if fields:
+                changed_fields.update(fields)
+                changed_products.append(product)
+
+        Product.objects.bulk_create(new_products)
+        if changed_products:
+            Product.objects.bulk_update(changed_products, [*changed_fields, 'updated_at'])
+
+        self.created_objects.extend(new_products)
+        self.updated_objects.extend(changed_products)
+
+    def get_processable_records(self):
+        """Existing products in create_only mode are left untouched, like ImportProductInstance does."""
+        return [record for record in self.batch_records if not (self.create_only and not self.products[record['sku']]._batch_created)]
+
+    # --------------------
+    # TRANSLATIONS
+    # --------------------
+    def get_record_translations(self, record):
+        translations = record.get('translations') or []
+        if not translations and record.get('name'):
+            translations = [{'name': record['name']}]
+
+        language = self.get_record_language(record)
+        return [{**translation, 'language': translation.get('language') or language} for translation in translations]
+
+    def save_translations(self):
+        records = self.get_processable_records()
+        product_ids = [self.products[record['sku']].id for record in records]
+
+        existing = {
+            (translation.product_id, translation.language): translation
+            for translation in ProductTranslation.objects.filter(
+                multi_tenant_company=self.multi_tenant_company,
+                product_id__in=product_ids,
+                sales_channel__isnull=True,
+            )
+        }
+
+        new_translations, changed_translations, changed_fields = [], [], set()
+        pending_url_keys = []
+
+        for record in records:
+            product = self.products[record['sku']]
+            for translation in self.get_record_translations(record):
+                if product._batch_created:
+                    values = {
+                        'name': translation.get('name') or record.get('name') or 'Unnamed',
+                        'short_description': translation.get('short_description'),
+                        'description': translation.get('description'),
+                        'url_key': translation.get('url_key'),
+                    }
+                else:
+                    values = {field: translation[field] for field in self.translation_fields if field in translation}
+
+                key = (product.id, translation['language'])
+                instance = existing.get(key)
+                if instance is None:
+                    instance = ProductTranslation(
+                        multi_tenant_company=self.multi_tenant_company,
+                        product=product,
+                        language=translation['language'],
+                        sales_channel=None,
+                        **values,
+                    )
+                    existing[key] = instance
+                    new_translations.append(instance)
+                    pending_url_keys.append(instance)
+                    continue
+
+                fields = self._update_fields(instance, values)
+                if fields:
+                    if instance not in changed_translations:
+                        changed_translations.append(instance)
+                    changed_fields.update(fields)
+                    if not instance.url_key:
+                        pending_url_keys.append(instance)
+                        changed_fields.add('url_key')
+
+        self.set_default_url_keys(pending_url_keys)
+
+        ProductTranslation.objects.bulk_create(new_translations)
+        if changed_translations:
+            ProductTranslation.objects.bulk_update(changed_translations, [*changed_fields, 'updated_at'])
+
+        self.created_objects.extend(new_translations)
+        self.updated_objects.extend(changed_translations)
+
+    def set_default_url_keys(self, translations):
+        """Same default as ProductTranslation.save(), with the collision check done in one query."""
+        translations = [translation for translation in translations if not translation.url_key]
+        candidates = {translation: slugify(translation.name) for translation in translations}
+
+        taken = set(
+            ProductTranslation.objects.filter(
+                multi_tenant_company=self.multi_tenant_company,
+                url_key__in=set(candidates.values()),
+            ).values_list('url_key', flat=True)
+        )
+
+        for translation, url_key in candidates.items():
+            if url_key in taken:
+                url_key += f'-{translation.product.sku}-{translation.language}'
+            translation.url_key = url_key
+            taken.add(url_key)
+
+    # --------------------
+    # EAN CODES
+    # --------------------
+    def save_ean_codes(self):
+        records = [
+            record for record in self.get_processable_records()
+            if record.get('ean_code') and record.get('type', Product.SIMPLE) == Product.SIMPLE
+        ]
+        if not records:
+            return
+
+        product_ids = [self.products[record['sku']].id for record in records]
+        by_product = {
+            ean.product_id: ean
+            for ean in EanCode.objects.filter(multi_tenant_company=self.multi_tenant_company, product_id__in=product_ids)
+        }
+        by_code = {
+            ean.ean_code: ean
+            for ean in EanCode.objects.filter(
+                multi_tenant_company=self.multi_tenant_company,
+                ean_code__in=[record['ean_code'] for record in records],
+            )
+        }
+
+        new_eans, changed_eans = [], []
+        for record in records:
+            product = self.products[record['sku']]
+            ean = by_product.get(product.id)
+
+            if ean is not None and self.override_only:
+                continue
+
+            if ean is None:
+                ean = by_code.get(record['ean_code'])
+                if ean is not None:
+                    ean.product = product
+                else:
+                    ean = EanCode(multi_tenant_company=self.multi_tenant_company, product=product, ean_code=record['ean_code'])
+                    by_code[record['ean_code']] = ean
+                    new_eans.append(ean)
+            else:
+                ean.ean_code = record['ean_code']
+
+            ean.already_used = True
+            ean.internal = False
+            if ean not in new_eans and ean not in changed_eans:
+                changed_eans.append(ean)
+
+        EanCode.objects.bulk_create(new_eans)
+        if changed_eans:
+            EanCode.objects.bulk_update(changed_eans, ['product', 'ean_code', 'already_used', 'internal', 'updated_at'])
+
+        self.created_objects.extend(new_eans)
+        self.updated_objects.extend(changed_eans)
+
+    # --------------------
+    # PRICES
+    # --------------------
+    def get_price_values(self, price) -> dict:
+        """Same normalisation as ImportSalesPriceInstance: a single value is the price, rrp is the higher one."""
+        rrp = Decimal(price['rrp']) if price.get('rrp') is not None else None
+        value = Decimal(price['price']) if price.get('price') is not None else None
+
+        if rrp is None and value is None:
+            raise ValueError("Both 'rrp' and 'price' cannot be None.")
+
+        if value is None:
+            return {'price': rrp, 'rrp': None}
+        if rrp is not None and rrp < value:
+            return {'price': rrp, 'rrp': value}
+        return {'price': value, 'rrp': rrp}
+
+    def save_prices(self):
+        records = [record for record in self.get_processable_records() if record.get('prices')]
+        if not records:
+            return
+
+        existing = {
+            (sales_price.product_id, sales_price.currency_id): sales_price
+            for sales_price in SalesPrice.objects.filter(
+                multi_tenant_company=self.multi_tenant_company,
+                product_id__in=[self.products[record['sku']].id for record in records],
+            )
+        }
+
+        new_prices, changed_prices = [], []
+        for record in records:
+            product = self.products[record['sku']]
+            for price in record['prices']:
+                values = self.get_price_values(price)
+                if values['price'] == 0:
+                    continue
+
+                currency = self.currencies[price['currency']]
+                sales_price = existing.get((product.id, currency.id))
+                if sales_price is None:
+                    sales_price = SalesPrice(multi_tenant_company=self.multi_tenant_company, product=product, currency=currency, **values)
+                    existing[(product.id, currency.id)] = sales_price
+                    new_prices.append(sales_price)
+                elif self._update_fields(sales_price, values) and sales_price not in changed_prices and sales_price not in new_prices:
+                    changed_prices.append(sales_price)
+
+        SalesPrice.objects.bulk_create(new_prices)
+        if changed_prices:
+            SalesPrice.objects.bulk_update(changed_prices, ['price', 'rrp', 'updated_at'])
+
+        self.created_objects.extend(new_prices)
+        self.updated_objects.extend(changed_prices)
+
+    # --------------------
+    # PROPERTIES
+    # --------------------
+    def save_product_properties(self):
+        records = [
+            record for record in self.get_processable_records()
+            if record.get('properties') and record.get('type', Product.SIMPLE) in [Product.SIMPLE, Product.BUNDLE]
+        ]
+        if not records:
+            return
+
+        existing = {
+            (product_property.product_id, product_property.property_id): product_property
+            for product_property in ProductProperty.objects.filter(
+                multi_tenant_company=self.multi_tenant_company,
+                product_id__in=[self.products[record['sku']].id for record in records],
+                property_id__in={prop.id for prop in self.properties.values()},
+            )
+        }
+
+        new_product_properties, changed_product_properties, changed_fields = [], [], set()
+        for record in records:
+            product = self.products[record['sku']]
+            for product_property_data in record['properties']:
+                property_instance = self.properties[product_property_data['property_data']['name']]
+                values = self.get_property_values(property_instance, product_property_data['value'])
+
+                key = (product.id, property_instance.id)
+                product_property = existing.get(key)
+                if product_property is None:
+                    product_property = ProductProperty(
+                        multi_tenant_company=self.multi_tenant_company,
+                        product=product,
+                        property=property_instance,
+                        **values,
+                    )
+                    existing[key] = product_property
+                    new_product_properties.append(product_property)
+                    continue
+
+                fields = self._update_fields(product_property, values)
+                if fields and product_property not in new_product_properties:
+                    changed_fields.update(fields)
+                    if product_property not in changed_product_properties:
+                        changed_product_properties.append(product_property)
+
+        ProductProperty.objects.bulk_create(new_product_properties)
+        if changed_product_properties:
+            ProductProperty.objects.bulk_update(changed_product_properties, [*changed_fields, 'updated_at'])
+
+        self.created_objects.extend(new_product_properties)
+        self.updated_objects.extend(changed_product_properties)
+
+    # --------------------
+    # SIGNALS
+    # --------------------
+    def send_signals(self):
+        from imports_exports.signals import products_batch_imported
+
+        created_product_ids = {obj.id for obj in self.created_objects if isinstance(obj, Product)}
+        touched_product_ids = {
+            obj.id if isinstance(obj, Product) else obj.product_id
+            for obj in [*self.created_objects, *self.updated_objects]
+        }
+
+        products_batch_imported.send(
+            sender=self.import_process.__class__,
+            instance=self.import_process,
+            product_ids=[self.products[record['sku']].id for record in self.batch_records],
+            created_product_ids=list(created_product_ids),
+            updated_product_ids=list(touched_product_ids - created_product_ids),
+            created_objects=self.created_objects,
+            updated_objects=self.updated_objects,
+        )
+
+    def save(self):
+        with transaction.atomic():
+            self.save_products()
+            self.save_translations()
+            self.save_ean_codes()
+            self.save_prices()
+            self.save_product_properties()
+
+        self.send_signals()
+        self.processed_records = list(self.batch_records)
+
+    def run(self):
+        self.split_records()
+        if not self.batch_records:
+            return
+
+        self.resolve_products()
+        self.resolve_vat_rates()
+        self.resolve_currencies()
+        self.resolve_properties()
+        self.resolve_select_values()
+        self.validate_values()
+
+        if self.batch_records:
+            self.save()
+
+
+class ProductPropertyValueCoercer(ImportProductPropertyInstance):
+    """
+    Reuses ImportProductPropertyInstance.set_value() to coerce a raw value for a known property,
+    so the batch path converts INT / FLOAT / BOOLEAN / DATE values exactly like the regular import.
+    Select values are resolved by the batch itself, value_select is never looked up here.
+    """
+
+    def __init__(self, *, property_instance, value):
+        self.property = property_instance
+        self.value = value
+        self.value_is_id = False
+
+        for field in BulkProductImport.product_property_value_fields:
+            setattr(self, field, None)
+
+    def set_value(self):
+        if self.property.type == Property.TYPES.SELECT:
+            return
+        super().set_value()
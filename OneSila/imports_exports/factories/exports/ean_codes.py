@@ -28,7 +28,7 @@ class EanCodesExportFactory(AbstractExportFactory):
 
         return queryset.order_by("id")
 
-    def get_payload(self):
+    def iter_payload(self):
         include_product_sku = self.include_column(key="product_sku") or to_bool(
             value=self.get_parameter(key="add_product_sku"),
             default=True,
@@ -36,13 +36,11 @@ class EanCodesExportFactory(AbstractExportFactory):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
 
-        payload = []
         for index, ean_code in enumerate(self.iterate_queryset(queryset=queryset), start=1):
             row = {
                 "ean_code": ean_code.ean_code,
             }
             if include_product_sku and ean_code.product_id:
                 row["product_sku"] = ean_code.product.sku
-            payload.append(row)
+            yield row
             self.update_progress(processed=index, total_records=total_records)
-        return payload
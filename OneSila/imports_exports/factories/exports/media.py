@@ -53,7 +53,7 @@ class BaseMediaExportFactory(AbstractExportFactory):
     def build_media_payload(self, *, assignment):
         raise NotImplementedError
 
-    def get_payload(self):
+    def iter_payload(self):
         include_product_sku = self.include_column(key="product_sku") or to_bool(
             value=self.get_parameter(key="add_product_sku"),
         )
@@ -67,7 +67,6 @@ class BaseMediaExportFactory(AbstractExportFactory):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
 
-        payload = []
         for index, assignment in enumerate(self.iterate_queryset(queryset=queryset), start=1):
             media = assignment.media
             row = self.build_media_payload(assignment=assignment)
@@ -86,11 +85,9 @@ class BaseMediaExportFactory(AbstractExportFactory):
             if self.include_column(key="sort_order"):
                 row["sort_order"] = assignment.sort_order
 
-            payload.append(row)
+            yield row
             self.update_progress(processed=index, total_records=total_records)
 
-        return payload
-
 
 class ImagesExportFactory(BaseMediaExportFactory):
     kind = "images"
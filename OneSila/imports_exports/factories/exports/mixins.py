@@ -78,9 +78,26 @@ class AbstractExportFactory(abc.ABC):
         data = self.get_payload()
         return ensure_serializable(data)
 
-    @abc.abstractmethod
+    def iter_payload_rows(self):
+        """Serializable rows one by one, so writers never hold the whole payload in memory."""
+        for row in self.iter_payload():
+            yield ensure_serializable(row)
+
     def get_payload(self):
-        raise NotImplementedError
+        return list(self.iter_payload())
+
+    def iter_payload(self):
+        """
+        The export rows one by one. Factories that build the whole payload in get_payload() are served from it.
+        """
+        if type(self).get_payload is AbstractExportFactory.get_payload:
+            raise NotImplementedError(f"{type(self).__name__} must implement iter_payload() or get_payload().")
+
+        payload = self.get_payload()
+        if isinstance(payload, dict):
+            yield payload
+        else:
+            yield from payload or []
 
     def get_total_records(self, *, payload):
         if self._tracked_total_records is not None:
@@ -195,6 +212,15 @@ class ExportRunner:
     def __init__(self, *, export_process):
         self.export_process = export_process
 
+    def iter_rows(self, *, factory):
+        export_process = self.export_process
+        yield from factory.iter_payload_rows()
+
+        # Every row has been built, only the file itself remains to be written.
+        export_process.total_records = factory.get_total_records(payload=None)
+        export_process.percentage = max(export_process.percentage, 90)
+        export_process.save(update_fields=["total_records", "percentage"])
+
     def run(self):
         from imports_exports.factories.exports.registry import get_export_factory
 
@@ -215,14 +241,9 @@ class ExportRunner:
             factory_class = get_export_factory(kind=export_process.kind)
             factory = factory_class(export_process=export_process)
             factory.validate_periodic_record_limit()
-            raw_data = factory.build_payload()
-
-            export_process.total_records = factory.get_total_records(payload=raw_data)
-            export_process.percentage = max(export_process.percentage, 90)
-            export_process.raw_data = []
-            export_process.save(update_fields=["raw_data", "total_records", "percentage"])
 
-            export_process.generate_file(raw_data=raw_data)
+            # Rows are serialized while the file is written, so the file is generated from the row iterator.
+            export_process.generate_file(raw_data=self.iter_rows(factory=factory))
 
             update_fields = ["status", "percentage", "raw_data", "total_records", "error_traceback"]
             if export_process.file:
@@ -55,12 +55,15 @@ class ProductPropertiesExportFactory(AbstractExportFactory):
 
         return queryset.order_by("id")
 
-    def build_rule_cache(self, *, products):
-        product_type_ids = set()
-        for product in products:
-            for product_property in product.productproperty_set.all():
-                if product_property.property.is_product_type and product_property.value_select_id:
-                    product_type_ids.add(product_property.value_select_id)
+    def build_rule_cache(self, *, queryset):
+        product_type_ids = set(
+            ProductProperty.objects.filter(
+                multi_tenant_company=self.multi_tenant_company,
+                product__in=queryset.values("id"),
+                property__is_product_type=True,
+                value_select_id__isnull=False,
+            ).values_list("value_select_id", flat=True).distinct()
+        )
 
         if not product_type_ids:
             return {}
@@ -152,16 +155,14 @@ class ProductPropertiesExportFactory(AbstractExportFactory):
 
         return payload
 
-    def get_payload(self):
+    def iter_payload(self):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
-        products = list(self.iterate_queryset(queryset=queryset))
-        rule_cache = self.build_rule_cache(products=products)
+        rule_cache = self.build_rule_cache(queryset=queryset)
         include_product_data = self.include_column(key="product_data")
         include_product_sku = self.include_column(key="product_sku")
 
-        payload = []
-        for index, product in enumerate(products, start=1):
+        for index, product in enumerate(self.iterate_queryset(queryset=queryset), start=1):
             row = {}
             if include_product_data:
                 row["product_data"] = build_product_stub(product=product)
@@ -172,6 +173,5 @@ class ProductPropertiesExportFactory(AbstractExportFactory):
                     product=product,
                     rule=self.get_product_rule(product=product, rule_cache=rule_cache),
                 )
-            payload.append(row)
+            yield row
             self.update_progress(processed=index, total_records=total_records)
-        return payload
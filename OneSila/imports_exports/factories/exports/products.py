@@ -666,17 +666,13 @@ class ProductsExportFactory(AbstractExportFactory):
 
         return row
 
-    def get_payload(self):
+    def iter_payload(self):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
         rule_cache = self.build_rule_cache(queryset=queryset)
-        payload = []
         for index, product in enumerate(self.iterate_queryset(queryset=queryset), start=1):
-            payload.append(
-                self.serialize_product(
-                    product=product,
-                    rule=self.get_product_rule(product=product, rule_cache=rule_cache),
-                )
+            yield self.serialize_product(
+                product=product,
+                rule=self.get_product_rule(product=product, rule_cache=rule_cache),
             )
             self.update_progress(processed=index, total_records=total_records)
-        return payload
@@ -98,16 +98,12 @@ class PropertiesExportFactory(AbstractExportFactory):
 
         return payload
 
-    def get_payload(self):
+    def iter_payload(self):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
-        payload = []
         for index, property_instance in enumerate(self.iterate_queryset(queryset=queryset), start=1):
-            payload.append(
-                self.serialize_property(property_instance=property_instance)
-            )
+            yield self.serialize_property(property_instance=property_instance)
             self.update_progress(processed=index, total_records=total_records)
-        return payload
 
 
 class PropertySelectValuesExportFactory(AbstractExportFactory):
@@ -143,7 +139,7 @@ class PropertySelectValuesExportFactory(AbstractExportFactory):
 
         return queryset.order_by("property_id", "id")
 
-    def get_payload(self):
+    def iter_payload(self):
         include_translations = self.include_column(key="translations")
         include_property_data = self.include_column(key="property_data")
         values_are_ids = to_bool(
@@ -152,20 +148,16 @@ class PropertySelectValuesExportFactory(AbstractExportFactory):
         )
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
-        payload = []
         for index, select_value in enumerate(self.iterate_queryset(queryset=queryset), start=1):
-            payload.append(
-                serialize_property_select_value_data(
-                    select_value=select_value,
-                    language=self.language,
-                    values_are_ids=values_are_ids,
-                    include_translations=include_translations,
-                    include_property_data=include_property_data,
-                    include_id=self.include_column(key="id"),
-                )
+            yield serialize_property_select_value_data(
+                select_value=select_value,
+                language=self.language,
+                values_are_ids=values_are_ids,
+                include_translations=include_translations,
+                include_property_data=include_property_data,
+                include_id=self.include_column(key="id"),
             )
             self.update_progress(processed=index, total_records=total_records)
-        return payload
 
 
 class RulesExportFactory(AbstractExportFactory):
@@ -210,10 +202,9 @@ class RulesExportFactory(AbstractExportFactory):
         )
         return payload
 
-    def get_payload(self):
+    def iter_payload(self):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
-        payload = []
         for index, rule in enumerate(self.iterate_queryset(queryset=queryset), start=1):
             row = {
                 "value": get_select_value_label(
@@ -228,6 +219,5 @@ class RulesExportFactory(AbstractExportFactory):
                     self.serialize_item(item=item)
                     for item in rule.items.all()
                 ]
-            payload.append(row)
+            yield row
             self.update_progress(processed=index, total_records=total_records)
-        return payload
@@ -45,7 +45,7 @@ class SalesPricesExportFactory(AbstractExportFactory):
 
         return queryset.order_by("product_id", "currency__iso_code")
 
-    def get_payload(self):
+    def iter_payload(self):
         include_product_sku = self.include_column(key="product_sku") or to_bool(
             value=self.get_parameter(key="add_product_sku"),
         )
@@ -53,7 +53,6 @@ class SalesPricesExportFactory(AbstractExportFactory):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
 
-        payload = []
         for index, sales_price in enumerate(self.iterate_queryset(queryset=queryset), start=1):
             row = {
                 "currency": sales_price.currency.iso_code,
@@ -66,9 +65,8 @@ class SalesPricesExportFactory(AbstractExportFactory):
                 row["product_data"] = build_product_stub(product=sales_price.product)
             if include_product_sku:
                 row["product_sku"] = sales_price.product.sku
-            payload.append(row)
+            yield row
             self.update_progress(processed=index, total_records=total_records)
-        return payload
 
 
 class PriceListsExportFactory(AbstractExportFactory):
@@ -119,10 +117,9 @@ class PriceListsExportFactory(AbstractExportFactory):
             "discount_override": item.discount_override,
         }
 
-    def get_payload(self):
+    def iter_payload(self):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
-        payload = []
         for index, sales_pricelist in enumerate(self.iterate_queryset(queryset=queryset), start=1):
             row = {
                 "name": sales_pricelist.name,
@@ -149,9 +146,8 @@ class PriceListsExportFactory(AbstractExportFactory):
                     self.serialize_item(item=item)
                     for item in sales_pricelist.salespricelistitem_set.all()
                 ]
-            payload.append(row)
+            yield row
             self.update_progress(processed=index, total_records=total_records)
-        return payload
 
 
 class PriceListPricesExportFactory(AbstractExportFactory):
@@ -194,7 +190,7 @@ class PriceListPricesExportFactory(AbstractExportFactory):
             queryset = queryset.filter(salespricelist_id__in=sales_pricelist_ids)
         return queryset.order_by("salespricelist_id", "product_id")
 
-    def get_payload(self):
+    def iter_payload(self):
         include_product_sku = self.include_column(key="product_sku") or to_bool(
             value=self.get_parameter(key="add_product_sku"),
         )
@@ -202,7 +198,6 @@ class PriceListPricesExportFactory(AbstractExportFactory):
         queryset = self.get_queryset()
         total_records = self.track_queryset(queryset=queryset)
 
-        payload = []
         for index, item in enumerate(self.iterate_queryset(queryset=queryset), start=1):
             row = {}
             if self.include_column(key="price_auto"):
@@ -223,7 +218,5 @@ class PriceListPricesExportFactory(AbstractExportFactory):
                 )
             if include_sales_pricelist_name:
                 row["salespricelist_name"] = item.salespricelist.name
-            payload.append(row)
+            yield row
             self.update_progress(processed=index, total_records=total_records)
-        return payload
-
@@ -1,8 +1,8 @@
-import copy
 import csv
 import json
+import tempfile
 from collections import OrderedDict
-from io import BytesIO, StringIO
+from io import BytesIO, TextIOWrapper
 
 from openpyxl import Workbook
 
@@ -89,17 +89,20 @@ def _serialize_cell_value(*, value):
 
 
 class TabularExportBuilder:
+    """
+    Flattens export records into rows with one column per header.
+
+    raw_data can be a list, a single record or any iterable (e.g. AbstractExportFactory.iter_payload_rows()).
+    The write_* methods never keep the rows in memory: the first pass flattens every record, collects the
+    headers and spools the rows to a temporary JSON-lines file, the second pass writes them to the target.
+    """
+
     def __init__(self, *, export_process, raw_data=None):
         self.export_process = export_process
         self.kind = export_process.kind
-        source_data = export_process.raw_data if raw_data is None else raw_data
-        self.raw_data = ensure_serializable(source_data)
-
-    def build(self):
-        headers = []
-        seen_headers = set()
-        row_maps = []
+        self.raw_data = export_process.raw_data if raw_data is None else raw_data
 
+    def iter_rows(self):
         for record in self._normalize_records():
             for expanded_record in self._expand_record(record=record):
                 row = OrderedDict()
@@ -108,53 +111,96 @@ class TabularExportBuilder:
                     mapping=expanded_record,
                     row=row,
                 )
-                row_maps.append(row)
-                for header in row.keys():
-                    if header in seen_headers:
-                        continue
-                    seen_headers.add(header)
-                    headers.append(header)
+                yield row
+
+    def _add_headers(self, *, row, headers, seen_headers):
+        for header in row.keys():
+            if header in seen_headers:
+                continue
+            seen_headers.add(header)
+            headers.append(header)
+
+    def build(self):
+        headers = []
+        seen_headers = set()
+        row_maps = []
+
+        for row in self.iter_rows():
+            row_maps.append(row)
+            self._add_headers(row=row, headers=headers, seen_headers=seen_headers)
 
         return headers, row_maps
 
+    def spool_rows(self, *, spool):
+        headers = []
+        seen_headers = set()
+
+        for row in self.iter_rows():
+            self._add_headers(row=row, headers=headers, seen_headers=seen_headers)
+            spool.write(json.dumps(row, ensure_ascii=False))
+            spool.write("\n")
+
+        spool.seek(0)
+        return headers
+
+    def iter_spooled_rows(self, *, spool, headers):
+        for line in spool:
+            row = json.loads(line)
+            yield [_serialize_cell_value(value=row.get(header)) for header in headers]
+
+    def write_csv(self, *, target):
+        """Write the CSV export to the binary file-like `target`."""
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as spool:
+            headers = self.spool_rows(spool=spool)
+
+            stream = TextIOWrapper(target, encoding="utf-8-sig", newline="")
+            try:
+                writer = csv.writer(stream)
+                writer.writerow(headers)
+                writer.writerows(self.iter_spooled_rows(spool=spool, headers=headers))
+            finally:
+                stream.flush()
+                stream.detach()
+
+    def write_excel(self, *, target):
+        """Write the XLSX export to the binary file-like `target` with a write-only workbook."""
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as spool:
+            headers = self.spool_rows(spool=spool)
+
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet(title=self.kind[:31] or "export")
+            worksheet.append(headers)
+            for row in self.iter_spooled_rows(spool=spool, headers=headers):
+                worksheet.append(row)
+            workbook.save(target)
+
     def to_csv_bytes(self):
-        headers, row_maps = self.build()
-        stream = StringIO()
-        writer = csv.writer(stream)
-        writer.writerow(headers)
-        for row in row_maps:
-            writer.writerow(
-                [_serialize_cell_value(value=row.get(header)) for header in headers]
-            )
-        return stream.getvalue().encode("utf-8-sig")
+        output = BytesIO()
+        self.write_csv(target=output)
+        return output.getvalue()
 
     def to_excel_bytes(self):
-        headers, row_maps = self.build()
-        workbook = Workbook()
-        worksheet = workbook.active
-        worksheet.title = self.kind[:31] or "export"
-        worksheet.append(headers)
-        for row in row_maps:
-            worksheet.append(
-                [_serialize_cell_value(value=row.get(header)) for header in headers]
-            )
-
         output = BytesIO()
-        workbook.save(output)
+        self.write_excel(target=output)
         return output.getvalue()
 
     def _normalize_records(self):
-        if isinstance(self.raw_data, list):
-            return self.raw_data
         if isinstance(self.raw_data, dict):
-            return [self.raw_data]
-        return []
+            return [ensure_serializable(self.raw_data)]
+        if isinstance(self.raw_data, (str, bytes)) or self.raw_data is None:
+            return []
+        try:
+            records = iter(self.raw_data)
+        except TypeError:
+            return []
+        return (ensure_serializable(record) for record in records)
 
     def _expand_record(self, *, record):
         if self.kind != "products" or not isinstance(record, dict):
             return [record]
 
-        base_record = copy.deepcopy(record)
+        # Records are fresh copies from ensure_serializable, only the keys that change need a new dict.
+        base_record = dict(record)
         expanded_rows = []
 
         variation_collections = {
@@ -168,7 +214,7 @@ class TabularExportBuilder:
             for item in variation_collections.get(collection_key) or []:
                 if not isinstance(item, dict):
                     continue
-                variation_data = copy.deepcopy(item.get("variation_data") or {})
+                variation_data = dict(item.get("variation_data") or {})
                 if not variation_data:
                     continue
 
@@ -356,3 +402,11 @@ def build_csv_export_content(*, export_process, raw_data=None):
 
 def build_excel_export_content(*, export_process, raw_data=None):
     return TabularExportBuilder(export_process=export_process, raw_data=raw_data).to_excel_bytes()
+
+
+def write_csv_export(*, export_process, target, raw_data=None):
+    TabularExportBuilder(export_process=export_process, raw_data=raw_data).write_csv(target=target)
+
+
+def write_excel_export(*, export_process, target, raw_data=None):
+    TabularExportBuilder(export_process=export_process, raw_data=raw_data).write_excel(target=target)
@@ -1,15 +1,26 @@
 import json
 import mimetypes
+import shutil
+import tempfile
+from contextlib import contextmanager
 from io import TextIOWrapper
 
 import requests
 from django.core.exceptions import ValidationError
 from imports_exports.factories.imports import ImportMixin
-from imports_exports.helpers import validate_external_fetch_url
+from imports_exports.helpers import validate_external_fetch_url, iter_json_records
 from imports_exports.models import MappedImport, TypedImport
 
 
 class MappedImportRunner(ImportMixin):
+    """
+    Runs a MappedImport by streaming the JSON document instead of loading it.
+
+    The file (or a local copy of the remote JSON) is read twice: a cheap counting pass for the
+    progress percentage and the import pass itself, which yields the records one by one.
+    """
+    remote_chunk_size = 1024 * 1024
+
     def __init__(self, import_process: MappedImport):
 
         # Set flags based on type
@@ -19,13 +30,16 @@ class MappedImportRunner(ImportMixin):
         self.import_products = import_process.type == TypedImport.TYPE_PRODUCT
         self.import_ean_codes = import_process.type == TypedImport.TYPE_EAN_CODE
         self.multi_tenant_company = import_process.multi_tenant_company
+        # Already loaded data takes precedence over the streamed source.
         self.data = None
+        self.remote_file = None
 
         super().__init__(import_process, language=import_process.language)
 
     def prepare_import_process(self):
         """
-        Validate and load the JSON content into `self.data`.
+        Validate the JSON source. Remote JSON is downloaded in chunks to a temporary file so it
+        is fetched only once and never held in memory.
         """
 
         if self.import_process.json_file:
@@ -36,47 +50,74 @@ class MappedImportRunner(ImportMixin):
             if mime_type not in ['application/json', 'text/plain']:
                 raise ValidationError("File MIME type is not recognized as JSON.")
 
-            try:
-                # open in binary mode…
-                with self.import_process.json_file.open('rb') as bin_f:
-                    text_f = TextIOWrapper(bin_f, encoding='utf-8')
-                    self.data = json.load(text_f)
-            except json.JSONDecodeError:
-                raise ValidationError("Uploaded file is not valid JSON.")
-
         elif self.import_process.json_url:
             if not self.import_process.json_url.lower().endswith('.json'):
                 raise ValidationError("URL does not point to a .json resource.")
 
             try:
                 validate_external_fetch_url(url=self.import_process.json_url, label="JSON")
-                response = requests.get(self.import_process.json_url, timeout=10)
-                response.raise_for_status()
+                with requests.get(self.import_process.json_url, timeout=10, stream=True) as response:
+                    response.raise_for_status()
 
-                content_type = response.headers.get('Content-Type', '')
-                if 'application/json' not in content_type:
-                    raise ValidationError(f"URL content-type is not JSON: {content_type}")
+                    content_type = response.headers.get('Content-Type', '')
+                    if 'application/json' not in content_type:
+                        raise ValidationError(f"URL content-type is not JSON: {content_type}")
 
-                self.data = response.json()
+                    self.remote_file = tempfile.TemporaryFile()
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, self.remote_file, self.remote_chunk_size)
 
             except requests.RequestException as e:
+                self.process_completed()
                 raise ValidationError(f"Failed to fetch remote JSON: {e}")
-            except json.JSONDecodeError:
-                raise ValidationError("Remote content is not valid JSON.")
 
         else:
             raise ValidationError("No input source provided for mapped import.")
 
+    @contextmanager
+    def open_json_stream(self):
+        if self.remote_file is not None:
+            self.remote_file.seek(0)
+            text_f = TextIOWrapper(self.remote_file, encoding='utf-8')
+            try:
+                yield text_f
+            finally:
+                # keep the temporary file open for the next pass
+                text_f.detach()
+            return
+
+        # open in binary mode…
+        with self.import_process.json_file.open('rb') as bin_f:
+            yield TextIOWrapper(bin_f, encoding='utf-8')
+
+    def iter_records(self):
+        if self.data is not None:
+            yield from ([self.data] if isinstance(self.data, dict) else self.data)
+            return
+
+        source = "Remote content" if self.remote_file is not None else "Uploaded file"
+        try:
+            with self.open_json_stream() as text_f:
+                yield from iter_json_records(text_f)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ValidationError(f"{source} is not valid JSON.")
+
     def get_total_instances(self):
-        if isinstance(self.data, dict):
-            return 1
-        return len(self.data)
+        if self.data is not None:
+            return 1 if isinstance(self.data, dict) else len(self.data)
+
+        return sum(1 for _ in self.iter_records())
+
+    def process_completed(self):
+        if self.remote_file is not None:
+            self.remote_file.close()
+            self.remote_file = None
 
     # --------------
     # PRODUCT
     # --------------
     def get_products_data(self):
-        return [self.data] if isinstance(self.data, dict) else self.data
+        return self.iter_records()
 
     def get_structured_product_data(self, product_data):
         return product_data
@@ -85,7 +126,7 @@ class MappedImportRunner(ImportMixin):
     # PROPERTY
     # --------------
     def get_properties_data(self):
-        return [self.data] if isinstance(self.data, dict) else self.data
+        return self.iter_records()
 
     def get_structured_property_data(self, property_data):
         return property_data
@@ -94,7 +135,7 @@ class MappedImportRunner(ImportMixin):
     # SELECT VALUES
     # --------------
     def get_select_values_data(self):
-        return [self.data] if isinstance(self.data, dict) else self.data
+        return self.iter_records()
 
     def get_structured_select_value_data(self, value_data):
         return value_data
@@ -103,7 +144,7 @@ class MappedImportRunner(ImportMixin):
     # RULES
     # --------------
     def get_rules_data(self):
-        return [self.data] if isinstance(self.data, dict) else self.data
+        return self.iter_records()
 
     def get_structured_rule_data(self, rule_data):
         return rule_data
@@ -112,7 +153,7 @@ class MappedImportRunner(ImportMixin):
     # EAN CODES
     # --------------
     def get_ean_codes_data(self):
-        return [self.data] if isinstance(self.data, dict) else self.data
+        return self.iter_records()
 
     def get_structured_ean_code_data(self, ean_code_data):
         return ean_code_data
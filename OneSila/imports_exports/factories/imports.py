@@ -1,4 +1,5 @@
 from imports_exports.decorators import handle_import_exception
+from imports_exports.factories.bulk_products import BulkProductImport
 from imports_exports.factories.ean_codes import ImportEanCodeInstance
 from imports_exports.factories.products import ImportProductInstance
 from imports_exports.factories.properties import ImportProductPropertiesRuleInstance, ImportPropertySelectValueInstance, \
@@ -8,6 +9,8 @@ from imports_exports.models import Import, ImportReport
 from notifications.factories.email import SendImportReportEmailFactory
 import traceback
 import math
+import time
+from itertools import islice
 from core.decorators import timeit_and_log
 from core.helpers import safe_run_task
 
@@ -24,6 +27,9 @@ class ImportMixin:
     import_rules = False
     import_products = False
     import_ean_codes = False
+    # When set, products are imported in chunks of this size through BulkProductImport. Opt-in: the chunks skip
+    # post_create / post_update, only the receivers of products_batch_imported catch up on them.
+    product_batch_size = None
 
     def __init__(self, import_process, language=None):
         self.import_process = import_process
@@ -34,6 +40,7 @@ class ImportMixin:
         self.current_percent = 0
         self._threshold_chunk = 1
         self._broken_records = []
+        self._started_at = None
 
     def calculate_percentage(self):
         self.total_import_instances_cnt = self.get_total_instances()
@@ -55,7 +62,7 @@ class ImportMixin:
 
         self.total_imported_instances += to_add
 
-        if self.total_imported_instances % self._threshold_chunk == 0:
+        if to_add != 1 or self.total_imported_instances % self._threshold_chunk == 0:
             new_percent = math.floor((self.total_imported_instances / self.total_import_instances_cnt) * 100)
 
             if new_percent > self.current_percent:
@@ -70,11 +77,22 @@ class ImportMixin:
         self.import_process.percentage = 0
         self.import_process.broken_records = []
         self.import_process.error_traceback = ""
-        self.import_process.save(update_fields=["status", "percentage", "broken_records", "error_traceback"])
+        self.import_process.records_per_second = None
+        self.import_process.save(update_fields=["status", "percentage", "broken_records", "error_traceback", "records_per_second"])
+        self._started_at = time.monotonic()
+
+    def set_records_per_second(self):
+        if self._started_at is None:
+            return
+
+        elapsed = time.monotonic() - self._started_at
+        if elapsed > 0:
+            self.import_process.records_per_second = round(self.total_imported_instances / elapsed, 2)
 
     def mark_success(self):
         self.import_process.status = Import.STATUS_SUCCESS
         self.import_process.percentage = 100
+        self.set_records_per_second()
         self.import_process.save()
 
         from imports_exports.signals import import_success
@@ -85,6 +103,7 @@ class ImportMixin:
     def mark_failure(self):
         self.import_process.status = Import.STATUS_FAILED
         self.import_process.percentage = 100
+        self.set_records_per_second()
         self.import_process.error_traceback = traceback.format_exc()
         self.import_process.save()
 
@@ -216,8 +235,44 @@ class ImportMixin:
         else:
             log_method(log_instance, import_instance)
 
+    def import_products_batch(self, products_data):
+        """
+        Import a chunk of products with BulkProductImport. Records it cannot handle, and the whole chunk
+        when the bulk write fails, go through generic_single_process so errors are reported per record.
+        """
+        final_data_map = {}
+        for product_data in products_data:
+            final_data = self.get_final_product_data_from_log(self.get_structured_product_data(product_data))
+            final_data_map[id(final_data)] = (final_data, product_data)
+
+        factory = BulkProductImport([final_data for final_data, _ in final_data_map.values()], self.import_process, language=self.language)
+        try:
+            factory.run()
+        except Exception:
+            logger.exception("Bulk product import failed, importing the batch record by record.")
+            fallback_data = products_data
+        else:
+            self.update_percentage(to_add=len(factory.processed_records))
+            fallback_data = [final_data_map[id(record)][1] for record in factory.fallback_records]
+
+        for product_data in fallback_data:
+            self.generic_single_process(
+                step_name='import_products_process',
+                data=product_data,
+                struct_method=self.get_structured_product_data,
+                final_data_method=self.get_final_product_data_from_log,
+                import_cls=ImportProductInstance,
+                log_method=self.update_product_log_instance,
+            )
+
     def import_products_process(self):
 
+        if self.product_batch_size:
+            products_data = iter(self.get_products_data())
+            while chunk := list(islice(products_data, self.product_batch_size)):
+                self.import_products_batch(chunk)
+            return
+
         for product_data in self.get_products_data():
             self.generic_single_process(
                 step_name='import_products_process',
@@ -355,12 +410,13 @@ class ImportMixin:
     @timeit_and_log(logger, "importing products")
     def run(self):
         self.prepare_import_process()
-        if hasattr(self, "disable_inspector_signals"):
-            self.disable_inspector_signals()
-        self.calculate_percentage()
-        self.strat_process()
 
         try:
+            if hasattr(self, "disable_inspector_signals"):
+                self.disable_inspector_signals()
+            self.calculate_percentage()
+            self.strat_process()
+
             self.validate()
 
             if self.import_properties:
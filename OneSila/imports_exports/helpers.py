@@ -1,3 +1,4 @@
+import json
 import math
 import ipaddress
 from urllib.parse import urlparse
@@ -84,3 +85,99 @@ def append_broken_record(process_id: int, record: dict) -> None:
         import_process=imp,
         record=record,
     )
+
+
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+_JSON_WHITESPACE = ' \t\n\r'
+_JSON_NUMBER_CHARS = '0123456789+-.eE'
+
+
+def iter_json_records(text_stream, *, chunk_size=JSON_STREAM_CHUNK_SIZE):
+    """
+    Incrementally parse a JSON document from a text stream and yield its records.
+
+    A top level array yields its elements one by one, any other top level value is yielded as a single
+    record. Only the record being decoded is kept in memory, so memory stays bounded by the largest
+    record instead of the size of the document. Raises json.JSONDecodeError on malformed input.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+
+    def fill(min_size):
+        nonlocal buffer, position, eof
+        buffer = buffer[position:]
+        position = 0
+        while not eof and len(buffer) < min_size:
+            chunk = text_stream.read(max(chunk_size, min_size - len(buffer)))
+            if not chunk:
+                eof = True
+            buffer += chunk
+
+    def next_char():
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _JSON_WHITESPACE:
+                position += 1
+            if position < len(buffer) or eof:
+                return buffer[position] if position < len(buffer) else ''
+            fill(chunk_size)
+
+    def decode_value():
+        nonlocal position
+        # Re-read with a growing buffer until the value is complete, a record split over
+        # several chunks is decoded at most log2(record size / chunk size) times.
+        needed = chunk_size
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                needed = max(needed, len(buffer) - position) * 2
+                fill(needed)
+                continue
+
+            # A number cut by the chunk boundary ("12" of "12.5e3") decodes fine, so numbers need
+            # a character after them that cannot belong to the number before they are trusted.
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if not eof and (end == len(buffer) or (is_number and not buffer[end:].strip(_JSON_NUMBER_CHARS))):
+                needed = max(needed, len(buffer) - position) * 2
+                fill(needed)
+                continue
+
+            position = end
+            return value
+
+    fill(chunk_size)
+    if buffer.startswith('\ufeff'):
+        position = 1
+
+    first = next_char()
+    if first == '':
+        raise json.JSONDecodeError("Expecting value", buffer, position)
+
+    if first != '[':
+        yield decode_value()
+        if next_char() != '':
+            raise json.JSONDecodeError("Extra data", buffer, position)
+        return
+
+    position += 1
+    if next_char() == ']':
+        position += 1
+    else:
+        while True:
+            yield decode_value()
+
+            separator = next_char()
+            position += 1
+            if separator == ']':
+                break
+            if separator != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, max(position - 1, 0))
+            next_char()
+
+    if next_char() != '':
+        raise json.JSONDecodeError("Extra data", buffer, position)
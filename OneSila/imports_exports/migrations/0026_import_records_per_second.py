@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports_exports', '0025_alter_export_language'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='import',
+            name='records_per_second',
+            field=models.FloatField(blank=True, help_text='Throughput of the last run, in imported records per second.', null=True),
+        ),
+    ]
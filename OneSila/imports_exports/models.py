@@ -6,10 +6,11 @@ from django.utils import timezone
 from datetime import timedelta
 import json
 import requests
+import tempfile
 import mimetypes
 from hashlib import shake_256
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 import shortuuid
 
 from core.helpers import ensure_serializable
@@ -93,6 +94,11 @@ class Import(PolymorphicModel, models.Model):
         default=0,
         help_text="How many items have been processed so far in async imports.",
     )
+    records_per_second = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Throughput of the last run, in imported records per second.",
+    )
     objects = ImportManager()
 
     def get_cleaned_errors_from_broken_records(self):
@@ -589,32 +595,48 @@ class Export(models.Model):
             return self.generate_excel(raw_data=raw_data)
         raise ValidationError(f"Unsupported export type: {self.type}")
 
+    def _save_spooled_file(self, *, filename, write):
+        """Let `write` fill a temporary file and store it, so exports never live in memory as a whole."""
+        with tempfile.TemporaryFile() as spool:
+            write(spool)
+            self.file.save(filename, File(spool, name=filename), save=False)
+        return self.file
+
     def generate_json(self, *, raw_data):
-        payload = json.dumps(
-            ensure_serializable(raw_data),
-            ensure_ascii=False,
-            indent=2,
-            sort_keys=True,
-        ).encode("utf-8")
         filename = f"{self.kind}-{self.id or 'export'}.json"
-        self.file.save(filename, ContentFile(payload), save=False)
-        return self.file
+
+        if isinstance(raw_data, dict):
+            payload = json.dumps(ensure_serializable(raw_data), ensure_ascii=False, indent=2, sort_keys=True)
+            self.file.save(filename, ContentFile(payload.encode("utf-8")), save=False)
+            return self.file
+
+        def write(spool):
+            # Same output as json.dumps(list, indent=2), written one record at a time.
+            separator = "[\n"
+            for record in raw_data:
+                dumped = json.dumps(ensure_serializable(record), ensure_ascii=False, indent=2, sort_keys=True)
+                dumped = dumped.replace("\n", "\n  ")
+                spool.write(f"{separator}  {dumped}".encode("utf-8"))
+                separator = ",\n"
+            spool.write(b"[]" if separator == "[\n" else b"\n]")
+
+        return self._save_spooled_file(filename=filename, write=write)
 
     def generate_csv(self, *, raw_data):
-        from imports_exports.factories.exports.tabular import build_csv_export_content
+        from imports_exports.factories.exports.tabular import write_csv_export
 
-        payload = build_csv_export_content(export_process=self, raw_data=raw_data)
-        filename = f"{self.kind}-{self.id or 'export'}.csv"
-        self.file.save(filename, ContentFile(payload), save=False)
-        return self.file
+        return self._save_spooled_file(
+            filename=f"{self.kind}-{self.id or 'export'}.csv",
+            write=lambda spool: write_csv_export(export_process=self, target=spool, raw_data=raw_data),
+        )
 
     def generate_excel(self, *, raw_data):
-        from imports_exports.factories.exports.tabular import build_excel_export_content
+        from imports_exports.factories.exports.tabular import write_excel_export
 
-        payload = build_excel_export_content(export_process=self, raw_data=raw_data)
-        filename = f"{self.kind}-{self.id or 'export'}.xlsx"
-        self.file.save(filename, ContentFile(payload), save=False)
-        return self.file
+        return self._save_spooled_file(
+            filename=f"{self.kind}-{self.id or 'export'}.xlsx",
+            write=lambda spool: write_excel_export(export_process=self, target=spool, raw_data=raw_data),
+        )
 
     def run(self, *, run_async=False):
         if run_async:
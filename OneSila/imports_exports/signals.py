@@ -2,3 +2,7 @@ from core.signals import ModelSignal
 
 # Emitted when an import process completes successfully
 import_success = ModelSignal(use_caching=True)
+
+# Emitted once per chunk imported by BulkProductImport, with the ids of the products in it
+# and the objects it created or updated without sending their post_save
+products_batch_imported = ModelSignal(use_caching=True)
@@ -191,3 +191,18 @@ class ExportHelpersUnitTest(unittest.TestCase):
         factory.update_progress(processed=250, total_records=250)
 
         self.assertEqual(mocked_logger.info.call_count, 2)
+
+    def test_iter_payload_falls_back_to_get_payload(self):
+        export_process = SimpleNamespace(
+            multi_tenant_company=SimpleNamespace(language="en", languages=["en"]),
+            language=None,
+            parameters={},
+            columns=[],
+        )
+        factory = DummyExportFactory(export_process=export_process)
+
+        with patch.object(DummyExportFactory, "get_payload", return_value=[{"id": 1}, {"id": 2}]):
+            self.assertEqual(list(factory.iter_payload_rows()), [{"id": 1}, {"id": 2}])
+
+        with patch.object(DummyExportFactory, "get_payload", return_value={"id": 3}):
+            self.assertEqual(list(factory.iter_payload_rows()), [{"id": 3}])
@@ -9,6 +9,7 @@ from imports_exports.factories.exports.tabular import (
     build_csv_export_content,
     build_excel_export_content,
     build_tabular_export,
+    write_csv_export,
 )
 
 
@@ -123,3 +124,24 @@ class TabularExportBuilderTest(SimpleTestCase):
             [worksheet.cell(row=2, column=1).value, worksheet.cell(row=2, column=2).value],
             ["1234567890123", "SKU-1"],
         )
+
+    def test_write_csv_export_streams_records_and_collects_late_headers(self):
+        export_process = SimpleNamespace(kind="ean_codes", raw_data=[])
+        consumed = []
+
+        def records():
+            for index in range(3):
+                consumed.append(index)
+                row = {"ean_code": f"EAN-{index}"}
+                if index == 2:
+                    row["product_sku"] = "SKU-2"
+                yield row
+
+        target = BytesIO()
+        write_csv_export(export_process=export_process, target=target, raw_data=records())
+        rows = list(csv.reader(StringIO(target.getvalue().decode("utf-8-sig"))))
+
+        self.assertEqual(consumed, [0, 1, 2])
+        self.assertEqual(rows[0], ["ean_code", "product_sku"])
+        self.assertEqual(rows[1], ["EAN-0", ""])
+        self.assertEqual(rows[3], ["EAN-2", "SKU-2"])
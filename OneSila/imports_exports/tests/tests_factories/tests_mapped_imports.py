@@ -1,15 +1,19 @@
 import json
 import tempfile
 import unittest
+from decimal import Decimal
 from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from core.tests import TestCase
+from currencies.currencies import currencies
+from currencies.models import Currency
 from eancodes.models import EanCode
 from imports_exports.factories.importers.mapped import MappedImportRunner
 from imports_exports.models import ImportBrokenRecord, MappedImport
 from products.models import Product
+from sales_prices.models import SalesPrice
 
 
 class MappedImportSkipBrokenRecordsTest(TestCase):
@@ -225,3 +229,119 @@ class MappedImportEanCodesTest(TestCase):
         )
 
         mocked_safe_run_task.assert_called_once()
+
+
+class MappedImportStreamingTest(TestCase):
+    def create_mapped_import(self, content):
+        mapped_import = MappedImport.objects.create(
+            multi_tenant_company=self.multi_tenant_company,
+            type='product',
+        )
+        mapped_import.json_file.save("products.json", ContentFile(content.encode("utf-8")), save=True)
+        return mapped_import
+
+    def test_records_are_streamed_and_counted(self):
+        payload = [{"sku": f"P{i:03}", "name": f"Product {i}", "price": i / 2} for i in range(50)]
+        runner = MappedImportRunner(self.create_mapped_import(json.dumps(payload, indent=2)))
+
+        runner.prepare_import_process()
+
+        self.assertIsNone(runner.data)
+        self.assertEqual(runner.get_total_instances(), 50)
+        self.assertEqual(list(runner.get_products_data()), payload)
+
+    def test_single_object_is_one_record(self):
+        payload = {"sku": "P001", "name": "Single"}
+        runner = MappedImportRunner(self.create_mapped_import(json.dumps(payload)))
+
+        runner.prepare_import_process()
+
+        self.assertEqual(runner.get_total_instances(), 1)
+        self.assertEqual(list(runner.get_products_data()), [payload])
+
+    def test_invalid_json_raises_validation_error(self):
+        runner = MappedImportRunner(self.create_mapped_import('[{"sku": "P001"}, {"sku": '))
+
+        runner.prepare_import_process()
+
+        with self.assertRaises(ValidationError):
+            runner.get_total_instances()
+
+
+class MappedImportProductBatchTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        batch_size = patch.object(MappedImportRunner, 'product_batch_size', 500)
+        batch_size.start()
+        self.addCleanup(batch_size.stop)
+        self.currency, _ = Currency.objects.get_or_create(
+            multi_tenant_company=self.multi_tenant_company,
+            is_default_currency=True,
+            **currencies['GB']
+        )
+
+    def create_mapped_import(self, data, **kwargs):
+        mapped_import = MappedImport.objects.create(
+            multi_tenant_company=self.multi_tenant_company,
+            type='product',
+            **kwargs,
+        )
+        mapped_import.json_file.save("products.json", ContentFile(json.dumps(data).encode("utf-8")), save=True)
+        return mapped_import
+
+    def get_product_data(self, count, *, name="Product", price="10.00"):
+        return [
+            {
+                "sku": f"BATCH-{i:03}",
+                "name": f"{name} {i}",
+                "type": "SIMPLE",
+                "active": True,
+                "ean_code": f"5400000000{i:03}",
+                "prices": [{"currency": self.currency.iso_code, "price": price, "rrp": "12.00"}],
+            }
+            for i in range(count)
+        ]
+
+    def test_batch_creates_products_translations_and_prices(self):
+        mapped_import = self.create_mapped_import(self.get_product_data(5))
+
+        with patch.object(MappedImportRunner, 'product_batch_size', 2):
+            mapped_import.run()
+
+        mapped_import.refresh_from_db()
+        self.assertEqual(mapped_import.status, 'success')
+        self.assertIsNotNone(mapped_import.records_per_second)
+
+        products = Product.objects.filter(multi_tenant_company=self.multi_tenant_company, sku__startswith="BATCH-")
+        self.assertEqual(products.count(), 5)
+
+        product = products.get(sku="BATCH-003")
+        self.assertEqual(product.translations.get().name, "Product 3")
+        self.assertEqual(product.translations.get().url_key, "product-3")
+        self.assertEqual(EanCode.objects.get(product=product).ean_code, "5400000000003")
+
+        sales_price = SalesPrice.objects.get(product=product, currency=self.currency)
+        self.assertEqual(sales_price.price, Decimal("10.00"))
+        self.assertEqual(sales_price.rrp, Decimal("12.00"))
+
+    def test_batch_updates_existing_products(self):
+        self.create_mapped_import(self.get_product_data(3)).run()
+        mapped_import = self.create_mapped_import(self.get_product_data(3, name="Renamed", price="11.00"))
+
+        mapped_import.run()
+
+        product = Product.objects.get(multi_tenant_company=self.multi_tenant_company, sku="BATCH-001")
+        self.assertEqual(product.translations.get().name, "Renamed 1")
+        self.assertEqual(SalesPrice.objects.get(product=product).price, Decimal("11.00"))
+
+    def test_unsupported_records_fall_back_to_single_import(self):
+        product_data = self.get_product_data(2)
+        product_data.append({"sku": "BATCH-BROKEN", "name": "Broken", "type": "NON_EXISTING_TYPE"})
+        mapped_import = self.create_mapped_import(product_data, skip_broken_records=True)
+
+        mapped_import.run()
+        mapped_import.refresh_from_db()
+
+        self.assertEqual(mapped_import.status, 'success')
+        self.assertEqual(mapped_import.broken_record_entries.count(), 1)
+        self.assertEqual(Product.objects.filter(multi_tenant_company=self.multi_tenant_company, sku__startswith="BATCH-").count(), 2)
@@ -5,6 +5,7 @@ from polymorphic.admin import PolymorphicChildModelFilter, PolymorphicParentMode
 from integrations.models import (
     Integration,
     IntegrationTaskQueue,
+    IntegrationTaskQueueCounter,
     IntegrationLog,
     PublicIntegrationType,
     PublicIntegrationTypeTranslation,
@@ -181,6 +182,13 @@ class RemoteTaskQueueAdmin(ModelAdmin):
         return True
 
 
+@admin.register(IntegrationTaskQueueCounter)
+class IntegrationTaskQueueCounterAdmin(ModelAdmin):
+    list_display = ['integration', 'pending_requests', 'processing_requests', 'coalesced_tasks']
+    search_fields = ['integration__hostname']
+    readonly_fields = ['integration', 'pending_requests', 'processing_requests', 'coalesced_tasks']
+
+
 @admin.register(IntegrationLog)
 class IntegrationLogAdmin(PolymorphicParentModelAdmin):
     base_model = IntegrationLog
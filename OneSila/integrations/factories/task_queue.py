@@ -4,12 +4,13 @@ import json
 from typing import Optional, Tuple, Dict
 
 from django.core.exceptions import ValidationError
-from django.db.models import Sum
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Sum
 from django.core.serializers.json import DjangoJSONEncoder
 
 from core.huey import DEFAULT_PRIORITY
 from integrations.helpers import resolve_function
-from integrations.models import IntegrationTaskQueue, Integration
+from integrations.models import IntegrationTaskQueue, IntegrationTaskQueueCounter, Integration
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,8 @@ class TaskQueueFactory:
         self.process_now = None
         self.task_queue_item = None
         self.sync_request = None
+        self.content_hash = None
+        self.coalesced = False
 
     def set_sync_request(self):
         if self.sync_request_id is None:
@@ -78,17 +81,19 @@ class TaskQueueFactory:
     def set_active_requests(self):
         """
         Get and set the total number of currently active requests for the integration.
+        Read from the running counter instead of aggregating the queue.
         """
-        self.active_requests = IntegrationTaskQueue.objects.filter(
-            integration=self.integration,
-            status__in=[IntegrationTaskQueue.PROCESSING, IntegrationTaskQueue.PENDING]
-        ).aggregate(total=Sum('number_of_remote_requests'))['total'] or 0
+        self.active_requests = IntegrationTaskQueueCounter.get_active_requests(self.integration)
 
     def set_process_now(self):
         """
         Determine if the task should be processed immediately based on the requests per minute limit and set it.
+        The task also needs room in the integration token bucket so enqueue and the queue drain share one budget.
         """
-        self.process_now = self.active_requests + self.remote_requests <= self.integration.requests_per_minute
+        self.process_now = (
+            self.active_requests + self.remote_requests <= self.integration.requests_per_minute
+            and self.integration.get_task_queue_bucket().consume(self.remote_requests)
+        )
 
     def _get_task_priority(self):
         """
@@ -105,6 +110,47 @@ class TaskQueueFactory:
     def _serialize(self, data):
         return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
 
+    def set_content_hash(self):
+        """
+        Hash the canonicalised task call so identical pending tasks can be merged.
+        """
+        self.content_hash = IntegrationTaskQueue.build_content_hash(
+            integration_id=self.integration.id,
+            task_name=self.task_func_path,
+            task_args=self._serialize(self.task_args),
+            task_kwargs=self._serialize(self.task_kwargs),
+        )
+
+    def coalesce_into_pending_task(self):
+        """
+        Merge into an identical pending task if there is one, keeping the higher priority.
+        Returns True when the task was merged and nothing needs to be created.
+        """
+        with transaction.atomic():
+            existing = IntegrationTaskQueue.objects.select_for_update().filter(
+                integration=self.integration,
+                status=IntegrationTaskQueue.PENDING,
+                content_hash=self.content_hash,
+            ).first()
+
+            if existing is None:
+                return False
+
+            task_priority = self._get_task_priority()
+            if task_priority > existing.priority:
+                existing.priority = task_priority
+                existing.save()
+
+            IntegrationTaskQueueCounter.increment_coalesced(integration_id=self.integration.id)
+
+        self.task_queue_item = existing
+        self.coalesced = True
+        self.process_now = False
+
+        logger.debug(
+            f"Task '{self.task_func_path}' merged into pending task {existing.id} for Integration '{self.integration.hostname}'.")
+        return True
+
     def create_task_queue_item(self):
         """
         Create the IntegrationTaskQueue entry and set it as a class attribute.
@@ -116,16 +162,24 @@ class TaskQueueFactory:
             f"Task for Integration '{self.integration.hostname}': Requests per minute limit is {self.integration.requests_per_minute}. "
             f"Currently active requests: {self.active_requests}. Processing now: {self.process_now}.")
 
-        self.task_queue_item = IntegrationTaskQueue.objects.create(
-            integration=self.integration,
-            task_name=self.task_func_path,
-            task_args=self._serialize(self.task_args),
-            task_kwargs=self._serialize(self.task_kwargs),
-            status=task_status,
-            number_of_remote_requests=self.remote_requests,
-            priority=task_priority,
-            multi_tenant_company=self.integration.multi_tenant_company
-        )
+        try:
+            with transaction.atomic():
+                self.task_queue_item = IntegrationTaskQueue.objects.create(
+                    integration=self.integration,
+                    task_name=self.task_func_path,
+                    task_args=self._serialize(self.task_args),
+                    task_kwargs=self._serialize(self.task_kwargs),
+                    status=task_status,
+                    number_of_remote_requests=self.remote_requests,
+                    priority=task_priority,
+                    content_hash=self.content_hash if task_status == IntegrationTaskQueue.PENDING else None,
+                    multi_tenant_company=self.integration.multi_tenant_company
+                )
+        except IntegrityError:
+            # An identical task became pending concurrently, merge into it instead.
+            if self.coalesce_into_pending_task():
+                return
+            raise
 
         logger.debug(
             f"Task '{self.task_func_path}' {'immediately processing' if self.process_now else 'added to the queue'} for Integration '{self.integration.hostname}' "
@@ -134,9 +188,15 @@ class TaskQueueFactory:
     def dispatch_task(self):
         """
         Dispatch the task if conditions allow, using the created task_queue_item.
+        Queued tasks schedule a drain for the moment the token bucket has capacity again.
         """
-        if self.process_now and self.task_queue_item:
+        if not self.task_queue_item:
+            return
+
+        if self.process_now:
             self.task_queue_item.safe_dispatch()
+        else:
+            IntegrationTaskQueue.schedule_queue_processing(self.integration)
 
     def run(self):
         """
@@ -152,15 +212,253 @@ class TaskQueueFactory:
         self.set_integration()
         self.set_task_func()
         self.set_remote_requests()
+        self.set_content_hash()
+        if self.coalesce_into_pending_task():
+            return
         self.set_active_requests()
         self.set_process_now()
         self.create_task_queue_item()
         self.dispatch_task()
 
 
+class BulkTaskQueueFactory:
+    """
+    Enqueue many tasks for one integration in a single pass.
+
+    Each entry of `tasks` takes the same keys as TaskQueueFactory (task_func_path, task_args, task_kwargs,
+    number_of_remote_requests, priority, sync_request_id) and keeps the same per-task semantics, but the
+    integration, sync requests and pending duplicates are resolved with one query each, the process-now split
+    is computed once and the rows are written with a single bulk_create.
+    """
+
+    def __init__(self, integration_id: str | int, tasks: list[dict]):
+        self.integration_id = integration_id
+        self.tasks = tasks
+
+        self.integration = None
+        self.factories = []
+        self.coalesced_count = 0
+
+    def set_integration(self):
+        self.integration = Integration.objects.get(id=self.integration_id)
+
+    def build_factories(self):
+        """
+        Prepare one TaskQueueFactory per task without touching the database.
+        """
+        task_funcs = {}
+        for task in self.tasks:
+            fac = TaskQueueFactory(integration_id=self.integration_id, **task)
+            fac.integration = self.integration
+
+            if fac.task_func_path not in task_funcs:
+                fac.set_task_func()
+                task_funcs[fac.task_func_path] = fac.task_func
+
+            fac.task_func = task_funcs[fac.task_func_path]
+            fac.set_remote_requests()
+            fac.set_content_hash()
+            self.factories.append(fac)
+
+    def filter_sync_requests(self):
+        """
+        Drop the tasks whose sync request is no longer pending, mirroring TaskQueueFactory.run.
+        """
+        sync_request_ids = {fac.sync_request_id for fac in self.factories if fac.sync_request_id is not None}
+        if not sync_request_ids:
+            return
+
+        from sales_channels.models import SyncRequest
+
+        pending_requests = SyncRequest.objects.filter(
+            id__in=sync_request_ids,
+            status=SyncRequest.STATUS_PENDING,
+        ).in_bulk()
+
+        factories = []
+        for fac in self.factories:
+            if fac.sync_request_id is not None:
+                fac.sync_request = pending_requests.get(fac.sync_request_id)
+                if fac.sync_request is None:
+                    logger.info(
+                        "Skipping task queue creation for sync request %s because it is no longer pending.",
+                        fac.sync_request_id,
+                    )
+                    continue
+            factories.append(fac)
+
+        self.factories = factories
+
+    def coalesce(self):
+        """
+        Merge tasks into identical pending rows, and identical tasks of the batch into each other,
+        keeping the highest priority.
+        """
+        hashes = {fac.content_hash for fac in self.factories}
+
+        with transaction.atomic():
+            existing = {
+                task.content_hash: task
+                for task in IntegrationTaskQueue.objects.select_for_update().filter(
+                    integration=self.integration,
+                    status=IntegrationTaskQueue.PENDING,
+                    content_hash__in=hashes,
+                )
+            }
+
+            raised_priorities = {}
+            batch_items = {}
+            factories = []
+            for fac in self.factories:
+                priority = fac._get_task_priority()
+                target = existing.get(fac.content_hash)
+
+                if target is not None:
+                    if priority > target.priority:
+                        target.priority = priority
+                        raised_priorities[target.id] = target
+                    fac.task_queue_item = target
+                    fac.coalesced = True
+                    self.coalesced_count += 1
+                    continue
+
+                twin = batch_items.get(fac.content_hash)
+                if twin is not None:
+                    twin.priority = max(twin.priority, priority)
+                    fac.coalesced = True
+                    self.coalesced_count += 1
+                    continue
+
+                fac.priority = priority
+                batch_items[fac.content_hash] = fac
+                factories.append(fac)
+
+            if raised_priorities:
+                IntegrationTaskQueue.objects.bulk_update(list(raised_priorities.values()), ['priority'])
+
+            if self.coalesced_count:
+                IntegrationTaskQueueCounter.increment_coalesced(integration_id=self.integration.id, count=self.coalesced_count)
+
+        self.factories = factories
+
+    def set_process_now(self):
+        """
+        Walk the tasks in order and decide which ones are processed immediately, exactly as consecutive
+        TaskQueueFactory runs would, but with a single counter read.
+        """
+        active_requests = IntegrationTaskQueueCounter.get_active_requests(self.integration)
+        bucket = self.integration.get_task_queue_bucket()
+        bucket_open = True
+
+        for fac in self.factories:
+            fac.active_requests = active_requests
+            fac.process_now = (
+                bucket_open
+                and active_requests + fac.remote_requests <= self.integration.requests_per_minute
+                and bucket.consume(fac.remote_requests)
+            )
+            if not fac.process_now:
+                bucket_open = False
+            active_requests += fac.remote_requests
+
+    def create_task_queue_items(self):
+        items = []
+        pending_requests = 0
+        processing_requests = 0
+        for fac in self.factories:
+            task_status = fac._get_task_status()
+            items.append(IntegrationTaskQueue(
+                integration=self.integration,
+                task_name=fac.task_func_path,
+                task_args=fac._serialize(fac.task_args),
+                task_kwargs=fac._serialize(fac.task_kwargs),
+                status=task_status,
+                number_of_remote_requests=fac.remote_requests,
+                priority=fac.priority,
+                content_hash=fac.content_hash if task_status == IntegrationTaskQueue.PENDING else None,
+                multi_tenant_company=self.integration.multi_tenant_company,
+            ))
+            if task_status == IntegrationTaskQueue.PENDING:
+                pending_requests += fac.remote_requests
+            else:
+                processing_requests += fac.remote_requests
+
+        with transaction.atomic():
+            created = IntegrationTaskQueue.objects.bulk_create(items)
+            IntegrationTaskQueueCounter.apply_delta(
+                integration_id=self.integration.id,
+                pending=pending_requests,
+                processing=processing_requests,
+            )
+
+        for fac, item in zip(self.factories, created):
+            fac.task_queue_item = item
+
+        logger.debug(
+            f"Bulk enqueued {len(created)} task(s) for Integration '{self.integration.hostname}', "
+            f"{sum(1 for fac in self.factories if fac.process_now)} processing now, {self.coalesced_count} coalesced.")
+
+    def fallback_to_single_tasks(self):
+        """
+        An identical task became pending concurrently. Give the tokens back and enqueue one by one,
+        which merges into the conflicting rows.
+        """
+        bucket = self.integration.get_task_queue_bucket()
+        bucket.refund(sum(fac.remote_requests for fac in self.factories if fac.process_now))
+
+        for fac in self.factories:
+            single = TaskQueueFactory(
+                integration_id=self.integration_id,
+                task_func_path=fac.task_func_path,
+                task_args=fac.task_args,
+                task_kwargs=fac.task_kwargs,
+                number_of_remote_requests=fac.number_of_remote_requests,
+                priority=fac.priority,
+                sync_request_id=fac.sync_request_id,
+            )
+            single.run()
+
+    def dispatch_tasks(self):
+        for fac in self.factories:
+            if fac.process_now:
+                fac.dispatch_task()
+
+        if any(not fac.process_now for fac in self.factories):
+            IntegrationTaskQueue.schedule_queue_processing(self.integration)
+
+    def run(self):
+        self.set_integration()
+        self.build_factories()
+        self.filter_sync_requests()
+        if not self.factories:
+            return
+
+        self.coalesce()
+        if not self.factories:
+            return
+
+        self.set_process_now()
+        try:
+            self.create_task_queue_items()
+        except IntegrityError:
+            self.fallback_to_single_tasks()
+            return
+
+        self.dispatch_tasks()
+
+
 class ProcessIntegrationTasksFactory:
-    def __init__(self):
-        self.integrations = Integration.objects.filter(active=True)
+    def __init__(self, integration_ids=None):
+        has_pending_tasks = Exists(
+            IntegrationTaskQueue.objects.filter(
+                integration=OuterRef('pk'),
+                status=IntegrationTaskQueue.PENDING,
+            )
+        )
+        self.integrations = Integration.objects.filter(has_pending_tasks, active=True)
+
+        if integration_ids is not None:
+            self.integrations = self.integrations.filter(id__in=integration_ids)
 
     def get_pending_tasks(self, integration):
         """
@@ -181,10 +479,7 @@ class ProcessIntegrationTasksFactory:
         """
         if not integration.active:
 
-            for task in pending_tasks:
-                task.status = IntegrationTaskQueue.SKIPPED
-
-            IntegrationTaskQueue.objects.bulk_update(pending_tasks, ['status'])
+            IntegrationTaskQueue.bulk_update_status(pending_tasks, IntegrationTaskQueue.SKIPPED)
             logger.info(
                 f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                 f"Integration '{integration.hostname}' is inactive — skipped {len(pending_tasks)} task(s)."
@@ -201,8 +496,83 @@ class ProcessIntegrationTasksFactory:
 
     def run(self):
         """
-        Run the process for all active integrations: get pending tasks and dispatch them.
+        Run the process for all active integrations with pending tasks: claim the tasks that fit in the
+        token bucket, dispatch them and schedule the next drain for whatever is left.
         """
         for integration in self.integrations:
             pending_tasks = self.get_pending_tasks(integration)
             self.dispatch_tasks(integration, pending_tasks)
+            IntegrationTaskQueue.schedule_queue_processing(integration)
+
+
+class ReconcileTaskQueueCountersFactory:
+    """
+    Recompute the IntegrationTaskQueueCounter rows from the queue itself to repair drift
+    (rows deleted in bulk, crashed workers, manual fixes in the database).
+    """
+
+    def __init__(self, integration_ids=None):
+        self.integration_ids = integration_ids
+        self.fixed_counters = 0
+
+    def get_actual_totals(self):
+        queryset = IntegrationTaskQueue.objects.filter(
+            integration__isnull=False,
+            status__in=[IntegrationTaskQueue.PENDING, IntegrationTaskQueue.PROCESSING],
+        )
+        if self.integration_ids is not None:
+            queryset = queryset.filter(integration_id__in=self.integration_ids)
+
+        totals = {}
+        for row in queryset.values('integration_id', 'status').annotate(total=Sum('number_of_remote_requests')):
+            pending, processing = totals.get(row['integration_id'], (0, 0))
+            if row['status'] == IntegrationTaskQueue.PENDING:
+                pending = row['total'] or 0
+            else:
+                processing = row['total'] or 0
+            totals[row['integration_id']] = (pending, processing)
+
+        return totals
+
+    def reconcile(self):
+        """
+        Lock the counters before counting the queue, so deltas applied by concurrent enqueues or
+        dispatches wait for the reconciliation instead of being overwritten by stale totals.
+        """
+        counters = IntegrationTaskQueueCounter.objects.select_for_update()
+        integrations = Integration.objects.all()
+        if self.integration_ids is not None:
+            counters = counters.filter(integration_id__in=self.integration_ids)
+            integrations = integrations.filter(id__in=self.integration_ids)
+
+        with transaction.atomic():
+            existing = {counter.integration_id: counter for counter in counters}
+            totals = self.get_actual_totals()
+            to_update = []
+            for counter in existing.values():
+                pending, processing = totals.get(counter.integration_id, (0, 0))
+                if (counter.pending_requests, counter.processing_requests) != (pending, processing):
+                    counter.pending_requests = pending
+                    counter.processing_requests = processing
+                    to_update.append(counter)
+
+            missing_ids = set(totals) - set(existing)
+            to_create = [
+                IntegrationTaskQueueCounter(
+                    integration_id=integration_id,
+                    multi_tenant_company_id=multi_tenant_company_id,
+                    pending_requests=totals[integration_id][0],
+                    processing_requests=totals[integration_id][1],
+                )
+                for integration_id, multi_tenant_company_id in integrations.filter(id__in=missing_ids).values_list('id', 'multi_tenant_company_id')
+            ]
+
+            IntegrationTaskQueueCounter.objects.bulk_update(to_update, ['pending_requests', 'processing_requests'])
+            IntegrationTaskQueueCounter.objects.bulk_create(to_create, ignore_conflicts=True)
+
+        self.fixed_counters = len(to_update) + len(to_create)
+        if self.fixed_counters:
+            logger.warning(f"Reconciled {self.fixed_counters} integration task queue counter(s) that drifted.")
+
+    def run(self):
+        self.reconcile()
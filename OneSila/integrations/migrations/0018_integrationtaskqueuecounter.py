@@ -0,0 +1,66 @@
+# Generated by Django 5.2 on 2026-10-18 09:12
+
+import core.models.core
+import dirtyfields.dirtyfields
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def populate_counters(apps, schema_editor):
+    IntegrationTaskQueue = apps.get_model('integrations', 'IntegrationTaskQueue')
+    IntegrationTaskQueueCounter = apps.get_model('integrations', 'IntegrationTaskQueueCounter')
+
+    totals = {}
+    rows = (
+        IntegrationTaskQueue.objects
+        .filter(integration__isnull=False, status__in=['PENDING', 'PROCESSING'])
+        .values('integration_id', 'integration__multi_tenant_company_id', 'status')
+        .annotate(total=Sum('number_of_remote_requests'))
+    )
+    for row in rows:
+        counter = totals.setdefault(row['integration_id'], {
+            'multi_tenant_company_id': row['integration__multi_tenant_company_id'],
+            'pending_requests': 0,
+            'processing_requests': 0,
+        })
+        key = 'pending_requests' if row['status'] == 'PENDING' else 'processing_requests'
+        counter[key] = row['total'] or 0
+
+    IntegrationTaskQueueCounter.objects.bulk_create([
+        IntegrationTaskQueueCounter(integration_id=integration_id, **values)
+        for integration_id, values in totals.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_alter_dashboardcard_url'),
+        ('integrations', '0017_seed_manual_public_integration_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IntegrationTaskQueueCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('pending_requests', models.IntegerField(default=0)),
+                ('processing_requests', models.IntegerField(default=0)),
+                ('created_by_multi_tenant_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_created_by_multi_tenant_user_set', to=settings.AUTH_USER_MODEL)),
+                ('integration', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='task_queue_counter', to='integrations.integration')),
+                ('last_update_by_multi_tenant_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_last_update_by_multi_tenant_user_set', to=settings.AUTH_USER_MODEL)),
+                ('multi_tenant_company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='core.multitenantcompany')),
+            ],
+            options={
+                'verbose_name': 'Integration Task Queue Counter',
+                'verbose_name_plural': 'Integration Task Queue Counters',
+            },
+            bases=(dirtyfields.dirtyfields.DirtyFieldsMixin, core.models.core.GetAbsoluteURLMixin, models.Model),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-18 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0018_integrationtaskqueuecounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='integrationtaskqueue',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='integrationtaskqueuecounter',
+            name='coalesced_tasks',
+            field=models.PositiveIntegerField(default=0, help_text='Number of enqueued tasks merged into an identical pending task.'),
+        ),
+        migrations.AddConstraint(
+            model_name='integrationtaskqueue',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'PENDING')), fields=('integration', 'content_hash'), name='unique_pending_integration_task_content_hash'),
+        ),
+    ]
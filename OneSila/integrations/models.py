@@ -7,7 +7,9 @@ from django.utils.timezone import now
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from core.huey import DEFAULT_PRIORITY
+import hashlib
 import json
+import math
 from datetime import datetime
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
@@ -65,6 +67,63 @@ class Integration(PolymorphicModel, models.Model):
     def __str__(self):
         return f"{self.hostname} @ {self.multi_tenant_company}"
 
+    def get_task_queue_bucket(self):
+        from core.rate_limiting import TokenBucket
+
+        return TokenBucket.per_minute(
+            key=f"integration_task_queue:{self.id}",
+            requests_per_minute=self.requests_per_minute,
+        )
+
+
+class IntegrationTaskQueueCounter(models.Model):
+    """
+    Running totals of the remote requests sitting in an integration queue, so enqueueing a task
+    does not need to aggregate the whole queue. Every status transition of IntegrationTaskQueue
+    applies its delta here and ReconcileTaskQueueCountersFactory repairs any drift.
+    """
+    integration = models.OneToOneField(Integration, on_delete=models.CASCADE, related_name='task_queue_counter')
+    pending_requests = models.IntegerField(default=0)
+    processing_requests = models.IntegerField(default=0)
+    coalesced_tasks = models.PositiveIntegerField(default=0, help_text="Number of enqueued tasks merged into an identical pending task.")
+
+    class Meta:
+        verbose_name = 'Integration Task Queue Counter'
+        verbose_name_plural = 'Integration Task Queue Counters'
+
+    def __str__(self):
+        return f"{self.integration} > pending {self.pending_requests} / processing {self.processing_requests}"
+
+    @property
+    def active_requests(self):
+        return self.pending_requests + self.processing_requests
+
+    @classmethod
+    def get_active_requests(cls, integration):
+        counter = cls.objects.filter(integration=integration).only('pending_requests', 'processing_requests').first()
+        return counter.active_requests if counter else 0
+
+    @classmethod
+    def _increment(cls, *, integration_id, **deltas):
+        updates = {field: models.F(field) + delta for field, delta in deltas.items() if delta}
+        if integration_id is None or not updates:
+            return
+
+        if cls.objects.filter(integration_id=integration_id).update(**updates):
+            return
+
+        multi_tenant_company_id = Integration.objects.filter(id=integration_id).values_list('multi_tenant_company_id', flat=True).first()
+        cls.objects.get_or_create(integration_id=integration_id, defaults={'multi_tenant_company_id': multi_tenant_company_id})
+        cls.objects.filter(integration_id=integration_id).update(**updates)
+
+    @classmethod
+    def apply_delta(cls, *, integration_id, pending=0, processing=0):
+        cls._increment(integration_id=integration_id, pending_requests=pending, processing_requests=processing)
+
+    @classmethod
+    def increment_coalesced(cls, *, integration_id, count=1):
+        cls._increment(integration_id=integration_id, coalesced_tasks=count)
+
 
 class IntegrationTaskQueue(models.Model):
     PENDING = 'PENDING'
@@ -93,59 +152,170 @@ class IntegrationTaskQueue(models.Model):
     error_history = models.JSONField(default=dict, blank=True)
     number_of_remote_requests = models.IntegerField(default=1)  # how many remote requests does this task do?
     priority = models.IntegerField(default=DEFAULT_PRIORITY)
+    # hash of (integration, task_name, args, kwargs) used to merge identical pending tasks
+    content_hash = models.CharField(max_length=64, null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['integration', 'content_hash'],
+                condition=models.Q(status='PENDING'),
+                name='unique_pending_integration_task_content_hash',
+            ),
+        ]
 
     @property
     def name(self):
         """Extracts the simplified task name from the task path."""
         return self.task_name.split('.')[-1]
 
+    @staticmethod
+    def build_content_hash(*, integration_id, task_name, task_args, task_kwargs):
+        """
+        Stable hash of a task call. Args and kwargs are expected to be JSON-serialised already
+        and are canonicalised by sorting the keys.
+        """
+        payload = json.dumps(
+            [integration_id, task_name, task_args or [], task_kwargs or {}],
+            sort_keys=True,
+            separators=(',', ':'),
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _counted_requests(cls, *, status, number_of_remote_requests):
+        """
+        Contribution of a task to the (pending, processing) counters of its integration.
+        """
+        if status == cls.PENDING:
+            return number_of_remote_requests, 0
+        if status == cls.PROCESSING:
+            return 0, number_of_remote_requests
+        return 0, 0
+
+    @classmethod
+    def bulk_update_status(cls, tasks, status):
+        """
+        Move the given tasks to a new status in one query and keep the integration counters in sync.
+        """
+        from dirtyfields.dirtyfields import reset_state
+
+        deltas = {}
+        for task in tasks:
+            if status != cls.PENDING:
+                task.content_hash = None
+
+            old_pending, old_processing = cls._counted_requests(status=task.status, number_of_remote_requests=task.number_of_remote_requests)
+            new_pending, new_processing = cls._counted_requests(status=status, number_of_remote_requests=task.number_of_remote_requests)
+            pending, processing = deltas.get(task.integration_id, (0, 0))
+            deltas[task.integration_id] = (pending + new_pending - old_pending, processing + new_processing - old_processing)
+            task.status = status
+
+        if not tasks:
+            return
+
+        cls.objects.bulk_update(tasks, ['status', 'content_hash'])
+
+        for task in tasks:
+            reset_state(sender=cls, instance=task)
+
+        for integration_id, (pending, processing) in deltas.items():
+            IntegrationTaskQueueCounter.apply_delta(integration_id=integration_id, pending=pending, processing=processing)
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            previous_status, previous_requests = None, self.number_of_remote_requests
+        else:
+            dirty_fields = self.get_dirty_fields()
+            previous_status = dirty_fields.get('status', self.status)
+            previous_requests = dirty_fields.get('number_of_remote_requests', self.number_of_remote_requests)
+
+        # Only pending rows are merge targets, a retried task comes back as a regular pending row.
+        if self.status != self.PENDING:
+            self.content_hash = None
+
+        super().save(*args, **kwargs)
+
+        if previous_status == self.status and previous_requests == self.number_of_remote_requests:
+            return
+
+        old_pending, old_processing = self._counted_requests(status=previous_status, number_of_remote_requests=previous_requests)
+        new_pending, new_processing = self._counted_requests(status=self.status, number_of_remote_requests=self.number_of_remote_requests)
+        IntegrationTaskQueueCounter.apply_delta(
+            integration_id=self.integration_id,
+            pending=new_pending - old_pending,
+            processing=new_processing - old_processing,
+        )
+
     def __str__(self):
         hostname = self.integration.hostname if self.integration else "N/A"
         return f"{self.name} > {hostname}"
 
     @classmethod
     def get_pending_tasks(cls, integration):
-        # Sum the number of remote requests for currently processing tasks
-        processing_requests = cls.objects.filter(
+        """
+        Claim the pending tasks that fit in the integration token bucket and flag them as processing.
+
+        Rows are locked with SKIP LOCKED so several workers can drain the same integration in parallel
+        without picking the same task twice.
+        """
+        from django.db import transaction
+
+        bucket = integration.get_task_queue_bucket()
+
+        with transaction.atomic():
+            # Get pending tasks, ordered by priority (high first) then by sent_to_queue_at.
+            # Every task costs at least one token, so we never need more rows than the bucket capacity.
+            pending_tasks = list(
+                cls.objects.select_for_update(skip_locked=True).filter(
+                    integration=integration,
+                    status=cls.PENDING
+                ).order_by('-priority', 'sent_to_queue_at')[:max(integration.requests_per_minute, 1)]
+            )
+
+            if not pending_tasks:
+                return []
+
+            granted = bucket.consume_sequence(task.number_of_remote_requests for task in pending_tasks)
+            selected_tasks = pending_tasks[:granted]
+            cls.bulk_update_status(selected_tasks, cls.PROCESSING)
+
+        return selected_tasks
+
+    @classmethod
+    def schedule_queue_processing(cls, integration):
+        """
+        Schedule a drain of the integration queue for the moment the next pending task fits in the bucket.
+        Only one drain is scheduled per integration at a time.
+        """
+        from django.core.cache import cache
+        from integrations.tasks import process_integration_tasks_queue
+
+        drain_key = f"integration_task_queue_drain:{integration.id}"
+        if cache.get(drain_key):
+            # A drain is already on its way, skip the queue lookup.
+            return
+
+        next_task = cls.objects.filter(
             integration=integration,
-            status=cls.PROCESSING
-        ).aggregate(total=models.Sum('number_of_remote_requests'))['total'] or 0
-
-        # Calculate the number of requests that can still be processed
-        remaining_requests = integration.requests_per_minute - processing_requests
-
-        if remaining_requests > 0:
-            # Get pending tasks, ordered by priority (high first) then by sent_to_queue_at
-            pending_tasks = cls.objects.filter(
-                integration=integration,
-                status=cls.PENDING
-            ).order_by('-priority', 'sent_to_queue_at')
-
-            # Select tasks until the sum of their remote requests fits the remaining capacity
-            selected_tasks = []
-            total_requests = 0
-
-            for task in pending_tasks:
-                task_requests = task.number_of_remote_requests
-
-                # if a task is bigger than the limit just add it. It will keep the queue full until is finished but at least will be processed
-                if task_requests > integration.requests_per_minute:
-                    task.status = cls.PROCESSING
-                    selected_tasks.append(task)
-                    break
-
-                if total_requests + task_requests <= remaining_requests:
-                    task.status = cls.PROCESSING
-                    selected_tasks.append(task)
-                    total_requests += task_requests
-                else:
-                    break
-
-            if selected_tasks:
-                cls.objects.bulk_update(selected_tasks, ['status'])
-            return selected_tasks
-
-        return []
+            status=cls.PENDING
+        ).order_by('-priority', 'sent_to_queue_at').only('number_of_remote_requests').first()
+
+        if next_task is None:
+            return
+
+        bucket = integration.get_task_queue_bucket()
+        wait = bucket.seconds_until_available(next_task.number_of_remote_requests)
+        if math.isinf(wait):
+            # A bucket without refill rate never frees up, only the periodic scan can pick these up.
+            return
+
+        delay = max(int(wait + 1), 1)
+
+        if not cache.add(drain_key, True, timeout=delay):
+            return
+
+        process_integration_tasks_queue.schedule(kwargs={'integration_id': integration.id}, delay=delay)
 
     def mark_as_processed(self):
         self.status = self.PROCESSED
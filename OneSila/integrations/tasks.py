@@ -1,4 +1,4 @@
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 from huey import crontab
 from huey.contrib.djhuey import db_task, periodic_task, db_periodic_task
 
@@ -35,10 +35,34 @@ def add_task_to_queue(
     fac.run()
 
 
+@db_task(priority=CRUCIAL_PRIORITY)
+def add_tasks_to_queue(*, integration_id: str | int, tasks: List[Dict]) -> None:
+    """
+    Enqueue a batch of tasks for one integration with a single huey message.
+    Every entry takes the same keys as add_task_to_queue.
+    """
+    from integrations.factories.task_queue import BulkTaskQueueFactory
+
+    fac = BulkTaskQueueFactory(integration_id=integration_id, tasks=tasks)
+    fac.run()
+
+
+@db_task(priority=CRUCIAL_PRIORITY)
+def process_integration_tasks_queue(*, integration_id: str | int) -> None:
+    """
+    Drain the task queue of a single integration as soon as its token bucket has capacity again.
+    """
+    from integrations.factories.task_queue import ProcessIntegrationTasksFactory
+
+    fac = ProcessIntegrationTasksFactory(integration_ids=[integration_id])
+    fac.run()
+
+
 @db_periodic_task(crontab(minute="*"))
 def sales_channels_process_remote_tasks_queue():
     """
     Periodically process the task queue for all active integrations.
+    Acts as a safety net for the per-integration drains scheduled from the token bucket.
     """
     from integrations.factories.task_queue import ProcessIntegrationTasksFactory
 
@@ -46,6 +70,17 @@ def sales_channels_process_remote_tasks_queue():
     fac.run()
 
 
+@db_periodic_task(crontab(minute="*/15"))
+def reconcile_task_queue_counters():
+    """
+    Repair any drift between the running queue counters and the actual queue content.
+    """
+    from integrations.factories.task_queue import ReconcileTaskQueueCountersFactory
+
+    fac = ReconcileTaskQueueCountersFactory()
+    fac.run()
+
+
 @db_periodic_task(crontab(hour=2, minute=0, day='1,15'))
 def clean_up_processed_tasks():
     deleted_count, _ = IntegrationTaskQueue.objects.filter(status=IntegrationTaskQueue.PROCESSED).delete()
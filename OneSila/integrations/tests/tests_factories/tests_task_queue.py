@@ -0,0 +1,252 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from model_bakery import baker
+
+from core.huey import HIGH_PRIORITY, LOW_PRIORITY
+from core.tests import TestCase
+from integrations.factories.task_queue import (
+    BulkTaskQueueFactory,
+    ProcessIntegrationTasksFactory,
+    ReconcileTaskQueueCountersFactory,
+    TaskQueueFactory,
+)
+from integrations.models import Integration, IntegrationTaskQueue, IntegrationTaskQueueCounter
+
+
+class IntegrationTaskQueueTokenBucketTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.integration = baker.make(
+            Integration,
+            hostname='https://bucket.example.com',
+            requests_per_minute=3,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+    def _make_task(self, *, priority=50, number_of_remote_requests=1):
+        return IntegrationTaskQueue.objects.create(
+            integration=self.integration,
+            task_name='integrations.tests.dummy_task',
+            task_args=[],
+            task_kwargs={},
+            priority=priority,
+            number_of_remote_requests=number_of_remote_requests,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+    def test_get_pending_tasks_claims_only_what_fits_in_the_bucket(self):
+        low = self._make_task(priority=10)
+        high = self._make_task(priority=90, number_of_remote_requests=2)
+        self._make_task(priority=50)
+
+        selected = IntegrationTaskQueue.get_pending_tasks(self.integration)
+
+        self.assertEqual([task.id for task in selected], [high.id, IntegrationTaskQueue.objects.get(priority=50).id])
+        self.assertEqual(IntegrationTaskQueue.objects.filter(status=IntegrationTaskQueue.PROCESSING).count(), 2)
+        low.refresh_from_db()
+        self.assertEqual(low.status, IntegrationTaskQueue.PENDING)
+
+        # The bucket is empty now, so a second drain claims nothing.
+        self.assertEqual(IntegrationTaskQueue.get_pending_tasks(self.integration), [])
+
+    @patch('integrations.tasks.process_integration_tasks_queue.schedule')
+    def test_process_factory_schedules_a_single_drain_for_leftovers(self, schedule_mock):
+        for _ in range(5):
+            self._make_task()
+
+        with patch.object(IntegrationTaskQueue, 'safe_dispatch') as dispatch_mock:
+            ProcessIntegrationTasksFactory(integration_ids=[self.integration.id]).run()
+            ProcessIntegrationTasksFactory(integration_ids=[self.integration.id]).run()
+
+        self.assertEqual(dispatch_mock.call_count, 3)
+        schedule_mock.assert_called_once()
+        self.assertEqual(schedule_mock.call_args.kwargs['kwargs'], {'integration_id': self.integration.id})
+
+    @patch('integrations.tasks.process_integration_tasks_queue.schedule')
+    def test_scheduled_drain_skips_the_queue_lookup(self, schedule_mock):
+        self._make_task()
+        IntegrationTaskQueue.schedule_queue_processing(self.integration)
+
+        with self.assertNumQueries(0):
+            IntegrationTaskQueue.schedule_queue_processing(self.integration)
+
+        schedule_mock.assert_called_once()
+
+    def test_process_factory_ignores_integrations_without_pending_tasks(self):
+        self.assertFalse(ProcessIntegrationTasksFactory().integrations.filter(id=self.integration.id).exists())
+
+        self._make_task()
+
+        self.assertTrue(ProcessIntegrationTasksFactory().integrations.filter(id=self.integration.id).exists())
+
+
+class IntegrationTaskQueueCounterTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.integration = baker.make(
+            Integration,
+            hostname='https://counter.example.com',
+            requests_per_minute=10,
+            max_retries=2,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+    def _make_task(self, *, status=IntegrationTaskQueue.PENDING, number_of_remote_requests=1):
+        return IntegrationTaskQueue.objects.create(
+            integration=self.integration,
+            task_name='integrations.tests.dummy_task',
+            task_args=[],
+            task_kwargs={},
+            status=status,
+            number_of_remote_requests=number_of_remote_requests,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+    def _counter(self):
+        return IntegrationTaskQueueCounter.objects.get(integration=self.integration)
+
+    def test_counter_follows_task_lifecycle(self):
+        first = self._make_task(number_of_remote_requests=2)
+        second = self._make_task(status=IntegrationTaskQueue.PROCESSING, number_of_remote_requests=3)
+
+        counter = self._counter()
+        self.assertEqual((counter.pending_requests, counter.processing_requests), (2, 3))
+
+        IntegrationTaskQueue.get_pending_tasks(self.integration)
+        counter = self._counter()
+        self.assertEqual((counter.pending_requests, counter.processing_requests), (0, 5))
+
+        first.refresh_from_db()
+        first.mark_as_failed(error_message='boom')
+        counter = self._counter()
+        self.assertEqual((counter.pending_requests, counter.processing_requests), (2, 3))
+
+        second.mark_as_processed()
+        self.assertEqual(IntegrationTaskQueueCounter.get_active_requests(self.integration), 2)
+
+    def test_reconcile_repairs_drift(self):
+        self._make_task(number_of_remote_requests=4)
+        IntegrationTaskQueueCounter.objects.filter(integration=self.integration).update(pending_requests=99, processing_requests=7)
+
+        fac = ReconcileTaskQueueCountersFactory(integration_ids=[self.integration.id])
+        fac.run()
+
+        counter = self._counter()
+        self.assertEqual(fac.fixed_counters, 1)
+        self.assertEqual((counter.pending_requests, counter.processing_requests), (4, 0))
+
+
+def dummy_remote_task(task_queue_item_id, **kwargs):
+    return None
+
+
+class TaskQueueCoalescingTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        # Zero capacity keeps every task pending so they can be merged.
+        self.integration = baker.make(
+            Integration,
+            hostname='https://coalesce.example.com',
+            requests_per_minute=0,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+    def _enqueue(self, *, priority, **task_kwargs):
+        fac = TaskQueueFactory(
+            integration_id=self.integration.id,
+            task_func_path='integrations.tests.tests_factories.tests_task_queue.dummy_remote_task',
+            task_kwargs=task_kwargs,
+            priority=priority,
+        )
+        with patch('integrations.models.IntegrationTaskQueue.schedule_queue_processing'):
+            fac.run()
+        return fac
+
+    def test_identical_pending_tasks_are_merged_keeping_highest_priority(self):
+        first = self._enqueue(priority=LOW_PRIORITY, sales_channel_id=1, remote_product_id=2)
+        second = self._enqueue(priority=HIGH_PRIORITY, remote_product_id=2, sales_channel_id=1)
+
+        self.assertFalse(first.coalesced)
+        self.assertTrue(second.coalesced)
+        self.assertEqual(IntegrationTaskQueue.objects.filter(integration=self.integration).count(), 1)
+
+        task = IntegrationTaskQueue.objects.get(integration=self.integration)
+        self.assertEqual(task.priority, HIGH_PRIORITY)
+
+        counter = IntegrationTaskQueueCounter.objects.get(integration=self.integration)
+        self.assertEqual(counter.coalesced_tasks, 1)
+        self.assertEqual(counter.pending_requests, 1)
+
+    def test_different_kwargs_are_not_merged(self):
+        self._enqueue(priority=LOW_PRIORITY, sales_channel_id=1, remote_product_id=2)
+        self._enqueue(priority=LOW_PRIORITY, sales_channel_id=1, remote_product_id=3)
+
+        self.assertEqual(IntegrationTaskQueue.objects.filter(integration=self.integration).count(), 2)
+
+    def test_claimed_task_is_no_longer_a_merge_target(self):
+        self._enqueue(priority=LOW_PRIORITY, sales_channel_id=1, remote_product_id=2)
+        task = IntegrationTaskQueue.objects.get(integration=self.integration)
+        IntegrationTaskQueue.bulk_update_status([task], IntegrationTaskQueue.PROCESSING)
+
+        second = self._enqueue(priority=LOW_PRIORITY, sales_channel_id=1, remote_product_id=2)
+
+        self.assertFalse(second.coalesced)
+        self.assertEqual(IntegrationTaskQueue.objects.filter(integration=self.integration).count(), 2)
+
+
+class BulkTaskQueueFactoryTestCase(TestCase):
+    task_func_path = 'integrations.tests.tests_factories.tests_task_queue.dummy_remote_task'
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.integration = baker.make(
+            Integration,
+            hostname='https://bulk.example.com',
+            requests_per_minute=3,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+    def _run(self, tasks):
+        fac = BulkTaskQueueFactory(integration_id=self.integration.id, tasks=tasks)
+        with patch.object(TaskQueueFactory, 'dispatch_task') as dispatch_mock, \
+                patch('integrations.models.IntegrationTaskQueue.schedule_queue_processing') as schedule_mock:
+            fac.run()
+        return fac, dispatch_mock, schedule_mock
+
+    def test_bulk_enqueue_splits_process_now_like_single_enqueues(self):
+        tasks = [
+            {'task_func_path': self.task_func_path, 'task_kwargs': {'remote_product_id': index}}
+            for index in range(5)
+        ]
+
+        fac, dispatch_mock, schedule_mock = self._run(tasks)
+
+        queue = IntegrationTaskQueue.objects.filter(integration=self.integration)
+        self.assertEqual(queue.count(), 5)
+        self.assertEqual(queue.filter(status=IntegrationTaskQueue.PROCESSING).count(), 3)
+        self.assertEqual(queue.filter(status=IntegrationTaskQueue.PENDING).count(), 2)
+        self.assertEqual(dispatch_mock.call_count, 3)
+        schedule_mock.assert_called_once()
+
+        counter = IntegrationTaskQueueCounter.objects.get(integration=self.integration)
+        self.assertEqual((counter.pending_requests, counter.processing_requests), (2, 3))
+
+    def test_bulk_enqueue_merges_duplicates_and_keeps_priority(self):
+        tasks = [
+            {'task_func_path': self.task_func_path, 'task_kwargs': {'remote_product_id': 1}, 'priority': LOW_PRIORITY},
+            {'task_func_path': self.task_func_path, 'task_kwargs': {'remote_product_id': 1}, 'priority': HIGH_PRIORITY},
+            {'task_func_path': self.task_func_path, 'task_kwargs': {'remote_product_id': 2}, 'number_of_remote_requests': 2},
+        ]
+
+        fac, _, _ = self._run(tasks)
+
+        queue = IntegrationTaskQueue.objects.filter(integration=self.integration)
+        self.assertEqual(fac.coalesced_count, 1)
+        self.assertEqual(queue.count(), 2)
+        self.assertEqual(queue.get(task_kwargs__remote_product_id=1).priority, HIGH_PRIORITY)
+        self.assertEqual(queue.get(task_kwargs__remote_product_id=2).number_of_remote_requests, 2)
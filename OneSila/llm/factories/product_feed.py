@@ -17,6 +17,7 @@ from products.models import Product
 from properties.models import ProductProperty
 from sales_channels.helpers import build_content_payload
 from sales_channels.models import RemoteProduct, SalesChannelViewAssign
+from sales_prices.helpers import SalesChannelPriceResolver
 
 
 @dataclass(frozen=True)
@@ -45,6 +46,7 @@ class ProductFeedPayloadFactory:
         products = self._resolve_products()
         property_cache = self._prepare_property_cache(products=products)
         media_map = self._prepare_media(products=products)
+        price_resolver = self._prepare_prices(products=products)
         parent_content_payload = build_content_payload(
             product=self.parent_product,
             sales_channel=self.sales_channel,
@@ -65,6 +67,7 @@ class ProductFeedPayloadFactory:
                     parent_content_payload=parent_content_payload,
                     property_cache=property_cache,
                     media_map=media_map,
+                    price_resolver=price_resolver,
                 )
             )
 
@@ -223,6 +226,14 @@ class ProductFeedPayloadFactory:
 
         return media_map
 
+    def _prepare_prices(self, *, products: Sequence[Product]) -> SalesChannelPriceResolver:
+        resolver = SalesChannelPriceResolver(
+            sales_channel=self.sales_channel,
+            product_ids=[product.id for product in products],
+        )
+        resolver.resolve()
+        return resolver
+
     def _get_property_value(
         self,
         *,
@@ -468,6 +479,7 @@ class ProductFeedPayloadFactory:
         parent_content_payload: Dict[str, object],
         property_cache: Dict[tuple[int, int], ProductProperty],
         media_map: Dict[int, List[MediaProductThrough]],
+        price_resolver: SalesChannelPriceResolver,
     ) -> Dict[str, object]:
         title = content_payload.get("name") or product.name
         description = content_payload.get("description")
@@ -488,7 +500,7 @@ class ProductFeedPayloadFactory:
         weight = self._compute_weight(product=product, property_cache=property_cache)
 
         availability, availability_date = self._compute_availability(product=product)
-        price, sale_price = product.get_price_for_sales_channel(self.sales_channel)
+        price, sale_price = price_resolver.get(product_id=product.id)
 
         item_group_id = None
         item_group_title = None
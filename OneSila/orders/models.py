@@ -1,5 +1,6 @@
 from core import models
-from currency_converter import CurrencyConverter, RateNotFoundError
+from currency_converter import RateNotFoundError
+from currencies.helpers import get_currency_converter
 
 from .managers import OrderItemManager, OrderManager
 
@@ -36,7 +37,7 @@ class Order(models.SetStatusMixin, models.Model):
     def total_value_custom_currency(self, currency_symbol):
         '''return the total_value in the given currency'''
         if self.currency.iso_code != currency_symbol:  # FIXME: Detect default currency instead
-            c = CurrencyConverter()
+            c = get_currency_converter()
             try:
                 return c.convert(self.total_value, self.currency.iso_code, currency_symbol, date=self.created_at)
             except RateNotFoundError:
@@ -79,7 +80,7 @@ class OrderItem(models.Model):
         price = self.price
 
         if self.order.currency.iso_code != currency_symbol:  # FIXME: Detect default currency instead
-            c = CurrencyConverter()
+            c = get_currency_converter()
             try:
                 price = c.convert(self.price, self.order.currency.iso_code, currency_symbol, date=self.order.created_at)
             except RateNotFoundError:
@@ -0,0 +1,102 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from products.models import Product, ProductSearchDocument, ProductTranslation
+
+
+class ProductSearchDocumentFactory:
+    """
+    Rebuild the search documents for the given products.
+
+    Every source (SKU, translated names, EAN codes and select value labels) is read with one
+    set-based query for the whole batch, and the documents are written with a single upsert.
+    """
+    batch_size = 500
+
+    def __init__(self, product_ids):
+        self.product_ids = list(set(product_ids))
+        self.parts = defaultdict(list)
+        self.products = {}
+
+    def set_products(self):
+        qs = Product.objects.filter(id__in=self.product_ids).values_list('id', 'multi_tenant_company_id')
+        self.products = {pk: multi_tenant_company_id for pk, multi_tenant_company_id in qs}
+
+    def add_part(self, product_id, value):
+        if value:
+            self.parts[product_id].append(str(value).lower())
+
+    def collect_skus(self):
+        for product_id, sku in Product.objects.filter(id__in=self.products.keys()).values_list('id', 'sku'):
+            self.add_part(product_id, sku)
+
+    def collect_names(self):
+        qs = ProductTranslation.objects.filter(product_id__in=self.products.keys()).values_list('product_id', 'name')
+        for product_id, name in qs:
+            self.add_part(product_id, name)
+
+    def collect_ean_codes(self):
+        from eancodes.models import EanCode
+
+        qs = EanCode.objects.filter(product_id__in=self.products.keys()).values_list('product_id', 'ean_code')
+        for product_id, ean_code in qs:
+            self.add_part(product_id, ean_code)
+
+    def collect_select_values(self):
+        from properties.models import ProductProperty, PropertySelectValueTranslation
+
+        product_ids = self.products.keys()
+        value_products = defaultdict(set)
+
+        selects = ProductProperty.objects.filter(
+            product_id__in=product_ids,
+            value_select__isnull=False,
+        ).values_list('product_id', 'value_select_id')
+        multi_selects = ProductProperty.value_multi_select.through.objects.filter(
+            productproperty__product_id__in=product_ids,
+        ).values_list('productproperty__product_id', 'propertyselectvalue_id')
+
+        for product_id, value_id in [*selects, *multi_selects]:
+            value_products[value_id].add(product_id)
+
+        if not value_products:
+            return
+
+        translations = PropertySelectValueTranslation.objects.filter(
+            propertyselectvalue_id__in=value_products.keys(),
+        ).values_list('propertyselectvalue_id', 'value')
+        for value_id, value in translations:
+            for product_id in value_products[value_id]:
+                self.add_part(product_id, value)
+
+    def build_documents(self):
+        return [
+            ProductSearchDocument(
+                product_id=product_id,
+                multi_tenant_company_id=multi_tenant_company_id,
+                document=' '.join(dict.fromkeys(self.parts[product_id])),
+            )
+            for product_id, multi_tenant_company_id in self.products.items()
+        ]
+
+    @transaction.atomic
+    def save_documents(self):
+        ProductSearchDocument.objects.bulk_create(
+            self.build_documents(),
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=['product'],
+            update_fields=['document', 'multi_tenant_company', 'updated_at'],
+        )
+
+    def run(self):
+        self.set_products()
+        if not self.products:
+            return
+
+        self.collect_skus()
+        self.collect_names()
+        self.collect_ean_codes()
+        self.collect_select_values()
+        self.save_documents()
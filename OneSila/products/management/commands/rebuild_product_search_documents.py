@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from products.factories.search_documents import ProductSearchDocumentFactory
+from products.models import Product
+
+
+class Command(BaseCommand):
+    help = "Rebuild the product search documents used by the PostgreSQL search backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--mtc-id", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        queryset = Product.objects.all().order_by("id")
+        if options["mtc_id"] is not None:
+            queryset = queryset.filter(multi_tenant_company_id=options["mtc_id"])
+
+        batch_size = options["batch_size"]
+        product_ids = list(queryset.values_list("id", flat=True))
+
+        for start in range(0, len(product_ids), batch_size):
+            ProductSearchDocumentFactory(product_ids=product_ids[start:start + batch_size]).run()
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search documents for {len(product_ids)} products."))
@@ -0,0 +1,61 @@
+# Generated by Django 5.2 on 2026-10-18 11:40
+
+import core.models.core
+import dirtyfields.dirtyfields
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # The trigram and full-text indexes only exist on PostgreSQL, other databases use the ORM search.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS products_searchdoc_trgm_idx "
+        "ON products_productsearchdocument USING gin (document gin_trgm_ops)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS products_searchdoc_tsv_idx "
+        "ON products_productsearchdocument USING gin (to_tsvector('simple'::regconfig, COALESCE(document, '')))"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS products_searchdoc_trgm_idx")
+    schema_editor.execute("DROP INDEX IF EXISTS products_searchdoc_tsv_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_alter_dashboardcard_url'),
+        ('products', '0025_alter_producttranslation_language'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('document', models.TextField(blank=True, default='')),
+                ('created_by_multi_tenant_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_created_by_multi_tenant_user_set', to=settings.AUTH_USER_MODEL)),
+                ('last_update_by_multi_tenant_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_last_update_by_multi_tenant_user_set', to=settings.AUTH_USER_MODEL)),
+                ('multi_tenant_company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='core.multitenantcompany')),
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='search_document', to='products.product')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['multi_tenant_company', 'product'], name='products_searchdoc_mtc_idx')],
+            },
+            bases=(dirtyfields.dirtyfields.DirtyFieldsMixin, core.models.core.GetAbsoluteURLMixin, models.Model),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2 on 2026-10-18 11:42
+
+from collections import defaultdict
+
+from django.db import migrations
+from django.utils import timezone
+
+
+BATCH_SIZE = 1000
+
+
+def populate_search_documents(apps, schema_editor):
+    # The documents only back the PostgreSQL search backend, other databases keep the ORM search.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    Product = apps.get_model('products', 'Product')
+    ProductTranslation = apps.get_model('products', 'ProductTranslation')
+    ProductSearchDocument = apps.get_model('products', 'ProductSearchDocument')
+    EanCode = apps.get_model('eancodes', 'EanCode')
+    ProductProperty = apps.get_model('properties', 'ProductProperty')
+    PropertySelectValueTranslation = apps.get_model('properties', 'PropertySelectValueTranslation')
+    MultiSelectThrough = ProductProperty.value_multi_select.through
+
+    product_rows = list(Product.objects.order_by('id').values_list('id', 'multi_tenant_company_id', 'sku'))
+
+    for start in range(0, len(product_rows), BATCH_SIZE):
+        batch = product_rows[start:start + BATCH_SIZE]
+        product_ids = [row[0] for row in batch]
+        parts = defaultdict(list)
+
+        def add_part(product_id, value):
+            if value:
+                parts[product_id].append(str(value).lower())
+
+        for product_id, _, sku in batch:
+            add_part(product_id, sku)
+
+        for product_id, name in ProductTranslation.objects.filter(product_id__in=product_ids).values_list('product_id', 'name'):
+            add_part(product_id, name)
+
+        for product_id, ean_code in EanCode.objects.filter(product_id__in=product_ids).values_list('product_id', 'ean_code'):
+            add_part(product_id, ean_code)
+
+        value_products = defaultdict(set)
+        selects = ProductProperty.objects.filter(
+            product_id__in=product_ids,
+            value_select__isnull=False,
+        ).values_list('product_id', 'value_select_id')
+        multi_selects = MultiSelectThrough.objects.filter(
+            productproperty__product_id__in=product_ids,
+        ).values_list('productproperty__product_id', 'propertyselectvalue_id')
+        for product_id, value_id in [*selects, *multi_selects]:
+            value_products[value_id].add(product_id)
+
+        translations = PropertySelectValueTranslation.objects.filter(
+            propertyselectvalue_id__in=value_products.keys(),
+        ).values_list('propertyselectvalue_id', 'value')
+        for value_id, value in translations:
+            for product_id in value_products[value_id]:
+                add_part(product_id, value)
+
+        now = timezone.now()
+        ProductSearchDocument.objects.bulk_create(
+            [
+                ProductSearchDocument(
+                    product_id=product_id,
+                    multi_tenant_company_id=multi_tenant_company_id,
+                    document=' '.join(dict.fromkeys(parts[product_id])),
+                    created_at=now,
+                    updated_at=now,
+                )
+                for product_id, multi_tenant_company_id, _ in batch
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eancodes', '0002_alter_eancode_ean_code'),
+        ('products', '0026_productsearchdocument'),
+        ('properties', '0022_property_translation_match_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
@@ -166,107 +166,107 @@ class Product(TranslatedModelMixin, models.Model):
         else:
             return self
 
+    def get_product_rule_requirements(self, *, sales_channel=None):
+        from properties.helpers import ProductRuleRequirements, ProductRuleRequirementsResolver
+
+        if self.pk is None:
+            return ProductRuleRequirements()
+
+        resolver = ProductRuleRequirementsResolver(
+            multi_tenant_company=self.multi_tenant_company_id,
+            product_ids=[self.pk],
+            sales_channel=sales_channel,
+        )
+        resolver.resolve()
+        return resolver.get(product_id=self.pk)
+
     def get_product_rule(self, *, sales_channel=None):
         from properties.models import ProductPropertiesRule
-        from django.core.exceptions import ObjectDoesNotExist
 
-        try:
-            product_type_value = self.productproperty_set.get(property__is_product_type=True)
-
-            filters = {
-                'product_type_id': product_type_value.value_select.id,
-                'multi_tenant_company': self.multi_tenant_company,
-            }
-
-            if sales_channel is not None:
-                try:
-                    return ProductPropertiesRule.objects.get(
-                        **filters,
-                        sales_channel=sales_channel,
-                    )
-                except ProductPropertiesRule.DoesNotExist:
-                    pass
+        rule_id = self.get_product_rule_requirements(sales_channel=sales_channel).rule_id
+        if rule_id is None:
+            return None
 
-            try:
-                return ProductPropertiesRule.objects.get(
-                    **filters,
-                    sales_channel__isnull=True,
-                )
-            except ProductPropertiesRule.DoesNotExist:
-                return None
-        except (ObjectDoesNotExist, AttributeError):
+        try:
+            return ProductPropertiesRule.objects.get(id=rule_id)
+        except ProductPropertiesRule.DoesNotExist:
             return None
 
-    def get_configurator_properties(self, *, product_rule=None, public_information_only=True, sales_channel=None):
+    def get_product_rule_items(self, *, product_rule=None, types=None, public_information_only=True, sales_channel=None):
+        """
+        Items of the given rule, or of the effective rule resolved through the cached rule requirements.
+        """
         from properties.models import ProductPropertiesRuleItem
 
+        if product_rule is not None:
+            rule_id = product_rule.id
+        else:
+            rule_id = self.get_product_rule_requirements(sales_channel=sales_channel).rule_id
+
         queryset = ProductPropertiesRuleItem.objects.filter(
-            multi_tenant_company=self.multi_tenant_company,
-            rule=product_rule or self.get_product_rule(sales_channel=sales_channel),
-            type__in=[
-                ProductPropertiesRuleItem.REQUIRED_IN_CONFIGURATOR,
-                ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR
-            ]
+            multi_tenant_company_id=self.multi_tenant_company_id,
+            rule_id=rule_id,
         )
+        if types is not None:
+            queryset = queryset.filter(type__in=types)
         if public_information_only:
             queryset = queryset.filter(property__is_public_information=True)
 
         return queryset.select_related('property')
 
-    def get_optional_in_configurator_properties(self, *, product_rule=None, public_information_only=True, sales_channel=None):
+    def get_configurator_properties(self, *, product_rule=None, public_information_only=True, sales_channel=None):
         from properties.models import ProductPropertiesRuleItem
 
-        queryset = ProductPropertiesRuleItem.objects.filter(
-            multi_tenant_company=self.multi_tenant_company,
-            rule=product_rule or self.get_product_rule(sales_channel=sales_channel),
-            type=ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR
+        return self.get_product_rule_items(
+            product_rule=product_rule,
+            types=[
+                ProductPropertiesRuleItem.REQUIRED_IN_CONFIGURATOR,
+                ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR
+            ],
+            public_information_only=public_information_only,
+            sales_channel=sales_channel,
         )
-        if public_information_only:
-            queryset = queryset.filter(property__is_public_information=True)
 
-        return queryset.select_related('property')
+    def get_optional_in_configurator_properties(self, *, product_rule=None, public_information_only=True, sales_channel=None):
+        from properties.models import ProductPropertiesRuleItem
+
+        return self.get_product_rule_items(
+            product_rule=product_rule,
+            types=[ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR],
+            public_information_only=public_information_only,
+            sales_channel=sales_channel,
+        )
 
     def get_required_properties(self, *, product_rule=None, public_information_only=True, sales_channel=None):
         from properties.models import ProductPropertiesRuleItem
 
-        queryset = ProductPropertiesRuleItem.objects.filter(
-            multi_tenant_company=self.multi_tenant_company,
-            rule=product_rule or self.get_product_rule(sales_channel=sales_channel),
-            type__in=[
+        return self.get_product_rule_items(
+            product_rule=product_rule,
+            types=[
                 ProductPropertiesRuleItem.REQUIRED,
                 ProductPropertiesRuleItem.REQUIRED_IN_CONFIGURATOR,
                 ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR
-            ]
+            ],
+            public_information_only=public_information_only,
+            sales_channel=sales_channel,
         )
-        if public_information_only:
-            queryset = queryset.filter(property__is_public_information=True)
-
-        return queryset.select_related('property')
 
     def get_optional_properties(self, *, product_rule=None, public_information_only=True, sales_channel=None):
         from properties.models import ProductPropertiesRuleItem
 
-        queryset = ProductPropertiesRuleItem.objects.filter(
-            multi_tenant_company=self.multi_tenant_company,
-            rule=product_rule or self.get_product_rule(sales_channel=sales_channel),
-            type=ProductPropertiesRuleItem.OPTIONAL
+        return self.get_product_rule_items(
+            product_rule=product_rule,
+            types=[ProductPropertiesRuleItem.OPTIONAL],
+            public_information_only=public_information_only,
+            sales_channel=sales_channel,
         )
-        if public_information_only:
-            queryset = queryset.filter(property__is_public_information=True)
-
-        return queryset.select_related('property')
 
     def get_required_and_optional_properties(self, *, product_rule=None, public_information_only=True, sales_channel=None):
-        from properties.models import ProductPropertiesRuleItem
-
-        queryset = ProductPropertiesRuleItem.objects.filter(
-            multi_tenant_company=self.multi_tenant_company,
-            rule=product_rule or self.get_product_rule(sales_channel=sales_channel),
+        return self.get_product_rule_items(
+            product_rule=product_rule,
+            public_information_only=public_information_only,
+            sales_channel=sales_channel,
         )
-        if public_information_only:
-            queryset = queryset.filter(property__is_public_information=True)
-
-        return queryset.select_related('property')
 
     def get_unique_configurable_variations(self, *, sales_channel=None):
         from properties.models import ProductProperty
@@ -305,6 +305,7 @@ class Product(TranslatedModelMixin, models.Model):
         from datetime import date
         from sales_prices.models import SalesPrice, SalesPriceListItem
         from sales_channels.models.sales_channels import SalesChannelIntegrationPricelist
+        from sales_prices.helpers import validate_sales_channel_prices as _validate_prices
         from currencies.models import Currency
 
         if currency is None:
@@ -312,13 +313,6 @@ class Product(TranslatedModelMixin, models.Model):
 
         today = date.today()
 
-        def _validate_prices(price, discount):
-            if price == 0 or discount == 0:
-                raise ValueError("Price or discount cannot be zero")
-            if discount is not None and price is not None and discount >= price:
-                return price, None
-            return price, discount
-
         # Step 1: Check for Periodic Pricelist
         periodic_pricelist = SalesChannelIntegrationPricelist.objects.filter(
             sales_channel=sales_channel,
@@ -496,6 +490,7 @@ class Product(TranslatedModelMixin, models.Model):
     class Meta:
         url_detail_page_string = 'products:product_detail'
         search_terms = ['sku', 'translations__name']
+        search_backend = 'products.search_backends.ProductSearchBackend'
         unique_together = ('sku', 'multi_tenant_company')
         constraints = [
             CheckConstraint(
@@ -732,3 +727,26 @@ class ProductTranslationBulletPoint(models.Model):
 
     class Meta:
         ordering = ['sort_order']
+
+
+class ProductSearchDocument(models.Model):
+    """
+    Denormalised, lowercased search text per product (SKU, translated names, EANs and select value labels).
+    On PostgreSQL it carries a pg_trgm GIN index and backs ProductSearchBackend, it is kept fresh by the
+    receivers in products/receivers.py.
+    """
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, related_name='search_document')
+    document = models.TextField(blank=True, default='')
+
+    def __str__(self):
+        return f"Search document for {self.product_id}"
+
+    @staticmethod
+    def is_enabled(using='default'):
+        from django.db import connections
+        return connections[using].vendor == 'postgresql'
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['multi_tenant_company', 'product'], name='products_searchdoc_mtc_idx'),
+        ]
@@ -1,9 +1,14 @@
 from django.db import models
 from django.dispatch import receiver
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_save, post_delete, m2m_changed
 
+from core.helpers import TransactionBuffer
 from core.schema.core.subscriptions import refresh_subscription_receiver
-from products.models import ProductTranslation
+from core.decorators import trigger_signal_for_dirty_fields
+from core.signals import post_create, post_update
+from imports_exports.signals import products_batch_imported
+from products.models import ProductTranslation, ProductSearchDocument
+from properties.models import ProductProperty, Property
 
 
 import logging
@@ -16,3 +21,142 @@ def products__images__subscription__post_save(sender, instance, **kwargs):
     This is to be sent on the every post_save or relevant signal
     """
     refresh_subscription_receiver(instance.product)
+
+
+SEARCH_DOCUMENT_INLINE_REFRESH_LIMIT = 100
+
+
+def rebuild_product_search_documents(product_ids):
+    """
+    Regular edits touch a handful of products and are rebuilt right away, so the search reflects them
+    as soon as they are saved. Larger fan-outs (a select value used by many products) go to a task.
+    """
+    from products.factories.search_documents import ProductSearchDocumentFactory
+    from products.tasks import products__tasks__refresh_search_documents
+
+    if len(product_ids) <= SEARCH_DOCUMENT_INLINE_REFRESH_LIMIT:
+        ProductSearchDocumentFactory(product_ids=product_ids).run()
+    else:
+        products__tasks__refresh_search_documents(product_ids=product_ids)
+
+
+class SearchDocumentRefreshBuffer(TransactionBuffer):
+    """
+    Collects the products whose search document is outdated during a transaction, so they are
+    rebuilt together once it commits.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.product_ids = set()
+
+    def clear(self):
+        self.product_ids = set()
+
+    def flush(self):
+        product_ids = list(self.product_ids)
+        self.clear()
+        if product_ids:
+            rebuild_product_search_documents(product_ids)
+
+
+search_document_refresh_buffer = SearchDocumentRefreshBuffer()
+
+
+def refresh_product_search_documents(product_ids):
+    """
+    Rebuild the search documents once the surrounding transaction commits, or right away outside one.
+    The documents only back the PostgreSQL search backend, so nothing happens on other databases.
+    """
+    product_ids = {pk for pk in product_ids if pk is not None}
+    if not product_ids or not ProductSearchDocument.is_enabled():
+        return
+
+    if search_document_refresh_buffer.register_flush():
+        search_document_refresh_buffer.product_ids.update(product_ids)
+        return
+
+    rebuild_product_search_documents(list(product_ids))
+
+
+@receiver(post_create, sender='products.Product')
+@receiver(post_create, sender='products.SimpleProduct')
+@receiver(post_create, sender='products.ConfigurableProduct')
+@receiver(post_create, sender='products.BundleProduct')
+@receiver(post_create, sender='products.AliasProduct')
+def products__search_document__product_post_create(sender, instance, **kwargs):
+    refresh_product_search_documents([instance.id])
+
+
+@receiver(post_update, sender='products.Product')
+@receiver(post_update, sender='products.SimpleProduct')
+@receiver(post_update, sender='products.ConfigurableProduct')
+@receiver(post_update, sender='products.BundleProduct')
+@receiver(post_update, sender='products.AliasProduct')
+@trigger_signal_for_dirty_fields('sku')
+def products__search_document__product_sku_changed(sender, instance, **kwargs):
+    refresh_product_search_documents([instance.id])
+
+
+@receiver(post_save, sender=ProductTranslation)
+@receiver(post_delete, sender=ProductTranslation)
+def products__search_document__translation_changed(sender, instance, **kwargs):
+    refresh_product_search_documents([instance.product_id])
+
+
+@receiver(post_save, sender='eancodes.EanCode')
+@receiver(post_delete, sender='eancodes.EanCode')
+def products__search_document__ean_code_changed(sender, instance, **kwargs):
+    refresh_product_search_documents([instance.product_id])
+
+
+def is_indexed_product_property(product_property):
+    # Only the select value labels end up in the search document.
+    return product_property.property.type in (Property.TYPES.SELECT, Property.TYPES.MULTISELECT)
+
+
+@receiver(post_save, sender='properties.ProductProperty')
+def products__search_document__product_property_saved(sender, instance, **kwargs):
+    # Multi select values are set after the save, see the m2m receiver.
+    if instance.property.type == Property.TYPES.SELECT:
+        refresh_product_search_documents([instance.product_id])
+
+
+@receiver(post_delete, sender='properties.ProductProperty')
+def products__search_document__product_property_deleted(sender, instance, **kwargs):
+    if is_indexed_product_property(instance):
+        refresh_product_search_documents([instance.product_id])
+
+
+@receiver(m2m_changed, sender=ProductProperty.value_multi_select.through)
+def products__search_document__multi_select_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            refresh_product_search_documents([instance.product_id])
+        return
+
+    # From the PropertySelectValue side the changed ProductProperties are in pk_set, only a clear
+    # has to read them before they are removed.
+    if action == 'pre_clear':
+        product_ids = instance.value_multi_select_set.values_list('product_id', flat=True)
+    elif action in ('post_add', 'post_remove') and pk_set:
+        product_ids = ProductProperty.objects.filter(id__in=pk_set).values_list('product_id', flat=True)
+    else:
+        return
+
+    refresh_product_search_documents(list(product_ids))
+
+
+@receiver(products_batch_imported)
+def products__search_document__products_batch_imported(sender, instance, created_product_ids, updated_product_ids, **kwargs):
+    refresh_product_search_documents([*created_product_ids, *updated_product_ids])
+
+
+@receiver(post_save, sender='properties.PropertySelectValueTranslation')
+@receiver(post_delete, sender='properties.PropertySelectValueTranslation')
+def products__search_document__select_value_translation_changed(sender, instance, **kwargs):
+    value_id = instance.propertyselectvalue_id
+    product_ids = ProductProperty.objects.filter(
+        models.Q(value_select_id=value_id) | models.Q(value_multi_select__id=value_id)
+    ).values_list('product_id', flat=True).distinct()
+    refresh_product_search_documents(list(product_ids))
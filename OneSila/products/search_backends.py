@@ -0,0 +1,6 @@
+from core.managers.search_backends import DocumentSearchBackend
+
+
+class ProductSearchBackend(DocumentSearchBackend):
+    document_model = 'products.ProductSearchDocument'
+    document_relation_field = 'product'
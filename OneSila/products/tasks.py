@@ -74,3 +74,11 @@ def products__tasks__import_product_translations(
         fields=fields,
     )
     flow.flow()
+
+
+@db_task()
+def products__tasks__refresh_search_documents(*, product_ids: list[int | str]) -> None:
+    from products.factories.search_documents import ProductSearchDocumentFactory
+
+    factory = ProductSearchDocumentFactory(product_ids=product_ids)
+    factory.run()
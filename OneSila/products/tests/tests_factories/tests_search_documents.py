@@ -0,0 +1,86 @@
+from core.tests import TestCase
+
+from eancodes.models import EanCode
+from products.factories.search_documents import ProductSearchDocumentFactory
+from products.models import ProductSearchDocument, ProductTranslation, SimpleProduct
+from products.receivers import search_document_refresh_buffer
+from properties.models import Property, PropertySelectValue, PropertySelectValueTranslation, ProductProperty
+
+
+class ProductSearchDocumentFactoryTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.product = SimpleProduct.objects.create(sku='CHAIR-001', multi_tenant_company=self.multi_tenant_company)
+        ProductTranslation.objects.create(
+            product=self.product,
+            language='en',
+            name='Oak Chair',
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        EanCode.objects.create(product=self.product, ean_code='5400000000017', multi_tenant_company=self.multi_tenant_company)
+
+        color = Property.objects.create(multi_tenant_company=self.multi_tenant_company, type=Property.TYPES.SELECT)
+        red = PropertySelectValue.objects.create(property=color, multi_tenant_company=self.multi_tenant_company)
+        PropertySelectValueTranslation.objects.create(
+            propertyselectvalue=red,
+            language='en',
+            value='Red',
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        ProductProperty.objects.create(
+            product=self.product,
+            property=color,
+            value_select=red,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        # The test transaction never commits, forget the refresh the setup registered.
+        search_document_refresh_buffer.clear()
+        search_document_refresh_buffer.pending_flush = None
+
+    def test_builds_document_from_all_sources(self):
+        ProductSearchDocumentFactory(product_ids=[self.product.id]).run()
+
+        document = ProductSearchDocument.objects.get(product=self.product)
+        self.assertEqual(document.multi_tenant_company, self.multi_tenant_company)
+        for part in ['chair-001', 'oak chair', '5400000000017', 'red']:
+            self.assertIn(part, document.document)
+
+    def test_rebuild_updates_existing_document(self):
+        ProductSearchDocumentFactory(product_ids=[self.product.id]).run()
+        ProductTranslation.objects.filter(product=self.product).update(name='Walnut Chair')
+
+        ProductSearchDocumentFactory(product_ids=[self.product.id]).run()
+
+        self.assertEqual(ProductSearchDocument.objects.filter(product=self.product).count(), 1)
+        document = ProductSearchDocument.objects.get(product=self.product)
+        self.assertIn('walnut chair', document.document)
+        self.assertNotIn('oak chair', document.document)
+
+    def test_deleted_select_value_translation_leaves_the_document(self):
+        ProductSearchDocumentFactory(product_ids=[self.product.id]).run()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PropertySelectValueTranslation.objects.get(value='Red').delete()
+
+        if ProductSearchDocument.is_enabled():
+            document = ProductSearchDocument.objects.get(product=self.product)
+            self.assertNotIn('red', document.document)
+
+    def test_edits_of_a_transaction_are_rebuilt_once(self):
+        size = Property.objects.create(multi_tenant_company=self.multi_tenant_company, type=Property.TYPES.MULTISELECT)
+        large = PropertySelectValue.objects.create(property=size, multi_tenant_company=self.multi_tenant_company)
+        product_property = ProductProperty.objects.create(
+            product=self.product,
+            property=size,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        search_document_refresh_buffer.clear()
+        search_document_refresh_buffer.pending_flush = None
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            large.value_multi_select_set.add(product_property)
+            ProductTranslation.objects.get(product=self.product).save()
+
+        if ProductSearchDocument.is_enabled():
+            self.assertEqual(len(callbacks), 1)
+            self.assertEqual(search_document_refresh_buffer.product_ids, {self.product.id})
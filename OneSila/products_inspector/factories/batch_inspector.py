@@ -0,0 +1,450 @@
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from core.helpers import TransactionBuffer
+from core.schema.core.subscriptions import refresh_subscription_receiver
+from core.signals import post_update
+from products_inspector.constants import REQUIRED, OPTIONAL, NONE, MISSING_PRICES_ERROR, MISSING_VARIATION_ERROR, \
+    MISSING_BUNDLE_ITEMS_ERROR, MISSING_PRODUCT_TYPE_ERROR, MISSING_REQUIRED_PROPERTIES_ERROR, \
+    MISSING_OPTIONAL_PROPERTIES_ERROR, MISSING_STOCK_ERROR, MISSING_MANUAL_PRICELIST_OVERRIDE_ERROR, \
+    ITEMS_MISSING_MANDATORY_INFORMATION_ERROR, VARIATIONS_MISSING_MANDATORY_INFORMATION_ERROR
+from products_inspector.exceptions import InspectorBlockFailed
+from products_inspector.models import Inspector, InspectorBlock
+from products_inspector.signals import inspector_missing_info_detected, inspector_missing_info_resolved, \
+    inspector_missing_optional_info_detected, inspector_missing_optional_info_resolved
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class BatchInspectorBlockFactory:
+    """
+    Re-evaluates many inspector blocks at once.
+
+    Takes (product_id, error_code) pairs, evaluates every error code for all its products with a few
+    set-based queries (error codes without a set-based check reuse the per-block factory `_check`),
+    bulk updates the blocks and inspectors whose state changed and only sends the
+    detected / resolved signals for inspectors that really transitioned.
+    """
+    applicability_fields = [
+        'simple_product_applicability',
+        'bundle_product_applicability',
+        'configurable_product_applicability',
+    ]
+
+    def __init__(self, pairs):
+        self.pairs = {(int(product_id), int(error_code)) for product_id, error_code in pairs}
+        self.changed_blocks = []
+        self.changed_inspectors = []
+        self.transitions = []
+
+    @classmethod
+    def for_products(cls, *, product_ids):
+        """All the blocks of the given products, like a full inspector resync."""
+        pairs = InspectorBlock.objects.filter(inspector__product_id__in=product_ids).values_list('inspector__product_id', 'error_code')
+        return cls(pairs)
+
+    # --------------------
+    # SET-BASED CHECKS
+    # --------------------
+    # Every check receives the products of one company and returns {product_id: fixing_message} for the failed ones.
+
+    def check_missing_prices(self, *, multi_tenant_company, products):
+        from sales_prices.models import SalesPrice
+
+        active_ids = [product.id for product in products if product.active]
+        counts = {
+            row['product_id']: row
+            for row in SalesPrice.objects.filter_multi_tenant(multi_tenant_company).filter(product_id__in=active_ids).
+            values('product_id').annotate(total=Count('id'), valid=Count('id', filter=Q(price__gt=0) | Q(rrp__gt=0)))
+        }
+
+        failed = {}
+        for product_id in active_ids:
+            row = counts.get(product_id)
+            if row is None:
+                failed[product_id] = "Product is missing default price."
+            elif not row['valid']:
+                failed[product_id] = "Product has only placeholder prices (RRP and Price are missing or zero)."
+        return failed
+
+    def check_missing_variation(self, *, multi_tenant_company, products):
+        from products.models import ConfigurableVariation
+
+        with_variations = set(
+            ConfigurableVariation.objects.filter_multi_tenant(multi_tenant_company).
+            filter(parent_id__in=[product.id for product in products], variation__active=True).
+            values_list('parent_id', flat=True)
+        )
+        return {product.id: "Configurable Product have no variation" for product in products if product.id not in with_variations}
+
+    def check_missing_bundle_items(self, *, multi_tenant_company, products):
+        from products.models import BundleVariation
+
+        with_items = set(
+            BundleVariation.objects.filter_multi_tenant(multi_tenant_company).
+            filter(parent_id__in=[product.id for product in products]).
+            values_list('parent_id', flat=True)
+        )
+        return {product.id: "Bundle Product have no items" for product in products if product.id not in with_items}
+
+    def check_missing_product_type(self, *, multi_tenant_company, products):
+        from properties.models import ProductProperty
+
+        with_product_type = set(
+            ProductProperty.objects.filter_multi_tenant(multi_tenant_company).
+            filter(product_id__in=[product.id for product in products], property__is_product_type=True).
+            values_list('product_id', flat=True)
+        )
+        return {
+            product.id: "Product is missing a required product type property."
+            for product in products if product.id not in with_product_type
+        }
+
+    def _get_missing_rule_properties(self, *, multi_tenant_company, products, item_types):
+        """Returns ({product_id: product_type_id}, {product_id: missing property ids}) for the given rule item types."""
+        from properties.models import ProductProperty, ProductPropertiesRuleItem
+
+        product_ids = [product.id for product in products]
+        product_types = {}
+        product_type_values = ProductProperty.objects.filter_multi_tenant(multi_tenant_company).filter(
+            product_id__in=product_ids,
+            property__is_product_type=True,
+        ).order_by('pk').values_list('product_id', 'value_select_id')
+        for product_id, value_select_id in product_type_values:
+            product_types.setdefault(product_id, value_select_id)
+
+        rule_property_ids = defaultdict(set)
+        rule_items = ProductPropertiesRuleItem.objects.filter(
+            rule__multi_tenant_company=multi_tenant_company,
+            rule__product_type_id__in={value for value in product_types.values() if value},
+            type__in=item_types,
+        ).values_list('rule__product_type_id', 'property_id')
+        for product_type_id, property_id in rule_items:
+            rule_property_ids[product_type_id].add(property_id)
+
+        existing = defaultdict(set)
+        all_property_ids = set().union(*rule_property_ids.values()) if rule_property_ids else set()
+        if all_property_ids:
+            existing_values = ProductProperty.objects.filter_multi_tenant(multi_tenant_company).filter(
+                product_id__in=product_ids,
+                property_id__in=all_property_ids,
+            ).values_list('product_id', 'property_id')
+            for product_id, property_id in existing_values:
+                existing[product_id].add(property_id)
+
+        missing = {}
+        for product_id, product_type_id in product_types.items():
+            missing_ids = rule_property_ids.get(product_type_id, set()) - existing[product_id]
+            if missing_ids:
+                missing[product_id] = missing_ids
+
+        return product_types, missing
+
+    def _get_property_labels(self, *, multi_tenant_company, property_ids):
+        from properties.models import Property
+
+        labels = {}
+        if property_ids:
+            queryset = Property.objects.filter_multi_tenant(multi_tenant_company).filter(id__in=property_ids).values_list('id', 'internal_name')
+            for property_id, internal_name in queryset:
+                labels[property_id] = internal_name or str(property_id)
+        return labels
+
+    def _format_missing_properties(self, *, multi_tenant_company, missing, message):
+        labels = self._get_property_labels(multi_tenant_company=multi_tenant_company, property_ids=set().union(*missing.values()) if missing else set())
+
+        failed = {}
+        for product_id, missing_ids in missing.items():
+            missing_labels = sorted({labels.get(property_id, str(property_id)) for property_id in missing_ids})
+            failed[product_id] = _(message) % {"properties": ", ".join(missing_labels)}
+        return failed
+
+    def check_missing_required_properties(self, *, multi_tenant_company, products):
+        from properties.models import ProductPropertiesRuleItem
+
+        product_types, missing = self._get_missing_rule_properties(
+            multi_tenant_company=multi_tenant_company,
+            products=products,
+            item_types=[
+                ProductPropertiesRuleItem.REQUIRED,
+                ProductPropertiesRuleItem.REQUIRED_IN_CONFIGURATOR,
+                ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR,
+            ],
+        )
+        failed = self._format_missing_properties(
+            multi_tenant_company=multi_tenant_company,
+            missing=missing,
+            message="Add the following required properties to the product: %(properties)s",
+        )
+        for product in products:
+            if not product_types.get(product.id):
+                failed[product.id] = "Product is missing a required product type property."
+        return failed
+
+    def check_missing_optional_properties(self, *, multi_tenant_company, products):
+        from properties.models import ProductPropertiesRuleItem
+
+        _product_types, missing = self._get_missing_rule_properties(
+            multi_tenant_company=multi_tenant_company,
+            products=products,
+            item_types=[
+                ProductPropertiesRuleItem.OPTIONAL,
+                ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR,
+            ],
+        )
+        return self._format_missing_properties(
+            multi_tenant_company=multi_tenant_company,
+            missing=missing,
+            message="Add the following optional properties to the product: %(properties)s",
+        )
+
+    def check_missing_stock(self, *, multi_tenant_company, products):
+        # Deprecated: legacy ERP stock validation, intentionally no-op.
+        return {}
+
+    def check_missing_manual_pricelist_override(self, *, multi_tenant_company, products):
+        from sales_prices.models import SalesPriceListItem
+
+        failed_ids = SalesPriceListItem.objects.filter_multi_tenant(multi_tenant_company).filter(
+            salespricelist__auto_update_prices=False,
+            product_id__in=[product.id for product in products],
+            price_override__isnull=True,
+        ).values_list('product_id', flat=True)
+        return {product_id: "Price have manual price list without a price override" for product_id in failed_ids}
+
+    def check_items_missing_mandatory_information(self, *, multi_tenant_company, products):
+        from products.models import BundleVariation
+
+        failed_ids = BundleVariation.objects.filter_multi_tenant(multi_tenant_company).filter(
+            parent_id__in=[product.id for product in products],
+            variation__inspector__has_missing_information=True,
+        ).values_list('parent_id', flat=True)
+        return {product_id: "Bundle items has missing information" for product_id in failed_ids}
+
+    def check_variations_missing_mandatory_information(self, *, multi_tenant_company, products):
+        from products.models import ConfigurableVariation
+
+        failed_ids = ConfigurableVariation.objects.filter_multi_tenant(multi_tenant_company).filter(
+            parent_id__in=[product.id for product in products],
+            variation__active=True,
+            variation__inspector__has_missing_information=True,
+        ).values_list('parent_id', flat=True)
+        return {product_id: "Variations has missing information" for product_id in failed_ids}
+
+    def get_set_based_checks(self):
+        return {
+            MISSING_PRICES_ERROR: self.check_missing_prices,
+            MISSING_VARIATION_ERROR: self.check_missing_variation,
+            MISSING_BUNDLE_ITEMS_ERROR: self.check_missing_bundle_items,
+            MISSING_PRODUCT_TYPE_ERROR: self.check_missing_product_type,
+            MISSING_REQUIRED_PROPERTIES_ERROR: self.check_missing_required_properties,
+            MISSING_OPTIONAL_PROPERTIES_ERROR: self.check_missing_optional_properties,
+            MISSING_STOCK_ERROR: self.check_missing_stock,
+            MISSING_MANUAL_PRICELIST_OVERRIDE_ERROR: self.check_missing_manual_pricelist_override,
+            ITEMS_MISSING_MANDATORY_INFORMATION_ERROR: self.check_items_missing_mandatory_information,
+            VARIATIONS_MISSING_MANDATORY_INFORMATION_ERROR: self.check_variations_missing_mandatory_information,
+        }
+
+    def check_with_block_factory(self, *, blocks):
+        """Fallback for error codes without a set-based check: run the regular block factory check."""
+        from products_inspector.factories.inspector_block import InspectorBlockFactoryRegistry
+
+        failed = {}
+        for block in blocks:
+            block_factory = InspectorBlockFactoryRegistry.get_factory(block.error_code)(block, save_inspector=False)
+            try:
+                block_factory._check()
+            except InspectorBlockFailed as e:
+                failed[block.inspector.product_id] = str(e)
+        return failed
+
+    # --------------------
+    # EVALUATION
+    # --------------------
+    def get_blocks(self):
+        product_ids = {product_id for product_id, _error_code in self.pairs}
+        error_codes = {error_code for _product_id, error_code in self.pairs}
+
+        queryset = InspectorBlock.objects.filter(
+            inspector__product_id__in=product_ids,
+            error_code__in=error_codes,
+        ).select_related(
+            'inspector',
+            'inspector__product',
+            'inspector__product__alias_parent_product',
+            'inspector__product__multi_tenant_company',
+        )
+        return [block for block in queryset if (block.inspector.product_id, block.error_code) in self.pairs]
+
+    def is_applicable(self, *, block):
+        target_field_key = block.get_target_field_key()
+        return bool(target_field_key) and getattr(block, target_field_key) != NONE
+
+    def evaluate_blocks(self, *, blocks):
+        checks = self.get_set_based_checks()
+
+        grouped = defaultdict(list)
+        for block in blocks:
+            if self.is_applicable(block=block):
+                grouped[(block.multi_tenant_company_id, block.error_code)].append(block)
+
+        now = timezone.now()
+        for (_multi_tenant_company_id, error_code), code_blocks in grouped.items():
+            multi_tenant_company = code_blocks[0].inspector.product.multi_tenant_company
+            check = checks.get(error_code)
+            if check is None:
+                failed = self.check_with_block_factory(blocks=code_blocks)
+            else:
+                failed = check(
+                    multi_tenant_company=multi_tenant_company,
+                    products=[block.inspector.product for block in code_blocks],
+                )
+
+            for block in code_blocks:
+                fixing_message = failed.get(block.inspector.product_id)
+                successfully_checked = block.inspector.product_id not in failed
+                if block.successfully_checked == successfully_checked and block.fixing_message == fixing_message:
+                    continue
+
+                block.successfully_checked = successfully_checked
+                block.fixing_message = fixing_message
+                block.updated_at = now
+                self.changed_blocks.append(block)
+
+    def update_inspectors(self, *, inspector_ids):
+        def has_missing(applicability):
+            applicability_q = Q()
+            for field in self.applicability_fields:
+                applicability_q |= Q(**{field: applicability})
+
+            return Exists(
+                InspectorBlock.objects.filter(applicability_q, inspector_id=OuterRef('pk'), successfully_checked=False)
+            )
+
+        inspectors = Inspector.objects.filter(id__in=inspector_ids).select_related('product').annotate(
+            missing_required=has_missing(REQUIRED),
+            missing_optional=has_missing(OPTIONAL),
+        )
+
+        now = timezone.now()
+        for inspector in inspectors:
+            previous = (inspector.has_missing_information, inspector.has_missing_optional_information)
+            current = (inspector.missing_required, inspector.missing_optional)
+            if previous == current:
+                continue
+
+            inspector.has_missing_information, inspector.has_missing_optional_information = current
+            inspector.updated_at = now
+            self.changed_inspectors.append(inspector)
+
+            if previous[0] != current[0]:
+                signal = inspector_missing_info_detected if current[0] else inspector_missing_info_resolved
+                self.transitions.append((inspector.product, signal))
+            if previous[1] != current[1]:
+                signal = inspector_missing_optional_info_detected if current[1] else inspector_missing_optional_info_resolved
+                self.transitions.append((inspector.product, signal))
+
+    def send_signals(self):
+        for product, signal in self.transitions:
+            signal.send(sender=product.__class__, instance=product)
+            logger.info(f"Signal {signal} sent for product {product.sku}.")
+
+        # bulk_update skips post_update, so refresh the subscriptions once per touched inspector instead.
+        refreshed_inspectors = {block.inspector_id: block.inspector for block in self.changed_blocks}
+        for inspector in refreshed_inspectors.values():
+            refresh_subscription_receiver(inspector)
+
+        # The inspectors keep their dirty fields after bulk_update, so the post_update receivers (subscription
+        # refresh, sync_remote_product once the missing information is resolved) see what changed.
+        for inspector in self.changed_inspectors:
+            post_update.send(sender=inspector.__class__, instance=inspector)
+
+    def run(self):
+        if not self.pairs:
+            return
+
+        with transaction.atomic():
+            blocks = self.get_blocks()
+            self.evaluate_blocks(blocks=blocks)
+            InspectorBlock.objects.bulk_update(self.changed_blocks, ['successfully_checked', 'fixing_message', 'updated_at'])
+
+            self.update_inspectors(inspector_ids={block.inspector_id for block in blocks})
+            Inspector.objects.bulk_update(self.changed_inspectors, ['has_missing_information', 'has_missing_optional_information', 'updated_at'])
+
+        self.send_signals()
+
+
+def in_application_transaction():
+    """
+    Whether the outermost atomic block was opened by the application. Like for durable blocks, the
+    transactions a TestCase wraps around the tests do not count as they never commit, so the tests see the
+    blocks evaluated right away.
+    """
+    connection = transaction.get_connection()
+    return connection.in_atomic_block and not getattr(connection.atomic_blocks[0], '_from_testcase', False)
+
+
+class InspectorBlockRefreshBuffer(TransactionBuffer):
+    """
+    Collects the (product_id, error_code) refreshes so the same block is evaluated once and every error code
+    runs set-based for all products. Inside `collect_inspector_block_refreshes` they are evaluated when it
+    exits, otherwise once the surrounding transaction commits. Outside a transaction they run right away.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.depth = 0
+        self.pairs = set()
+
+    @property
+    def is_active(self):
+        return self.depth > 0
+
+    def clear(self):
+        self.pairs = set()
+
+    def add(self, *, product_id, error_code):
+        """
+        Returns False when the refresh is not collected and has to run right away.
+        """
+        if not self.is_active and not (in_application_transaction() and self.register_flush()):
+            return False
+
+        self.pairs.add((product_id, error_code))
+        return True
+
+    def flush(self):
+        # Transitions can request more refreshes (parents of changed variations), keep going until settled.
+        self.depth += 1
+        try:
+            while self.pairs:
+                pairs, self.pairs = self.pairs, set()
+                BatchInspectorBlockFactory(pairs).run()
+        finally:
+            self.depth -= 1
+
+
+inspector_block_refresh_buffer = InspectorBlockRefreshBuffer()
+
+
+@contextmanager
+def collect_inspector_block_refreshes():
+    buffer = inspector_block_refresh_buffer
+    buffer.depth += 1
+    try:
+        yield buffer
+    except Exception:
+        if buffer.depth == 1:
+            buffer.pairs = set()
+        raise
+    else:
+        if buffer.depth == 1:
+            buffer.flush()
+    finally:
+        buffer.depth -= 1
@@ -1,12 +1,12 @@
 from products_inspector.factories.inspector import InspectorCreateOrUpdateFactory, ResyncInspectorFactory
 
 
-def inspector_creation_flow(product):
+def inspector_creation_flow(product, run_sync=True):
     """
     This flow is responsible for creating the inspector and its related blocks
-    based on the product's type.
+    based on the product's type. With run_sync=False the blocks are left to be checked by the caller.
     """
-    factory = InspectorCreateOrUpdateFactory(product)
+    factory = InspectorCreateOrUpdateFactory(product, run_sync=run_sync)
     factory.run()
 
 
@@ -29,18 +29,18 @@ def resync_inspector_flow(inspector, run_async=True):
 
 def bulk_refresh_inspector_flow(*, multi_tenant_company, product_ids: list[int | str]) -> None:
     """
-    Refresh inspectors for the provided product ids.
+    Refresh inspectors for the provided product ids, evaluating every block type for all products at once.
     """
-    from products_inspector.models import Inspector
+    from products.models import Product
+    from products_inspector.factories.batch_inspector import BatchInspectorBlockFactory, collect_inspector_block_refreshes
 
     if not product_ids:
         return
 
-    unique_product_ids = list(dict.fromkeys(product_ids))
-    inspectors = Inspector.objects.select_related("product").filter(
-        product_id__in=unique_product_ids,
-        product__multi_tenant_company=multi_tenant_company,
-    )
+    unique_product_ids = Product.objects.filter(
+        id__in=list(dict.fromkeys(product_ids)),
+        multi_tenant_company=multi_tenant_company,
+    ).values_list('id', flat=True)
 
-    for inspector in inspectors.iterator():
-        inspector.inspect_product(run_async=False)
\ No newline at end of file
+    with collect_inspector_block_refreshes():
+        BatchInspectorBlockFactory.for_products(product_ids=list(unique_product_ids)).run()
\ No newline at end of file
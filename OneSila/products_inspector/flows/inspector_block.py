@@ -1,5 +1,6 @@
 from core.schema.core.subscriptions import refresh_subscription_receiver
 from products_inspector.factories.inspector_block import InspectorBlockFactoryRegistry
+from products_inspector.factories.batch_inspector import inspector_block_refresh_buffer, collect_inspector_block_refreshes
 import logging
 
 
@@ -7,6 +8,9 @@ logger = logging.getLogger(__name__)
 
 
 def inspector_block_sync_flow(block):
+    if inspector_block_refresh_buffer.add(product_id=block.inspector.product_id, error_code=block.error_code):
+        return
+
     block_factory = InspectorBlockFactoryRegistry.get_factory(block.error_code)(block, save_inspector=True)
     block_factory.run()
 
@@ -25,6 +29,9 @@ def inspector_sync_block_by_error_code_flow(inspector, error_code, **kwargs):
 
     run_async = kwargs.get('run_async', False)
 
+    if not run_async and inspector_block_refresh_buffer.add(product_id=inspector.product_id, error_code=error_code):
+        return
+
     if run_async:
         resync_inspector_block_task(block.id)
     else:
@@ -93,11 +100,12 @@ def trigger_product_inspectors_for_rule_flow(rule):
                              MISSING_EAN_CODE_ERROR
                              ]
 
-    for product in Product.objects.filter_by_properties_rule(rule=rule).iterator():
-        for error_code in rule_dependent_blocks:
-            inspector_block_refresh.send(sender=product.inspector.__class__,
-                                         instance=product.inspector,
-                                         error_code=error_code,
-                                         run_async=False)
+    with collect_inspector_block_refreshes():
+        for product in Product.objects.filter_by_properties_rule(rule=rule).iterator():
+            for error_code in rule_dependent_blocks:
+                inspector_block_refresh.send(sender=product.inspector.__class__,
+                                             instance=product.inspector,
+                                             error_code=error_code,
+                                             run_async=False)
 
-            refresh_subscription_receiver(product.inspector)
+                refresh_subscription_receiver(product.inspector)
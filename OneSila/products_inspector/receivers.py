@@ -4,6 +4,7 @@ from core.decorators import trigger_signal_for_dirty_fields
 from core.schema.core.subscriptions import refresh_subscription_receiver
 from core.signals import post_create, post_update, mutation_update, mutation_create
 from eancodes.signals import ean_code_released_for_product
+from imports_exports.signals import products_batch_imported
 from products_inspector.constants import HAS_IMAGES_ERROR, MISSING_PRICES_ERROR, INACTIVE_BUNDLE_ITEMS_ERROR, \
     MISSING_BUNDLE_ITEMS_ERROR, MISSING_VARIATION_ERROR, MISSING_EAN_CODE_ERROR, \
     MISSING_PRODUCT_TYPE_ERROR, MISSING_REQUIRED_PROPERTIES_ERROR, MISSING_OPTIONAL_PROPERTIES_ERROR, \
@@ -33,6 +34,23 @@ def products_inspector__inspector__product_created(sender, instance, **kwargs):
     inspector_creation_flow(instance)
 
 
+@receiver(products_batch_imported)
+def products_inspector__inspector__products_batch_imported(sender, instance, created_product_ids, updated_product_ids, **kwargs):
+    """
+    Bulk imports skip post_create / post_update, create the inspectors of the new products without checking their
+    blocks once the whole chunk is stored, then evaluate the blocks of all products of the chunk in one batch.
+    """
+    from products.models import Product
+    from .factories.batch_inspector import BatchInspectorBlockFactory, collect_inspector_block_refreshes
+    from .flows.inspector import inspector_creation_flow
+
+    with collect_inspector_block_refreshes():
+        for product in Product.objects.filter(id__in=created_product_ids):
+            inspector_creation_flow(product, run_sync=False)
+
+        BatchInspectorBlockFactory.for_products(product_ids=[*created_product_ids, *updated_product_ids]).run()
+
+
 @receiver(post_update, sender=InspectorBlock)
 @receiver(post_delete, sender=InspectorBlock)
 def products_inspector__inspector_block__subscription__post_save(sender, instance, **kwargs):
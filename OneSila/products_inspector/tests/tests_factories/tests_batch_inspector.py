@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+from django.db import transaction
+
+from core.signals import post_update
+from core.tests import TestCase
+from currencies.currencies import currencies
+from currencies.models import Currency
+from products.models import SimpleProduct
+from products_inspector.constants import MISSING_PRICES_ERROR, MISSING_PRODUCT_TYPE_ERROR
+from products_inspector.factories.batch_inspector import BatchInspectorBlockFactory, collect_inspector_block_refreshes, \
+    inspector_block_refresh_buffer
+from products_inspector.models import Inspector, InspectorBlock
+from products_inspector.signals import inspector_block_refresh
+from sales_prices.models import SalesPrice
+
+
+class BatchInspectorBlockFactoryTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.currency, _ = Currency.objects.get_or_create(
+            is_default_currency=True,
+            multi_tenant_company=self.multi_tenant_company,
+            **currencies['GB']
+        )
+        self.priced_product = SimpleProduct.objects.create(multi_tenant_company=self.multi_tenant_company, active=True)
+        self.unpriced_product = SimpleProduct.objects.create(multi_tenant_company=self.multi_tenant_company, active=True)
+        SalesPrice.objects.create(
+            product=self.priced_product,
+            multi_tenant_company=self.multi_tenant_company,
+            price=100.00,
+            currency=self.currency,
+        )
+        inspector_block_refresh_buffer.clear()
+        inspector_block_refresh_buffer.pending_flush = None
+
+    def get_block(self, product, error_code):
+        return InspectorBlock.objects.get(inspector__product=product, error_code=error_code)
+
+    def test_batch_matches_single_block_results(self):
+        InspectorBlock.objects.filter(
+            inspector__product__in=[self.priced_product, self.unpriced_product],
+            error_code=MISSING_PRICES_ERROR,
+        ).update(successfully_checked=True, fixing_message=None)
+
+        BatchInspectorBlockFactory([
+            (self.priced_product.id, MISSING_PRICES_ERROR),
+            (self.unpriced_product.id, MISSING_PRICES_ERROR),
+            (self.unpriced_product.id, MISSING_PRODUCT_TYPE_ERROR),
+        ]).run()
+
+        self.assertTrue(self.get_block(self.priced_product, MISSING_PRICES_ERROR).successfully_checked)
+
+        block = self.get_block(self.unpriced_product, MISSING_PRICES_ERROR)
+        self.assertFalse(block.successfully_checked)
+        self.assertEqual(block.fixing_message, "Product is missing default price.")
+        self.assertFalse(self.get_block(self.unpriced_product, MISSING_PRODUCT_TYPE_ERROR).successfully_checked)
+
+        self.unpriced_product.inspector.refresh_from_db()
+        self.assertTrue(self.unpriced_product.inspector.has_missing_information)
+
+    def test_rerun_without_changes_sends_no_transitions(self):
+        pairs = [(self.unpriced_product.id, MISSING_PRICES_ERROR)]
+        BatchInspectorBlockFactory(pairs).run()
+
+        factory = BatchInspectorBlockFactory(pairs)
+        factory.run()
+
+        self.assertEqual(factory.changed_blocks, [])
+        self.assertEqual(factory.changed_inspectors, [])
+        self.assertEqual(factory.transitions, [])
+
+    def test_collect_refreshes_deduplicates_and_flushes_on_exit(self):
+        InspectorBlock.objects.filter(
+            inspector__product=self.unpriced_product,
+            error_code=MISSING_PRICES_ERROR,
+        ).update(successfully_checked=True, fixing_message=None)
+        inspector = self.unpriced_product.inspector
+
+        with collect_inspector_block_refreshes():
+            for _ in range(3):
+                inspector_block_refresh.send(sender=inspector.__class__, instance=inspector, error_code=MISSING_PRICES_ERROR, run_async=False)
+
+            self.assertEqual(inspector_block_refresh_buffer.pairs, {(self.unpriced_product.id, MISSING_PRICES_ERROR)})
+            self.assertTrue(self.get_block(self.unpriced_product, MISSING_PRICES_ERROR).successfully_checked)
+
+        self.assertFalse(self.get_block(self.unpriced_product, MISSING_PRICES_ERROR).successfully_checked)
+        self.assertEqual(inspector_block_refresh_buffer.pairs, set())
+
+    def test_refreshes_of_a_transaction_are_evaluated_on_commit(self):
+        InspectorBlock.objects.filter(
+            inspector__product=self.unpriced_product,
+            error_code=MISSING_PRICES_ERROR,
+        ).update(successfully_checked=True, fixing_message=None)
+        inspector = self.unpriced_product.inspector
+
+        # The TestCase transaction never commits, pretend it is one opened by the application.
+        with patch('products_inspector.factories.batch_inspector.in_application_transaction', return_value=True), \
+                self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                for _ in range(3):
+                    inspector_block_refresh.send(sender=inspector.__class__, instance=inspector, error_code=MISSING_PRICES_ERROR, run_async=False)
+
+            self.assertEqual(inspector_block_refresh_buffer.pairs, {(self.unpriced_product.id, MISSING_PRICES_ERROR)})
+            self.assertTrue(self.get_block(self.unpriced_product, MISSING_PRICES_ERROR).successfully_checked)
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(self.get_block(self.unpriced_product, MISSING_PRICES_ERROR).successfully_checked)
+        self.assertEqual(inspector_block_refresh_buffer.pairs, set())
+
+    def test_changed_inspectors_send_post_update_with_dirty_state(self):
+        inspector = self.priced_product.inspector
+        Inspector.objects.filter(id=inspector.id).update(has_missing_information=not inspector.has_missing_information)
+
+        received = []
+
+        def inspector_post_update(sender, instance, **kwargs):
+            received.append((instance.id, instance.is_dirty_field('has_missing_information')))
+
+        post_update.connect(inspector_post_update, sender=Inspector)
+        try:
+            BatchInspectorBlockFactory.for_products(product_ids=[self.priced_product.id]).run()
+        finally:
+            post_update.disconnect(inspector_post_update, sender=Inspector)
+
+        self.assertEqual(received, [(inspector.id, True)])
@@ -1,5 +1,12 @@
+import difflib
+import math
 import re
+import time
 import unicodedata
+from dataclasses import dataclass
+from itertools import islice
+
+from django.core.cache import cache
 
 SEP_REGEX = re.compile(r"[\s\-_./]+")
 ALNUM_REGEX = re.compile(r"[a-z0-9]+")
@@ -38,6 +45,53 @@ def _norm_code(s: str) -> str:
     return re.sub(r"[^a-z0-9]", "", s)
 
 
+def build_select_value_match_keys(value: str) -> dict:
+    """
+    Precompute the keys used by PropertySelectValueQuerySet.find_duplicates for one translation value:
+    the collapsed code key, whether the value is code-like, the sorted numeric tokens and the sorted
+    text tokens (with their length, which bounds the fuzzy ratio).
+    """
+    tokens = _tokens(value)
+    text_key = " ".join(sorted({t for t in tokens if not t.isdigit()}))
+
+    return {
+        'match_code_key': _norm_code(value),
+        'match_is_code': any(CODE_TOKEN_REGEX.match(t) for t in tokens),
+        'match_numbers_key': " ".join(sorted({t for t in tokens if t.isdigit()})),
+        'match_text_key': text_key,
+        'match_text_length': len(text_key),
+    }
+
+
+def build_property_match_key(name: str) -> str:
+    from django.utils.text import slugify
+
+    return slugify(name).replace("-", "").lower()
+
+
+def get_ratio_length_bounds(length: int, threshold: float):
+    """
+    SequenceMatcher.ratio() is 2 * matches / (len(a) + len(b)) and matches <= min(len(a), len(b)),
+    so a candidate can only reach `threshold` when its length falls in the returned (inclusive) range.
+    Returns None when the threshold does not bound the length.
+    """
+    if threshold <= 0:
+        return None
+
+    threshold = min(threshold, 1)
+    lower = math.floor(length * threshold / (2 - threshold))
+    upper = math.ceil(length * (2 - threshold) / threshold)
+    return lower, upper
+
+
+def is_similar(a: str, b: str, threshold: float) -> bool:
+    """Same outcome as SequenceMatcher(None, a, b).ratio() >= threshold, pruning with the cheap upper bounds first."""
+    matcher = difflib.SequenceMatcher(None, a, b)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return False
+    return matcher.ratio() >= threshold
+
+
 def sanitize_internal_name(internal_name: str | None, multi_tenant_company=None, *, allow_reserved: bool = False) -> str | None:
     """Return a normalised internal name, avoiding reserved identifiers unless explicitly allowed."""
     if not internal_name:
@@ -118,3 +172,185 @@ def generate_unique_internal_name(name, multi_tenant_company, instance_id=None):
         counter += 1
 
     return internal_name
+
+
+PRODUCT_RULES_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_product_rules_cache_version(multi_tenant_company_id) -> int:
+    # Seeded with the time so a version lost by the cache never brings back entries of an older one.
+    return cache.get_or_set(f"product_rules:version:{multi_tenant_company_id}", time.time_ns, timeout=None)
+
+
+def invalidate_product_rules_cache(multi_tenant_company_id) -> None:
+    """
+    Drop the cached rule requirements of a company by moving its version, the old entries simply expire.
+    """
+    key = f"product_rules:version:{multi_tenant_company_id}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+@dataclass(frozen=True)
+class ProductRuleRequirements:
+    """
+    The effective rule of a product type for a sales channel with its items as (property_id, type,
+    is_public_information) tuples, in the order of the rule items.
+    """
+    rule_id: int | None = None
+    require_ean_code: bool = False
+    items: tuple = ()
+
+    def get_property_ids(self, *, types, public_information_only=True) -> list[int]:
+        return [
+            property_id for property_id, item_type, is_public_information in self.items
+            if item_type in types and (is_public_information or not public_information_only)
+        ]
+
+    def get_required_property_ids(self, *, public_information_only=True) -> list[int]:
+        from properties.models import ProductPropertiesRuleItem
+
+        return self.get_property_ids(
+            types=[
+                ProductPropertiesRuleItem.REQUIRED,
+                ProductPropertiesRuleItem.REQUIRED_IN_CONFIGURATOR,
+                ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR,
+            ],
+            public_information_only=public_information_only,
+        )
+
+    def get_optional_property_ids(self, *, public_information_only=True) -> list[int]:
+        from properties.models import ProductPropertiesRuleItem
+
+        return self.get_property_ids(
+            types=[ProductPropertiesRuleItem.OPTIONAL],
+            public_information_only=public_information_only,
+        )
+
+    def get_configurator_property_ids(self, *, public_information_only=True) -> list[int]:
+        from properties.models import ProductPropertiesRuleItem
+
+        return self.get_property_ids(
+            types=[
+                ProductPropertiesRuleItem.REQUIRED_IN_CONFIGURATOR,
+                ProductPropertiesRuleItem.OPTIONAL_IN_CONFIGURATOR,
+            ],
+            public_information_only=public_information_only,
+        )
+
+
+class ProductRuleRequirementsResolver:
+    """
+    Resolve the effective ProductPropertiesRule of many products with the same precedence as
+    Product.get_product_rule: the rule of the sales channel and otherwise the default rule of the product type.
+
+    The requirements are cached per (company, product type, sales channel) and the cache of a company is
+    invalidated whenever one of its rules or rule items changes (see properties.receivers), so a warm
+    resolve costs the single query that reads the product types. Results are keyed on product_id.
+    """
+    chunk_size = 2000
+
+    def __init__(self, *, multi_tenant_company, product_ids, sales_channel=None):
+        self.multi_tenant_company_id = getattr(multi_tenant_company, 'id', multi_tenant_company)
+        self.product_ids = list(dict.fromkeys(product_ids))
+        self.sales_channel_id = getattr(sales_channel, 'id', sales_channel)
+        self.product_types = {}
+        self.requirements = {}
+
+    def get_cache_key(self, *, version, product_type_id):
+        return f"product_rules:{self.multi_tenant_company_id}:{version}:{product_type_id}:{self.sales_channel_id or 'default'}"
+
+    def get_product_types(self, *, product_ids):
+        from properties.models import ProductProperty
+
+        product_types = {}
+        rows = ProductProperty.objects.filter(
+            product_id__in=product_ids,
+            property__is_product_type=True,
+            value_select__isnull=False,
+        ).values_list('product_id', 'value_select_id').order_by('id')
+
+        for product_id, product_type_id in rows:
+            product_types.setdefault(product_id, product_type_id)
+
+        return product_types
+
+    def load_requirements(self, *, product_type_ids):
+        from django.db.models import Q
+        from properties.models import ProductPropertiesRule, ProductPropertiesRuleItem
+
+        sales_channel_filter = Q(sales_channel__isnull=True)
+        if self.sales_channel_id is not None:
+            sales_channel_filter |= Q(sales_channel_id=self.sales_channel_id)
+
+        rules = {}
+        rows = ProductPropertiesRule.objects.filter(
+            sales_channel_filter,
+            multi_tenant_company_id=self.multi_tenant_company_id,
+            product_type_id__in=product_type_ids,
+        ).values_list('id', 'product_type_id', 'sales_channel_id', 'require_ean_code')
+
+        for rule_id, product_type_id, sales_channel_id, require_ean_code in rows:
+            if sales_channel_id is None and product_type_id in rules:
+                continue
+            rules[product_type_id] = (rule_id, require_ean_code)
+
+        items = {}
+        rows = ProductPropertiesRuleItem.objects.filter(
+            rule_id__in=[rule_id for rule_id, _ in rules.values()],
+        ).values_list('rule_id', 'property_id', 'type', 'property__is_public_information')
+
+        for rule_id, property_id, item_type, is_public_information in rows:
+            items.setdefault(rule_id, []).append((property_id, item_type, is_public_information))
+
+        requirements = {}
+        for product_type_id in product_type_ids:
+            if product_type_id not in rules:
+                requirements[product_type_id] = ProductRuleRequirements()
+                continue
+
+            rule_id, require_ean_code = rules[product_type_id]
+            requirements[product_type_id] = ProductRuleRequirements(
+                rule_id=rule_id,
+                require_ean_code=require_ean_code,
+                items=tuple(items.get(rule_id, ())),
+            )
+
+        return requirements
+
+    def get_requirements(self, *, product_type_ids):
+        """
+        Returns a map of product_type_id -> ProductRuleRequirements, reading the rules of the cache misses only.
+        """
+        version = get_product_rules_cache_version(self.multi_tenant_company_id)
+        keys = {self.get_cache_key(version=version, product_type_id=product_type_id): product_type_id for product_type_id in product_type_ids}
+        cached = cache.get_many(keys.keys())
+
+        requirements = {keys[key]: value for key, value in cached.items()}
+        missing = [product_type_id for product_type_id in product_type_ids if product_type_id not in requirements]
+        if missing:
+            loaded = self.load_requirements(product_type_ids=missing)
+            cache.set_many(
+                {self.get_cache_key(version=version, product_type_id=product_type_id): value for product_type_id, value in loaded.items()},
+                timeout=PRODUCT_RULES_CACHE_TIMEOUT,
+            )
+            requirements.update(loaded)
+
+        return requirements
+
+    def resolve(self):
+        product_ids = iter(self.product_ids)
+        while chunk := list(islice(product_ids, self.chunk_size)):
+            self.product_types.update(self.get_product_types(product_ids=chunk))
+
+        requirements = self.get_requirements(product_type_ids=set(self.product_types.values())) if self.product_types else {}
+        for product_id in self.product_ids:
+            product_type_id = self.product_types.get(product_id)
+            self.requirements[product_id] = requirements.get(product_type_id, ProductRuleRequirements())
+
+        return self.requirements
+
+    def get(self, *, product_id) -> ProductRuleRequirements:
+        return self.requirements.get(product_id, ProductRuleRequirements())
@@ -1,13 +1,14 @@
 from django.core.exceptions import ValidationError
-from django.db.models import Subquery, OuterRef, Value, CharField, Exists, Min, Count, IntegerField, ExpressionWrapper
+from collections import defaultdict
+from django.db.models import Subquery, OuterRef, Value, CharField, Exists, Min, Count, IntegerField, ExpressionWrapper, Q
 from django.db.models.functions import Coalesce
 from django.utils.text import slugify
 from django.conf import settings
-import difflib
 from django.utils.translation import gettext_lazy as _
 from core.managers import MultiTenantManager, MultiTenantQuerySet
 from django.db import transaction, IntegrityError
-from .helpers import generate_unique_internal_name, _is_code_like, _norm_code, _tokens
+from .helpers import generate_unique_internal_name, build_property_match_key, build_select_value_match_keys, \
+    get_ratio_length_bounds, is_similar
 
 
 def build_property_usage_count_expression(*, multi_tenant_company_id):
@@ -180,18 +181,27 @@ class PropertyQuerySet(MultiTenantQuerySet):
         if language_code is None:
             language_code = settings.LANGUAGE_CODE
 
-        processed_name = slugify(name).replace("-", "").lower()
+        processed_name = build_property_match_key(name)
         translations = PropertyTranslation.objects.filter(
             property__in=self,
             language=language_code,
-        ).select_related("property")
+        )
+
+        # Only names whose length can still reach the threshold are loaded, rows saved without
+        # keys (bulk writes) are always loaded and normalised on the fly.
+        bounds = get_ratio_length_bounds(len(processed_name), threshold)
+        if bounds is not None:
+            translations = translations.filter(
+                Q(match_key_length__gte=bounds[0], match_key_length__lte=bounds[1]) | Q(match_key__isnull=True)
+            )
 
         matched_ids = set()
-        for translation in translations:
-            processed = slugify(translation.name).replace("-", "").lower()
-            ratio = difflib.SequenceMatcher(None, processed_name, processed).ratio()
-            if ratio >= threshold:
-                matched_ids.add(translation.property_id)
+        for property_id, translation_name, match_key in translations.values_list('property_id', 'name', 'match_key'):
+            if match_key is None:
+                match_key = build_property_match_key(translation_name)
+
+            if is_similar(processed_name, match_key, threshold):
+                matched_ids.add(property_id)
 
         return self.filter(id__in=matched_ids).order_by('id').distinct('id')
 
@@ -320,10 +330,33 @@ class PropertySelectValueQuerySet(MultiTenantQuerySet):
             )
         )
 
-    def find_duplicates(self, value, property_instance, language_code=None, threshold=0.88):
+    def _get_match_translations(self, property_instance, language_code):
+        from .models import PropertySelectValueTranslation
+
+        return PropertySelectValueTranslation.objects.filter(
+            propertyselectvalue__in=self,
+            propertyselectvalue__property=property_instance,
+            language=language_code,
+        )
+
+    def _iter_match_keys(self, translations):
+        """
+        Yield (select value id, match keys) for the given translations.
+        Rows written without keys (bulk writes bypass save) are normalised on the fly.
         """
-        Return property select values similar to `value` within the same property.
+        fields = ['match_code_key', 'match_is_code', 'match_numbers_key', 'match_text_key', 'match_text_length']
 
+        for row in translations.values('propertyselectvalue_id', 'value', *fields):
+            if row['match_code_key'] is None:
+                keys = build_select_value_match_keys(row['value'])
+            else:
+                keys = {field: row[field] for field in fields}
+
+            yield row['propertyselectvalue_id'], keys
+
+    @staticmethod
+    def _is_duplicate(probe, candidate, threshold):
+        """
         Rules:
           - If EITHER side looks code-like (any token has letters+digits), require exact match
             after collapsing non-alnum (prevents ath_s700bt ~ ath_s200bt).
@@ -331,65 +364,110 @@ class PropertySelectValueQuerySet(MultiTenantQuerySet):
               * match if token sets are equal (order/sep-insensitive), or
               * fall back to fuzzy on TEXT tokens only (numbers already matched).
         """
-        from .models import PropertySelectValueTranslation
+        if probe['match_is_code'] or candidate['match_is_code']:
+            return probe['match_is_code'] and probe['match_code_key'] == candidate['match_code_key']
 
-        if language_code is None:
-            language_code = settings.LANGUAGE_CODE
+        if probe['match_numbers_key'] != candidate['match_numbers_key']:
+            return False
 
-        probe_is_code = _is_code_like(value)
-        probe_code_key = _norm_code(value) if probe_is_code else None
-
-        # Precompute probe tokens & split into numeric/text
-        probe_all_tokens = _tokens(value)
-        probe_num_set = {t for t in probe_all_tokens if t.isdigit()}
-        probe_text_set = set(t for t in probe_all_tokens if not t.isdigit())
-        probe_tokens_sorted = sorted(probe_text_set | probe_num_set)  # for exact set compare when needed
-        probe_text_key = " ".join(sorted(probe_text_set))  # for fuzzy on text only
-
-        translations = (
-            PropertySelectValueTranslation.objects
-            .filter(
-                propertyselectvalue__in=self,
-                propertyselectvalue__property=property_instance,
-                language=language_code,
-            )
-            .select_related("propertyselectvalue")
-        )
+        if probe['match_text_key'] == candidate['match_text_key']:
+            return True
 
-        matched_ids = set()
+        return is_similar(probe['match_text_key'], candidate['match_text_key'], threshold)
 
-        for t in translations:
-            raw = t.value or ""
-            cand_is_code = _is_code_like(raw)
+    def find_duplicates(self, value, property_instance, language_code=None, threshold=0.88):
+        """
+        Return property select values similar to `value` within the same property, see `_is_duplicate` for the rules.
 
-            if probe_is_code or cand_is_code:
-                # CODE COMPARATOR: strict equality after collapsing
-                if probe_code_key and probe_code_key == _norm_code(raw):
-                    matched_ids.add(t.propertyselectvalue_id)
-                continue
+        Candidates are narrowed in the database with the keys stored on the translations: code-like values
+        only need the rows sharing their code key, labels only the non-code rows with the same numeric tokens
+        and a text length that can still reach the threshold. The fuzzy ratio only runs on that shortlist.
+        """
+        if language_code is None:
+            language_code = settings.LANGUAGE_CODE
 
-            # LABEL COMPARATOR
-            cand_all_tokens = _tokens(raw)
-            cand_num_set = {x for x in cand_all_tokens if x.isdigit()}
-            cand_text_set = set(x for x in cand_all_tokens if not x.isdigit())
+        probe = build_select_value_match_keys(value)
+        translations = self._get_match_translations(property_instance, language_code)
 
-            # 1) Different numeric tokens => NOT a duplicate (e.g., 50 vs 60 Hertz)
-            if probe_num_set != cand_num_set:
-                continue
+        if probe['match_is_code']:
+            candidates_q = Q(match_code_key=probe['match_code_key'])
+        else:
+            candidates_q = Q(match_is_code=False, match_numbers_key=probe['match_numbers_key'])
+            bounds = get_ratio_length_bounds(probe['match_text_length'], threshold)
+            if bounds is not None:
+                candidates_q &= Q(match_text_length__gte=bounds[0], match_text_length__lte=bounds[1])
 
-            # 2) Exact token set equality (numbers + text), order/sep-insensitive
-            cand_tokens_sorted = sorted(cand_text_set | cand_num_set)
-            if probe_tokens_sorted == cand_tokens_sorted:
-                matched_ids.add(t.propertyselectvalue_id)
-                continue
+        translations = translations.filter(candidates_q | Q(match_code_key__isnull=True))
 
-            # 3) Conservative fuzzy on TEXT ONLY (numbers already proven equal)
-            cand_text_key = " ".join(sorted(cand_text_set))
-            if difflib.SequenceMatcher(None, probe_text_key, cand_text_key).ratio() >= threshold:
-                matched_ids.add(t.propertyselectvalue_id)
+        matched_ids = set()
+        for select_value_id, keys in self._iter_match_keys(translations):
+            if self._is_duplicate(probe, keys, threshold):
+                matched_ids.add(select_value_id)
 
         return self.filter(id__in=matched_ids).order_by('id').distinct('id')
 
+    def find_duplicate_clusters(self, property_instance, language_code=None, threshold=0.88):
+        """
+        Group every select value of the property into clusters of duplicates, for cleanup jobs.
+        Two values belong together when either of them would be returned by find_duplicates for the other,
+        clusters are the connected groups of that relation. Returns a list of sorted id lists,
+        only clusters with more than one value are returned.
+        """
+        if language_code is None:
+            language_code = settings.LANGUAGE_CODE
+
+        parents = {}
+
+        def find(node):
+            parents.setdefault(node, node)
+            while parents[node] != node:
+                parents[node] = parents[parents[node]]
+                node = parents[node]
+            return node
+
+        def union(a, b):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parents[max(root_a, root_b)] = min(root_a, root_b)
+
+        by_code_key = defaultdict(list)
+        labels = defaultdict(lambda: defaultdict(list))
+
+        for select_value_id, keys in self._iter_match_keys(self._get_match_translations(property_instance, language_code)):
+            find(select_value_id)
+            by_code_key[keys['match_code_key']].append((select_value_id, keys['match_is_code']))
+            if not keys['match_is_code']:
+                labels[keys['match_numbers_key']][keys['match_text_key']].append(select_value_id)
+
+        # A code-like value matches everything sharing its code key.
+        for members in by_code_key.values():
+            if any(is_code for _, is_code in members):
+                for select_value_id, _ in members[1:]:
+                    union(members[0][0], select_value_id)
+
+        # Labels only match within the same numeric tokens: equal text keys directly, otherwise fuzzy
+        # over a sliding window of text keys whose length can still reach the threshold.
+        for text_keys in labels.values():
+            for select_value_ids in text_keys.values():
+                for select_value_id in select_value_ids[1:]:
+                    union(select_value_ids[0], select_value_id)
+
+            ordered_keys = sorted(text_keys, key=len)
+            for index, text_key in enumerate(ordered_keys):
+                bounds = get_ratio_length_bounds(len(text_key), threshold)
+                for other_key in ordered_keys[index + 1:]:
+                    if bounds is not None and len(other_key) > bounds[1]:
+                        break
+
+                    if is_similar(text_key, other_key, threshold) or is_similar(other_key, text_key, threshold):
+                        union(text_keys[text_key][0], text_keys[other_key][0])
+
+        clusters = defaultdict(set)
+        for select_value_id in parents:
+            clusters[find(select_value_id)].add(select_value_id)
+
+        return sorted(sorted(ids) for ids in clusters.values() if len(ids) > 1)
+
     def merge(self, target):
         from .models import PropertySelectValue
         from .models import ProductProperty
@@ -504,6 +582,17 @@ class PropertySelectValueManager(MultiTenantManager):
             threshold=threshold,
         )
 
+    def find_duplicate_clusters(self, property_instance, multi_tenant_company, threshold=0.88):
+        qs = self.filter(
+            multi_tenant_company=multi_tenant_company,
+            property=property_instance,
+        )
+        return qs.find_duplicate_clusters(
+            property_instance,
+            language_code=multi_tenant_company.language,
+            threshold=threshold,
+        )
+
     def merge(self, sources, target):
         if hasattr(sources, "merge"):
             return sources.merge(target)
@@ -0,0 +1,89 @@
+# Generated by Django 5.2 on 2026-10-18 12:10
+
+from django.db import migrations, models
+
+
+def populate_match_keys(apps, schema_editor):
+    from properties.helpers import build_property_match_key, build_select_value_match_keys
+
+    PropertyTranslation = apps.get_model('properties', 'PropertyTranslation')
+    PropertySelectValueTranslation = apps.get_model('properties', 'PropertySelectValueTranslation')
+
+    batch = []
+    for translation in PropertyTranslation.objects.only('id', 'name').iterator(chunk_size=2000):
+        translation.match_key = build_property_match_key(translation.name)
+        translation.match_key_length = len(translation.match_key)
+        batch.append(translation)
+        if len(batch) >= 2000:
+            PropertyTranslation.objects.bulk_update(batch, ['match_key', 'match_key_length'])
+            batch = []
+    PropertyTranslation.objects.bulk_update(batch, ['match_key', 'match_key_length'])
+
+    fields = ['match_code_key', 'match_is_code', 'match_numbers_key', 'match_text_key', 'match_text_length']
+    batch = []
+    for translation in PropertySelectValueTranslation.objects.only('id', 'value').iterator(chunk_size=2000):
+        for field, key in build_select_value_match_keys(translation.value).items():
+            setattr(translation, field, key)
+        batch.append(translation)
+        if len(batch) >= 2000:
+            PropertySelectValueTranslation.objects.bulk_update(batch, fields)
+            batch = []
+    PropertySelectValueTranslation.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0021_alter_productpropertytexttranslation_language_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertytranslation',
+            name='match_key',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='propertytranslation',
+            name='match_key_length',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='propertyselectvaluetranslation',
+            name='match_code_key',
+            field=models.CharField(blank=True, editable=False, max_length=512, null=True),
+        ),
+        migrations.AddField(
+            model_name='propertyselectvaluetranslation',
+            name='match_is_code',
+            field=models.BooleanField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='propertyselectvaluetranslation',
+            name='match_numbers_key',
+            field=models.CharField(blank=True, editable=False, max_length=512, null=True),
+        ),
+        migrations.AddField(
+            model_name='propertyselectvaluetranslation',
+            name='match_text_key',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='propertyselectvaluetranslation',
+            name='match_text_length',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='propertytranslation',
+            index=models.Index(fields=['language', 'match_key_length'], name='properties_proptr_match_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyselectvaluetranslation',
+            index=models.Index(fields=['language', 'match_code_key'], name='properties_psvtr_code_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyselectvaluetranslation',
+            index=models.Index(fields=['language', 'match_numbers_key', 'match_text_length'], name='properties_psvtr_label_idx'),
+        ),
+        migrations.RunPython(populate_match_keys, migrations.RunPython.noop),
+    ]
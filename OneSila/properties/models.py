@@ -112,11 +112,26 @@ class PropertyTranslation(TranslationFieldsMixin, models.Model):
     property = models.ForeignKey(Property, on_delete=models.CASCADE)
     name = models.CharField(max_length=200, verbose_name=_('Name'))
 
+    # Normalised name used by PropertyQuerySet.find_duplicates, kept in sync on save.
+    match_key = models.TextField(null=True, blank=True, editable=False)
+    match_key_length = models.PositiveIntegerField(null=True, blank=True, editable=False)
+
+    def set_match_keys(self):
+        from properties.helpers import build_property_match_key
+
+        self.match_key = build_property_match_key(self.name)
+        self.match_key_length = len(self.match_key)
+
+    def save(self, *args, **kwargs):
+        self.set_match_keys()
+        super().save(*args, **kwargs)
+
     class Meta:
         translated_field = 'property'
         search_terms = ['name']
         indexes = [
             models.Index(fields=['property', 'language']),
+            models.Index(fields=['language', 'match_key_length'], name='properties_proptr_match_idx'),
         ]
 
 
@@ -167,11 +182,30 @@ class PropertySelectValueTranslation(TranslationFieldsMixin, models.Model):
     propertyselectvalue = models.ForeignKey(PropertySelectValue, on_delete=models.CASCADE)
     value = models.CharField(max_length=255, verbose_name=_('Value'))
 
+    # Normalised keys used by PropertySelectValueQuerySet.find_duplicates, kept in sync on save.
+    match_code_key = models.CharField(max_length=512, null=True, blank=True, editable=False)
+    match_is_code = models.BooleanField(null=True, blank=True, editable=False)
+    match_numbers_key = models.CharField(max_length=512, null=True, blank=True, editable=False)
+    match_text_key = models.TextField(null=True, blank=True, editable=False)
+    match_text_length = models.PositiveIntegerField(null=True, blank=True, editable=False)
+
+    def set_match_keys(self):
+        from properties.helpers import build_select_value_match_keys
+
+        for field, key in build_select_value_match_keys(self.value).items():
+            setattr(self, field, key)
+
+    def save(self, *args, **kwargs):
+        self.set_match_keys()
+        super().save(*args, **kwargs)
+
     class Meta:
         translated_field = 'propertyselectvalue'
         search_terms = ['value']
         indexes = [
             models.Index(fields=['propertyselectvalue', 'language']),
+            models.Index(fields=['language', 'match_code_key'], name='properties_psvtr_code_idx'),
+            models.Index(fields=['language', 'match_numbers_key', 'match_text_length'], name='properties_psvtr_label_idx'),
         ]
         # added language as well because some words translates the same in different languages
         # the issue with that is that we also kinda need to do propertyselectvalue__property but this is not possible because we can have the same translation
@@ -1,15 +1,18 @@
 from django.core.exceptions import ValidationError
-from django.db.models.signals import post_delete, pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from properties.helpers import generate_unique_internal_name
+from properties.helpers import generate_unique_internal_name, invalidate_product_rules_cache
 from django.utils.translation import gettext_lazy as _
+from core.decorators import trigger_signal_for_dirty_fields
 from core.models import MultiTenantCompany
 from core.signals import post_create, post_update
-from properties.models import Property, PropertyTranslation, PropertySelectValue, ProductProperty, PropertySelectValueTranslation, ProductPropertiesRule
+from properties.models import Property, PropertyTranslation, PropertySelectValue, ProductProperty, PropertySelectValueTranslation, ProductPropertiesRule, \
+    ProductPropertiesRuleItem
 
 import logging
 
-from properties.signals import product_properties_rule_rename, product_properties_rule_created
+from properties.signals import product_properties_rule_rename, product_properties_rule_created, \
+    product_properties_rule_updated, product_properties_rule_configurator_updated
 
 logger = logging.getLogger(__name__)
 
@@ -94,3 +97,21 @@ def prevent_property_select_value_deletion(sender, instance, **kwargs):
         raise ValidationError(
             _("This value cannot be deleted because it is used in as a product property multi-select field.")
         )
+
+
+@receiver(product_properties_rule_created, sender=ProductPropertiesRule)
+@receiver(product_properties_rule_updated, sender=ProductPropertiesRule)
+@receiver(product_properties_rule_configurator_updated, sender=ProductPropertiesRule)
+@receiver(post_save, sender=ProductPropertiesRule)
+@receiver(post_delete, sender=ProductPropertiesRule)
+@receiver(post_save, sender=ProductPropertiesRuleItem)
+@receiver(post_delete, sender=ProductPropertiesRuleItem)
+def properties__product_properties_rule__invalidate_cache(sender, instance, **kwargs):
+    invalidate_product_rules_cache(instance.multi_tenant_company_id)
+
+
+@receiver(post_update, sender=Property)
+@trigger_signal_for_dirty_fields('is_public_information')
+def properties__property__invalidate_product_rules_cache(sender, instance, **kwargs):
+    # The cached rule items carry the is_public_information of their property.
+    invalidate_product_rules_cache(instance.multi_tenant_company_id)
@@ -1,8 +1,9 @@
-from core.tests import TestCaseDemoDataMixin, TransactionTestCase
+from core.tests import TestCase, TestCaseDemoDataMixin, TransactionTestCase
 from products.demo_data import SIMPLE_CHAIR_WOOD_SKU
-from products.models import Product
-from properties.models import Property
-from properties.helpers import get_product_properties_dict
+from products.models import Product, SimpleProduct
+from properties.models import Property, PropertySelectValue, ProductProperty, ProductPropertiesRule, \
+    ProductPropertiesRuleItem
+from properties.helpers import get_product_properties_dict, ProductRuleRequirementsResolver
 
 
 class PropertyHelpersTestCase(TestCaseDemoDataMixin, TransactionTestCase):
@@ -10,3 +11,97 @@ class PropertyHelpersTestCase(TestCaseDemoDataMixin, TransactionTestCase):
         product = Product.objects.get(sku=SIMPLE_CHAIR_WOOD_SKU, multi_tenant_company=self.multi_tenant_company)
         properties_dict = get_product_properties_dict(product)
         self.assertTrue(isinstance(properties_dict, dict))
+
+
+class ProductRuleRequirementsResolverTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.product_type_property = Property.objects.get(
+            multi_tenant_company=self.multi_tenant_company,
+            is_product_type=True,
+        )
+        self.product_type = PropertySelectValue.objects.create(
+            property=self.product_type_property,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        self.rule = ProductPropertiesRule.objects.get(
+            product_type=self.product_type,
+            sales_channel__isnull=True,
+        )
+        self.public_property = Property.objects.create(
+            type=Property.TYPES.SELECT,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        self.private_property = Property.objects.create(
+            type=Property.TYPES.TEXT,
+            is_public_information=False,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        ProductPropertiesRuleItem.objects.create(
+            rule=self.rule,
+            property=self.public_property,
+            type=ProductPropertiesRuleItem.REQUIRED,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        ProductPropertiesRuleItem.objects.create(
+            rule=self.rule,
+            property=self.private_property,
+            type=ProductPropertiesRuleItem.OPTIONAL,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+        self.products = [
+            SimpleProduct.objects.create(multi_tenant_company=self.multi_tenant_company)
+            for _ in range(3)
+        ]
+        for product in self.products[:2]:
+            ProductProperty.objects.create(
+                product=product,
+                property=self.product_type_property,
+                value_select=self.product_type,
+                multi_tenant_company=self.multi_tenant_company,
+            )
+
+    def resolve(self):
+        resolver = ProductRuleRequirementsResolver(
+            multi_tenant_company=self.multi_tenant_company,
+            product_ids=[product.id for product in self.products],
+        )
+        return resolver.resolve()
+
+    def test_resolve_returns_rule_requirements_per_product(self):
+        requirements = self.resolve()
+
+        first, second, without_type = (requirements[product.id] for product in self.products)
+        self.assertEqual(first.rule_id, self.rule.id)
+        self.assertEqual(first, second)
+        self.assertEqual(first.get_required_property_ids(), [self.public_property.id])
+        self.assertEqual(first.get_optional_property_ids(), [])
+        self.assertEqual(first.get_optional_property_ids(public_information_only=False), [self.private_property.id])
+        self.assertIsNone(without_type.rule_id)
+        self.assertEqual(self.products[0].get_product_rule(), self.rule)
+
+    def test_resolve_uses_cache_until_rule_items_change(self):
+        self.resolve()
+
+        with self.assertNumQueries(1):
+            requirements = self.resolve()
+        self.assertEqual(requirements[self.products[0].id].get_required_property_ids(), [self.public_property.id])
+
+        ProductPropertiesRuleItem.objects.filter(rule=self.rule, property=self.private_property).get().delete()
+
+        requirements = self.resolve()
+        self.assertEqual(requirements[self.products[0].id].get_optional_property_ids(public_information_only=False), [])
+
+    def test_product_rule_items_go_through_the_cached_requirements(self):
+        product = self.products[0]
+        self.resolve()
+
+        with self.assertNumQueries(2):
+            required = list(product.get_required_properties())
+        self.assertEqual([item.property_id for item in required], [self.public_property.id])
+
+        with self.assertNumQueries(2):
+            optional = list(product.get_optional_properties(public_information_only=False))
+        self.assertEqual([item.property_id for item in optional], [self.private_property.id])
+        self.assertEqual(list(self.products[2].get_required_and_optional_properties()), [])
@@ -769,3 +769,76 @@ class PropertySelectValueSearchQuerySetTest(TestCase):
 
         self.assertGreaterEqual(values_per_company, dataset['total_values'])
         self.assertGreaterEqual(translations_per_company, dataset['total_translations'])
+
+
+class PropertySelectValueDuplicatesQuerySetTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.language = self.multi_tenant_company.language
+        self.property = Property.objects.create(
+            type=Property.TYPES.SELECT,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+    def _create_value(self, value):
+        select_value = PropertySelectValue.objects.create(
+            property=self.property,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        PropertySelectValueTranslation.objects.create(
+            propertyselectvalue=select_value,
+            language=self.language,
+            value=value,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        return select_value
+
+    def _find_duplicate_ids(self, value):
+        qs = PropertySelectValue.objects.filter(property=self.property)
+        return set(qs.find_duplicates(value, self.property, language_code=self.language, threshold=0.8).values_list('id', flat=True))
+
+    def test_translation_save_stores_match_keys(self):
+        select_value = self._create_value("ATH-S700BT 02")
+        translation = PropertySelectValueTranslation.objects.get(propertyselectvalue=select_value)
+
+        self.assertTrue(translation.match_is_code)
+        self.assertEqual(translation.match_code_key, "aths700bt02")
+        self.assertEqual(translation.match_numbers_key, "2")
+        self.assertEqual(translation.match_text_key, "ath s700bt")
+
+    def test_find_duplicates_rules(self):
+        red = self._create_value("Red")
+        code = self._create_value("ATH-S700BT")
+        fifty = self._create_value("50 Hertz")
+        self._create_value("60 Hertz")
+        self._create_value("ATH-S200BT")
+
+        self.assertEqual(self._find_duplicate_ids("Redd"), {red.id})
+        self.assertEqual(self._find_duplicate_ids("ath_s700bt"), {code.id})
+        self.assertEqual(self._find_duplicate_ids("hertz 050"), {fifty.id})
+        self.assertEqual(self._find_duplicate_ids("Blue"), set())
+
+    def test_find_duplicates_normalises_rows_without_keys(self):
+        red = self._create_value("Red")
+        PropertySelectValueTranslation.objects.filter(propertyselectvalue=red).update(
+            match_code_key=None,
+            match_is_code=None,
+            match_numbers_key=None,
+            match_text_key=None,
+            match_text_length=None,
+        )
+
+        self.assertEqual(self._find_duplicate_ids("Redd"), {red.id})
+
+    def test_find_duplicate_clusters(self):
+        red = self._create_value("Red")
+        redd = self._create_value("Redd")
+        code = self._create_value("ATH-S700BT")
+        code_alias = self._create_value("ath s700bt")
+        self._create_value("ATH-S200BT")
+        self._create_value("50 Hertz")
+        self._create_value("60 Hertz")
+
+        clusters = PropertySelectValue.objects.find_duplicate_clusters(self.property, self.multi_tenant_company, threshold=0.8)
+
+        self.assertEqual(clusters, sorted([sorted([red.id, redd.id]), sorted([code.id, code_alias.id])]))
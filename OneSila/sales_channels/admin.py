@@ -28,15 +28,9 @@ from pygments.formatters import HtmlFormatter
 
 
 def _enqueue_sync_requests(*, queryset):
-    success_count = 0
-    errors = []
-    for sync_request in queryset:
-        try:
-            sync_request.enqueue()
-            success_count += 1
-        except Exception as exc:
-            errors.append(f"SyncRequest {sync_request.pk}: {exc}")
-    return success_count, errors
+    from .factories.task_queue.sync_requests import enqueue_sync_requests
+
+    return enqueue_sync_requests(sync_requests=queryset.only("id"))
 
 
 def _set_sync_request_status(*, queryset, status):
@@ -197,7 +191,7 @@ class SalesChannelViewAssignAdmin(SalesChannelRemoteAdmin):
 @admin.register(SalesChannelGptFeed)
 class SalesChannelGptFeedAdmin(ModelAdmin):
     raw_id_fields = ['sales_channel']
-    list_display = ('sales_channel', 'last_synced_at')
+    list_display = ('sales_channel', 'last_synced_at', 'compaction_requested_at')
 
 
 @admin.register(SyncRequest)
@@ -1,10 +1,45 @@
 from __future__ import annotations
 
 from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
 
 from sales_channels.models import SalesChannelFeed, SalesChannelFeedItem
 
 
+def count_feed_item_rows(*, payload_data) -> int:
+    """Rows of a feed item, the shared gathering keeps them under "rows" while Mirakl stores the row list."""
+    if isinstance(payload_data, dict):
+        return len(payload_data.get("rows") or [])
+    return len(payload_data or [])
+
+
+def shift_feed_summary(*, feed_id, items_delta: int = 0, rows_delta: int = 0) -> None:
+    """
+    Shift items_count / rows_count of a feed with a single UPDATE instead of recounting all of its items.
+    """
+    if not items_delta and not rows_delta:
+        return
+
+    SalesChannelFeed.objects.filter(pk=feed_id).update(
+        items_count=Greatest(F("items_count") + items_delta, Value(0)),
+        rows_count=Greatest(F("rows_count") + rows_delta, Value(0)),
+        updated_at=timezone.now(),
+    )
+
+
+def apply_feed_summary_delta(*, feed, items_delta: int = 0, rows_delta: int = 0) -> None:
+    """
+    Shift the counters of the given feed, see shift_feed_summary, and reload them on the instance.
+    """
+    if not items_delta and not rows_delta:
+        return
+
+    shift_feed_summary(feed_id=feed.pk, items_delta=items_delta, rows_delta=rows_delta)
+    feed.refresh_from_db(fields=["items_count", "rows_count", "updated_at"])
+
+
 class SalesChannelFeedGatheringFactory:
     """Shared helper for feed integrations that gather product payloads into an open batch."""
 
@@ -45,6 +80,46 @@ class SalesChannelFeedGatheringFactory:
                 **self.feed_defaults,
             )
 
+    @staticmethod
+    def count_rows(*, payload_data) -> int:
+        return count_feed_item_rows(payload_data=payload_data)
+
+    def _apply_upsert(self, *, item, merged_action: str, identifier: str, payload_data: dict) -> list[str]:
+        changed_fields = []
+        if item.action != merged_action:
+            item.action = merged_action
+            changed_fields.append("action")
+        if item.identifier != identifier:
+            item.identifier = identifier
+            changed_fields.append("identifier")
+        if item.payload_data != payload_data:
+            item.payload_data = payload_data
+            changed_fields.append("payload_data")
+        if item.status != SalesChannelFeedItem.STATUS_PENDING:
+            item.status = SalesChannelFeedItem.STATUS_PENDING
+            changed_fields.append("status")
+        if item.result_data:
+            item.result_data = {}
+            changed_fields.append("result_data")
+        if item.error_message:
+            item.error_message = ""
+            changed_fields.append("error_message")
+        return changed_fields
+
+    def _build_item(self, *, feed, remote_product, sales_channel_view, action: str, identifier: str, payload_data: dict):
+        return SalesChannelFeedItem(
+            feed=feed,
+            multi_tenant_company=self.sales_channel.multi_tenant_company,
+            remote_product=remote_product,
+            sales_channel_view=sales_channel_view,
+            action=action,
+            identifier=identifier,
+            payload_data=payload_data,
+            status=SalesChannelFeedItem.STATUS_PENDING,
+            result_data={},
+            error_message="",
+        )
+
     def upsert_item(
         self,
         *,
@@ -55,56 +130,57 @@ class SalesChannelFeedGatheringFactory:
         sales_channel_view=None,
     ):
         feed = self.get_or_create_feed()
-        item, _created = SalesChannelFeedItem.objects.update_or_create(
-            feed=feed,
-            remote_product=remote_product,
-            sales_channel_view=sales_channel_view,
-            defaults={
-                "multi_tenant_company": self.sales_channel.multi_tenant_company,
-                "action": self._merge_action(existing_item=None, new_action=action, existing_feed=feed, remote_product=remote_product, sales_channel_view=sales_channel_view),
-                "identifier": identifier,
-                "payload_data": payload_data,
-                "status": SalesChannelFeedItem.STATUS_PENDING,
-                "result_data": {},
-                "error_message": "",
-            },
-        )
-        if item.pk:
-            merged_action = self._merge_action(
-                existing_item=item,
-                new_action=action,
-                existing_feed=feed,
-                remote_product=remote_product,
-                sales_channel_view=sales_channel_view,
+        with transaction.atomic():
+            item = (
+                SalesChannelFeedItem.objects.select_for_update()
+                .filter(
+                    feed=feed,
+                    remote_product=remote_product,
+                    sales_channel_view=sales_channel_view,
+                )
+                .first()
+            )
+            merged_action = self._merge_actions(current_action=getattr(item, "action", ""), new_action=action)
+
+            if item is None:
+                item = self._build_item(
+                    feed=feed,
+                    remote_product=remote_product,
+                    sales_channel_view=sales_channel_view,
+                    action=merged_action,
+                    identifier=identifier,
+                    payload_data=payload_data,
+                )
+                item.save()
+                items_delta, previous_rows = 1, 0
+            else:
+                previous_rows = self.count_rows(payload_data=item.payload_data)
+                changed_fields = self._apply_upsert(
+                    item=item,
+                    merged_action=merged_action,
+                    identifier=identifier,
+                    payload_data=payload_data,
+                )
+                if changed_fields:
+                    item.save(update_fields=changed_fields)
+                items_delta = 0
+
+            apply_feed_summary_delta(
+                feed=feed,
+                items_delta=items_delta,
+                rows_delta=self.count_rows(payload_data=payload_data) - previous_rows,
             )
-            changed_fields = []
-            if item.action != merged_action:
-                item.action = merged_action
-                changed_fields.append("action")
-            if item.identifier != identifier:
-                item.identifier = identifier
-                changed_fields.append("identifier")
-            if item.payload_data != payload_data:
-                item.payload_data = payload_data
-                changed_fields.append("payload_data")
-            if item.status != SalesChannelFeedItem.STATUS_PENDING:
-                item.status = SalesChannelFeedItem.STATUS_PENDING
-                changed_fields.append("status")
-            if item.result_data:
-                item.result_data = {}
-                changed_fields.append("result_data")
-            if item.error_message:
-                item.error_message = ""
-                changed_fields.append("error_message")
-            if changed_fields:
-                item.save(update_fields=changed_fields)
-
-        self.refresh_summary(feed=feed)
+
         return feed, item
 
     def refresh_summary(self, *, feed) -> None:
-        feed.items_count = feed.items.count()
-        feed.rows_count = sum(len(item.payload_data.get("rows") or []) for item in feed.items.all())
+        """
+        Recount items_count / rows_count from the items. The counters are kept up to date incrementally,
+        this is only needed to repair them.
+        """
+        items = feed.items.only("payload_data")
+        feed.items_count = items.count()
+        feed.rows_count = sum(self.count_rows(payload_data=item.payload_data) for item in items.iterator())
         feed.save(update_fields=["items_count", "rows_count", "updated_at"])
 
     def _merge_action(self, *, existing_item, new_action: str, existing_feed, remote_product, sales_channel_view):
@@ -114,7 +190,10 @@ class SalesChannelFeedGatheringFactory:
                 remote_product=remote_product,
                 sales_channel_view=sales_channel_view,
             ).first()
-        current_action = getattr(existing_item, "action", "")
+        return self._merge_actions(current_action=getattr(existing_item, "action", ""), new_action=new_action)
+
+    @staticmethod
+    def _merge_actions(*, current_action: str, new_action: str) -> str:
         if new_action == SalesChannelFeedItem.ACTION_DELETE:
             return SalesChannelFeedItem.ACTION_DELETE
         if current_action == SalesChannelFeedItem.ACTION_CREATE and new_action == SalesChannelFeedItem.ACTION_UPDATE:
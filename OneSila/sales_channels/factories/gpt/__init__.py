@@ -1,5 +1,10 @@
 """Factories for CPT (channel product tooling)."""
 
+from .compaction import SalesChannelGptFeedCompactionFactory, request_gpt_feed_compaction
 from .product_feed import SalesChannelGptProductFeedFactory
 
-__all__ = ["SalesChannelGptProductFeedFactory"]
+__all__ = [
+    "SalesChannelGptFeedCompactionFactory",
+    "SalesChannelGptProductFeedFactory",
+    "request_gpt_feed_compaction",
+]
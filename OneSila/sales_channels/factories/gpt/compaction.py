@@ -0,0 +1,117 @@
+import json
+import logging
+import tempfile
+from datetime import timedelta
+
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from sales_channels.models import SalesChannelGptFeed
+
+logger = logging.getLogger(__name__)
+
+
+def request_gpt_feed_compaction(*, feed: SalesChannelGptFeed) -> None:
+    """
+    Flag the feed file as outdated after its entries changed. The timestamp moves with every change
+    so the compaction only runs once the feed stopped changing for the debounce period.
+    """
+    now = timezone.now()
+    SalesChannelGptFeed.objects.filter(pk=feed.pk).update(
+        compaction_requested_at=now,
+        last_synced_at=now,
+        updated_at=now,
+    )
+    feed.compaction_requested_at = now
+    feed.last_synced_at = now
+
+
+class SalesChannelGptFeedCompactionFactory:
+    """
+    Rebuild the downloadable GPT feed file from the keyed feed entries.
+
+    The entries are streamed ordered by identifier into a temporary file which is handed to the
+    storage, so the feed is never held in memory. Unless forced, feeds that changed during
+    the last `debounce` are left for a later run.
+    """
+    debounce = timedelta(minutes=5)
+    chunk_size = 2000
+
+    def __init__(self, *, feed: SalesChannelGptFeed, force: bool = False) -> None:
+        self.feed = feed
+        self.force = force
+        self.compacted = False
+
+    @classmethod
+    def get_due_feeds(cls, *, force: bool = False):
+        queryset = SalesChannelGptFeed.objects.filter(compaction_requested_at__isnull=False)
+        if not force:
+            queryset = queryset.filter(compaction_requested_at__lte=timezone.now() - cls.debounce)
+        return queryset.select_related("sales_channel").order_by("id")
+
+    def is_due(self) -> bool:
+        if self.force:
+            return True
+
+        requested_at = self.feed.compaction_requested_at
+        return requested_at is not None and requested_at <= timezone.now() - self.debounce
+
+    def get_filename(self) -> str:
+        feed = self.feed
+        company_id = getattr(feed.sales_channel, "multi_tenant_company_id", None) or 0
+        unique_code = f"{company_id:08x}{feed.sales_channel_id:08x}{feed.id:08x}"
+        seller_name = getattr(feed.sales_channel, "gpt_seller_name", None) or getattr(feed.sales_channel, "name", None) or str(feed.sales_channel.id)
+        seller_slug = slugify(seller_name) or f"channel-{feed.sales_channel_id}"
+        return f"gpt-feed-{feed.sales_channel_id}.{seller_slug}-{unique_code}.json"
+
+    def write_entries(self, *, stream) -> int:
+        count = 0
+        payloads = (
+            self.feed.entries
+            .order_by("identifier")
+            .values_list("payload", flat=True)
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+        stream.write(b"[")
+        for index, payload in enumerate(payloads):
+            if index:
+                stream.write(b",")
+            stream.write(b"\n")
+            stream.write(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
+            count += 1
+        stream.write(b"\n]\n" if count else b"]\n")
+
+        return count
+
+    def compact(self) -> None:
+        feed = self.feed
+        requested_at = feed.compaction_requested_at
+
+        with tempfile.TemporaryFile() as stream:
+            count = self.write_entries(stream=stream)
+            stream.seek(0)
+
+            with transaction.atomic():
+                if feed.file:
+                    feed.file.delete(save=False)
+                feed.file.save(self.get_filename(), File(stream), save=False)
+                feed.save(update_fields=["file"])
+
+                # Changes that happened while writing keep the flag so the next run picks them up.
+                SalesChannelGptFeed.objects.filter(
+                    pk=feed.pk,
+                    compaction_requested_at=requested_at,
+                ).update(compaction_requested_at=None)
+
+        self.compacted = True
+        logger.info("Compacted GPT feed %s with %s entries.", feed.pk, count)
+
+    def run(self) -> None:
+        if not self.is_due():
+            return
+
+        self.compact()
+        self.feed.refresh_from_db(fields=["compaction_requested_at"])
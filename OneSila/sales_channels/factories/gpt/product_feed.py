@@ -1,21 +1,21 @@
-import json
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Sequence, Set, Tuple
 
-from django.core.files.base import ContentFile
 from django.db import transaction
 from django.utils import timezone
-from django.utils.text import slugify
 
 from llm.factories import ProductFeedPayloadFactory
 from sales_channels.models import (
     RemoteProduct,
     SalesChannel,
     SalesChannelGptFeed,
+    SalesChannelGptFeedEntry,
 )
 
+from .compaction import request_gpt_feed_compaction
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +26,13 @@ class _RemoteProductPayload:
 
 
 class SalesChannelGptProductFeedFactory:
-    """Synchronise GPT product feeds for sales channels."""
+    """
+    Synchronise GPT product feeds for sales channels.
+
+    The payloads are written to the keyed SalesChannelGptFeedEntry rows, the feed file itself is
+    rebuilt later by SalesChannelGptFeedCompactionFactory.
+    """
+    batch_size = 500
 
     def __init__(
         self,
@@ -64,20 +70,11 @@ class SalesChannelGptProductFeedFactory:
             ]
 
             feed = self._get_feed_for_channel(sales_channel=sales_channel)
-            existing_entries = self._load_existing_feed(feed=feed)
-            updated_entries = self._merge_entries(
-                existing_entries=existing_entries,
-                payloads=payloads,
-            )
-
-            if updated_entries is None:
-                continue
 
             with transaction.atomic():
-                self._persist_feed(
-                    feed=feed,
-                    entries=updated_entries,
-                )
+                changed = self._apply_payloads(feed=feed, payloads=payloads)
+                if changed or self.sync_all:
+                    request_gpt_feed_compaction(feed=feed)
 
         if processed_remote_ids:
             self._clear_required_flags(remote_product_ids=processed_remote_ids)
@@ -153,65 +150,78 @@ class SalesChannelGptProductFeedFactory:
     def _get_feed_for_channel(self, *, sales_channel: SalesChannel) -> SalesChannelGptFeed:
         return sales_channel.ensure_gpt_feed()
 
-    def _load_existing_feed(
+    def _split_payloads(
         self,
         *,
-        feed: SalesChannelGptFeed,
-    ) -> Dict[str, Dict[str, object]]:
-        items = feed.items or []
-        entries: Dict[str, Dict[str, object]] = {}
-        for item in items:
-            identifier = item.get("id")
-            if not identifier:
-                continue
-            entries[str(identifier)] = item
-        return entries
-
-    def _merge_entries(
-        self,
-        *,
-        existing_entries: Dict[str, Dict[str, object]],
         payloads: Sequence[_RemoteProductPayload],
-    ) -> Dict[str, Dict[str, object]] | None:
-        if not payloads and not self.sync_all:
-            return None
-
-        merged = {} if self.sync_all else dict(existing_entries)
+    ) -> Tuple[Dict[str, Dict[str, object]], Set[str]]:
+        upserts: Dict[str, Dict[str, object]] = {}
+        removals: Set[str] = set()
 
         for payload in payloads:
-            for identifier, item in payload.payloads.items():
-                merged[identifier] = item
-
-        if not self.sync_all:
-            for payload in payloads:
-                for identifier in payload.identifiers:
-                    if identifier not in payload.payloads:
-                        merged.pop(identifier, None)
+            upserts.update(payload.payloads)
+            if not self.sync_all:
+                removals.update(
+                    identifier
+                    for identifier in payload.identifiers
+                    if identifier not in payload.payloads
+                )
 
-        if not self.sync_all and merged == existing_entries:
-            return None
+        for identifier in removals:
+            upserts.pop(identifier, None)
 
-        return merged
+        return upserts, removals
 
-    def _persist_feed(
+    def _apply_payloads(
         self,
         *,
         feed: SalesChannelGptFeed,
-        entries: Dict[str, Dict[str, object]],
-    ) -> None:
-        ordered = [entries[key] for key in sorted(entries.keys())]
-        feed.items = ordered
-        company_id = getattr(feed.sales_channel, "multi_tenant_company_id", None) or 0
-        unique_code = f"{company_id:08x}{feed.sales_channel_id:08x}{feed.id:08x}"
-        seller_name = getattr(feed.sales_channel, "gpt_seller_name", None) or getattr(feed.sales_channel, "name", None) or str(feed.sales_channel.id)
-        seller_slug = slugify(seller_name) or f"channel-{feed.sales_channel_id}"
-        filename = f"gpt-feed-{feed.sales_channel_id}.{seller_slug}-{unique_code}.json"
-        content = json.dumps(ordered, ensure_ascii=False, indent=2, default=str)
-        if feed.file:
-            feed.file.delete(save=False)
-        feed.file.save(filename, ContentFile(content), save=False)
-        feed.last_synced_at = timezone.now()
-        feed.save(update_fields=["items", "file", "last_synced_at"])
+        payloads: Sequence[_RemoteProductPayload],
+    ) -> bool:
+        """
+        Write the payloads of the synced products to the keyed feed entries. Only the entries of these
+        products are read and written, on sync_all the entries of products no longer in the feed are
+        removed as well. Returns whether anything changed.
+        """
+        upserts, removals = self._split_payloads(payloads=payloads)
+
+        existing = {
+            entry.identifier: entry
+            for entry in feed.entries.filter(identifier__in=upserts.keys()).only("id", "identifier", "payload")
+        }
+
+        to_create: List[SalesChannelGptFeedEntry] = []
+        to_update: List[SalesChannelGptFeedEntry] = []
+        now = timezone.now()
+
+        for identifier, payload in upserts.items():
+            entry = existing.get(identifier)
+            if entry is None:
+                to_create.append(
+                    SalesChannelGptFeedEntry(
+                        feed=feed,
+                        identifier=identifier,
+                        payload=payload,
+                        multi_tenant_company_id=feed.multi_tenant_company_id,
+                    )
+                )
+            elif entry.payload != payload:
+                entry.payload = payload
+                entry.updated_at = now
+                to_update.append(entry)
+
+        deleted = 0
+        if self.sync_all:
+            deleted, _ = feed.entries.exclude(identifier__in=upserts.keys()).delete()
+        elif removals:
+            deleted, _ = feed.entries.filter(identifier__in=removals).delete()
+
+        if to_create:
+            SalesChannelGptFeedEntry.objects.bulk_create(to_create, batch_size=self.batch_size)
+        if to_update:
+            SalesChannelGptFeedEntry.objects.bulk_update(to_update, ["payload", "updated_at"], batch_size=self.batch_size)
+
+        return bool(to_create or to_update or deleted)
 
     def _clear_required_flags(
         self,
@@ -239,12 +249,8 @@ class SalesChannelGptProductFeedFactory:
             return
 
         feed = self._get_feed_for_channel(sales_channel=sales_channel)
-        existing_entries = self._load_existing_feed(feed=feed)
-        identifier = str(self.deleted_sku)
-        if identifier not in existing_entries:
-            return
-
-        existing_entries.pop(identifier, None)
 
         with transaction.atomic():
-            self._persist_feed(feed=feed, entries=existing_entries)
\ No newline at end of file
+            deleted, _ = feed.entries.filter(identifier=str(self.deleted_sku)).delete()
+            if deleted:
+                request_gpt_feed_compaction(feed=feed)
@@ -19,6 +19,7 @@ from .task_queue import (
     SingleViewAddTask,
     TaskTarget,
     ViewScopedAddTask,
+    collect_sales_channel_syncs,
 )
 
 __all__ = [
@@ -42,4 +43,5 @@ __all__ = [
     "SingleViewAddTask",
     "TaskTarget",
     "ViewScopedAddTask",
+    "collect_sales_channel_syncs",
 ]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import logging
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .task_queue import enqueue_integration_tasks, sales_channel_sync_buffer
+
+logger = logging.getLogger(__name__)
+
+
+def get_sync_request_key(sync_request) -> tuple:
+    return (
+        sync_request.sales_channel_id,
+        sync_request.sales_channel_view_id,
+        sync_request.remote_product_id,
+        sync_request.sync_type,
+    )
+
+
+class SyncRequestBulkCreateFactory:
+    """
+    Create many SyncRequest rows in a few queries.
+
+    The given unsaved requests are deduplicated on (sales channel, view, remote product, sync type): the last
+    request of every key is created as pending and the earlier ones as skipped for it. Requests that were already
+    pending for the same key are superseded by the new one with a single UPDATE. With `enqueue` the new pending
+    requests are sent to the task queue through enqueue_sync_requests().
+    """
+    batch_size = 1000
+
+    def __init__(self, *, sync_requests: Iterable, enqueue: bool = False, mark_done: bool = True):
+        self.sync_requests = list(sync_requests)
+        self.enqueue = enqueue
+        self.mark_done = mark_done
+
+        self.pending_requests = []
+        self.skipped_requests = []
+        self.superseded_count = 0
+        self.enqueued_count = 0
+
+    def split_requests(self):
+        from sales_channels.models import SyncRequest
+
+        survivors = {}
+        self.skipped_requests = []
+        for sync_request in self.sync_requests:
+            key = get_sync_request_key(sync_request)
+            previous = survivors.get(key)
+            if previous is not None:
+                previous.status = SyncRequest.STATUS_SKIPPED
+                self.skipped_requests.append((key, previous))
+
+            sync_request.status = SyncRequest.STATUS_PENDING
+            survivors[key] = sync_request
+
+        self.pending_requests = list(survivors.values())
+
+    def create_requests(self):
+        from sales_channels.models import SyncRequest
+
+        SyncRequest.objects.bulk_create(self.pending_requests, batch_size=self.batch_size)
+
+        if not self.skipped_requests:
+            return
+
+        survivors = {get_sync_request_key(sync_request): sync_request for sync_request in self.pending_requests}
+        for key, sync_request in self.skipped_requests:
+            sync_request.skipped_for = survivors[key]
+
+        SyncRequest.objects.bulk_create(
+            [sync_request for _, sync_request in self.skipped_requests],
+            batch_size=self.batch_size,
+        )
+
+    def supersede_pending_requests(self):
+        """
+        Mark the older pending requests of the same keys as skipped for the request that replaces them.
+        A NULL view is part of the key, hence the Coalesce on both sides.
+        """
+        from sales_channels.models import SyncRequest
+
+        new_ids = [sync_request.id for sync_request in self.pending_requests]
+        if not new_ids:
+            return
+
+        superseding = (
+            SyncRequest.objects.filter(
+                id__in=new_ids,
+                sales_channel_id=OuterRef("sales_channel_id"),
+                remote_product_id=OuterRef("remote_product_id"),
+                sync_type=OuterRef("sync_type"),
+            )
+            .annotate(view_key=Coalesce("sales_channel_view_id", Value(0)))
+            .filter(view_key=Coalesce(OuterRef("sales_channel_view_id"), Value(0)))
+            .order_by("-id")
+            .values("id")[:1]
+        )
+
+        self.superseded_count = (
+            SyncRequest.objects.filter(
+                status=SyncRequest.STATUS_PENDING,
+                remote_product_id__in={sync_request.remote_product_id for sync_request in self.pending_requests},
+            )
+            .exclude(id__in=new_ids)
+            .filter(Exists(superseding))
+            .update(
+                status=SyncRequest.STATUS_SKIPPED,
+                skipped_for_id=Subquery(superseding),
+                updated_at=timezone.now(),
+            )
+        )
+
+    def enqueue_requests(self):
+        if not self.enqueue:
+            return
+
+        self.enqueued_count, _ = enqueue_sync_requests(
+            sync_requests=self.pending_requests,
+            mark_done=self.mark_done,
+        )
+
+    def run(self):
+        if not self.sync_requests:
+            return
+
+        self.split_requests()
+
+        with transaction.atomic():
+            self.create_requests()
+            self.supersede_pending_requests()
+            self.enqueue_requests()
+
+        logger.debug(
+            "Created %s pending and %s skipped sync requests, superseded %s.",
+            len(self.pending_requests),
+            len(self.skipped_requests),
+            self.superseded_count,
+        )
+
+
+def enqueue_sync_requests(*, sync_requests: Iterable, mark_done: bool = True):
+    """
+    Bulk counterpart of SyncRequest.enqueue: the still pending requests are sent to the task queue with one
+    batched insert per sales channel once the transaction commits.
+
+    With `mark_done` the requests are marked done with one update and the tasks are queued without their
+    sync_request_id, as the queue only accepts tasks whose request is still pending. Without it the requests
+    stay pending and gate their task until the remote factory cleans them up.
+    Returns the number of enqueued requests and the errors of the ones that could not be enqueued.
+    """
+    from sales_channels.models import SyncRequest
+
+    ids = [sync_request.id for sync_request in sync_requests if sync_request.id]
+    pending_requests = SyncRequest.objects.filter(
+        id__in=ids,
+        status=SyncRequest.STATUS_PENDING,
+    ).order_by("id")
+
+    errors = []
+    tasks_per_integration = {}
+    enqueued_ids = []
+    for sync_request in pending_requests.iterator():
+        if not sync_request.task_func_path:
+            errors.append(f"SyncRequest {sync_request.pk}: SyncRequest is missing task_func_path.")
+            continue
+
+        task = {
+            "task_func_path": sync_request.task_func_path,
+            "task_kwargs": sync_request.task_kwargs or {},
+            "number_of_remote_requests": sync_request.number_of_remote_requests,
+        }
+        if not mark_done:
+            task["sync_request_id"] = sync_request.id
+
+        tasks_per_integration.setdefault(sync_request.sales_channel_id, []).append(task)
+        enqueued_ids.append(sync_request.id)
+
+    for integration_id, tasks in tasks_per_integration.items():
+        if sales_channel_sync_buffer.is_active:
+            sales_channel_sync_buffer.add_tasks(integration_id=integration_id, tasks=tasks)
+            continue
+
+        enqueue_integration_tasks(integration_id=integration_id, tasks=tasks)
+
+    if mark_done and enqueued_ids:
+        SyncRequest.objects.filter(id__in=enqueued_ids).update(
+            status=SyncRequest.STATUS_DONE,
+            updated_at=timezone.now(),
+        )
+
+    return len(enqueued_ids), errors
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Any, Iterable
 from media.models import DocumentType, Media, MediaProductThrough
@@ -7,11 +9,118 @@ from django.db import transaction
 import logging
 
 from integrations.helpers import get_import_path
-from integrations.tasks import add_task_to_queue
+from integrations.tasks import add_task_to_queue, add_tasks_to_queue
 
 logger = logging.getLogger(__name__)
 
 
+def enqueue_integration_tasks(*, integration_id, tasks):
+    """
+    Hand the tasks of one integration over to the queue once the transaction commits.
+    A single task keeps using add_task_to_queue, several go through add_tasks_to_queue in one batch.
+    """
+    if len(tasks) == 1:
+        transaction.on_commit(
+            lambda lb_task=tasks[0], integration_id=integration_id: add_task_to_queue(
+                integration_id=integration_id,
+                **lb_task,
+            )
+        )
+        return
+
+    transaction.on_commit(
+        lambda lb_tasks=tasks, integration_id=integration_id: add_tasks_to_queue(
+            integration_id=integration_id,
+            tasks=lb_tasks,
+        )
+    )
+
+
+class SalesChannelSyncBuffer(threading.local):
+    """
+    Collects the tasks flushed by add-task runners and the products flagged for a feed update
+    while collect_sales_channel_syncs() is active, so a fan-out over many products ends up as
+    one enqueue per integration and one feed flag update.
+    When sales_channel_ids is set, the runners and the feed flags only reach those sales channels.
+    Price data resolved up front for many products is kept here so the price guards do not rebuild it.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.sales_channel_ids: set[int] | None = None
+        self.tasks: dict[int, list[dict[str, Any]]] = {}
+        self.feed_product_ids: set[int] = set()
+        self.price_data: dict[tuple[int, int], dict] = {}
+
+    @property
+    def is_active(self):
+        return self.depth > 0
+
+    def allows(self, *, sales_channel_id):
+        return self.sales_channel_ids is None or sales_channel_id in self.sales_channel_ids
+
+    def add_tasks(self, *, integration_id, tasks):
+        self.tasks.setdefault(integration_id, []).extend(tasks)
+
+    def add_feed_product_ids(self, *, product_ids):
+        self.feed_product_ids.update(product_ids)
+
+    def add_price_data(self, *, sales_channel_id, price_data_map):
+        self.price_data.update(
+            ((sales_channel_id, product_id), price_data) for product_id, price_data in price_data_map.items()
+        )
+
+    def get_price_data(self, *, sales_channel_id, product_id):
+        return self.price_data.get((sales_channel_id, product_id))
+
+    def clear(self):
+        self.tasks = {}
+        self.feed_product_ids = set()
+        self.price_data = {}
+
+    def flush(self):
+        from sales_channels.helpers import mark_remote_products_for_feed_updates
+
+        tasks, feed_product_ids = self.tasks, self.feed_product_ids
+        self.clear()
+
+        mark_remote_products_for_feed_updates(product_ids=feed_product_ids, sales_channel_ids=self.sales_channel_ids)
+        for integration_id, integration_tasks in tasks.items():
+            enqueue_integration_tasks(integration_id=integration_id, tasks=integration_tasks)
+
+
+sales_channel_sync_buffer = SalesChannelSyncBuffer()
+
+
+@contextmanager
+def collect_sales_channel_syncs(*, sales_channel_ids=None):
+    """
+    Buffer add-task enqueues and feed flags until the outermost context exits.
+    Passing sales_channel_ids limits the syncs of the block to those sales channels.
+    Nothing is sent when the block raises.
+    """
+    previous_sales_channel_ids = sales_channel_sync_buffer.sales_channel_ids
+    if sales_channel_ids is not None:
+        sales_channel_sync_buffer.sales_channel_ids = set(sales_channel_ids)
+
+    sales_channel_sync_buffer.depth += 1
+    try:
+        yield sales_channel_sync_buffer
+    except Exception:
+        sales_channel_sync_buffer.depth -= 1
+        if not sales_channel_sync_buffer.is_active:
+            sales_channel_sync_buffer.clear()
+        sales_channel_sync_buffer.sales_channel_ids = previous_sales_channel_ids
+        raise
+
+    sales_channel_sync_buffer.depth -= 1
+    try:
+        if not sales_channel_sync_buffer.is_active:
+            sales_channel_sync_buffer.flush()
+    finally:
+        sales_channel_sync_buffer.sales_channel_ids = previous_sales_channel_ids
+
+
 @dataclass
 class GuardResult:
     allowed: bool
@@ -56,6 +165,7 @@ class AddTaskBase:
         self.number_of_remote_requests = number_of_remote_requests
         self.sales_channels_filter_kwargs = sales_channels_filter_kwargs or {}
         self.extra_task_kwargs: dict[str, Any] = {}
+        self.queued_task_kwargs: dict[int, list[dict[str, Any]]] = {}
         self.validate_config()
 
     def validate_config(self):
@@ -135,7 +245,7 @@ class AddTaskBase:
                 task_kwargs["product_id"] = local_instance_id
         return task_kwargs
 
-    def _create_sync_request_record(
+    def _build_sync_request_record(
         self,
         *,
         remote_product,
@@ -150,7 +260,7 @@ class AddTaskBase:
     ):
         from sales_channels.models import SyncRequest
 
-        return SyncRequest.objects.create(
+        return SyncRequest(
             multi_tenant_company=self.multi_tenant_company,
             remote_product=remote_product,
             sales_channel=sales_channel,
@@ -164,21 +274,42 @@ class AddTaskBase:
             skipped_for=skipped_for,
         )
 
+    def _create_sync_request_record(self, **kwargs):
+        sync_request = self._build_sync_request_record(**kwargs)
+        sync_request.save()
+        return sync_request
+
     def get_integration_id(self, *, target: TaskTarget) -> int:
         return target.sales_channel.id
 
     def send_to_queue(self, *, target: TaskTarget, guard_result: GuardResult):
         task_kwargs = self.build_task_kwargs(target=target)
         integration_id = self.get_integration_id(target=target)
+        self.queued_task_kwargs.setdefault(integration_id, []).append(task_kwargs)
+
+    def flush_queue(self):
+        """
+        Send everything collected by send_to_queue during this run: one huey message per integration.
+        Inside collect_sales_channel_syncs() the tasks are handed to the shared buffer instead.
+        """
+        queued_task_kwargs, self.queued_task_kwargs = self.queued_task_kwargs, {}
+        task_func_path = get_import_path(self.task_func)
 
-        transaction.on_commit(
-            lambda lb_task_kwargs=task_kwargs, integration_id=integration_id: add_task_to_queue(
-                integration_id=integration_id,
-                task_func_path=get_import_path(self.task_func),
-                task_kwargs=lb_task_kwargs,
-                number_of_remote_requests=self.number_of_remote_requests,
-            )
-        )
+        for integration_id, task_kwargs_list in queued_task_kwargs.items():
+            tasks = [
+                {
+                    "task_func_path": task_func_path,
+                    "task_kwargs": task_kwargs,
+                    "number_of_remote_requests": self.number_of_remote_requests,
+                }
+                for task_kwargs in task_kwargs_list
+            ]
+
+            if sales_channel_sync_buffer.is_active:
+                sales_channel_sync_buffer.add_tasks(integration_id=integration_id, tasks=tasks)
+                continue
+
+            enqueue_integration_tasks(integration_id=integration_id, tasks=tasks)
 
     def _get_pending_requests_for_remote(
         self,
@@ -497,6 +628,67 @@ class AddTaskBase:
             reason=sync_request_reason,
         )
 
+    def _get_pending_request_keys(self, *, targets):
+        from sales_channels.models import SyncRequest
+
+        remote_product_ids = {target.remote_product.id for target in targets}
+        if not remote_product_ids:
+            return set()
+
+        return set(
+            SyncRequest.objects.filter(
+                status=SyncRequest.STATUS_PENDING,
+                remote_product_id__in=remote_product_ids,
+            ).values_list("sales_channel_id", "sales_channel_view_id", "remote_product_id")
+        )
+
+    def create_sync_requests(self, *, targets):
+        """
+        Create the sync requests of a whole run. A target whose remote product has nothing pending for its
+        view and is not a variation needs none of the create_sync_request dedupe, those are created with
+        SyncRequestBulkCreateFactory. The others go through create_sync_request one by one afterwards.
+        """
+        from sales_channels.models import SyncRequest
+        from .sync_requests import SyncRequestBulkCreateFactory
+
+        targets = [
+            (target, guard_result)
+            for target, guard_result in targets
+            if target.remote_product is not None and (guard_result.sync_type or self.sync_type)
+        ]
+        pending_keys = self._get_pending_request_keys(targets=[target for target, _ in targets])
+        task_func_path = get_import_path(self.task_func)
+
+        bulk_requests = []
+        single_targets = []
+        seen_keys = set()
+        for target, guard_result in targets:
+            sales_channel_view_id = getattr(target.sales_channel_view, "id", target.sales_channel_view)
+            key = (target.sales_channel.id, sales_channel_view_id, target.remote_product.id)
+
+            if key in pending_keys or key in seen_keys or getattr(target.remote_product, "is_variation", False):
+                single_targets.append((target, guard_result))
+                continue
+
+            seen_keys.add(key)
+            bulk_requests.append(
+                self._build_sync_request_record(
+                    remote_product=target.remote_product,
+                    sales_channel=target.sales_channel,
+                    sales_channel_view_id=sales_channel_view_id,
+                    sync_type=guard_result.sync_type or self.sync_type,
+                    reason=guard_result.reason or self.reason,
+                    task_func_path=task_func_path,
+                    task_kwargs=self.build_task_kwargs(target=target),
+                    status=SyncRequest.STATUS_PENDING,
+                )
+            )
+
+        SyncRequestBulkCreateFactory(sync_requests=bulk_requests).run()
+
+        for target, guard_result in single_targets:
+            self.create_sync_request(target=target, guard_result=guard_result)
+
     def log_guard_blocked(self, *, target: TaskTarget, guard_result: GuardResult):
         logger.debug(
             "Guard blocked task: reason=%s sync_type=%s sales_channel_id=%s remote_product_id=%s "
@@ -515,7 +707,11 @@ class AddTaskBase:
 
     def run(self):
         self.set_local_instance()
+        sync_request_targets = []
         for sales_channel in self.get_sales_channels():
+            if not sales_channel_sync_buffer.allows(sales_channel_id=sales_channel.id):
+                continue
+
             for target in self.get_targets(sales_channel=sales_channel):
                 guard_result = self.guard(target=target)
                 if not guard_result.allowed:
@@ -525,7 +721,12 @@ class AddTaskBase:
                 if self.live:
                     self.send_to_queue(target=target, guard_result=guard_result)
                 else:
-                    self.create_sync_request(target=target, guard_result=guard_result)
+                    sync_request_targets.append((target, guard_result))
+
+        if sync_request_targets:
+            self.create_sync_requests(targets=sync_request_targets)
+
+        self.flush_queue()
 
 
 class ChannelScopedAddTask(AddTaskBase):
@@ -644,16 +845,11 @@ class ProductPropertyAddTask(ProductScopedAddTask):
         if not property_obj.is_public_information:
             return GuardResult(allowed=False, reason="property_internal")
 
-        self.rule = self.product.get_product_rule(sales_channel=target.sales_channel)
-        if not self.rule:
+        requirements = self.product.get_product_rule_requirements(sales_channel=target.sales_channel)
+        if requirements.rule_id is None:
             return GuardResult(allowed=False, reason="property_rule_missing")
 
-        from properties.models import ProductPropertiesRuleItem
-
-        is_used = ProductPropertiesRuleItem.objects.filter(
-            rule=self.rule,
-            property=property_obj,
-        ).exists()
+        is_used = any(property_id == property_obj.id for property_id, _, _ in requirements.items)
         if not is_used:
             return GuardResult(allowed=False, reason="property_not_used_in_rule")
 
@@ -674,7 +870,12 @@ class ProductPriceAddTask(ProductScopedAddTask):
         from sales_channels.models import RemotePrice
         from sales_channels.helpers import build_price_data, compute_price_data_hash
 
-        price_data = build_price_data(product=self.product, sales_channel=target.sales_channel)
+        price_data = sales_channel_sync_buffer.get_price_data(
+            sales_channel_id=target.sales_channel.id,
+            product_id=self.product.id,
+        )
+        if price_data is None:
+            price_data = build_price_data(product=self.product, sales_channel=target.sales_channel)
         price_hash = compute_price_data_hash(price_data=price_data)
 
         remote_price = getattr(target.remote_product, "price", None)
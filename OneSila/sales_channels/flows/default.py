@@ -280,3 +280,63 @@ def run_delete_product_specific_generic_sales_channel_task_flow(
             except remote_class.DoesNotExist:
                 # If the remote instance does not exist for this sales channel, skip
                 pass
+
+
+def update_remote_prices_flow(*, multi_tenant_company, product_ids, currency):
+    """
+    Fan a price change for many products out to the sales channels.
+
+    The remote products are looked up with one query and every sales channel holding some of the products
+    gets a single task once the transaction commits, see update_sales_channel_remote_prices_flow.
+    """
+    from sales_channels.tasks import sales_channels__tasks__update_remote_prices_for_channel
+
+    channel_product_ids = {}
+    for sales_channel_id, product_id in RemoteProduct.objects.filter(
+        multi_tenant_company=multi_tenant_company,
+        local_instance_id__in=set(product_ids),
+    ).values_list('sales_channel_id', 'local_instance_id'):
+        channel_product_ids.setdefault(sales_channel_id, set()).add(product_id)
+
+    currency_id = currency.id if currency else None
+    for sales_channel_id, channel_ids in channel_product_ids.items():
+        transaction.on_commit(
+            lambda lb_sales_channel_id=sales_channel_id, lb_product_ids=sorted(channel_ids): sales_channels__tasks__update_remote_prices_for_channel(
+                sales_channel_id=lb_sales_channel_id,
+                product_ids=lb_product_ids,
+                currency_id=currency_id,
+            )
+        )
+
+
+def update_sales_channel_remote_prices_flow(*, sales_channel_id, product_ids, currency_id=None):
+    """
+    Sync the price change of many products to one sales channel.
+
+    The prices are resolved for all products at once with build_price_data_map and only the products whose
+    price data differs from the stored RemotePrice are signalled. The resolved price data is handed to the
+    price guards through the sync buffer instead of being rebuilt per product. The syncs are scoped to the
+    sales channel, so the add-task runners end up as one enqueue and the feed flags as one update.
+    """
+    from currencies.models import Currency
+    from products.models import Product
+    from sales_channels.factories.task_queue import collect_sales_channel_syncs
+    from sales_channels.helpers import build_price_data_map, get_products_with_changed_price_data
+    from sales_channels.models import SalesChannel
+    from sales_channels.signals import update_remote_price
+
+    sales_channel = SalesChannel.objects.get(id=sales_channel_id)
+    currency = Currency.objects.get(id=currency_id) if currency_id else None
+
+    price_data_map = build_price_data_map(product_ids=set(product_ids), sales_channel=sales_channel)
+    changed_product_ids = get_products_with_changed_price_data(
+        sales_channel=sales_channel,
+        product_ids=product_ids,
+        price_data_map=price_data_map,
+    )
+    products = Product.objects.filter(multi_tenant_company_id=sales_channel.multi_tenant_company_id, id__in=changed_product_ids)
+
+    with collect_sales_channel_syncs(sales_channel_ids=[sales_channel.id]) as sync_buffer:
+        sync_buffer.add_price_data(sales_channel_id=sales_channel.id, price_data_map=price_data_map)
+        for product in products.iterator():
+            update_remote_price.send(sender=product.__class__, instance=product, currency=currency)
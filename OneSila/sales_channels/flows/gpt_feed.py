@@ -5,12 +5,14 @@ from django.db.models import Q
 from llm.models import ChatGptProductFeedConfig
 from properties.models import ProductProperty, Property
 
+from sales_channels.factories.gpt.compaction import SalesChannelGptFeedCompactionFactory
 from sales_channels.factories.gpt.product_feed import SalesChannelGptProductFeedFactory
 from sales_channels.helpers import mark_remote_products_for_feed_updates
 
 __all__ = [
     "sync_gpt_feed",
     "remove_from_gpt_feed",
+    "compact_gpt_feeds",
     "mark_product_property_for_gpt_feed_update",
 ]
 
@@ -37,6 +39,15 @@ def remove_from_gpt_feed(*, sales_channel_id: int, sku: str) -> None:
     ).run()
 
 
+def compact_gpt_feeds(*, sales_channel_id: int | None = None, force: bool = False) -> None:
+    feeds = SalesChannelGptFeedCompactionFactory.get_due_feeds(force=force)
+    if sales_channel_id is not None:
+        feeds = feeds.filter(sales_channel_id=sales_channel_id)
+
+    for feed in feeds.iterator():
+        SalesChannelGptFeedCompactionFactory(feed=feed, force=force).run()
+
+
 def mark_product_property_for_gpt_feed_update(*, product_property: ProductProperty) -> None:
     property_id = getattr(product_property, "property_id", None)
     company_id = getattr(product_property, "multi_tenant_company_id", None)
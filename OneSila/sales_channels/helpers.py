@@ -1,4 +1,7 @@
+import logging
 import os
+
+from core.helpers import TransactionBuffer
 from django.db import models
 
 from sales_channels.integrations.magento2.models import MagentoSalesChannel
@@ -6,6 +9,8 @@ from typing import Iterable, Optional
 
 from sales_channels.models import RemoteProduct
 
+logger = logging.getLogger(__name__)
+
 
 def describe_document(*, media, media_through=None, remote_document_type=None) -> str:
     """Return a user-facing description for a document preflight error."""
@@ -439,14 +444,106 @@ def rebind_magento_attribute_sets_for_rule(*, rule):
         )
 
 
-def mark_remote_products_for_feed_updates(*, product_ids: Iterable[int]) -> None:
+class FeedDirtyProductsCollector(TransactionBuffer):
+    """
+    Collects the products flagged for a feed update inside a transaction and flags them with one
+    update per sales channel group when it commits, instead of one update per receiver call.
+
+    One flush is registered per transaction and the ids of a rolled back transaction are dropped.
+    `calls` and `updates` keep the totals of this thread, `saved_updates` is how many updates the
+    coalescing avoided.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.groups: dict[tuple[bool, frozenset], set[int]] = {}
+        self.pending_calls = 0
+        self.calls = 0
+        self.updates = 0
+
+    @property
+    def saved_updates(self):
+        return self.calls - self.updates
+
+    def add(self, *, product_ids, gpt_only=True, sales_channel_ids=None):
+        """
+        Returns False outside a transaction, nothing is collected then.
+        """
+        if not self.register_flush():
+            return False
+
+        key = (gpt_only, frozenset(sales_channel_ids or ()))
+        self.groups.setdefault(key, set()).update(product_ids)
+        self.pending_calls += 1
+        return True
+
+    def clear(self):
+        self.groups = {}
+        self.pending_calls = 0
+
+    def flush(self):
+        groups, pending_calls = self.groups, self.pending_calls
+        self.clear()
+        if not groups:
+            return
+
+        for (gpt_only, sales_channel_ids), product_ids in groups.items():
+            _flag_remote_products_for_feed_sync(
+                product_ids=product_ids,
+                gpt_only=gpt_only,
+                sales_channel_ids=sales_channel_ids,
+            )
+
+        self.calls += pending_calls
+        self.updates += len(groups)
+        logger.debug(
+            "Flagged remote products for feed sync with %s updates for %s calls (%s saved).",
+            len(groups),
+            pending_calls,
+            pending_calls - len(groups),
+        )
+
+
+feed_dirty_products_collector = FeedDirtyProductsCollector()
+
+
+def _flag_remote_products_for_feed_sync(*, product_ids, gpt_only=True, sales_channel_ids=None) -> None:
+    queryset = RemoteProduct.objects.filter(local_instance_id__in=product_ids)
+    if gpt_only:
+        queryset = queryset.filter(sales_channel__gpt_enable=True)
+    if sales_channel_ids:
+        queryset = queryset.filter(sales_channel_id__in=sales_channel_ids)
+
+    queryset.update(required_feed_sync=True)
+
+
+def _mark_remote_products(*, product_ids, gpt_only=True, sales_channel_ids=None) -> None:
+    if feed_dirty_products_collector.add(
+        product_ids=product_ids,
+        gpt_only=gpt_only,
+        sales_channel_ids=sales_channel_ids,
+    ):
+        return
+
+    _flag_remote_products_for_feed_sync(
+        product_ids=product_ids,
+        gpt_only=gpt_only,
+        sales_channel_ids=sales_channel_ids,
+    )
+
+
+def mark_remote_products_for_feed_updates(*, product_ids: Iterable[int], sales_channel_ids: Iterable[int] | None = None) -> None:
+    from sales_channels.factories.task_queue.task_queue import sales_channel_sync_buffer
+
     ids = {product_id for product_id in product_ids if product_id}
     if not ids:
         return
-    RemoteProduct.objects.filter(
-        local_instance_id__in=ids,
-        sales_channel__gpt_enable=True,
-    ).update(required_feed_sync=True)
+
+    if sales_channel_sync_buffer.is_active:
+        sales_channel_sync_buffer.add_feed_product_ids(product_ids=ids)
+        return
+
+    _mark_remote_products(product_ids=ids, sales_channel_ids=sales_channel_ids)
 
 
 def mark_remote_products_for_sales_channel_updates(*, product_ids: Iterable[int], sales_channel_ids: Iterable[int] | None = None) -> None:
@@ -454,12 +551,8 @@ def mark_remote_products_for_sales_channel_updates(*, product_ids: Iterable[int]
     if not ids:
         return
 
-    queryset = RemoteProduct.objects.filter(local_instance_id__in=ids)
     channel_ids = {sales_channel_id for sales_channel_id in (sales_channel_ids or []) if sales_channel_id}
-    if channel_ids:
-        queryset = queryset.filter(sales_channel_id__in=channel_ids)
-
-    queryset.update(required_feed_sync=True)
+    _mark_remote_products(product_ids=ids, gpt_only=False, sales_channel_ids=channel_ids)
 
 
 def run_generic_sales_channel_factory(sales_channel_id, factory_class, local_instance_id=None, local_instance_class=None, factory_kwargs=None, sales_channel_class=MagentoSalesChannel):
@@ -490,6 +583,83 @@ def compute_price_data_hash(*, price_data):
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
+def _serialize_price_data(*, full_price, discount_price):
+    return {
+        "price": float(full_price) if full_price is not None else None,
+        "discount_price": float(discount_price) if discount_price is not None else None,
+    }
+
+
+def build_price_data_map(*, product_ids, sales_channel):
+    """
+    Same payload as build_price_data for many products at once, keyed on product id.
+    Prices are resolved with SalesChannelPriceResolver so the query count does not grow with the products.
+    """
+    from sales_channels.models import RemoteCurrency
+    from sales_prices.helpers import SalesChannelPriceResolver
+
+    currencies = [
+        remote_currency.local_instance
+        for remote_currency in RemoteCurrency.objects.filter(
+            sales_channel=sales_channel,
+            local_instance__isnull=False,
+        ).select_related('local_instance')
+    ]
+
+    resolver = SalesChannelPriceResolver(
+        sales_channel=sales_channel,
+        product_ids=product_ids,
+        currencies=currencies,
+    )
+    resolver.resolve()
+
+    price_data_map = {}
+    for product_id in resolver.product_ids:
+        price_data = {}
+        try:
+            for currency in currencies:
+                full_price, discount_price = resolver.get(product_id=product_id, currency_id=currency.id)
+                price_data[currency.iso_code] = _serialize_price_data(full_price=full_price, discount_price=discount_price)
+        except ValueError:
+            # build_price_data raises for these, leave them out so the caller can handle them one by one.
+            continue
+
+        price_data_map[product_id] = price_data
+
+    return price_data_map
+
+
+def get_products_with_changed_price_data(*, sales_channel, product_ids, price_data_map=None):
+    """
+    Ids of the products whose price data on the sales channel differs from their stored RemotePrice, which is
+    what ProductPriceAddTask.guard checks one product at a time. Products the map cannot resolve are kept,
+    so the per product path still reports them.
+    """
+    from sales_channels.models import RemotePrice
+
+    product_ids = set(product_ids)
+    if price_data_map is None:
+        price_data_map = build_price_data_map(product_ids=product_ids, sales_channel=sales_channel)
+    stored_hashes = {}
+    for product_id, price_data_hash in RemotePrice.objects.non_polymorphic().filter(
+        remote_product__sales_channel=sales_channel,
+        remote_product__local_instance_id__in=product_ids,
+    ).values_list('remote_product__local_instance_id', 'price_data_hash'):
+        stored_hashes.setdefault(product_id, set()).add(price_data_hash)
+
+    changed = set()
+    for product_id in product_ids:
+        if product_id not in price_data_map or product_id not in stored_hashes:
+            changed.add(product_id)
+            continue
+
+        price_hash = compute_price_data_hash(price_data=price_data_map[product_id])
+        if stored_hashes[product_id] != {price_hash}:
+            changed.add(product_id)
+
+    return changed
+
+
 def build_price_data(*, product, sales_channel):
     from sales_channels.models import RemoteCurrency
 
@@ -502,10 +672,7 @@ def build_price_data(*, product, sales_channel):
         full_price, discount_price = product.get_price_for_sales_channel(
             sales_channel, currency=local_currency
         )
-        price_data[local_currency.iso_code] = {
-            "price": float(full_price) if full_price is not None else None,
-            "discount_price": float(discount_price) if discount_price is not None else None,
-        }
+        price_data[local_currency.iso_code] = _serialize_price_data(full_price=full_price, discount_price=discount_price)
 
     return price_data
 
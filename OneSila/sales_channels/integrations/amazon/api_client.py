@@ -0,0 +1,184 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from spapi import ApiClient, Configuration, SPAPIClient
+from spapi.auth.lwa_request import AccessTokenCache
+
+from core.rate_limiting import TokenBucket
+from sales_channels.integrations.amazon.constants import AMAZON_SP_API_RATE_LIMITS
+
+import logging
+logger = logging.getLogger(__name__)
+
+_configurations = {}
+_configurations_lock = threading.Lock()
+
+
+class ThreadApiClients(threading.local):
+    """
+    The api clients of the current thread per sales channel. ApiClient.call_api keeps the state of the
+    call (last_response, default_headers, api_models_module) on the client, so a client is never shared.
+    """
+
+    def __init__(self):
+        self.clients = {}
+
+
+_thread_clients = ThreadApiClients()
+
+
+class SharedAccessTokenCache(AccessTokenCache):
+    """
+    LWA access token cache shared by all workers through the default cache, so a refresh token is only
+    exchanged once per token lifetime instead of once per client.
+    """
+
+    def __init__(self, *, cache_key, **kwargs):
+        super().__init__(**kwargs)
+        self.cache_key = cache_key
+
+    def get_lwa_access_token(self):
+        if self.token_info and time.time() < self.token_info["expires_at"]:
+            return self.token_info["access_token"]
+
+        token_info = cache.get(self.cache_key)
+        if token_info and time.time() < token_info["expires_at"]:
+            self.token_info = token_info
+            return token_info["access_token"]
+
+        access_token = self.request_new_token(
+            self.client_id,
+            self.client_secret,
+            self.refresh_token,
+            self.grant_type,
+            self.scope,
+            self.oauth_endpoint,
+        )
+        timeout = int(self.token_info["expires_at"] - time.time())
+        if timeout > 0:
+            cache.set(self.cache_key, self.token_info, timeout=timeout)
+
+        return access_token
+
+
+class RateLimitedApiClient(ApiClient):
+    """
+    ApiClient that waits for a token of the operation bucket before every call.
+
+    The buckets are shared by all workers per sales channel and operation, with Amazon's published burst as
+    capacity and the rate of the last x-amzn-RateLimit-Limit header (or the published one) as refill rate.
+    """
+    rate_limit_header = "x-amzn-RateLimit-Limit"
+    rate_limit_cache_timeout = 60 * 60 * 24
+    max_wait = 60
+
+    def __init__(self, *args, sales_channel_id, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sales_channel_id = sales_channel_id
+
+    def get_rate_limit_cache_key(self, *, operation):
+        method, resource_path = operation
+        return f"amazon_rate_limit:{self.sales_channel_id}:{method}:{resource_path}"
+
+    def get_bucket(self, *, operation):
+        rate, burst = AMAZON_SP_API_RATE_LIMITS[operation]
+        rate = cache.get(self.get_rate_limit_cache_key(operation=operation), rate)
+        method, resource_path = operation
+
+        return TokenBucket(
+            key=f"amazon_sp_api:{self.sales_channel_id}:{method}:{resource_path}",
+            capacity=burst,
+            refill_rate=rate,
+        )
+
+    def acquire(self, *, operation):
+        bucket = self.get_bucket(operation=operation)
+        waited = 0
+        while not bucket.consume():
+            delay = min(max(bucket.seconds_until_available(), 0.05), self.max_wait - waited)
+            if delay <= 0:
+                # Leave it to the throttling retries rather than blocking the worker any longer.
+                logger.warning(f"Gave up waiting for the SP-API rate limit of {operation} on sales channel {self.sales_channel_id}.")
+                return
+
+            time.sleep(delay)
+            waited += delay
+
+    def store_rate_limit(self, *, operation):
+        response = self.last_response
+        if response is None:
+            return
+
+        value = response.getheader(self.rate_limit_header)
+        if not value:
+            return
+
+        try:
+            rate = float(value)
+        except ValueError:
+            return
+
+        if rate > 0:
+            cache.set(self.get_rate_limit_cache_key(operation=operation), rate, timeout=self.rate_limit_cache_timeout)
+
+    def call_api(self, resource_path, method, *args, **kwargs):
+        operation = (method.upper(), resource_path)
+        if operation not in AMAZON_SP_API_RATE_LIMITS:
+            return super().call_api(resource_path, method, *args, **kwargs)
+
+        self.acquire(operation=operation)
+        self.last_response = None
+        response = super().call_api(resource_path, method, *args, **kwargs)
+        self.store_rate_limit(operation=operation)
+        return response
+
+
+def get_amazon_api_configuration(*, sales_channel) -> Configuration:
+    """
+    Returns the process wide configuration of the sales channel with its shared access token cache.
+    It is rebuilt when the credentials of the sales channel change.
+    """
+    refresh_token = sales_channel.refresh_token
+    credentials = hashlib.sha256(f"{settings.AMAZON_CLIENT_ID}:{refresh_token}".encode()).hexdigest()
+    key = (sales_channel.id, sales_channel.region, credentials)
+
+    with _configurations_lock:
+        configuration = _configurations.get(key)
+        if configuration is not None:
+            return configuration
+
+        # Built like SPAPIClient does, but with a SharedAccessTokenCache: the token ApiClient.__init__ and
+        # every call ask for is read from the default cache and only exchanged once per token lifetime.
+        configuration = Configuration()
+        configuration.host = SPAPIClient.region_to_endpoint.get(sales_channel.region)
+        configuration.access_token_cache = SharedAccessTokenCache(
+            cache_key=f"amazon_access_token:{sales_channel.id}:{credentials}",
+            client_id=settings.AMAZON_CLIENT_ID,
+            client_secret=settings.AMAZON_CLIENT_SECRET,
+            refresh_token=refresh_token,
+            oauth_endpoint=SPAPIClient.oauth_endpoint,
+        )
+
+        for stale_key in [stale_key for stale_key in _configurations if stale_key[0] == sales_channel.id]:
+            del _configurations[stale_key]
+        _configurations[key] = configuration
+
+    return configuration
+
+
+def get_amazon_api_client(*, sales_channel) -> RateLimitedApiClient:
+    """
+    Returns the api client of the sales channel for the current thread. The client keeps its HTTP pool
+    between calls and shares the process wide configuration and access token of the sales channel.
+    """
+    configuration = get_amazon_api_configuration(sales_channel=sales_channel)
+
+    client = _thread_clients.clients.get(sales_channel.id)
+    if client is None or client.configuration is not configuration:
+        client = RateLimitedApiClient(configuration=configuration, sales_channel_id=sales_channel.id)
+        _thread_clients.clients[sales_channel.id] = client
+
+    return client
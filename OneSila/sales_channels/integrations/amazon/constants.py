@@ -26,6 +26,24 @@ SELLER_CENTRAL_URLS = {
 
 AMAZON_OAUTH_TOKEN_URL = "https://api.amazon.com/auth/o2/token"
 
+# Published SP-API usage plans as (requests per second, burst) per (method, resource path).
+# The rate is replaced by the x-amzn-RateLimit-Limit header once Amazon returned one.
+AMAZON_SP_API_RATE_LIMITS = {
+    ("GET", "/listings/2021-08-01/items/{sellerId}/{sku}"): (5, 10),
+    ("PUT", "/listings/2021-08-01/items/{sellerId}/{sku}"): (5, 10),
+    ("PATCH", "/listings/2021-08-01/items/{sellerId}/{sku}"): (5, 10),
+    ("DELETE", "/listings/2021-08-01/items/{sellerId}/{sku}"): (5, 10),
+    ("GET", "/listings/2021-08-01/items/{sellerId}"): (5, 5),
+    ("GET", "/definitions/2020-09-01/productTypes/{productType}"): (5, 10),
+    ("GET", "/definitions/2020-09-01/productTypes"): (5, 10),
+    ("GET", "/catalog/2022-04-01/items/{asin}"): (2, 2),
+    ("GET", "/catalog/2022-04-01/items"): (2, 2),
+    ("GET", "/sellers/v1/marketplaceParticipations"): (0.016, 15),
+    ("POST", "/reports/2021-06-30/reports"): (0.0167, 15),
+    ("GET", "/reports/2021-06-30/reports/{reportId}"): (2, 15),
+    ("GET", "/reports/2021-06-30/documents/{reportDocumentId}"): (0.0167, 15),
+}
+
 
 AMAZON_LOCALE_MAPPING = {
     'en': 'en_US',
@@ -7,7 +7,7 @@ import requests
 
 def throttle_safe(max_retries=5, base_delay=1.0):
     """
-    Decorator to retry the decorated function if throttled (HTTP 429).
+    Decorator to retry the decorated function if throttled (HTTP 429) or on a server error (HTTP 500).
     Uses exponential backoff.
     """
     def decorator(func):
@@ -24,7 +24,7 @@ def throttle_safe(max_retries=5, base_delay=1.0):
                     continue
                 except ApiException as exc:
                     status = getattr(exc, "status", None)
-                    if status != 500 or attempt == max_retries:
+                    if status not in (429, 500) or attempt == max_retries:
                         raise
                     delay = base_delay * (2 ** attempt)
                     time.sleep(delay)
@@ -1,6 +1,8 @@
 import pprint
 import re
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from itertools import islice
 from django.utils import timezone
 import logging
 import traceback
@@ -23,6 +25,7 @@ from sales_channels.integrations.amazon.helpers import (
     infer_product_type,
     extract_description_and_bullets,
     get_is_product_variation, extract_amazon_attribute_value, is_amazon_internal_property,
+    serialize_listing_item,
 )
 from sales_channels.integrations.amazon.models import (
     AmazonProduct,
@@ -73,6 +76,12 @@ class AmazonProductsImportProcessor(TemporaryDisableInspectorSignalsMixin, Impor
     ERROR_NAME_TOO_LONG = "NAME_TOO_LONG"
     ERROR_INVALID_VARIATION_THEME = "INVALID_VARIATION_THEME"
 
+    # Listings are read ahead in chunks so their catalog attributes can be fetched with searchCatalogItems,
+    # which accepts up to 20 ASINs per call. The calls run in parallel and wait on the shared rate limiter.
+    catalog_prefetch_chunk_size = 200
+    catalog_search_batch_size = 20
+    catalog_prefetch_workers = 2
+
     def _add_broken_record(self, *, code, message, data=None, context=None, exc=None):
         record = {
             "data": ensure_serializable(data) if data else {},
@@ -122,8 +131,87 @@ class AmazonProductsImportProcessor(TemporaryDisableInspectorSignalsMixin, Impor
 
     @timeit_and_log(logger, "AmazonProductsImportProcessor.get_products_data")
     def get_products_data(self):
-        # Delegate to the mixin helper which yields ListingItem objects
-        yield from self.get_all_products(sort_order="DESC")
+        # Delegate to the mixin helper which yields ListingItem objects, serialized here so the
+        # prefetched catalog attributes travel with each product to its (async) processor.
+        listings = self.get_all_products(sort_order="DESC")
+        while chunk := [serialize_listing_item(item) for item in islice(listings, self.catalog_prefetch_chunk_size)]:
+            self.prefetch_catalog_attributes(chunk)
+            yield from chunk
+
+    # ------------------------------------------------------------------
+    # Catalog prefetch
+    # ------------------------------------------------------------------
+    @throttle_safe(max_retries=5, base_delay=1)
+    def _search_catalog_items(self, asins, marketplace_id, catalog_api=None):
+        """Return a map of ASIN -> catalog attributes for a batch of ASINs of one marketplace."""
+        catalog_api = catalog_api or self.get_catalog_api_client()
+        response = catalog_api.search_catalog_items(
+            [marketplace_id],
+            identifiers=asins,
+            identifiers_type="ASIN",
+            included_data=["attributes"],
+            page_size=len(asins),
+        )
+
+        items = response.get("items") if isinstance(response, dict) else getattr(response, "items", None)
+        attributes = {}
+        for item in items or []:
+            if isinstance(item, dict):
+                asin, item_attributes = item.get("asin"), item.get("attributes")
+            else:
+                asin, item_attributes = getattr(item, "asin", None), getattr(item, "attributes", None)
+
+            if asin:
+                attributes[asin] = ensure_serializable(item_attributes or {})
+
+        return attributes
+
+    def _fetch_catalog_batch(self, marketplace_id, asins):
+        # Runs in a prefetch worker: the client is built in the worker thread, so no call state is shared.
+        try:
+            catalog_api = self.get_catalog_api_client()
+            return marketplace_id, asins, self._search_catalog_items(asins, marketplace_id, catalog_api=catalog_api)
+        except Exception as exc:
+            logger.warning(f"Catalog prefetch failed for {len(asins)} ASINs on {marketplace_id}: {exc}")
+            return marketplace_id, asins, None
+
+    @timeit_and_log(logger, "AmazonProductsImportProcessor.prefetch_catalog_attributes")
+    def prefetch_catalog_attributes(self, products):
+        """
+        Store the catalog attributes of the given serialized listings under `catalog_attributes`, which
+        get__product_data reads instead of calling getCatalogItem per listing. ASINs unknown to the catalog get
+        an empty dict, listings of a failed batch are left without the key and fall back to the single lookup.
+        """
+        asins_by_marketplace = {}
+        for product in products:
+            summary = self._get_summary(product)
+            asin = summary.get("asin")
+            marketplace_id = summary.get("marketplace_id")
+            if asin and marketplace_id and "catalog_attributes" not in product:
+                asins_by_marketplace.setdefault(marketplace_id, {})[asin] = None
+
+        batches = []
+        for marketplace_id, asins in asins_by_marketplace.items():
+            asins = iter(asins)
+            while batch := list(islice(asins, self.catalog_search_batch_size)):
+                batches.append((marketplace_id, batch))
+
+        if not batches:
+            return
+
+        catalog_attributes = {}
+        with ThreadPoolExecutor(max_workers=self.catalog_prefetch_workers) as executor:
+            for marketplace_id, asins, attributes in executor.map(lambda batch: self._fetch_catalog_batch(*batch), batches):
+                if attributes is None:
+                    continue
+                for asin in asins:
+                    catalog_attributes[(marketplace_id, asin)] = attributes.get(asin, {})
+
+        for product in products:
+            summary = self._get_summary(product)
+            key = (summary.get("marketplace_id"), summary.get("asin"))
+            if key in catalog_attributes:
+                product["catalog_attributes"] = catalog_attributes[key]
 
     # ------------------------------------------------------------------
     # Structuring
@@ -742,7 +830,10 @@ class AmazonProductsImportProcessor(TemporaryDisableInspectorSignalsMixin, Impor
             product_attrs, product_type_code, view
         )
 
-        catalog_attrs = self._fetch_catalog_attributes(asin, view)
+        catalog_attrs = product_data.get("catalog_attributes")
+        if catalog_attrs is None:
+            catalog_attrs = self._fetch_catalog_attributes(asin, view)
+
         if catalog_attrs:
             extra_attrs, extra_map = self._parse_attributes(
                 catalog_attrs,
@@ -8,8 +8,9 @@ import json
 from django.conf import settings
 from django.utils import timezone
 from sp_api.base import SellingApiException
-from spapi import SellersApi, SPAPIConfig, SPAPIClient, DefinitionsApi, ListingsApi
+from spapi import SellersApi, DefinitionsApi, ListingsApi
 from spapi.rest import ApiException
+from sales_channels.integrations.amazon.api_client import get_amazon_api_client
 from sales_channels.integrations.amazon.decorators import throttle_safe
 from sales_channels.integrations.amazon.exceptions import (
     AmazonProductValidationIssuesException,
@@ -111,13 +112,7 @@ class GetAmazonAPIMixin:
                 raise AmazonProductValidationIssuesException(issues=error_issues)
 
     def _get_client(self):
-        config = SPAPIConfig(
-            client_id=settings.AMAZON_CLIENT_ID,
-            client_secret=settings.AMAZON_CLIENT_SECRET,
-            refresh_token=self.sales_channel.refresh_token,
-            region=self.sales_channel.region,
-        )
-        return SPAPIClient(config).api_client
+        return get_amazon_api_client(sales_channel=self.sales_channel)
 
     def get_api(self):
         return None
@@ -1,20 +1,43 @@
 import gzip
+import shutil
+import tempfile
 import time
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from itertools import islice
 from typing import Iterable
 
 import requests
 from sp_api.base import ReportStatus
 from sp_api.base.reportTypes import ReportType
+from django.utils import timezone
 from spapi import ReportsApi
 
 from sales_channels.integrations.amazon.factories.mixins import GetAmazonAPIMixin
 from sales_channels.integrations.amazon.models import AmazonBrowseNode, AmazonSalesChannelView
 
+import logging
+logger = logging.getLogger(__name__)
+
 
 class AmazonBrowseNodeSyncFactory(GetAmazonAPIMixin):
     """Sync all Amazon browse nodes for a given marketplace view."""
 
+    batch_size = 2000
+    download_timeout = (10, 300)
+    download_chunk_size = 1024 * 1024
+    update_fields = [
+        "name",
+        "context_name",
+        "has_children",
+        "child_node_ids",
+        "browse_path_by_id",
+        "browse_path_by_name",
+        "product_type_definitions",
+        "path_depth",
+        "updated_at",
+    ]
+
     def __init__(self, view: AmazonSalesChannelView):
         self.view = view
         self.sales_channel = view.sales_channel
@@ -35,41 +58,113 @@ class AmazonBrowseNodeSyncFactory(GetAmazonAPIMixin):
                 raise RuntimeError(f"Report failed: {status}")
             time.sleep(30)
 
-    def _download_document(self, report_document_id: str) -> str:
+    @contextmanager
+    def _download_document(self, report_document_id: str):
+        """
+        Stream the report document into a temporary file and yield it as a readable, decompressed stream.
+        The file is written before parsing so the download is not held open while the nodes are saved.
+        """
         doc_info = self.api.get_report_document(report_document_id)
-        content = requests.get(doc_info.url).content
-        if doc_info.compression_algorithm == "GZIP":
-            content = gzip.decompress(content)
-        return content.decode("utf-8")
-
-    def _parse_nodes(self, xml_text: str) -> Iterable[AmazonBrowseNode]:
-        root = ET.fromstring(xml_text)
-        nodes = root.findall(".//Node")
-        for node_elem in nodes:
-            remote_id = node_elem.findtext("browseNodeId")
-            if not remote_id:
+        with tempfile.TemporaryFile() as stream:
+            with requests.get(doc_info.url, stream=True, timeout=self.download_timeout) as response:
+                response.raise_for_status()
+                shutil.copyfileobj(response.raw, stream, self.download_chunk_size)
+            stream.seek(0)
+
+            if doc_info.compression_algorithm == "GZIP":
+                with gzip.GzipFile(fileobj=stream) as document:
+                    yield document
+            else:
+                yield stream
+
+    def _build_node(self, node_elem) -> AmazonBrowseNode | None:
+        remote_id = node_elem.findtext("browseNodeId")
+        if not remote_id:
+            return None
+        name = node_elem.findtext("browseNodeName")
+        context_name = node_elem.findtext("browseNodeStoreContextName")
+        has_children = node_elem.findtext("hasChildren") == "true"
+        child_ids = [el.text.strip() for el in node_elem.findall("childNodes/id") if el.text]
+        path_by_id = [s.strip() for s in (node_elem.findtext("browsePathById") or "").split(",") if s.strip()]
+        path_by_name = [s.strip() for s in (node_elem.findtext("browsePathByName") or "").split(",") if s.strip()]
+        ptd_text = node_elem.findtext("productTypeDefinitions") or ""
+        product_type_definitions = [s.strip() for s in ptd_text.split(",") if s.strip()]
+        path_depth = len(path_by_id)
+        return AmazonBrowseNode(
+            remote_id=remote_id,
+            marketplace_id=self.marketplace_id,
+            name=name,
+            context_name=context_name,
+            has_children=has_children,
+            child_node_ids=child_ids,
+            browse_path_by_id=path_by_id,
+            browse_path_by_name=path_by_name,
+            product_type_definitions=product_type_definitions,
+            path_depth=path_depth,
+        )
+
+    def _parse_nodes(self, source) -> Iterable[AmazonBrowseNode]:
+        """
+        Yield the nodes of the browse tree one by one with iterparse, clearing every parsed node so the
+        document is never held in memory.
+        """
+        root = None
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if root is None:
+                root = elem
                 continue
-            name = node_elem.findtext("browseNodeName")
-            context_name = node_elem.findtext("browseNodeStoreContextName")
-            has_children = node_elem.findtext("hasChildren") == "true"
-            child_ids = [el.text.strip() for el in node_elem.findall("childNodes/id") if el.text]
-            path_by_id = [s.strip() for s in (node_elem.findtext("browsePathById") or "").split(",") if s.strip()]
-            path_by_name = [s.strip() for s in (node_elem.findtext("browsePathByName") or "").split(",") if s.strip()]
-            ptd_text = node_elem.findtext("productTypeDefinitions") or ""
-            product_type_definitions = [s.strip() for s in ptd_text.split(",") if s.strip()]
-            path_depth = len(path_by_id)
-            yield AmazonBrowseNode(
-                remote_id=remote_id,
-                marketplace_id=self.marketplace_id,
-                name=name,
-                context_name=context_name,
-                has_children=has_children,
-                child_node_ids=child_ids,
-                browse_path_by_id=path_by_id,
-                browse_path_by_name=path_by_name,
-                product_type_definitions=product_type_definitions,
-                path_depth=path_depth,
+
+            if event != "end" or elem.tag != "Node":
+                continue
+
+            node = self._build_node(elem)
+            elem.clear()
+            root.clear()
+            if node is not None:
+                yield node
+
+    def _save_nodes(self, nodes: Iterable[AmazonBrowseNode]) -> int:
+        """
+        Upsert the nodes in chunks. Rows keep their ids, so existing parent links and product assignments
+        survive the sync.
+        """
+        saved = 0
+        nodes = iter(nodes)
+        while chunk := list(islice(nodes, self.batch_size)):
+            # The same node can be listed twice, Postgres refuses to upsert a row twice in one statement.
+            chunk = list({node.remote_id: node for node in chunk}.values())
+            AmazonBrowseNode.objects.bulk_create(
+                chunk,
+                update_conflicts=True,
+                unique_fields=["remote_id", "marketplace_id"],
+                update_fields=self.update_fields,
             )
+            saved += len(chunk)
+
+        return saved
+
+    def _rebuild_tree(self):
+        """
+        Set parent_node and is_root from browsePathById, writing only the nodes whose link changed.
+        """
+        qs = AmazonBrowseNode.objects.filter(marketplace_id=self.marketplace_id)
+        id_map = dict(qs.values_list("remote_id", "id").iterator(chunk_size=self.batch_size))
+
+        changed = []
+        rows = qs.values_list("id", "browse_path_by_id", "parent_node_id", "is_root").iterator(chunk_size=self.batch_size)
+        for pk, path, parent_node_id, is_root in rows:
+            parent_remote = path[-2] if len(path) >= 2 else None
+            parent_pk = id_map.get(parent_remote)
+            if parent_pk == parent_node_id and is_root == (parent_pk is None):
+                continue
+
+            changed.append(AmazonBrowseNode(pk=pk, parent_node_id=parent_pk, is_root=parent_pk is None))
+            if len(changed) >= self.batch_size:
+                AmazonBrowseNode.objects.bulk_update(changed, ["parent_node", "is_root"])
+                changed = []
+
+        if changed:
+            AmazonBrowseNode.objects.bulk_update(changed, ["parent_node", "is_root"])
 
     # ------------------------------------------------------------------
     # Public API
@@ -82,30 +177,17 @@ class AmazonBrowseNodeSyncFactory(GetAmazonAPIMixin):
             }
         )
         report_info = self._wait_for_report(response.report_id)
-        xml_text = self._download_document(report_info.report_document_id)
-        new_objs = list(self._parse_nodes(xml_text))
-        new_ids = {obj.remote_id for obj in new_objs}
-        AmazonBrowseNode.objects.bulk_create(new_objs, ignore_conflicts=True)
-        existing_ids = set(
-            AmazonBrowseNode.objects.filter(marketplace_id=self.marketplace_id).values_list("remote_id", flat=True)
-        )
-        stale_ids = existing_ids - new_ids
-        if stale_ids:
+        sync_started_at = timezone.now()
+
+        with self._download_document(report_info.report_document_id) as document:
+            saved = self._save_nodes(self._parse_nodes(document))
+
+        # every node of the tree was touched by the upsert, the ones left behind are gone from Amazon
+        if saved:
             AmazonBrowseNode.objects.filter(
-                marketplace_id=self.marketplace_id, remote_id__in=stale_ids
+                marketplace_id=self.marketplace_id,
+                updated_at__lt=sync_started_at,
             ).delete()
 
-        # rebuild parent relationships using browsePathById
-        qs = AmazonBrowseNode.objects.filter(marketplace_id=self.marketplace_id)
-        id_map = dict(qs.values_list("remote_id", "id"))
-        root_ids = []
-        for node in qs:
-            path = node.browse_path_by_id
-            parent_remote = path[-2] if len(path) >= 2 else None
-            parent_pk = id_map.get(parent_remote)
-            if parent_pk:
-                AmazonBrowseNode.objects.filter(pk=node.pk).update(parent_node_id=parent_pk, is_root=False)
-            else:
-                root_ids.append(node.pk)
-        if root_ids:
-            AmazonBrowseNode.objects.filter(pk__in=root_ids).update(parent_node=None, is_root=True)
+        self._rebuild_tree()
+        logger.info(f"Synced {saved} browse nodes for marketplace {self.marketplace_id}.")
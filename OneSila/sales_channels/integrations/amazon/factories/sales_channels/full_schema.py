@@ -8,6 +8,7 @@ from sales_channels.integrations.amazon.factories.mixins import (
     GetAmazonAPIMixin,
 )
 from sales_channels.integrations.amazon.helpers import is_amazon_document_field, is_amazon_internal_property
+from sales_channels.integrations.amazon.schema_store import AmazonSchemaStore
 from sales_channels.integrations.amazon.models import (
     AmazonDocumentType,
     AmazonSalesChannelView,
@@ -15,7 +16,7 @@ from sales_channels.integrations.amazon.models import (
 )
 from sales_channels.integrations.amazon.models.properties import AmazonProductType, AmazonPublicDefinition, \
     AmazonProperty, AmazonPropertySelectValue, AmazonProductTypeItem
-import requests
+import hashlib
 import json
 import logging
 from properties.models import Property, ProductPropertiesRuleItem
@@ -24,6 +25,10 @@ from core.logging_helpers import timeit_and_log
 logger = logging.getLogger(__name__)
 
 
+def get_schema_definition_checksum(schema_definition) -> str:
+    return hashlib.md5(json.dumps(schema_definition, sort_keys=True).encode("utf-8")).hexdigest()
+
+
 class ExportDefinitionFactory:
     def __init__(self, public_definition: AmazonPublicDefinition):
         self.public_definition = public_definition
@@ -544,14 +549,20 @@ class AmazonProductTypeRuleFactory(
             ).order_by("id").first()
         return product_type
 
-    def _download_json(self, url):
+    def _download_schema(self, *, response, view, requirements):
         """
-        Download the JSON schema from Amazon's URL and save it to disk for inspection.
+        Return the schema of a definitions response from the shared schema store, which only downloads
+        schemas it does not hold yet.
         """
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return data
+        product_type_version = getattr(response, "product_type_version", None)
+        return AmazonSchemaStore().get_schema(
+            product_type=self.product_type.product_type_code,
+            marketplace_id=view.remote_id,
+            requirements=requirements,
+            version=getattr(product_type_version, "version", None),
+            checksum=getattr(response.var_schema, "checksum", None),
+            url=response.var_schema.link.resource,
+        )
 
     @timeit_and_log(logger)
     @throttle_safe(max_retries=5, base_delay=1)
@@ -569,8 +580,7 @@ class AmazonProductTypeRuleFactory(
             seller_id=self.sales_channel.remote_id,
         )
 
-        schema_link = response.var_schema.link.resource
-        schema_data = self._download_json(schema_link)
+        schema_data = self._download_schema(response=response, view=view, requirements="LISTING")
 
         offer_response = definitions_api.get_definitions_product_type(
             product_type=self.product_type.product_type_code,
@@ -579,8 +589,11 @@ class AmazonProductTypeRuleFactory(
             seller_id=self.sales_channel.remote_id,
         )
 
-        offer_schema_link = offer_response.var_schema.link.resource
-        offer_schema_data = self._download_json(offer_schema_link)
+        offer_schema_data = self._download_schema(
+            response=offer_response,
+            view=view,
+            requirements="LISTING_OFFER_ONLY",
+        )
 
         offer_property_keys = list(offer_schema_data.get("properties", {}).keys())
 
@@ -668,6 +681,9 @@ class AmazonProductTypeRuleFactory(
             code=attr_code,
         )
 
+        schema_checksum = get_schema_definition_checksum(schema_definition)
+        schema_changed = public_def.schema_checksum != schema_checksum
+
         public_def.name = schema_definition["title"] if "title" in schema_definition else f"{attr_code} {view.api_region_code}"
         public_def.raw_schema = schema_definition
         public_def.is_required = attr_code in required_properties
@@ -686,6 +702,10 @@ class AmazonProductTypeRuleFactory(
         public_def.allowed_in_listing_offer_request = (
             attr_code in offer_allowed_properties
         )
+        # The checksum is only stored together with the definitions parsed from the schema, so a run that
+        # fails while parsing is retried. Nothing is parsed from internal properties.
+        if public_def.is_internal and not public_def.is_document_field:
+            public_def.schema_checksum = schema_checksum
         public_def.save()
 
         if public_def.is_document_field:
@@ -703,6 +723,10 @@ class AmazonProductTypeRuleFactory(
                 public_def.export_definition = None
                 update_fields.append("export_definition")
 
+            if public_def.schema_checksum != schema_checksum:
+                public_def.schema_checksum = schema_checksum
+                update_fields.append("schema_checksum")
+
             public_def.last_fetched = timezone.now()
             update_fields.append("last_fetched")
 
@@ -716,7 +740,8 @@ class AmazonProductTypeRuleFactory(
             )
             return public_def
 
-        if public_def.should_refresh() and not public_def.is_internal:
+        # The definitions only depend on the schema slice, so they are parsed once per schema version.
+        if (schema_changed or public_def.should_refresh()) and not public_def.is_internal:
 
             # These factories will handle smart fallback logic (for now: pass)
             export_definition_fac = ExportDefinitionFactory(public_def)
@@ -725,6 +750,7 @@ class AmazonProductTypeRuleFactory(
             usage_definition_fac = UsageDefinitionFactory(public_def)
             public_def.usage_definition = usage_definition_fac.run()
             public_def.export_definition = export_definition_fac.results
+            public_def.schema_checksum = schema_checksum
             public_def.last_fetched = timezone.now()
             public_def.save()
 
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('amazon', '0082_delete_amazoninventory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='amazonpublicdefinition',
+            name='schema_checksum',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+    ]
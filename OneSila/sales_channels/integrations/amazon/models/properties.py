@@ -41,6 +41,7 @@ class AmazonPublicDefinition(models.SharedModel):
     # ------------- display -------------
     name = models.CharField(max_length=255)
     raw_schema = models.JSONField(blank=True, null=True)        # the slice of Amazon schema for this property
+    schema_checksum = models.CharField(max_length=32, blank=True, default="")   # md5 of raw_schema when last parsed
 
     # ------------- rendering / encoding -------------
     usage_definition = models.TextField(
@@ -0,0 +1,130 @@
+import base64
+import binascii
+import gzip
+import hashlib
+import json
+import threading
+
+import requests
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from requests.adapters import HTTPAdapter
+
+import logging
+logger = logging.getLogger(__name__)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_schema_session() -> requests.Session:
+    """
+    Process wide HTTP session for the schema downloads, so the connections to Amazon's schema host are reused.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=3))
+            _session = session
+
+    return _session
+
+
+def normalise_schema_checksum(checksum) -> str | None:
+    """
+    Amazon sends the checksum as a base64 MD5 digest, stored here as hex so it can be used in a path.
+    """
+    if not checksum:
+        return None
+
+    try:
+        digest = base64.b64decode(checksum, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+
+    return digest.hex() if len(digest) == 16 else None
+
+
+class AmazonSchemaStore:
+    """
+    Content addressed store of the product type definition schemas, shared by all sales channels.
+
+    Schemas are kept gzipped in the default storage under the MD5 of their content, which is the checksum
+    Amazon sends with the definition, so a schema is downloaded once whatever the tenant asking for it.
+    An index in the cache maps (product type, marketplace, requirements, version) to the stored checksum and
+    the ETag of the download, used for a conditional request when Amazon did not send a checksum.
+    """
+    storage_prefix = "amazon/schemas"
+    download_timeout = (10, 120)
+    index_timeout = 60 * 60 * 24 * 30
+
+    def __init__(self, *, storage=None):
+        self.storage = storage or default_storage
+
+    def get_index_key(self, *, product_type, marketplace_id, requirements, version):
+        return f"amazon_schema:{product_type}:{marketplace_id}:{requirements}:{version or 'latest'}"
+
+    def get_path(self, *, checksum):
+        return f"{self.storage_prefix}/{checksum[:2]}/{checksum}.json.gz"
+
+    def exists(self, *, checksum):
+        return bool(checksum) and self.storage.exists(self.get_path(checksum=checksum))
+
+    def read(self, *, checksum):
+        if not self.exists(checksum=checksum):
+            return None
+
+        with self.storage.open(self.get_path(checksum=checksum), "rb") as stored:
+            return json.loads(gzip.decompress(stored.read()))
+
+    def write(self, *, checksum, content: bytes):
+        path = self.get_path(checksum=checksum)
+        if not self.storage.exists(path):
+            self.storage.save(path, ContentFile(gzip.compress(content)))
+
+    def download(self, *, url, etag=None):
+        """
+        Returns the content and ETag of the schema, or None as content when the ETag still matches.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = get_schema_session().get(url, headers=headers, timeout=self.download_timeout)
+        if response.status_code == 304:
+            return None, etag
+
+        response.raise_for_status()
+        return response.content, response.headers.get("ETag")
+
+    def get_schema(self, *, product_type, marketplace_id, requirements, version, checksum, url) -> dict:
+        checksum = normalise_schema_checksum(checksum)
+        index_key = self.get_index_key(
+            product_type=product_type,
+            marketplace_id=marketplace_id,
+            requirements=requirements,
+            version=version,
+        )
+
+        if checksum:
+            data = self.read(checksum=checksum)
+            if data is not None:
+                return data
+
+        entry = cache.get(index_key) or {}
+        if checksum and entry.get("checksum") != checksum:
+            entry = {}
+
+        etag = entry.get("etag") if self.exists(checksum=entry.get("checksum")) else None
+        content, etag = self.download(url=url, etag=etag)
+        if content is None:
+            return self.read(checksum=entry["checksum"])
+
+        content_checksum = hashlib.md5(content).hexdigest()
+        if checksum and checksum != content_checksum:
+            logger.warning(f"Checksum mismatch for the {requirements} schema of {product_type} in {marketplace_id}.")
+
+        self.write(checksum=content_checksum, content=content)
+        cache.set(index_key, {"checksum": content_checksum, "etag": etag}, timeout=self.index_timeout)
+
+        return json.loads(content)
@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from spapi.auth.lwa_request import AccessTokenCache
+
+from sales_channels.integrations.amazon import api_client
+from sales_channels.integrations.amazon.api_client import get_amazon_api_client
+
+CATALOG_ITEM = ("GET", "/catalog/2022-04-01/items/{asin}")
+
+
+class AmazonApiClientTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        api_client._configurations.clear()
+        api_client._thread_clients.clients.clear()
+        self.addCleanup(api_client._configurations.clear)
+        self.addCleanup(api_client._thread_clients.clients.clear)
+        self.sales_channel = SimpleNamespace(id=1, region="EU", refresh_token="refresh")
+        self.exchanges = 0
+
+        def request_new_token(token_cache, *args):
+            self.exchanges += 1
+            token_cache.token_info = {"access_token": f"token-{self.exchanges}", "expires_at": time.time() + 3600}
+            return token_cache.token_info["access_token"]
+
+        patcher = patch.object(AccessTokenCache, "request_new_token", request_new_token)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_is_reused_per_sales_channel(self):
+        client = get_amazon_api_client(sales_channel=self.sales_channel)
+
+        self.assertIs(get_amazon_api_client(sales_channel=self.sales_channel), client)
+        self.assertEqual(client.configuration.host, "https://sellingpartnerapi-eu.amazon.com")
+
+        self.sales_channel.refresh_token = "other"
+        self.assertIsNot(get_amazon_api_client(sales_channel=self.sales_channel), client)
+        self.assertEqual(len(api_client._configurations), 1)
+
+    def test_threads_get_their_own_client_with_the_shared_configuration(self):
+        client = get_amazon_api_client(sales_channel=self.sales_channel)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            thread_client = executor.submit(get_amazon_api_client, sales_channel=self.sales_channel).result()
+
+        self.assertIsNot(thread_client, client)
+        self.assertIs(thread_client.configuration, client.configuration)
+        self.assertEqual(self.exchanges, 1)
+
+    def test_access_token_is_shared_between_processes(self):
+        get_amazon_api_client(sales_channel=self.sales_channel)
+        api_client._configurations.clear()
+        api_client._thread_clients.clients.clear()
+        client = get_amazon_api_client(sales_channel=self.sales_channel)
+
+        self.assertEqual(self.exchanges, 1)
+        self.assertEqual(client.default_headers["x-amz-access-token"], "token-1")
+
+    def test_rate_limit_header_sets_bucket_rate(self):
+        client = get_amazon_api_client(sales_channel=self.sales_channel)
+        self.assertEqual(client.get_bucket(operation=CATALOG_ITEM).refill_rate, 2)
+
+        client.last_response = Mock(getheader=Mock(return_value="0.5"))
+        client.store_rate_limit(operation=CATALOG_ITEM)
+
+        bucket = client.get_bucket(operation=CATALOG_ITEM)
+        self.assertEqual(bucket.refill_rate, 0.5)
+        self.assertEqual(bucket.capacity, 2)
+
+    @patch("sales_channels.integrations.amazon.api_client.time.sleep")
+    def test_acquire_waits_once_burst_is_used(self, sleep):
+        client = get_amazon_api_client(sales_channel=self.sales_channel)
+
+        client.acquire(operation=CATALOG_ITEM)
+        client.acquire(operation=CATALOG_ITEM)
+        sleep.assert_not_called()
+
+        with patch("core.rate_limiting.TokenBucket.consume", side_effect=[False, True]):
+            client.acquire(operation=CATALOG_ITEM)
+        sleep.assert_called_once()
@@ -1,3 +1,6 @@
+import gzip
+import io
+from contextlib import nullcontext
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
@@ -46,7 +49,7 @@ class AmazonBrowseNodeSyncFactoryTest(TestCase):
         fac = AmazonBrowseNodeSyncFactory(self.view)
         fac.api.create_report = Mock(return_value=SimpleNamespace(report_id="rid"))
         fac._wait_for_report = Mock(return_value=SimpleNamespace(report_document_id="doc"))
-        fac._download_document = Mock(return_value=xml)
+        fac._download_document = Mock(return_value=nullcontext(io.BytesIO(xml.encode("utf-8"))))
 
         fac.run()
 
@@ -73,10 +76,53 @@ class AmazonBrowseNodeSyncFactoryTest(TestCase):
         fac = AmazonBrowseNodeSyncFactory(self.view)
         fac.api.create_report = Mock(return_value=SimpleNamespace(report_id="rid"))
         fac._wait_for_report = Mock(return_value=SimpleNamespace(report_document_id="doc"))
-        fac._download_document = Mock(return_value=xml)
+        fac._download_document = Mock(return_value=nullcontext(io.BytesIO(xml.encode("utf-8"))))
 
         fac.run()
 
         node = AmazonBrowseNode.objects.get(remote_id="573406")
         self.assertTrue(node.is_root)
         self.assertIsNone(node.parent_node)
+
+    @patch("sales_channels.integrations.amazon.factories.recommended_browse_nodes.sync.requests.get")
+    @patch("sales_channels.integrations.amazon.factories.recommended_browse_nodes.sync.ReportsApi", return_value=SimpleNamespace())
+    @patch("sales_channels.integrations.amazon.factories.mixins.GetAmazonAPIMixin._get_client", return_value=None)
+    def test_resync_streams_gzip_and_updates_tree(self, _get_client, _reports_api, requests_get):
+        stale = AmazonBrowseNode.objects.create(remote_id="9", marketplace_id="GB", name="Stale", browse_path_by_id=["9"])
+        AmazonBrowseNode.objects.filter(pk=stale.pk).update(updated_at=stale.updated_at.replace(year=2000))
+        existing = AmazonBrowseNode.objects.create(remote_id="2", marketplace_id="GB", name="Old name", is_root=True)
+        xml = """
+        <Nodes>
+            <Node>
+                <browseNodeId>1</browseNodeId>
+                <browseNodeName>Root</browseNodeName>
+                <browsePathById>1</browsePathById>
+            </Node>
+            <Node>
+                <browseNodeId>2</browseNodeId>
+                <browseNodeName>Child</browseNodeName>
+                <browsePathById>1,2</browsePathById>
+            </Node>
+        </Nodes>
+        """
+        response = Mock(raw=io.BytesIO(gzip.compress(xml.encode("utf-8"))))
+        response.__enter__ = Mock(return_value=response)
+        response.__exit__ = Mock(return_value=False)
+        requests_get.return_value = response
+
+        fac = AmazonBrowseNodeSyncFactory(self.view)
+        fac.batch_size = 1
+        fac.api.create_report = Mock(return_value=SimpleNamespace(report_id="rid"))
+        fac.api.get_report_document = Mock(return_value=SimpleNamespace(url="https://example.com/tree.xml.gz", compression_algorithm="GZIP"))
+        fac._wait_for_report = Mock(return_value=SimpleNamespace(report_document_id="doc"))
+
+        fac.run()
+
+        root = AmazonBrowseNode.objects.get(remote_id="1")
+        child = AmazonBrowseNode.objects.get(remote_id="2")
+        self.assertEqual(child.pk, existing.pk)
+        self.assertEqual(child.name, "Child")
+        self.assertEqual(child.parent_node, root)
+        self.assertFalse(child.is_root)
+        self.assertTrue(root.is_root)
+        self.assertFalse(AmazonBrowseNode.objects.filter(pk=stale.pk).exists())
@@ -89,6 +89,71 @@ class AmazonProductsImportProcessorNameTest(TestCase):
         self.assertEqual(structured["name"], "Summary name")
 
 
+class AmazonProductsImportProcessorCatalogPrefetchTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.sales_channel = AmazonSalesChannel.objects.create(
+            multi_tenant_company=self.multi_tenant_company,
+            remote_id="SELLER",
+        )
+        self.import_process = Import.objects.create(multi_tenant_company=self.multi_tenant_company)
+
+    def _product(self, asin, marketplace_id="GB"):
+        return {
+            "sku": f"SKU-{asin}",
+            "summaries": [{"asin": asin, "marketplace_id": marketplace_id}],
+        }
+
+    def test_prefetch_batches_asins_per_marketplace(self):
+        products = [self._product(f"ASIN{index}") for index in range(25)] + [self._product("ASIN0", "DE")]
+
+        def search(asins, marketplace_id, catalog_api=None):
+            return {asin: {"color": [{"value": marketplace_id}]} for asin in asins if asin != "ASIN1"}
+
+        with patch.object(AmazonProductsImportProcessor, "get_api", return_value=None), \
+                patch.object(AmazonProductsImportProcessor, "get_catalog_api_client", side_effect=object) as client_mock, \
+                patch.object(AmazonProductsImportProcessor, "_search_catalog_items", side_effect=search) as search_mock:
+            processor = AmazonProductsImportProcessor(self.import_process, self.sales_channel)
+            processor.prefetch_catalog_attributes(products)
+
+        batches = sorted((len(call.args[0]), call.args[1]) for call in search_mock.call_args_list)
+        self.assertEqual(batches, [(1, "DE"), (5, "GB"), (20, "GB")])
+        self.assertEqual(client_mock.call_count, 3)
+        self.assertEqual(len({id(call.kwargs["catalog_api"]) for call in search_mock.call_args_list}), 3)
+        self.assertEqual(products[0]["catalog_attributes"], {"color": [{"value": "GB"}]})
+        self.assertEqual(products[1]["catalog_attributes"], {})
+        self.assertEqual(products[-1]["catalog_attributes"], {"color": [{"value": "DE"}]})
+
+    def test_failed_batch_falls_back_to_single_lookup(self):
+        products = [self._product("ASIN0")]
+
+        with patch.object(AmazonProductsImportProcessor, "get_api", return_value=None), \
+                patch.object(AmazonProductsImportProcessor, "_search_catalog_items", side_effect=Exception("throttled")):
+            processor = AmazonProductsImportProcessor(self.import_process, self.sales_channel)
+            processor.prefetch_catalog_attributes(products)
+
+        self.assertNotIn("catalog_attributes", products[0])
+
+    def test_product_data_uses_prefetched_attributes(self):
+        AmazonSalesChannelView.objects.create(
+            multi_tenant_company=self.multi_tenant_company,
+            sales_channel=self.sales_channel,
+            remote_id="GB",
+        )
+        product_data = self._product("ASIN0")
+        product_data["catalog_attributes"] = {}
+
+        with patch.object(AmazonProductsImportProcessor, "get_api", return_value=None), \
+                patch.object(AmazonProductsImportProcessor, "_parse_images", return_value=[]), \
+                patch.object(AmazonProductsImportProcessor, "_parse_prices", return_value=([], [])), \
+                patch.object(AmazonProductsImportProcessor, "_parse_attributes", return_value=([], {})), \
+                patch.object(AmazonProductsImportProcessor, "_fetch_catalog_attributes") as fetch_mock:
+            processor = AmazonProductsImportProcessor(self.import_process, self.sales_channel)
+            processor.get__product_data(product_data, False)
+
+        fetch_mock.assert_not_called()
+
+
 class AmazonProductsImportProcessorPriceTest(TestCase):
     def setUp(self):
         super().setUp()
@@ -0,0 +1,56 @@
+import base64
+import hashlib
+import json
+import tempfile
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase
+
+from sales_channels.integrations.amazon.schema_store import AmazonSchemaStore
+
+SCHEMA = {"properties": {"color": {"title": "Colour"}}, "required": ["color"]}
+CONTENT = json.dumps(SCHEMA).encode("utf-8")
+CHECKSUM = base64.b64encode(hashlib.md5(CONTENT).digest()).decode()
+
+
+class AmazonSchemaStoreTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = AmazonSchemaStore(storage=FileSystemStorage(location=directory.name))
+
+        self.session = Mock()
+        self.session.get.return_value = Mock(status_code=200, content=CONTENT, headers={"ETag": '"v1"'})
+        patcher = patch("sales_channels.integrations.amazon.schema_store.get_schema_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_schema(self, **kwargs):
+        params = {
+            "product_type": "CHAIR",
+            "marketplace_id": "A1F83G8C2ARO7P",
+            "requirements": "LISTING",
+            "version": "U1",
+            "checksum": CHECKSUM,
+            "url": "https://schemas.example.com/chair.json",
+        }
+        params.update(kwargs)
+        return self.store.get_schema(**params)
+
+    def test_schema_is_downloaded_once_per_checksum(self):
+        self.assertEqual(self.get_schema(), SCHEMA)
+        self.assertEqual(self.get_schema(marketplace_id="A13V1IB3VIYZZH", url="https://schemas.example.com/other.json"), SCHEMA)
+
+        self.session.get.assert_called_once()
+        self.assertTrue(self.store.exists(checksum=hashlib.md5(CONTENT).hexdigest()))
+
+    def test_conditional_download_without_checksum(self):
+        self.get_schema(checksum=None)
+        self.session.get.return_value = Mock(status_code=304)
+
+        self.assertEqual(self.get_schema(checksum=None), SCHEMA)
+        self.assertEqual(self.session.get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
@@ -1,5 +1,6 @@
 from .build import MiraklProductFeedBuildFactory, MiraklProductFeedFactory
 from .new_product_report import MiraklNewProductReportSyncFactory
+from .offer_snapshot import MiraklOfferSnapshot
 from .product_payloads import (
     MiraklProductCreateFactory,
     MiraklProductCreatePayloadFactory,
@@ -20,6 +21,7 @@ __all__ = [
     "MiraklFeedResyncFactory",
     "MiraklImportStatusSyncFactory",
     "MiraklNewProductReportSyncFactory",
+    "MiraklOfferSnapshot",
     "MiraklProductCreateFactory",
     "MiraklProductCreatePayloadFactory",
     "MiraklProductDeleteFactory",
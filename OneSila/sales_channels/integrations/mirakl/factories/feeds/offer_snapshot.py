@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import time
+from itertools import islice
+from typing import Any
+
+from django.core.cache import cache
+
+from sales_channels.integrations.mirakl.factories.mixins import GetMiraklAPIMixin
+
+
+class MiraklOfferSnapshot(GetMiraklAPIMixin):
+    """
+    Shop wide snapshot of the OF21 offers, grouped by product sku and shared by every payload builder through the
+    cache.
+
+    Builders read the offers of a remote sku from the snapshot and only call OF21 for that sku when it is missing.
+    The snapshot is built in the background once a sales channel made `build_threshold` single sku calls within
+    `ttl`, so a bulk feed run pages through the shop once while a lone product update keeps its single call.
+    """
+    ttl = 60 * 15
+    build_threshold = 50
+    batch_size = 1000
+
+    def __init__(self, *, sales_channel) -> None:
+        self.sales_channel = sales_channel
+
+    @property
+    def cache_key(self) -> str:
+        return f"mirakl_offer_snapshot:{self.sales_channel.id}"
+
+    def _get_offers_key(self, *, version: int, remote_sku: str) -> str:
+        return f"{self.cache_key}:{version}:{remote_sku}"
+
+    def get_offers(self, *, remote_sku: str) -> list[dict[str, Any]] | None:
+        """
+        Returns the offers of the remote sku, or None when there is no snapshot or the sku is not in it.
+        """
+        version = cache.get(self.cache_key)
+        if version is None:
+            return None
+        return cache.get(self._get_offers_key(version=version, remote_sku=remote_sku))
+
+    def record_miss(self) -> None:
+        misses_key = f"{self.cache_key}:misses"
+        if cache.add(misses_key, 1, timeout=self.ttl):
+            misses = 1
+        else:
+            try:
+                misses = cache.incr(misses_key)
+            except ValueError:
+                return
+
+        if misses != self.build_threshold:
+            return
+
+        if cache.add(f"{self.cache_key}:building", True, timeout=self.ttl):
+            from sales_channels.integrations.mirakl.tasks import mirakl_build_offer_snapshot_db_task
+
+            mirakl_build_offer_snapshot_db_task(sales_channel_id=self.sales_channel.id)
+
+    def load_offers(self) -> dict[str, list[dict[str, Any]]]:
+        offers = self.mirakl_paginated_get(
+            path="/api/offers",
+            results_key="offers",
+            params={"shop_id": self.sales_channel.shop_id},
+        )
+
+        offers_by_sku: dict[str, list[dict[str, Any]]] = {}
+        for offer in offers:
+            product_sku = str(offer.get("product_sku") or "").strip()
+            if not product_sku:
+                continue
+            offers_by_sku.setdefault(product_sku, []).append(
+                {"active": offer.get("active"), "quantity": offer.get("quantity")}
+            )
+
+        return offers_by_sku
+
+    def build(self) -> int:
+        try:
+            offers_by_sku = self.load_offers()
+            version = time.time_ns()
+
+            # The entries outlive the version key a little so a published snapshot is never half gone.
+            entries = iter(offers_by_sku.items())
+            while chunk := list(islice(entries, self.batch_size)):
+                cache.set_many(
+                    {self._get_offers_key(version=version, remote_sku=remote_sku): offers for remote_sku, offers in chunk},
+                    timeout=self.ttl + 60,
+                )
+
+            cache.set(self.cache_key, version, timeout=self.ttl)
+            cache.delete(f"{self.cache_key}:misses")
+        finally:
+            cache.delete(f"{self.cache_key}:building")
+
+        return len(offers_by_sku)
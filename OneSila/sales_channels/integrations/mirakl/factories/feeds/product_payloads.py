@@ -21,8 +21,10 @@ from sales_channels.factories.products.products import (
     RemoteProductDeleteFactory,
     RemoteProductSyncFactory,
 )
+from sales_channels.factories.feeds.gathering import apply_feed_summary_delta
 from sales_channels.factories.value_mixins import RemoteValueMixin
 from sales_channels.helpers import _content_is_empty, build_content_data, build_content_payload, select_content_payload
+from sales_channels.integrations.mirakl.factories.feeds.offer_snapshot import MiraklOfferSnapshot
 from sales_channels.integrations.mirakl.factories.mixins import GetMiraklAPIMixin
 from sales_channels.integrations.mirakl.models import (
     MiraklCategory,
@@ -564,8 +566,12 @@ class MiraklProductPayloadBuilder:
                 self._raise_offer_quantity_not_found(product_context=product_context, remote_sku=remote_sku)
             return int(cached_quantity)
 
-        offers_payload = self._mirakl_get(path="/api/offers", params={"product_id": remote_sku, "shop_id": self.sales_channel.shop_id})
-        offers = offers_payload.get("offers") or []
+        snapshot = MiraklOfferSnapshot(sales_channel=self.sales_channel)
+        offers = snapshot.get_offers(remote_sku=remote_sku)
+        if offers is None:
+            snapshot.record_miss()
+            offers_payload = self._mirakl_get(path="/api/offers", params={"product_id": remote_sku, "shop_id": self.sales_channel.shop_id})
+            offers = offers_payload.get("offers") or []
         selected_offer = self._select_existing_offer_for_quantity(offers=offers)
         if selected_offer is None:
             self._offer_quantity_by_remote_sku_cache[remote_sku] = self._QUANTITY_CACHE_MISSING
@@ -1867,6 +1873,8 @@ class _MiraklFeedPersistenceMixin:
                 current_action=getattr(item, "action", ""),
                 new_action=self.feed_action,
             )
+            items_delta = 0 if item is not None else 1
+            previous_rows = len(item.payload_data or []) if item is not None else 0
             if item is None:
                 item = MiraklSalesChannelFeedItem.objects.create(
                     feed=feed,
@@ -1897,11 +1905,15 @@ class _MiraklFeedPersistenceMixin:
                         "error_message",
                     ]
                 )
+            apply_feed_summary_delta(
+                feed=feed,
+                items_delta=items_delta,
+                rows_delta=len(rows) - previous_rows,
+            )
             MiraklProductIssue.objects.filter(remote_product=self.remote_instance).delete()
             self.remote_instance.refresh_status(
                 override_status=self.remote_instance.STATUS_PENDING_APPROVAL,
             )
-        self._refresh_feed_summary(feed=feed)
         return item
 
     def _get_or_create_feed(self, *, product_type: MiraklProductType) -> MiraklSalesChannelFeed:
@@ -1934,11 +1946,10 @@ class _MiraklFeedPersistenceMixin:
             )
 
     def _refresh_feed_summary(self, *, feed: MiraklSalesChannelFeed) -> None:
-        items = list(
-            MiraklSalesChannelFeedItem.objects.filter(feed=feed).only("payload_data")
-        )
-        feed.items_count = len(items)
-        feed.rows_count = sum(len(item.payload_data or []) for item in items)
+        # Counters are kept up to date by _persist_feed_rows, a full recount is only needed for repairs.
+        items = MiraklSalesChannelFeedItem.objects.filter(feed=feed).only("payload_data")
+        feed.items_count = items.count()
+        feed.rows_count = sum(len(item.payload_data or []) for item in items.iterator())
         feed.save(update_fields=["items_count", "rows_count", "updated_at"])
 
     def _get_identifier(self) -> str:
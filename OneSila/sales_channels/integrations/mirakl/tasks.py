@@ -56,6 +56,14 @@ def mirakl_map_perfect_match_properties_db_task(*, sales_channel_id: int):
     return MiraklPerfectMatchPropertyMappingFactory(sales_channel=sales_channel).run()
 
 
+@db_task()
+def mirakl_build_offer_snapshot_db_task(*, sales_channel_id: int):
+    from sales_channels.integrations.mirakl.factories.feeds.offer_snapshot import MiraklOfferSnapshot
+
+    sales_channel = MiraklSalesChannel.objects.get(id=sales_channel_id)
+    return MiraklOfferSnapshot(sales_channel=sales_channel).build()
+
+
 @db_periodic_task(crontab(minute="*/20"))
 def sales_channels__tasks__sync_mirakl_product_feeds__cronjob():
     from sales_channels.integrations.mirakl.flows import process_mirakl_gathering_product_feeds
@@ -13,6 +13,7 @@ from properties.models import ProductPropertiesRule, PropertySelectValueTranslat
 from properties.models import ProductPropertyTextTranslation
 from products.models import ProductTranslation, ProductTranslationBulletPoint
 from sales_channels.exceptions import MiraklPayloadValidationError, MissingMappingError, PreFlightCheckError, SwitchedToSyncException
+from sales_channels.integrations.mirakl.factories.feeds.offer_snapshot import MiraklOfferSnapshot
 from sales_channels.integrations.mirakl.factories.feeds.product_payloads import (
     MiraklProductCreateFactory,
     MiraklProductPayloadBuilder,
@@ -393,6 +394,49 @@ class MiraklProductPayloadBuilderTests(DisableMiraklConnectionMixin, TestCase):
             params={"product_id": "MKP-REMOTE-1", "shop_id": self.sales_channel.shop_id},
         )
 
+    def test_resolve_quantity_reads_offer_snapshot_and_falls_back_on_miss(self):
+        local_property = baker.make(
+            Property,
+            multi_tenant_company=self.multi_tenant_company,
+            type=Property.TYPES.TEXT,
+        )
+        builder, _, _ = self._build_builder(
+            remote_code="collection",
+            local_property=local_property,
+            required=False,
+            action=SalesChannelFeedItem.ACTION_UPDATE,
+        )
+        snapshot = MiraklOfferSnapshot(sales_channel=self.sales_channel)
+        with patch.object(
+            MiraklOfferSnapshot,
+            "mirakl_paginated_get",
+            return_value=[
+                {"product_sku": "MKP-REMOTE-1", "active": True, "quantity": 4},
+                {"product_sku": "MKP-REMOTE-1", "active": False, "quantity": 0},
+            ],
+        ):
+            self.assertEqual(snapshot.build(), 1)
+
+        builder.remote_product.remote_sku = "MKP-REMOTE-1"
+        with patch.object(builder, "_mirakl_get") as mirakl_get_mock:
+            self.assertEqual(
+                builder._resolve_quantity(product_context={"remote_product": builder.remote_product}),
+                "4",
+            )
+        mirakl_get_mock.assert_not_called()
+
+        builder.remote_product.remote_sku = "MKP-REMOTE-2"
+        with patch.object(
+            builder,
+            "_mirakl_get",
+            return_value={"offers": [{"active": True, "quantity": 7}], "total_count": 1},
+        ) as mirakl_get_mock:
+            self.assertEqual(
+                builder._resolve_quantity(product_context={"remote_product": builder.remote_product}),
+                "7",
+            )
+        mirakl_get_mock.assert_called_once()
+
     def test_resolve_quantity_skips_of21_for_delete_rows(self):
         local_property = baker.make(
             Property,
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-18 10:12
+
+import core.models.core
+import dirtyfields.dirtyfields
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_alter_dashboardcard_url'),
+        ('sales_channels', '0095_saleschannel_max_description_length_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='saleschannelgptfeed',
+            name='compaction_requested_at',
+            field=models.DateTimeField(blank=True, help_text='Timestamp of the last entry change not yet written to the file. Empty when the file is up to date.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='saleschannelgptfeed',
+            name='items',
+            field=models.JSONField(blank=True, default=list, help_text='Snapshot of the GPT product feed entries, rebuilt together with the file on compaction.'),
+        ),
+        migrations.CreateModel(
+            name='SalesChannelGptFeedEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('identifier', models.CharField(max_length=255)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('created_by_multi_tenant_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_created_by_multi_tenant_user_set', to=settings.AUTH_USER_MODEL)),
+                ('last_update_by_multi_tenant_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='%(class)s_last_update_by_multi_tenant_user_set', to=settings.AUTH_USER_MODEL)),
+                ('multi_tenant_company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='core.multitenantcompany')),
+                ('feed', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='sales_channels.saleschannelgptfeed')),
+            ],
+            options={
+                'verbose_name': 'Sales Channel GPT Feed Entry',
+                'verbose_name_plural': 'Sales Channel GPT Feed Entries',
+                'ordering': ['identifier'],
+                'constraints': [models.UniqueConstraint(fields=('feed', 'identifier'), name='uniq_sales_channel_gpt_feed_entry_identifier')],
+            },
+            bases=(dirtyfields.dirtyfields.DirtyFieldsMixin, core.models.core.GetAbsoluteURLMixin, models.Model),
+        ),
+    ]
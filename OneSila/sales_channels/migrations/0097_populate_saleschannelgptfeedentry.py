@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+def populate_gpt_feed_entries(apps, schema_editor):
+    SalesChannelGptFeed = apps.get_model('sales_channels', 'SalesChannelGptFeed')
+    SalesChannelGptFeedEntry = apps.get_model('sales_channels', 'SalesChannelGptFeedEntry')
+
+    for feed in SalesChannelGptFeed.objects.exclude(items=[]).iterator():
+        entries = {}
+        for item in feed.items or []:
+            identifier = item.get('id') if isinstance(item, dict) else None
+            if not identifier:
+                continue
+            entries[str(identifier)] = SalesChannelGptFeedEntry(
+                feed=feed,
+                identifier=str(identifier),
+                payload=item,
+                multi_tenant_company_id=feed.multi_tenant_company_id,
+            )
+
+        if entries:
+            SalesChannelGptFeedEntry.objects.bulk_create(entries.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sales_channels', '0096_saleschannelgptfeed_compaction_requested_at_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_gpt_feed_entries, reverse_code=migrations.RunPython.noop),
+    ]
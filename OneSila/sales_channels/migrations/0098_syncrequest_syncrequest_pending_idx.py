@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-18 11:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sales_channels', '0097_populate_saleschannelgptfeedentry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='syncrequest',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['remote_product', 'sales_channel', 'sync_type', 'sales_channel_view'], name='syncrequest_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-18 15:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sales_channels', '0098_syncrequest_syncrequest_pending_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='saleschannelgptfeed',
+            name='items',
+        ),
+    ]
@@ -8,7 +8,7 @@ from .sales_channels import (
     RejectedSalesChannelViewAssign,
     RemoteLanguage,
 )
-from .gpt import SalesChannelGptFeed
+from .gpt import SalesChannelGptFeed, SalesChannelGptFeedEntry
 from .feeds import SalesChannelFeed, SalesChannelFeedItem
 from .manual import ManualSalesChannel, ManualSalesChannelView
 
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from django.db import models as django_models
+
 from core import models
 from get_absolute_url.helpers import generate_absolute_url
 
@@ -10,11 +12,6 @@ class SalesChannelGptFeed(models.Model):
         on_delete=models.CASCADE,
         related_name='gpt_feed_record',
     )
-    items = models.JSONField(
-        default=list,
-        blank=True,
-        help_text="Cached GPT product feed entries for this sales channel.",
-    )
     file = models.FileField(
         upload_to='gpt_feeds/',
         null=True,
@@ -26,6 +23,11 @@ class SalesChannelGptFeed(models.Model):
         blank=True,
         help_text="Timestamp when the GPT feed was last synchronised.",
     )
+    compaction_requested_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Timestamp of the last entry change not yet written to the file. Empty when the file is up to date.",
+    )
 
     class Meta:
         verbose_name = 'Sales Channel GPT Feed'
@@ -42,3 +44,31 @@ class SalesChannelGptFeed(models.Model):
             return f"{generate_absolute_url(trailing_slash=False)}{self.file.url}"
         except ValueError:
             return None
+
+
+class SalesChannelGptFeedEntry(models.Model):
+    """
+    One keyed entry of a GPT product feed. Syncs only touch the entries of the changed products,
+    the feed file is rebuilt from these rows by the debounced compaction.
+    """
+    feed = models.ForeignKey(
+        SalesChannelGptFeed,
+        on_delete=models.CASCADE,
+        related_name='entries',
+    )
+    identifier = models.CharField(max_length=255)
+    payload = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        ordering = ['identifier']
+        constraints = [
+            django_models.UniqueConstraint(
+                fields=['feed', 'identifier'],
+                name='uniq_sales_channel_gpt_feed_entry_identifier',
+            ),
+        ]
+        verbose_name = 'Sales Channel GPT Feed Entry'
+        verbose_name_plural = 'Sales Channel GPT Feed Entries'
+
+    def __str__(self) -> str:
+        return f"{self.feed_id}:{self.identifier}"
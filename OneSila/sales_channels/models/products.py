@@ -307,6 +307,11 @@ class SyncRequest(models.Model):
             Index(fields=["sales_channel", "sales_channel_view", "remote_product", "status", "sync_type"]),
             Index(fields=["sales_channel", "remote_product", "status"]),
             Index(fields=["skipped_for"]),
+            Index(
+                fields=["remote_product", "sales_channel", "sync_type", "sales_channel_view"],
+                condition=Q(status="pending"),
+                name="syncrequest_pending_idx",
+            ),
         ]
 
     def __str__(self) -> str:
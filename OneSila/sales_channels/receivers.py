@@ -6,6 +6,7 @@ from core.decorators import trigger_signal_for_dirty_fields
 from core.schema.core.subscriptions import refresh_subscription_receiver
 from core.signals import post_create, post_update, mutation_update, post_save
 from eancodes.signals import ean_code_released_for_product
+from imports_exports.signals import products_batch_imported
 from media.models import Media, MediaProductThrough
 from properties.signals import (
     product_properties_rule_configurator_updated,
@@ -15,7 +16,7 @@ from properties.signals import (
     property_select_value_created,
 )
 from sales_prices.models import SalesPriceListItem
-from sales_prices.signals import price_changed
+from sales_prices.signals import price_changed, bulk_price_changed, sales_price_list_items_prices_changed
 from .integrations.amazon.models import AmazonSalesChannel, AmazonSalesChannelImport
 from .integrations.ebay.models import EbaySalesChannel, EbaySalesChannelImport
 from .integrations.magento2.models import MagentoProduct
@@ -374,6 +375,27 @@ def sales_channels__assign__added_or_remove_receiver(sender, instance, **kwargs)
     """
     refresh_subscription_receiver(instance.product)
 
+
+@receiver(post_delete, sender='sales_channels.SalesChannelFeedItem')
+def sales_channels__feed_item__post_delete_receiver(sender, instance, origin=None, **kwargs):
+    """
+    Feed items also go through cascades (e.g. with their remote product), keep the incremental
+    items_count / rows_count of the feed in line. Nothing to do when the feed itself is deleted.
+    """
+    from django.db.models import QuerySet
+    from .factories.feeds.gathering import count_feed_item_rows, shift_feed_summary
+    from .models import SalesChannelFeed
+
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if issubclass(origin_model, SalesChannelFeed):
+        return
+
+    shift_feed_summary(
+        feed_id=instance.feed_id,
+        items_delta=-1,
+        rows_delta=-count_feed_item_rows(payload_data=instance.payload_data),
+    )
+
 # ------------------------------------------------------------- SEND SIGNALS FOR PROPERTIES
 
 
@@ -664,6 +686,15 @@ def sales_channels__sales_price_list_item__post_create_receiver(sender, instance
     update_remote_price.send(sender=instance.product.__class__, instance=instance.product, currency=instance.salespricelist.currency)
 
 
+@receiver(sales_price_list_items_prices_changed, sender='sales_prices.SalesPriceListItem')
+def sales_channels__sales_price_list_items__prices_changed_receiver(sender, multi_tenant_company, currency, product_ids, **kwargs):
+    """
+    Auto prices of price list items are bulk updated without post_update, trigger the price update once per product.
+    """
+    from sales_channels.flows.default import update_remote_prices_flow
+    update_remote_prices_flow(multi_tenant_company=multi_tenant_company, product_ids=product_ids, currency=currency)
+
+
 @receiver(post_update, sender='sales_prices.SalesPrice')
 def sales_channels__sales_price__post_update_receiver(sender, instance, **kwargs):
     """
@@ -680,6 +711,16 @@ def sales_channels__price_changed__receiver(sender, instance, **kwargs):
     currency = kwargs.get('currency', None)
     update_remote_price.send(sender=instance.__class__, instance=instance, currency=currency)
 
+
+@receiver(bulk_price_changed, sender='products.Product')
+def sales_channels__bulk_price_changed__receiver(sender, multi_tenant_company, currency, product_ids, **kwargs):
+    """
+    Same as the price_changed receiver for a whole set of products in one currency.
+    """
+    from sales_channels.flows.default import update_remote_prices_flow
+    update_remote_prices_flow(multi_tenant_company=multi_tenant_company, product_ids=product_ids, currency=currency)
+
+
 # ------------------------------------------------------------- SEND SIGNALS FOR PRODUCT CONTENT
 
 
@@ -961,6 +1002,60 @@ def sales_channels__ean_code_released_receiver(sender, instance, **kwargs):
     update_remote_product_eancode.send(sender=instance.__class__, instance=instance)
 
 
+@receiver(products_batch_imported)
+def sales_channels__products_batch_imported__receiver(sender, instance, created_product_ids, created_objects, updated_objects, **kwargs):
+    """
+    Bulk imports skip the per object signals, so send the remote updates the post_create / post_update receivers
+    above would have sent: one per product and language, currency or property instead of one per written row,
+    with the enqueues collected. New products are not assigned to any sales channel yet and are skipped.
+    """
+    from eancodes.models import EanCode
+    from products.models import Product, ProductTranslation
+    from sales_channels.factories.task_queue import collect_sales_channel_syncs
+    from sales_prices.models import SalesPrice
+
+    created_product_ids = set(created_product_ids)
+    products, contents, prices, ean_codes = {}, {}, {}, {}
+    product_properties = []
+
+    for obj, created in [*[(obj, True) for obj in created_objects], *[(obj, False) for obj in updated_objects]]:
+        if isinstance(obj, Product):
+            if not created:
+                products[obj.id] = obj
+            continue
+
+        if obj.product_id in created_product_ids:
+            continue
+
+        if isinstance(obj, ProductTranslation):
+            contents[(obj.product_id, obj.language)] = obj
+        elif isinstance(obj, SalesPrice) and not created:
+            prices[(obj.product_id, obj.currency_id)] = obj
+        elif isinstance(obj, EanCode):
+            ean_codes[obj.product_id] = obj.product
+        elif isinstance(obj, ProductProperty):
+            product_properties.append((obj, created))
+
+    with collect_sales_channel_syncs():
+        for product in products.values():
+            update_remote_product.send(sender=product.__class__, instance=product)
+
+        for translation in contents.values():
+            update_remote_product_content.send(sender=translation.product.__class__, instance=translation.product, language=translation.language)
+
+        for sales_price in prices.values():
+            update_remote_price.send(sender=sales_price.product.__class__, instance=sales_price.product, currency=sales_price.currency)
+
+        for product in ean_codes.values():
+            update_remote_product_eancode.send(sender=product.__class__, instance=product)
+
+        for product_property, created in product_properties:
+            if created:
+                sales_channels__product_property__post_create_receiver(sender=product_property.__class__, instance=product_property)
+            else:
+                sales_channels__product_property__post_update_receiver(sender=product_property.__class__, instance=product_property)
+
+
 @receiver(post_create, sender='taxes.VatRate')
 def sales_channels__vat_rate__post_create_receiver(sender, instance, **kwargs):
     """
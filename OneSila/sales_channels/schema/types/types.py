@@ -2,6 +2,7 @@ from typing import Optional, List, Annotated
 
 from strawberry import lazy
 from strawberry.relay import to_base64
+from strawberry.scalars import JSON
 
 from core.schema.core.types.types import type, relay, field, strawberry_type
 from core.schema.core.mixins import GetQuerysetMultiTenantMixin
@@ -152,6 +153,11 @@ class SalesChannelGptFeedType(relay.Node, GetQuerysetMultiTenantMixin):
     def file_url(self) -> Optional[str]:
         return SalesChannelGptFeed.file_url.fget(self)
 
+    @field()
+    def items(self) -> JSON:
+        # The entries replaced the items column, keep serving them in the same shape and order as the file.
+        return list(self.entries.order_by('identifier').values_list('payload', flat=True))
+
 
 @type(SalesChannelFeed, filters=SalesChannelFeedFilter, order=SalesChannelFeedOrder, pagination=True, fields='__all__')
 class SalesChannelFeedType(relay.Node, GetQuerysetMultiTenantMixin):
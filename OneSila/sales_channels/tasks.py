@@ -94,12 +94,31 @@ def sales_channels__tasks__sync_gpt_feed_full__cronjob():
 
 @db_task()
 def sales_channels__tasks__sync_gpt_feed_for_channel(*, sales_channel_id: int, sync_all: bool) -> None:
-    from .flows.gpt_feed import sync_gpt_feed
+    from .flows.gpt_feed import compact_gpt_feeds, sync_gpt_feed
 
     sync_gpt_feed(
         sales_channel_id=sales_channel_id,
         sync_all=sync_all,
     )
+    compact_gpt_feeds(sales_channel_id=sales_channel_id, force=True)
+
+
+@db_task()
+def sales_channels__tasks__update_remote_prices_for_channel(*, sales_channel_id: int, product_ids: list[int], currency_id: int | None) -> None:
+    from .flows.default import update_sales_channel_remote_prices_flow
+
+    update_sales_channel_remote_prices_flow(
+        sales_channel_id=sales_channel_id,
+        product_ids=product_ids,
+        currency_id=currency_id,
+    )
+
+
+@db_periodic_task(crontab(minute='*/5'))
+def sales_channels__tasks__compact_gpt_feeds__cronjob():
+    from .flows.gpt_feed import compact_gpt_feeds
+
+    compact_gpt_feeds()
 
 
 @db_task()
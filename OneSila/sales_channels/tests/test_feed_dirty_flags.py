@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+from django.db import DatabaseError, transaction
+
+from model_bakery import baker
+
+from core.tests import TestCase
+from products.product_types import SIMPLE
+from sales_channels.helpers import feed_dirty_products_collector, mark_remote_products_for_feed_updates
+from sales_channels.integrations.amazon.models import AmazonSalesChannel
+from sales_channels.models import RemoteProduct
+
+
+class FeedDirtyProductsCollectorTests(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.connect_patcher = patch(
+            "sales_channels.models.sales_channels.SalesChannel.connect",
+            autospec=True,
+            return_value=None,
+        )
+        self.connect_patcher.start()
+        self.addCleanup(self.connect_patcher.stop)
+        self.gpt_channel = baker.make(
+            AmazonSalesChannel,
+            multi_tenant_company=self.multi_tenant_company,
+            hostname="https://gpt.example.com",
+            gpt_enable=True,
+        )
+        self.other_channel = baker.make(
+            AmazonSalesChannel,
+            multi_tenant_company=self.multi_tenant_company,
+            hostname="https://other.example.com",
+            gpt_enable=False,
+        )
+        self.product = baker.make(
+            "products.Product",
+            multi_tenant_company=self.multi_tenant_company,
+            type=SIMPLE,
+        )
+        self.gpt_remote_product = self._build_remote_product(sales_channel=self.gpt_channel)
+        self.other_remote_product = self._build_remote_product(sales_channel=self.other_channel)
+        # The test transaction never commits, drop what the setup collected.
+        feed_dirty_products_collector.clear()
+        feed_dirty_products_collector.pending_flush = None
+
+    def _build_remote_product(self, *, sales_channel):
+        remote_product = baker.make(
+            RemoteProduct,
+            sales_channel=sales_channel,
+            multi_tenant_company=self.multi_tenant_company,
+            local_instance=self.product,
+        )
+        RemoteProduct.objects.filter(pk=remote_product.pk).update(required_feed_sync=False)
+        return remote_product
+
+    def test_flags_are_coalesced_until_commit(self):
+        calls, updates = feed_dirty_products_collector.calls, feed_dirty_products_collector.updates
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with self.assertNumQueries(0):
+                for _ in range(5):
+                    mark_remote_products_for_feed_updates(product_ids=[self.product.id])
+
+        self.assertEqual(len(callbacks), 1)
+        with self.assertNumQueries(1):
+            for callback in callbacks:
+                callback()
+
+        self.gpt_remote_product.refresh_from_db(fields=["required_feed_sync"])
+        self.other_remote_product.refresh_from_db(fields=["required_feed_sync"])
+        self.assertTrue(self.gpt_remote_product.required_feed_sync)
+        self.assertFalse(self.other_remote_product.required_feed_sync)
+        self.assertEqual(feed_dirty_products_collector.calls - calls, 5)
+        self.assertEqual(feed_dirty_products_collector.updates - updates, 1)
+
+    def test_rolled_back_flags_are_dropped_and_the_next_transaction_flushes(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    mark_remote_products_for_feed_updates(product_ids=[self.product.id])
+                    raise DatabaseError
+            except DatabaseError:
+                pass
+
+        self.assertEqual(callbacks, [])
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            mark_remote_products_for_feed_updates(product_ids=[self.product.id])
+            self.assertEqual(feed_dirty_products_collector.pending_calls, 1)
+
+        self.assertEqual(len(callbacks), 1)
+        self.gpt_remote_product.refresh_from_db(fields=["required_feed_sync"])
+        self.assertTrue(self.gpt_remote_product.required_feed_sync)
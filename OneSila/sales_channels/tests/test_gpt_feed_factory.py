@@ -2,13 +2,15 @@ import json
 from unittest.mock import Mock, patch
 
 from django.db import connection
+from django.utils import timezone
 from model_bakery import baker
 
 from core.tests import TransactionTestCase
 from products.product_types import SIMPLE
+from sales_channels.factories.gpt.compaction import SalesChannelGptFeedCompactionFactory
 from sales_channels.factories.gpt.product_feed import SalesChannelGptProductFeedFactory
 from sales_channels.integrations.amazon.models import AmazonSalesChannel
-from sales_channels.models import RemoteProduct, SalesChannel, SalesChannelGptFeed
+from sales_channels.models import RemoteProduct, SalesChannel, SalesChannelGptFeed, SalesChannelGptFeedEntry
 
 
 class SalesChannelGptProductFeedFactoryTests(TransactionTestCase):
@@ -68,6 +70,25 @@ class SalesChannelGptProductFeedFactoryTests(TransactionTestCase):
             remote_product.refresh_from_db()
         return remote_product
 
+    def _seed_entries(self, *, feed, items):
+        for item in items:
+            SalesChannelGptFeedEntry.objects.create(
+                feed=feed,
+                identifier=item["id"],
+                payload=item,
+                multi_tenant_company=self.multi_tenant_company,
+            )
+
+    def _entries(self, *, feed):
+        return list(feed.entries.order_by("identifier").values_list("payload", flat=True))
+
+    def _compact(self, *, feed, force=True):
+        feed.refresh_from_db()
+        factory = SalesChannelGptFeedCompactionFactory(feed=feed, force=force)
+        factory.run()
+        feed.refresh_from_db()
+        return factory
+
     def test_incremental_updates_feed_and_file(self):
         remote_product = self._build_remote_product(sku="SKU-1")
         payload = {"id": "SKU-1", "title": "Updated"}
@@ -85,7 +106,11 @@ class SalesChannelGptProductFeedFactoryTests(TransactionTestCase):
         self.assertFalse(remote_product.required_feed_sync)
 
         feed = SalesChannelGptFeed.objects.get(sales_channel=self.channel)
-        self.assertEqual(feed.items, [payload])
+        self.assertEqual(self._entries(feed=feed), [payload])
+        self.assertIsNotNone(feed.compaction_requested_at)
+
+        self._compact(feed=feed)
+        self.assertIsNone(feed.compaction_requested_at)
         self.assertIsNotNone(feed.file)
         feed.file.open("r")
         try:
@@ -98,8 +123,7 @@ class SalesChannelGptProductFeedFactoryTests(TransactionTestCase):
     def test_incremental_removes_stale_entries(self):
         remote_product = self._build_remote_product(sku="SKU-2")
         feed = self.channel.ensure_gpt_feed()
-        feed.items = [{"id": "SKU-2", "title": "Old"}]
-        feed.save(update_fields=["items"])
+        self._seed_entries(feed=feed, items=[{"id": "SKU-2", "title": "Old"}])
         factory_mock = Mock()
         factory_mock.build.return_value = []
 
@@ -111,16 +135,14 @@ class SalesChannelGptProductFeedFactoryTests(TransactionTestCase):
 
         remote_product.refresh_from_db()
         self.assertFalse(remote_product.required_feed_sync)
-        feed.refresh_from_db()
-        self.assertEqual(feed.items, [])
+        self.assertEqual(self._entries(feed=feed), [])
 
     def test_sync_all_refreshes_even_without_flags(self):
         remote_product = self._build_remote_product(sku="SKU-3")
         RemoteProduct.objects.filter(pk=remote_product.pk).update(required_feed_sync=False)
         remote_product.refresh_from_db()
         feed = self.channel.ensure_gpt_feed()
-        feed.items = [{"id": "OTHER", "title": "Other"}]
-        feed.save(update_fields=["items"])
+        self._seed_entries(feed=feed, items=[{"id": "OTHER", "title": "Other"}])
         payload = {"id": "SKU-3", "title": "Fresh"}
         factory_mock = Mock()
         factory_mock.build.return_value = [payload]
@@ -133,17 +155,18 @@ class SalesChannelGptProductFeedFactoryTests(TransactionTestCase):
 
         remote_product.refresh_from_db()
         self.assertFalse(remote_product.required_feed_sync)
-        feed.refresh_from_db()
-        self.assertEqual(feed.items, [payload])
+        self.assertEqual(self._entries(feed=feed), [payload])
 
     def test_deleted_sku_removes_entry(self):
         self._build_remote_product(sku="SKU-DEL")
         feed = self.channel.ensure_gpt_feed()
-        feed.items = [
-            {"id": "SKU-DEL", "title": "Remove"},
-            {"id": "KEEP", "title": "Keep"},
-        ]
-        feed.save(update_fields=["items"])
+        self._seed_entries(
+            feed=feed,
+            items=[
+                {"id": "SKU-DEL", "title": "Remove"},
+                {"id": "KEEP", "title": "Keep"},
+            ],
+        )
 
         SalesChannelGptProductFeedFactory(
             sync_all=False,
@@ -152,5 +175,55 @@ class SalesChannelGptProductFeedFactoryTests(TransactionTestCase):
         ).run()
 
         feed.refresh_from_db()
-        self.assertEqual(feed.items, [{"id": "KEEP", "title": "Keep"}])
+        self.assertEqual(self._entries(feed=feed), [{"id": "KEEP", "title": "Keep"}])
         self.assertIsNotNone(feed.last_synced_at)
+        self.assertIsNotNone(feed.compaction_requested_at)
+
+    def test_incremental_update_only_touches_changed_entries(self):
+        self._build_remote_product(sku="SKU-4")
+        feed = self.channel.ensure_gpt_feed()
+        self._seed_entries(
+            feed=feed,
+            items=[
+                {"id": "SKU-4", "title": "Old"},
+                {"id": "UNTOUCHED", "title": "Untouched"},
+            ],
+        )
+        untouched = feed.entries.get(identifier="UNTOUCHED")
+        factory_mock = Mock()
+        factory_mock.build.return_value = [{"id": "SKU-4", "title": "New"}]
+
+        with patch(
+            "sales_channels.factories.gpt.product_feed.ProductFeedPayloadFactory",
+            return_value=factory_mock,
+        ):
+            SalesChannelGptProductFeedFactory(sync_all=False).run()
+
+        self.assertEqual(
+            self._entries(feed=feed),
+            [{"id": "SKU-4", "title": "New"}, {"id": "UNTOUCHED", "title": "Untouched"}],
+        )
+        self.assertEqual(feed.entries.get(identifier="UNTOUCHED").updated_at, untouched.updated_at)
+
+    def test_compaction_is_debounced(self):
+        feed = self.channel.ensure_gpt_feed()
+        self._seed_entries(feed=feed, items=[{"id": "B", "title": "B"}, {"id": "A", "title": "A"}])
+        SalesChannelGptFeed.objects.filter(pk=feed.pk).update(compaction_requested_at=timezone.now())
+
+        factory = self._compact(feed=feed, force=False)
+        self.assertFalse(factory.compacted)
+        self.assertFalse(feed.file)
+
+        SalesChannelGptFeed.objects.filter(pk=feed.pk).update(
+            compaction_requested_at=timezone.now() - SalesChannelGptFeedCompactionFactory.debounce,
+        )
+        factory = self._compact(feed=feed, force=False)
+        self.assertTrue(factory.compacted)
+        self.assertIsNone(feed.compaction_requested_at)
+
+        feed.file.open("r")
+        try:
+            data = json.load(feed.file)
+        finally:
+            feed.file.close()
+        self.assertEqual(data, [{"id": "A", "title": "A"}, {"id": "B", "title": "B"}])
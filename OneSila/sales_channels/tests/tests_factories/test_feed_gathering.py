@@ -0,0 +1,59 @@
+from model_bakery import baker
+
+from core.tests import TestCase
+from sales_channels.factories.feeds import SalesChannelFeedGatheringFactory
+from sales_channels.integrations.mirakl.models import MiraklProduct, MiraklSalesChannel, MiraklSalesChannelFeed
+from sales_channels.models import SalesChannelFeedItem
+from sales_channels.tests.helpers import DisableMiraklConnectionMixin
+
+
+class SalesChannelFeedGatheringFactoryTests(DisableMiraklConnectionMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.sales_channel = baker.make(
+            MiraklSalesChannel,
+            multi_tenant_company=self.multi_tenant_company,
+            hostname="mirakl.example.com",
+        )
+        self.factory = SalesChannelFeedGatheringFactory(
+            sales_channel=self.sales_channel,
+            feed_model_class=MiraklSalesChannelFeed,
+            feed_type=MiraklSalesChannelFeed.TYPE_OFFER,
+        )
+        self.remote_products = [
+            baker.make(MiraklProduct, sales_channel=self.sales_channel, multi_tenant_company=self.multi_tenant_company)
+            for _ in range(3)
+        ]
+
+    def rows(self, count):
+        return {"rows": [{"index": index} for index in range(count)]}
+
+    def assertSummaryMatchesRecount(self, feed):
+        feed.refresh_from_db()
+        items_count, rows_count = feed.items_count, feed.rows_count
+        self.factory.refresh_summary(feed=feed)
+        self.assertEqual((items_count, rows_count), (feed.items_count, feed.rows_count))
+
+    def test_upsert_item_updates_counters_incrementally(self):
+        first, second = self.remote_products[:2]
+
+        feed, _ = self.factory.upsert_item(remote_product=first, action=SalesChannelFeedItem.ACTION_CREATE, payload_data=self.rows(3))
+        self.factory.upsert_item(remote_product=second, action=SalesChannelFeedItem.ACTION_UPDATE, payload_data=self.rows(2))
+        feed, item = self.factory.upsert_item(remote_product=first, action=SalesChannelFeedItem.ACTION_UPDATE, payload_data=self.rows(1))
+
+        self.assertEqual(item.action, SalesChannelFeedItem.ACTION_CREATE)
+        self.assertEqual(feed.items_count, 2)
+        self.assertEqual(feed.rows_count, 3)
+        self.assertSummaryMatchesRecount(feed)
+
+    def test_cascade_deleted_items_shift_the_counters(self):
+        first, second = self.remote_products[:2]
+        self.factory.upsert_item(remote_product=first, action=SalesChannelFeedItem.ACTION_CREATE, payload_data=self.rows(3))
+        feed, _ = self.factory.upsert_item(remote_product=second, action=SalesChannelFeedItem.ACTION_CREATE, payload_data=self.rows(2))
+
+        first.delete()
+
+        feed.refresh_from_db()
+        self.assertEqual(feed.items_count, 1)
+        self.assertEqual(feed.rows_count, 2)
+        self.assertSummaryMatchesRecount(feed)
@@ -6,6 +6,7 @@ from model_bakery import baker
 from core.tests import TransactionTestCase
 from products.models import Product
 from sales_channels.factories.task_queue import ProductPropertyAddTask, TaskTarget, GuardResult
+from sales_channels.factories.task_queue.sync_requests import SyncRequestBulkCreateFactory, enqueue_sync_requests
 from sales_channels.integrations.magento2.models import MagentoProduct, MagentoSalesChannel
 from sales_channels import signals as sc_signals
 from sales_channels.models import SyncRequest
@@ -141,3 +142,95 @@ class SyncRequestDedupeTests(TransactionTestCase):
             else:
                 skipped_for = SyncRequest.objects.get(id=skipped_request.skipped_for_id)
                 self.assertEqual(skipped_for.sync_type, SyncRequest.TYPE_PRODUCT)
+
+    def _build_sync_request(self, *, remote_product, sync_type=SyncRequest.TYPE_PROPERTY):
+        return SyncRequest(
+            multi_tenant_company=self.multi_tenant_company,
+            remote_product=remote_product,
+            sales_channel=self.sales_channel,
+            sync_type=sync_type,
+            task_func_path=get_import_path(_dummy_task),
+            task_kwargs={"remote_product_id": remote_product.id},
+        )
+
+    def test_bulk_create_supersedes_pending_requests(self):
+        product = baker.make(Product, type="SIMPLE", multi_tenant_company=self.multi_tenant_company, sku='BULK-1')
+        other_product = baker.make(Product, type="SIMPLE", multi_tenant_company=self.multi_tenant_company, sku='BULK-2')
+        remote = self._make_remote_product(product=product)
+        other_remote = self._make_remote_product(product=other_product)
+
+        older = self._build_sync_request(remote_product=remote)
+        older.save()
+        other_type = self._build_sync_request(remote_product=remote, sync_type=SyncRequest.TYPE_PRICE)
+        other_type.save()
+
+        factory = SyncRequestBulkCreateFactory(
+            sync_requests=[
+                self._build_sync_request(remote_product=remote),
+                self._build_sync_request(remote_product=remote),
+                self._build_sync_request(remote_product=other_remote),
+            ],
+        )
+        factory.run()
+
+        newest = factory.pending_requests[0]
+        older.refresh_from_db()
+        other_type.refresh_from_db()
+
+        self.assertEqual(factory.superseded_count, 1)
+        self.assertEqual(older.status, SyncRequest.STATUS_SKIPPED)
+        self.assertEqual(older.skipped_for_id, newest.id)
+        self.assertEqual(other_type.status, SyncRequest.STATUS_PENDING)
+        self.assertEqual(
+            SyncRequest.objects.filter(remote_product=remote, sync_type=SyncRequest.TYPE_PROPERTY, status=SyncRequest.STATUS_PENDING).get(),
+            newest,
+        )
+        self.assertEqual(
+            SyncRequest.objects.filter(skipped_for=newest).count(),
+            2,
+        )
+        self.assertTrue(
+            SyncRequest.objects.filter(remote_product=other_remote, status=SyncRequest.STATUS_PENDING).exists(),
+        )
+
+    def test_create_sync_requests_bulk_creates_and_keeps_dedupe(self):
+        products = [
+            baker.make(Product, type="SIMPLE", multi_tenant_company=self.multi_tenant_company, sku=f'RUN-{index}')
+            for index in range(3)
+        ]
+        remotes = [self._make_remote_product(product=product) for product in products]
+        task = DummyPropertyAddTask(
+            task_func=_dummy_task,
+            product=products[0],
+        )
+        guard_result = GuardResult(allowed=True)
+        targets = [
+            (TaskTarget(sales_channel=self.sales_channel, remote_product=remote), guard_result)
+            for remote in remotes
+        ]
+        targets.append((TaskTarget(sales_channel=self.sales_channel, remote_product=remotes[0]), guard_result))
+
+        task.create_sync_requests(targets=targets)
+
+        pending = SyncRequest.objects.filter(status=SyncRequest.STATUS_PENDING)
+        self.assertEqual(pending.filter(sync_type=task.sync_type).count(), 2)
+        self.assertEqual(pending.get(remote_product=remotes[0]).sync_type, SyncRequest.TYPE_PRODUCT)
+
+    @patch("sales_channels.factories.task_queue.sync_requests.enqueue_integration_tasks")
+    def test_enqueue_sync_requests_batches_per_channel(self, enqueue_integration_tasks):
+        products = [
+            baker.make(Product, type="SIMPLE", multi_tenant_company=self.multi_tenant_company, sku=f'ENQ-{index}')
+            for index in range(3)
+        ]
+        sync_requests = []
+        for product in products:
+            sync_request = self._build_sync_request(remote_product=self._make_remote_product(product=product))
+            sync_request.save()
+            sync_requests.append(sync_request)
+
+        enqueued, errors = enqueue_sync_requests(sync_requests=sync_requests)
+
+        self.assertEqual((enqueued, errors), (3, []))
+        enqueue_integration_tasks.assert_called_once()
+        self.assertEqual(len(enqueue_integration_tasks.call_args.kwargs["tasks"]), 3)
+        self.assertFalse(SyncRequest.objects.filter(status=SyncRequest.STATUS_PENDING).exists())
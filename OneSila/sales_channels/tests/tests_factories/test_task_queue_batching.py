@@ -0,0 +1,133 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import SimpleTestCase
+
+from integrations.helpers import get_import_path
+from sales_channels.factories.task_queue import AddTaskBase, GuardResult, TaskTarget, collect_sales_channel_syncs
+from sales_channels.factories.task_queue.task_queue import sales_channel_sync_buffer
+
+
+def _dummy_task():
+    return None
+
+
+class DummyBatchAddTask(AddTaskBase):
+    def __init__(self, *, sales_channels, targets_per_channel, **kwargs):
+        self.sales_channels = sales_channels
+        self.targets_per_channel = targets_per_channel
+        super().__init__(**kwargs)
+
+    def get_sales_channels(self):
+        return self.sales_channels
+
+    def get_targets(self, *, sales_channel):
+        for index in range(self.targets_per_channel):
+            yield TaskTarget(sales_channel=sales_channel, remote_product=SimpleNamespace(id=index + 1))
+
+    def guard(self, *, target):
+        return GuardResult(allowed=True)
+
+    def build_task_kwargs(self, *, target):
+        task_kwargs = super().build_task_kwargs(target=target)
+        task_kwargs["remote_product_id"] = target.remote_product.id
+        return task_kwargs
+
+
+class TaskQueueBatchingTests(SimpleTestCase):
+    def _build_task(self, *, sales_channels, targets_per_channel):
+        return DummyBatchAddTask(
+            task_func=_dummy_task,
+            multi_tenant_company=object(),
+            number_of_remote_requests=2,
+            sales_channels=sales_channels,
+            targets_per_channel=targets_per_channel,
+        )
+
+    def _run(self, *, sales_channels, targets_per_channel, runs=1, collect=False, sales_channel_ids=None):
+        tasks = [
+            self._build_task(sales_channels=sales_channels, targets_per_channel=targets_per_channel)
+            for _ in range(runs)
+        ]
+        with patch(
+            "sales_channels.factories.task_queue.task_queue.add_task_to_queue",
+        ) as add_task_mock, patch(
+            "sales_channels.factories.task_queue.task_queue.add_tasks_to_queue",
+        ) as add_tasks_mock, patch.object(
+            transaction,
+            "on_commit",
+            side_effect=lambda func, using=None: func(),
+        ):
+            if collect:
+                with collect_sales_channel_syncs(sales_channel_ids=sales_channel_ids):
+                    for task in tasks:
+                        task.run()
+                    add_tasks_mock.assert_not_called()
+            else:
+                for task in tasks:
+                    task.run()
+
+        return add_task_mock, add_tasks_mock
+
+    def test_single_target_keeps_single_enqueue(self):
+        channel = SimpleNamespace(id=7)
+        add_task_mock, add_tasks_mock = self._run(sales_channels=[channel], targets_per_channel=1)
+
+        add_task_mock.assert_called_once_with(
+            integration_id=7,
+            task_func_path=get_import_path(_dummy_task),
+            task_kwargs={"sales_channel_id": 7, "remote_product_id": 1},
+            number_of_remote_requests=2,
+        )
+        add_tasks_mock.assert_not_called()
+
+    def test_many_targets_are_sent_as_one_message_per_integration(self):
+        channels = [SimpleNamespace(id=7), SimpleNamespace(id=8)]
+        add_task_mock, add_tasks_mock = self._run(sales_channels=channels, targets_per_channel=3)
+
+        add_task_mock.assert_not_called()
+        self.assertEqual(add_tasks_mock.call_count, 2)
+
+        calls = {call.kwargs["integration_id"]: call.kwargs["tasks"] for call in add_tasks_mock.call_args_list}
+        self.assertSetEqual(set(calls), {7, 8})
+        self.assertEqual(
+            [task["task_kwargs"]["remote_product_id"] for task in calls[7]],
+            [1, 2, 3],
+        )
+        self.assertTrue(all(task["number_of_remote_requests"] == 2 for task in calls[8]))
+
+    def test_collected_runs_are_sent_as_one_message_per_integration(self):
+        channels = [SimpleNamespace(id=7), SimpleNamespace(id=8)]
+        add_task_mock, add_tasks_mock = self._run(sales_channels=channels, targets_per_channel=1, runs=3, collect=True)
+
+        add_task_mock.assert_not_called()
+        self.assertEqual(add_tasks_mock.call_count, 2)
+        for call in add_tasks_mock.call_args_list:
+            self.assertEqual(len(call.kwargs["tasks"]), 3)
+
+    def test_collected_runs_only_reach_the_scoped_sales_channels(self):
+        channels = [SimpleNamespace(id=7), SimpleNamespace(id=8)]
+        add_task_mock, add_tasks_mock = self._run(
+            sales_channels=channels,
+            targets_per_channel=1,
+            runs=3,
+            collect=True,
+            sales_channel_ids=[8],
+        )
+
+        add_task_mock.assert_not_called()
+        add_tasks_mock.assert_called_once()
+        self.assertEqual(add_tasks_mock.call_args.kwargs["integration_id"], 8)
+        self.assertIsNone(sales_channel_sync_buffer.sales_channel_ids)
+
+    def test_collected_price_data_is_kept_per_sales_channel_until_exit(self):
+        price_data = {"GBP": {"price": 10.0, "discount_price": None}}
+
+        with collect_sales_channel_syncs(sales_channel_ids=[7]) as sync_buffer:
+            sync_buffer.add_price_data(sales_channel_id=7, price_data_map={1: price_data})
+
+            self.assertEqual(sales_channel_sync_buffer.get_price_data(sales_channel_id=7, product_id=1), price_data)
+            self.assertIsNone(sales_channel_sync_buffer.get_price_data(sales_channel_id=8, product_id=1))
+
+        self.assertIsNone(sales_channel_sync_buffer.get_price_data(sales_channel_id=7, product_id=1))
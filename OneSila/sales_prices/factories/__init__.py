@@ -1,4 +1,4 @@
-from .currencies import SalesPriceCurrencyChangeFactory
+from .currencies import SalesPriceBulkCurrencyChangeFactory
 from .salespricelist_items import SalesPriceForSalesPriceListItemCreateFactory, \
     SalesPriceListForSalesPriceListItemsCreateUpdateFactory, SalesPriceListForSalesPriceListItemUpdatePricesFactory, \
     SalesPriceForSalesPriceListItemUpdatePricesFactory, SalesPriceItemAutoPriceUpdateMixin, \
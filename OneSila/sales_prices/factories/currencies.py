@@ -1,22 +1,119 @@
-from currencies.signals import exchange_rate_change
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
 
+from currencies.helpers import currency_convert, sort_currencies_by_inheritance
+from currencies.models import Currency
+from products.models import Product
+from sales_prices.helpers import quantize_price
+from sales_prices.models import SalesPrice, SalesPriceList
+from sales_prices.signals import bulk_price_changed
+from .salespricelist_items import SalesPriceListForSalesPriceListItemUpdatePricesFactory
 
-class SalesPriceCurrencyChangeFactory:
-    def __init__(self, currency):
-        self.currency = currency
-        self.multi_tenant_company = currency.multi_tenant_company
+import logging
+logger = logging.getLogger(__name__)
 
-    def set_salesprice_qs(self):
-        self.salesprices_qs = self.currency.salesprice_set.\
-            filter_multi_tenant(self.multi_tenant_company)
 
-    def trigger_exchange_change(self, sales_price):
-        exchange_rate_change.send(sender=sales_price.__class__, instance=sales_price)
+class SalesPriceBulkCurrencyChangeFactory:
+    """
+    Reprice the SalesPrices of currencies whose rate changed in bulk.
 
-    def cycle(self):
-        for sales_price in self.salesprices_qs.iterator():
-            self.trigger_exchange_change(sales_price)
+    Every currency inheriting from a changed currency is repriced too, parents before children, since
+    its prices are converted from the parent prices. Per currency the parent prices are joined in
+    one query, the converted prices are computed in a single pass and only the rows that changed are
+    bulk updated. Auto-priced price lists of the currency are then recalculated and the affected
+    products are announced with one bulk_price_changed.
+    """
+    batch_size = 1000
+
+    def __init__(self, currencies):
+        self.changed_currencies = list(currencies)
+        self.updated_prices = {}
+
+    @property
+    def updated_prices_count(self):
+        return sum(self.updated_prices.values())
+
+    def set_currencies(self):
+        currency_ids = {currency.id for currency in self.changed_currencies}
+        parent_ids = set(currency_ids)
+        while parent_ids:
+            parent_ids = set(
+                Currency.objects.filter(inherits_from_id__in=parent_ids).
+                exclude(id__in=currency_ids).
+                values_list('id', flat=True)
+            )
+            currency_ids |= parent_ids
+
+        currencies = Currency.objects.filter(id__in=currency_ids, inherits_from__isnull=False).select_related('multi_tenant_company')
+        self.currencies = sort_currencies_by_inheritance(currencies)
+
+    def get_changed_sales_prices(self, currency):
+        parent_prices = SalesPrice.objects.filter(
+            product_id=OuterRef('product_id'),
+            currency_id=currency.inherits_from_id,
+        )
+        rows = SalesPrice.objects.filter(
+            currency=currency,
+            multi_tenant_company=currency.multi_tenant_company,
+        ).annotate(
+            parent_rrp=Subquery(parent_prices.values('rrp')[:1]),
+            parent_price=Subquery(parent_prices.values('price')[:1]),
+        ).values_list('id', 'product_id', 'rrp', 'price', 'parent_rrp', 'parent_price')
+
+        now = timezone.now()
+        for sales_price_id, product_id, old_rrp, old_price, parent_rrp, parent_price in rows.iterator(chunk_size=self.batch_size):
+            # Same conversion as SalesPriceUpdateCreateFactory._update_self
+            rrp = currency_convert(
+                round_prices_up_to=currency.round_prices_up_to,
+                exchange_rate=currency.rate,
+                price=parent_rrp
+            )
+            price = currency_convert(
+                round_prices_up_to=currency.round_prices_up_to,
+                exchange_rate=currency.rate,
+                price=parent_price
+            ) if parent_price else None
+
+            rrp, price = quantize_price(rrp), quantize_price(price)
+            if quantize_price(old_rrp) == rrp and quantize_price(old_price) == price:
+                continue
+
+            yield SalesPrice(id=sales_price_id, product_id=product_id, rrp=rrp, price=price, updated_at=now)
+
+    def reprice_currency(self, currency):
+        changed_sales_prices = list(self.get_changed_sales_prices(currency))
+        self.updated_prices[currency.id] = len(changed_sales_prices)
+        if not changed_sales_prices:
+            return
+
+        with transaction.atomic():
+            SalesPrice.objects.bulk_update(changed_sales_prices, ['rrp', 'price', 'updated_at'], batch_size=self.batch_size)
+
+        logger.info(f"Repriced {len(changed_sales_prices)} sales prices for {currency.iso_code} ({currency.multi_tenant_company_id}).")
+        self.update_price_lists(currency)
+        self.send_signals(currency, product_ids={sales_price.product_id for sales_price in changed_sales_prices})
+
+    def update_price_lists(self, currency):
+        price_lists = SalesPriceList.objects.filter(
+            multi_tenant_company=currency.multi_tenant_company,
+            currency=currency,
+            auto_update_prices=True,
+        )
+        for price_list in price_lists:
+            SalesPriceListForSalesPriceListItemUpdatePricesFactory(price_list).run()
+
+    def send_signals(self, currency, product_ids):
+        bulk_price_changed.send(
+            sender=Product,
+            multi_tenant_company=currency.multi_tenant_company,
+            currency=currency,
+            product_ids=sorted(product_ids),
+        )
 
     def run(self):
-        self.set_salesprice_qs()
-        self.cycle()
+        self.set_currencies()
+        for currency in self.currencies:
+            self.reprice_currency(currency)
+
+        logger.info(f"Repriced {self.updated_prices_count} sales prices over {len(self.currencies)} currencies.")
@@ -1,16 +1,97 @@
 from decimal import Decimal
+from django.db import transaction
+from django.utils import timezone
 from currencies.models import Currency
 from currencies.helpers import roundup
 from sales_prices.models import SalesPriceList, SalesPriceListItem, SalesPrice
+from sales_prices.helpers import quantize_price
+from sales_prices.signals import sales_price_list_items_prices_changed
 
 import logging
 logger = logging.getLogger(__name__)
 
 
 class SalesPriceItemAutoPriceUpdateMixin:
+    batch_size = 1000
+
     def run_update_cycle(self):
-        for spi in self.salespricelistitems.iterator():
-            self.update_salespricelistitem(spi)
+        """
+        Recalculate the auto prices of all self.salespricelistitems at once.
+
+        The sales prices are fetched in one query, the items that actually change are written with
+        bulk_update and a single sales_price_list_items_prices_changed is sent for the affected
+        products instead of a post_update per item.
+        """
+        highest_prices = self.get_highest_prices()
+        now = timezone.now()
+        changed_items = []
+        product_ids = set()
+
+        items = self.salespricelistitems.select_related('salespricelist').order_by('id')
+        for salespricelistitem in items.iterator(chunk_size=self.batch_size):
+            highest_price = highest_prices.get(salespricelistitem.product_id)
+            if highest_price is None:
+                logger.warning(f"No sales price in {self.currency} for {salespricelistitem=}, skipping auto price update.")
+                continue
+
+            if not self.set_auto_prices(salespricelistitem, highest_price):
+                continue
+
+            salespricelistitem.updated_at = now
+            changed_items.append(salespricelistitem)
+            product_ids.add(salespricelistitem.product_id)
+
+        if not changed_items:
+            return
+
+        with transaction.atomic():
+            SalesPriceListItem.objects.bulk_update(
+                changed_items,
+                ['price_auto', 'discount_auto', 'updated_at'],
+                batch_size=self.batch_size,
+            )
+
+        logger.debug(f"Updated auto prices for {len(changed_items)} salespricelistitems.")
+        sales_price_list_items_prices_changed.send(
+            sender=SalesPriceListItem,
+            multi_tenant_company=self.multi_tenant_company,
+            currency=self.currency,
+            product_ids=sorted(product_ids),
+        )
+
+    def get_highest_prices(self):
+        sales_prices = SalesPrice.objects.filter(
+            product_id__in=self.salespricelistitems.values('product_id'),
+            currency=self.currency,
+            multi_tenant_company=self.multi_tenant_company,
+        ).values_list('product_id', 'rrp', 'price')
+
+        return {product_id: max([rrp or 0, price or 0]) for product_id, rrp, price in sales_prices}
+
+    def set_auto_prices(self, salespricelistitem, highest_price):
+        """
+        Same calculation as update_salespricelistitem without saving.
+        Returns True when price_auto or discount_auto changed.
+        """
+        round_prices_up_to = self.currency.round_prices_up_to
+        price_auto = quantize_price(self.calculate_price(highest_price,
+            conversion_factor=salespricelistitem.salespricelist.price_change_pcnt,
+            round_prices_up_to=round_prices_up_to,
+            is_discount=False))
+        discount_auto = quantize_price(self.calculate_price(highest_price,
+            conversion_factor=salespricelistitem.salespricelist.discount_pcnt,
+            round_prices_up_to=round_prices_up_to,
+            is_discount=True))
+
+        if discount_auto >= price_auto:
+            discount_auto = quantize_price(salespricelistitem.discount_auto)
+
+        if quantize_price(salespricelistitem.price_auto) == price_auto and quantize_price(salespricelistitem.discount_auto) == discount_auto:
+            return False
+
+        salespricelistitem.price_auto = price_auto
+        salespricelistitem.discount_auto = discount_auto
+        return True
 
     @staticmethod
     def calculate_price(from_price, conversion_factor, round_prices_up_to, is_discount=True):
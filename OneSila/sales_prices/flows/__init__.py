@@ -4,4 +4,4 @@ from .salespricelist_items import sales_price__salespricelistitem__create_update
     sales_price__salespricelistitem__update_prices_flow, \
     sales_price_list__salespricelistitem__update_prices_flow, \
     salespricelistitem__update_prices_flow
-from .currencies import salesprice_currency_change_flow
+from .currencies import salesprice_currency_change_flow, salesprice_currencies_change_flow
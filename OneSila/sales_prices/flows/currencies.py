@@ -1,6 +1,11 @@
-from sales_prices.factories import SalesPriceCurrencyChangeFactory
+from sales_prices.factories import SalesPriceBulkCurrencyChangeFactory
 
 
 def salesprice_currency_change_flow(currency):
-    f = SalesPriceCurrencyChangeFactory(currency)
+    return salesprice_currencies_change_flow([currency])
+
+
+def salesprice_currencies_change_flow(currencies):
+    f = SalesPriceBulkCurrencyChangeFactory(currencies)
     f.run()
+    return f.updated_prices_count
@@ -0,0 +1,171 @@
+from datetime import date
+from decimal import Decimal
+from itertools import islice
+
+
+def quantize_price(value):
+    """
+    Round a computed price the way the two decimal price fields store it, so freshly computed
+    prices can be compared with the stored ones.
+    """
+    if value is None:
+        return None
+    return Decimal(value).quantize(Decimal('0.01'))
+
+
+def validate_sales_channel_prices(price, discount):
+    """
+    Validation applied to every resolved price / discount pair, see Product.get_price_for_sales_channel.
+    """
+    if price == 0 or discount == 0:
+        raise ValueError("Price or discount cannot be zero")
+    if discount is not None and price is not None and discount >= price:
+        return price, None
+    return price, discount
+
+
+class SalesChannelPriceResolver:
+    """
+    Resolve the price and discount of many products for a sales channel in a handful of queries.
+
+    The precedence is the same as Product.get_price_for_sales_channel: an item of the running periodic
+    price list, then an item of the non-periodic price list and finally the SalesPrice of the product.
+    Results are keyed on (product_id, currency_id). Pairs that fail the validation are kept in `errors`
+    and raise the same ValueError as the single product lookup when requested through get().
+    """
+    chunk_size = 2000
+
+    def __init__(self, *, sales_channel, product_ids, currencies=None, today=None):
+        self.sales_channel = sales_channel
+        self.product_ids = list(dict.fromkeys(product_ids))
+        self.currencies = currencies
+        self.today = today or date.today()
+        self.currency_ids = []
+        self.prices = {}
+        self.errors = {}
+
+    def get_currencies(self):
+        from currencies.models import Currency
+
+        if self.currencies is not None:
+            return [currency for currency in self.currencies if currency is not None]
+
+        default_currency = Currency.objects.filter(
+            multi_tenant_company=self.sales_channel.multi_tenant_company,
+            is_default_currency=True,
+        ).first()
+        return [default_currency] if default_currency is not None else []
+
+    def get_price_lists(self, *, currency_ids):
+        """
+        Returns two maps of currency_id -> price_list_id, one for the running periodic price lists and
+        one for the non-periodic ones. When several match, the first one wins like .first() does.
+        """
+        from sales_channels.models.sales_channels import SalesChannelIntegrationPricelist
+
+        periodic, non_periodic = {}, {}
+        integrations = SalesChannelIntegrationPricelist.objects.filter(
+            sales_channel=self.sales_channel,
+            price_list__currency_id__in=currency_ids,
+        ).values_list('price_list_id', 'price_list__currency_id', 'price_list__start_date', 'price_list__end_date').order_by('id')
+
+        for price_list_id, currency_id, start_date, end_date in integrations:
+            if start_date is None and end_date is None:
+                non_periodic.setdefault(currency_id, price_list_id)
+            elif start_date is not None and end_date is not None and start_date <= self.today <= end_date:
+                periodic.setdefault(currency_id, price_list_id)
+
+        return periodic, non_periodic
+
+    def get_price_list_items(self, *, price_list_ids, product_ids):
+        from sales_prices.models import SalesPriceListItem
+
+        items = SalesPriceListItem.objects.filter(
+            salespricelist_id__in=price_list_ids,
+            product_id__in=product_ids,
+        ).annotate_prices().values_list('salespricelist_id', 'product_id', 'price', 'discount')
+
+        return {(price_list_id, product_id): (price, discount) for price_list_id, product_id, price, discount in items}
+
+    def get_sales_prices(self, *, currency_ids, product_ids):
+        from sales_prices.models import SalesPrice
+
+        sales_prices = {}
+        rows = SalesPrice.objects.filter(
+            product_id__in=product_ids,
+            currency_id__in=currency_ids,
+        ).values_list('product_id', 'currency_id', 'rrp', 'price').order_by('id')
+
+        for product_id, currency_id, rrp, price in rows:
+            sales_prices.setdefault((product_id, currency_id), (rrp, price))
+
+        return sales_prices
+
+    def resolve_sales_price(self, *, rrp, price):
+        if rrp is not None and price is not None:
+            return rrp, price
+        if rrp is not None:
+            return rrp, None
+        if price is not None:
+            return price, None
+        return None
+
+    def resolve_chunk(self, *, product_ids, currency_ids, periodic, non_periodic):
+        price_list_ids = set(periodic.values()) | set(non_periodic.values())
+        items = self.get_price_list_items(price_list_ids=price_list_ids, product_ids=product_ids) if price_list_ids else {}
+        sales_prices = self.get_sales_prices(currency_ids=currency_ids, product_ids=product_ids)
+
+        for product_id in product_ids:
+            for currency_id in currency_ids:
+                key = (product_id, currency_id)
+                resolved = None
+
+                for price_list_id in (periodic.get(currency_id), non_periodic.get(currency_id)):
+                    if price_list_id is not None and (price_list_id, product_id) in items:
+                        resolved = items[(price_list_id, product_id)]
+                        break
+
+                if resolved is None and key in sales_prices:
+                    resolved = self.resolve_sales_price(rrp=sales_prices[key][0], price=sales_prices[key][1])
+
+                if resolved is None:
+                    continue
+
+                try:
+                    self.prices[key] = validate_sales_channel_prices(*resolved)
+                except ValueError as e:
+                    self.errors[key] = e
+
+    def resolve(self):
+        self.currency_ids = currency_ids = [currency.id for currency in self.get_currencies()]
+        if not currency_ids or not self.product_ids:
+            return self.prices
+
+        periodic, non_periodic = self.get_price_lists(currency_ids=currency_ids)
+
+        product_ids = iter(self.product_ids)
+        while chunk := list(islice(product_ids, self.chunk_size)):
+            self.resolve_chunk(
+                product_ids=chunk,
+                currency_ids=currency_ids,
+                periodic=periodic,
+                non_periodic=non_periodic,
+            )
+
+        return self.prices
+
+    def get(self, *, product_id, currency_id=None):
+        """
+        Returns (price, discount) like Product.get_price_for_sales_channel. Without a currency_id the first
+        resolved currency is used, which is the default currency when no currencies were given.
+        """
+        if currency_id is None:
+            if not self.currency_ids:
+                return None, None
+            currency_id = self.currency_ids[0]
+
+        key = (product_id, currency_id)
+        if key in self.errors:
+            raise self.errors[key]
+
+        return self.prices.get(key, (None, None))
@@ -1,7 +1,7 @@
 from core.signals import post_save, post_create
 from django.dispatch import receiver
-from currencies.signals import exchange_rate_change
-from currencies.models import Currency
+from currencies.signals import exchange_rate_change, exchange_rates_change
+from imports_exports.signals import products_batch_imported
 from sales_prices.models import SalesPrice, SalesPriceList, SalesPriceListItem
 from currencies.models import Currency
 
@@ -30,6 +30,16 @@ def sales_prices__salesprice__post_save(sender, instance, created=False, **kwarg
     sales_price__salespricelistitem__update_prices_task(instance)
 
 
+@receiver(products_batch_imported)
+def sales_prices__products_batch_imported(sender, instance, created_objects, updated_objects, **kwargs):
+    """
+    Bulk imports skip post_save, populate the prices written in the chunk the same way.
+    """
+    for obj, created in [*[(obj, True) for obj in created_objects], *[(obj, False) for obj in updated_objects]]:
+        if isinstance(obj, SalesPrice):
+            sales_prices__salesprice__post_save(sender=SalesPrice, instance=obj, created=created)
+
+
 @receiver(post_create, sender=Currency)
 def sales_prices__currencies__exchange_rate_changes(sender, instance, **kwargs):
     """
@@ -49,6 +59,15 @@ def salesprices__salesprice_change_on_currency_rate_change(sender, instance, **k
     salesprice__currency_change__task(instance)
 
 
+@receiver(exchange_rates_change, sender=Currency)
+def salesprices__salesprice_change_on_currency_rates_change(sender, instances, **kwargs):
+    """
+    The nightly rate update changes many currencies at once, reprice them in one go.
+    """
+    from .tasks import salesprice__currencies_change__task
+    salesprice__currencies_change__task([currency.id for currency in instances])
+
+
 @receiver(post_save, sender=SalesPriceList)
 def sales_prices__salespricelist__post_create(sender, instance, created, **kwargs):
     from .tasks import salespricelistitem__create_for_salespricelist__task, \
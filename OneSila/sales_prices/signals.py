@@ -1,3 +1,5 @@
 from django.db.models.signals import ModelSignal
 
 price_changed = ModelSignal(use_caching=True)
+bulk_price_changed = ModelSignal(use_caching=True)
+sales_price_list_items_prices_changed = ModelSignal(use_caching=True)
@@ -5,7 +5,7 @@ from core.decorators import run_task_after_commit
 
 import logging
 
-from .signals import price_changed
+from .signals import bulk_price_changed
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,14 @@ def salesprice__currency_change__task(currency):
     salesprice_currency_change_flow(currency)
 
 
+# @run_task_after_commit
+@db_task()
+def salesprice__currencies_change__task(currency_ids):
+    from currencies.models import Currency
+    from sales_prices.flows import salesprice_currencies_change_flow
+    salesprice_currencies_change_flow(Currency.objects.filter(id__in=currency_ids))
+
+
 # @run_task_after_commit
 @db_task()
 def salesprice__create_for_currency__task(currency):
@@ -68,19 +76,31 @@ def salespricelistitem__update_prices_task(salespricelistitem):
 
 @db_periodic_task(crontab(hour=2, minute=0))
 def salespricelistitem__check_price_changed_periodic_task():
+    from django.db.models import Q
+    from products.models import Product
     from .models import SalesPriceList
     """
     Periodic task to check for promotions starting or ending.
+    The affected products are sent as one bulk_price_changed per company and currency.
     """
     today = date.today()
     yesterday = today - timedelta(days=1)
 
-    ending_promotions = SalesPriceList.objects.filter(end_date=yesterday)
-    for salespricelist in ending_promotions:
-        for item in salespricelist.salespricelistitem_set.all().iterator():
-            price_changed.send(sender=item.product.__class__, instance=item.product, currency=salespricelist.currency)
-
-    starting_promotions = SalesPriceList.objects.filter(start_date=today)
-    for salespricelist in starting_promotions:
-        for item in salespricelist.salespricelistitem_set.all().iterator():
-            price_changed.send(sender=item.product.__class__, instance=item.product, currency=salespricelist.currency)
+    product_ids_per_currency = {}
+    changed_promotions = SalesPriceList.objects.filter(
+        Q(end_date=yesterday) | Q(start_date=today)
+    ).select_related('currency', 'multi_tenant_company')
+
+    for salespricelist in changed_promotions:
+        key = (salespricelist.multi_tenant_company, salespricelist.currency)
+        product_ids_per_currency.setdefault(key, set()).update(
+            salespricelist.salespricelistitem_set.values_list('product_id', flat=True)
+        )
+
+    for (multi_tenant_company, currency), product_ids in product_ids_per_currency.items():
+        bulk_price_changed.send(
+            sender=Product,
+            multi_tenant_company=multi_tenant_company,
+            currency=currency,
+            product_ids=sorted(product_ids),
+        )
@@ -8,6 +8,7 @@ from sales_prices.factories import SalesPriceForSalesPriceListItemCreateFactory,
     SalesPriceListForSalesPriceListItemsCreateUpdateFactory, SalesPriceItemAutoPriceUpdateMixin, \
     SalesPriceListForSalesPriceListItemUpdatePricesFactory, SalesPriceForSalesPriceListItemUpdatePricesFactory
 from currencies.currencies import currencies
+from sales_prices.signals import sales_price_list_items_prices_changed
 
 
 class SalesPriceItemAutoPriceUpdateMixinTestCase(TestCase):
@@ -259,3 +260,55 @@ class SalesPriceForSalesPriceListItemCreateFactoryTestCase(TestCase):
         # Let's also ensure the update happen when a salesprice changes
         f = SalesPriceForSalesPriceListItemUpdatePricesFactory(salesprice_gbp)
         f.run()
+
+
+class SalesPriceListForSalesPriceListItemUpdatePricesFactoryTestCase(TestCase):
+    def test_bulk_update_auto_prices_and_single_notification(self):
+        currency_gbp, _ = Currency.objects.get_or_create(
+            is_default_currency=True,
+            multi_tenant_company=self.multi_tenant_company,
+            **currencies['GB'])
+        price_list = SalesPriceList.objects.create(
+            multi_tenant_company=self.multi_tenant_company,
+            currency=currency_gbp,
+            auto_update_prices=True,
+            auto_add_products=False,
+            price_change_pcnt=10,
+            discount_pcnt=20,
+        )
+
+        products = []
+        for rrp in (100, 200, 300):
+            product = SimpleProduct.objects.create(multi_tenant_company=self.multi_tenant_company)
+            salesprice, _ = product.salesprice_set.get_or_create(
+                multi_tenant_company=self.multi_tenant_company,
+                currency=currency_gbp)
+            salesprice.set_prices(rrp=rrp, price=rrp - 10)
+            price_list.salespricelistitem_set.get_or_create(
+                multi_tenant_company=self.multi_tenant_company,
+                product=product)
+            products.append((product, rrp))
+
+        price_list.salespricelistitem_set.update(price_auto=None, discount_auto=None)
+
+        received = []
+
+        def receiver(sender, product_ids, **kwargs):
+            received.append(product_ids)
+
+        sales_price_list_items_prices_changed.connect(receiver)
+        self.addCleanup(sales_price_list_items_prices_changed.disconnect, receiver)
+
+        SalesPriceListForSalesPriceListItemUpdatePricesFactory(price_list).run()
+
+        self.assertEqual(received, [sorted(product.id for product, _ in products)])
+        for product, rrp in products:
+            item = price_list.salespricelistitem_set.get(product=product)
+            expected_price = SalesPriceItemAutoPriceUpdateMixin.calculate_price(rrp, 10, currency_gbp.round_prices_up_to, is_discount=False)
+            expected_discount = SalesPriceItemAutoPriceUpdateMixin.calculate_price(rrp, 20, currency_gbp.round_prices_up_to, is_discount=True)
+            self.assertEqual(item.price_auto, expected_price)
+            self.assertEqual(item.discount_auto, expected_discount)
+
+        # Nothing changed, so nothing is written nor notified.
+        SalesPriceListForSalesPriceListItemUpdatePricesFactory(price_list).run()
+        self.assertEqual(len(received), 1)
@@ -6,7 +6,7 @@ from sales_prices.models import SalesPriceList
 from sales_prices.flows import salesprice_updatecreate_flow, \
     sales_price__salespricelistitem__create_update_flow, \
     sales_price__salespricelistitem__update_prices_flow, \
-    salesprice_currency_change_flow
+    salesprice_currency_change_flow, salesprice_currencies_change_flow
 
 
 class CurrencyChangeTestCase(TestCase):
@@ -86,3 +86,46 @@ class CurrencyChangeTestCase(TestCase):
 
         self.assertFalse(salespricelistprice_eur_before_price == salespricelistprice_eur_after_price)
         self.assertFalse(salespricelistprice_eur_before_discount == salespricelistprice_eur_after_discount)
+
+    def test_currencies_rate_change_reprices_inheritance_chain(self):
+        product = SimpleProduct.objects.create(multi_tenant_company=self.multi_tenant_company)
+        currency_gbp, _ = Currency.objects.get_or_create(
+            is_default_currency=True,
+            multi_tenant_company=self.multi_tenant_company,
+            **currencies['GB'])
+        currency_eur, _ = Currency.objects.get_or_create(
+            is_default_currency=False,
+            multi_tenant_company=self.multi_tenant_company,
+            inherits_from=currency_gbp,
+            exchange_rate=1,
+            follow_official_rate=False,
+            **currencies['FR'])
+        currency_ron, _ = Currency.objects.get_or_create(
+            is_default_currency=False,
+            multi_tenant_company=self.multi_tenant_company,
+            inherits_from=currency_eur,
+            exchange_rate=1,
+            follow_official_rate=False,
+            **currencies['RO'])
+
+        salesprice_gbp, _ = product.salesprice_set.get_or_create(
+            multi_tenant_company=self.multi_tenant_company,
+            currency=currency_gbp)
+        salesprice_gbp.set_prices(rrp=100, price=90)
+        salesprice_updatecreate_flow(salesprice_gbp)
+
+        # Rates are written in bulk by the nightly job, so no save() signals are involved.
+        Currency.objects.filter(id=currency_eur.id).update(exchange_rate=10)
+
+        updated_count = salesprice_currencies_change_flow([currency_eur])
+
+        salesprice_eur = product.salesprice_set.get(currency=currency_eur)
+        salesprice_ron = product.salesprice_set.get(currency=currency_ron)
+        self.assertEqual(salesprice_eur.rrp, 1000)
+        self.assertEqual(salesprice_eur.price, 900)
+        self.assertEqual(salesprice_ron.rrp, 1000)
+        self.assertEqual(salesprice_ron.price, 900)
+        self.assertEqual(updated_count, 2)
+
+        # Nothing left to reprice on a second run.
+        self.assertEqual(salesprice_currencies_change_flow([currency_eur]), 0)
@@ -0,0 +1,113 @@
+from datetime import date, timedelta
+
+from core.tests import TestCase
+from products.models import SimpleProduct
+from sales_channels.integrations.amazon.models import AmazonSalesChannel
+from sales_channels.models import SalesChannelIntegrationPricelist
+from sales_prices.helpers import SalesChannelPriceResolver
+from sales_prices.models import SalesPrice, SalesPriceList, SalesPriceListItem
+
+
+class SalesChannelPriceResolverTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.channel = AmazonSalesChannel.objects.create(
+            hostname="https://example.com",
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        self.periodic_list = SalesPriceList.objects.create(
+            name="periodic",
+            currency=self.currency,
+            start_date=date.today() - timedelta(days=1),
+            end_date=date.today() + timedelta(days=1),
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        self.fallback_list = SalesPriceList.objects.create(
+            name="fallback",
+            currency=self.currency,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+        for price_list in (self.periodic_list, self.fallback_list):
+            SalesChannelIntegrationPricelist.objects.create(
+                sales_channel=self.channel,
+                price_list=price_list,
+                multi_tenant_company=self.multi_tenant_company,
+            )
+
+        self.periodic_product = self.create_product(rrp=50, price=40)
+        self.fallback_product = self.create_product(rrp=50)
+        self.sales_price_product = self.create_product(rrp=50, price=40)
+        self.discount_too_high_product = self.create_product()
+        self.without_price_product = self.create_product()
+        self.invalid_product = self.create_product()
+
+        self.create_item(price_list=self.periodic_list, product=self.periodic_product, price=30, discount=20)
+        self.create_item(price_list=self.fallback_list, product=self.periodic_product, price=35, discount=25)
+        self.create_item(price_list=self.fallback_list, product=self.fallback_product, price=45, discount=None)
+        self.create_item(price_list=self.fallback_list, product=self.discount_too_high_product, price=45, discount=60)
+        self.create_item(price_list=self.fallback_list, product=self.invalid_product, price=0, discount=None)
+
+        self.products = [
+            self.periodic_product,
+            self.fallback_product,
+            self.sales_price_product,
+            self.discount_too_high_product,
+            self.without_price_product,
+            self.invalid_product,
+        ]
+
+    def create_product(self, rrp=None, price=None):
+        product = SimpleProduct.objects.create(multi_tenant_company=self.multi_tenant_company)
+        if rrp is not None or price is not None:
+            SalesPrice.objects.create(
+                product=product,
+                currency=self.currency,
+                rrp=rrp,
+                price=price,
+                multi_tenant_company=self.multi_tenant_company,
+            )
+        return product
+
+    def create_item(self, *, price_list, product, price, discount):
+        return SalesPriceListItem.objects.create(
+            salespricelist=price_list,
+            product=product,
+            price_override=price,
+            discount_override=discount,
+            multi_tenant_company=self.multi_tenant_company,
+        )
+
+    def test_resolver_matches_single_product_lookup(self):
+        resolver = SalesChannelPriceResolver(
+            sales_channel=self.channel,
+            product_ids=[product.id for product in self.products],
+        )
+        resolver.chunk_size = 2
+        resolver.resolve()
+
+        for product in self.products:
+            if product == self.invalid_product:
+                continue
+
+            self.assertEqual(
+                resolver.get(product_id=product.id, currency_id=self.currency.id),
+                product.get_price_for_sales_channel(self.channel, self.currency),
+            )
+
+        self.assertEqual(resolver.get(product_id=self.periodic_product.id), (30, 20))
+        self.assertEqual(resolver.get(product_id=self.discount_too_high_product.id), (45, None))
+        self.assertEqual(resolver.get(product_id=self.without_price_product.id), (None, None))
+
+    def test_resolver_raises_for_invalid_prices_like_single_lookup(self):
+        resolver = SalesChannelPriceResolver(
+            sales_channel=self.channel,
+            product_ids=[self.invalid_product.id],
+            currencies=[self.currency],
+        )
+        resolver.resolve()
+
+        with self.assertRaises(ValueError):
+            self.invalid_product.get_price_for_sales_channel(self.channel, self.currency)
+
+        with self.assertRaises(ValueError):
+            resolver.get(product_id=self.invalid_product.id, currency_id=self.currency.id)
@@ -5,6 +5,7 @@ from django.dispatch import receiver
 
 from core.signals import post_create
 from core.schema.core.subscriptions import refresh_subscription_receiver
+from imports_exports.signals import products_batch_imported
 from products.models import AliasProduct, BundleProduct, ConfigurableProduct, Product, SimpleProduct
 from workflows.models import Workflow, WorkflowProductAssignment
 
@@ -50,6 +51,12 @@ def workflows__product__post_create_auto_assign(sender, instance, **kwargs):
     _create_auto_workflow_assignments_for_product(product=instance)
 
 
+@receiver(products_batch_imported)
+def workflows__products_batch_imported__auto_assign(sender, instance, created_product_ids, **kwargs):
+    for product in Product.objects.filter(id__in=created_product_ids):
+        _create_auto_workflow_assignments_for_product(product=product)
+
+
 @receiver(post_save, sender=WorkflowProductAssignment)
 @receiver(post_delete, sender=WorkflowProductAssignment)
 def workflows__assignment__refresh_related_subscriptions(sender, instance, **kwargs):